@@ -20,29 +20,11 @@ print(f"RUN.PY: Modified sys.path: {sys.path}")
 #     print(f"RUN.PY: Warning - Could not apply startup optimizations: {e}")
 print("RUN.PY: Startup optimizations disabled for compatibility")
 
-import asyncio
-from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-# Import qasync
-import qasync
+# Only light imports at module level: with the multi-process download mode
+# every spawned worker re-imports this file as __mp_main__, so the Qt/UI
+# imports and the file logging setup live in main() and stay out of them
 import logging
-from logging.handlers import RotatingFileHandler
-from PyQt6.QtCore import QCoreApplication, QTimer
-from typing import Dict
 
-# Import MainWindow from the correct location
-from src.ui.main_window import MainWindow 
-
-# PRINT THE FILE PATH OF THE MODULE CONTAINING MainWindow
-import inspect
-module_path = inspect.getfile(MainWindow)
-print(f"RUN.PY: MainWindow class is defined in module: {module_path}")
-
-# INTENTIONAL CRASH POINT FOR RUN.PY - REMOVED
-# raise Exception("BREAKPOINT_RUN_PY: If you see this, the LATEST run.py is running, AND MainWindow path was printed.")
-
-from src.config_manager import ConfigManager
-from src.services.deezer_api import DeezerAPI
 # Legacy download manager moved to backup
 # from src.services.download_manager import DownloadManager, is_valid_arl
 
@@ -50,16 +32,12 @@ from src.services.deezer_api import DeezerAPI
 def is_valid_arl(arl: str) -> bool:
     """Basic check if ARL looks potentially valid."""
     return arl is not None and len(arl) > 100
-from src.ui.settings_dialog import SettingsDialog
-# Import image cache utilities
-from src.utils.image_cache import clean_cache
 
-# Set up basic logging for run.py
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 logger = logging.getLogger("run")
 
-# Initialize rotating file logging early so all modules write to file
+# Rotating file logging so all modules write to file (main process only)
 def _setup_file_logging():
+    from logging.handlers import RotatingFileHandler
     try:
         appdata_dir = os.environ.get('APPDATA') or os.path.expanduser('~')
         log_dir = os.path.join(appdata_dir, 'DeeMusic', 'logs')
@@ -78,8 +56,6 @@ def _setup_file_logging():
     except Exception as e:
         print(f"RUN.PY: Failed to initialize file logging: {e}")
 
-_setup_file_logging()
-
 # Remove the async run_app function, setup will be synchronous
 # async def run_app(): ...
 
@@ -87,6 +63,10 @@ def test_single_download(track_id_to_test: int, app_instance):
     """
     Directly tests downloading a single track using the backend services.
     """
+    import asyncio
+    from src.config_manager import ConfigManager
+    from src.services.deezer_api import DeezerAPI
+
     logger.info(f"--- Starting Direct Download Test for Track ID: {track_id_to_test} ---")
 
     # 1. Initialize ConfigManager
@@ -159,6 +139,24 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     traceback.print_exception(exc_type, exc_value, exc_traceback, file=sys.stderr)
 
 def main():
+    # Set up basic logging for run.py and the file log before anything else logs
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    _setup_file_logging()
+
+    import asyncio
+    import qasync
+    from PyQt6.QtWidgets import QApplication
+
+    # Import MainWindow from the correct location
+    from src.ui.main_window import MainWindow
+    from src.config_manager import ConfigManager
+    # Import image cache utilities
+    from src.utils.image_cache import clean_cache
+
+    # PRINT THE FILE PATH OF THE MODULE CONTAINING MainWindow
+    import inspect
+    print(f"RUN.PY: MainWindow class is defined in module: {inspect.getfile(MainWindow)}")
+
     # Set up global exception handler
     sys.excepthook = handle_exception
     
@@ -318,4 +316,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed by the multi-process download mode in frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -336,6 +336,16 @@ class ConfigManager:
         # Save the updated config
         self.save_config()
         
+    def override_setting(self, path: str, value: Any):
+        """Set a setting for this run only, without saving it to the settings file.
+        
+        Args:
+            path: Setting path (e.g. 'downloads.path')
+            value: Value to use
+        """
+        logger.info(f"Overriding setting {path} = {value} for this run")
+        self._set_nested_value(self.config, path.split('.'), value)
+        
     def _set_nested_value(self, config: Dict, keys: list, value: Any):
         """Set a nested value in the config dictionary, creating parent dicts if necessary."""
         if not keys:
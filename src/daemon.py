@@ -0,0 +1,355 @@
+"""
+Headless download daemon.
+
+Runs the download service (ConfigManager, DeezerAPI, QueueManager and the
+download engine) without any widgets, so the queue can be drained on a
+server without a desktop session:
+
+    python -m src.daemon https://www.deezer.com/album/302127 track:3135556
+    python -m src.daemon --type playlist 908622995,1479458365
+    python -m src.daemon --watch ~/deemusic-inbox.txt
+
+Progress is printed to stdout as one JSON object per line, logging goes to
+stderr. Items already waiting in the persisted queue are downloaded as well.
+The daemon uses the GUI's config directory and queue file by default, so
+don't run both against the same config at the same time.
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+src_path = Path(__file__).parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.utils.deezer_links import ITEM_TYPES, parse_reference, split_references
+
+logger = logging.getLogger(__name__)
+
+
+class JsonProgressPrinter:
+    """Prints ProgressFeed records as JSON lines, serializing writes from the worker threads"""
+
+    def __init__(self, service, stream=None):
+        from src.services.progress_feed import ProgressFeed
+
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self.feed = ProgressFeed(service, self.write)
+
+    def close(self):
+        """Stop printing events"""
+        self.feed.close()
+
+    def emit(self, event: str, **fields: Any):
+        """Print a record that doesn't come from an event"""
+        self.feed.emit(event, **fields)
+
+    def write(self, record: Dict[str, Any]):
+        """Print one record"""
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                self.stream.write(line + '\n')
+                self.stream.flush()
+            except (BrokenPipeError, ValueError):
+                pass
+
+
+class WatchFile:
+    """
+    Reads references appended to a text file.
+
+    Only lines added since the last poll are returned; a file that shrank
+    (rotated or truncated) is read again from the start. Lines are only
+    consumed once they end with a newline.
+    """
+
+    def __init__(self, path: Path, from_start: bool = True):
+        self.path = path
+        self._offset = 0
+        if not from_start and path.exists():
+            self._offset = path.stat().st_size
+
+    def poll(self) -> List[str]:
+        """Return the complete lines added since the last poll"""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.error(f"[WatchFile] Error reading {self.path}: {e}")
+            return []
+
+        if size < self._offset:
+            self._offset = 0
+        if size == self._offset:
+            return []
+
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read(size - self._offset)
+        except OSError as e:
+            logger.error(f"[WatchFile] Error reading {self.path}: {e}")
+            return []
+
+        end = data.rfind(b'\n')
+        if end < 0:
+            return []
+        self._offset += end + 1
+        return data[:end].decode('utf-8', errors='replace').splitlines()
+
+
+class DownloadDaemon:
+    """
+    Drives a DownloadService from the command line.
+
+    Args:
+        service: Started DownloadService
+        printer: Progress output
+        default_type: Item type assumed for bare numeric IDs
+        watch_file: Optional file polled for new references
+        exit_when_idle: Quit once nothing is queued, downloading or expanding
+    """
+
+    def __init__(self, service, printer: JsonProgressPrinter, default_type: str = 'album',
+                 watch_file: Optional[WatchFile] = None, exit_when_idle: bool = True):
+        self.service = service
+        self.printer = printer
+        self.default_type = default_type
+        self.watch_file = watch_file
+        self.exit_when_idle = exit_when_idle
+        self.added_item_ids: List[str] = []
+        self._stop_requested = False
+
+    def enqueue(self, references: Iterable[str]) -> int:
+        """Add references to the queue. Returns the number of items added."""
+        from src.models.queue_models import ItemPriority
+
+        added = 0
+        for text in split_references(references):
+            reference = parse_reference(text, self.default_type)
+            if not reference:
+                self.printer.emit('error', reference=text, error='Not a Deezer album, playlist or track reference')
+                continue
+
+            item_type, deezer_id = reference
+            try:
+                item_id = self.service.download_item(item_type, deezer_id, priority=ItemPriority.NORMAL)
+            except Exception as e:
+                self.printer.emit('error', reference=text, type=item_type, deezer_id=deezer_id, error=str(e))
+                continue
+
+            if item_id:
+                self.added_item_ids.append(item_id)
+                added += 1
+            else:
+                self.printer.emit('skipped', reference=text, type=item_type, deezer_id=deezer_id,
+                                  reason='Already in queue')
+        return added
+
+    def request_stop(self, *args):
+        """Ask the daemon to shut down (signal handler)"""
+        self._stop_requested = True
+
+    def is_idle(self) -> bool:
+        """True if nothing is queued, downloading or still expanding"""
+        if self.service.get_download_count() > 0:
+            return False
+        return not self.service.queue_manager.has_pending_work()
+
+    def tick(self) -> bool:
+        """
+        Poll the watch file and check for shutdown (event loop timer).
+
+        Returns:
+            False once the daemon should quit
+        """
+        if self._stop_requested:
+            return False
+
+        if self.watch_file:
+            lines = self.watch_file.poll()
+            if lines:
+                self.enqueue(lines)
+
+        return not (self.exit_when_idle and self.is_idle())
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Queue summary plus the outcome of the items added by this run"""
+        from src.models.queue_models import DownloadState
+
+        failed = []
+        for item_id in self.added_item_ids:
+            state = self.service.queue_manager.get_state(item_id)
+            if state and state.state == DownloadState.FAILED:
+                failed.append(item_id)
+        return {
+            'queue': self.service.get_queue_summary(),
+            'added': len(self.added_item_ids),
+            'failed': failed,
+        }
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command line options"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.daemon',
+        description='Download Deezer albums, playlists and tracks without the GUI. '
+                    'Progress is printed to stdout as JSON lines.'
+    )
+    parser.add_argument('references', nargs='*',
+                        help="Deezer URLs, 'album:ID' / 'playlist:ID' / 'track:ID', or bare IDs "
+                             "(comma separated lists are accepted)")
+    parser.add_argument('--type', choices=ITEM_TYPES, default='album',
+                        help='Item type of bare numeric IDs (default: album)')
+    parser.add_argument('--watch', type=Path, metavar='FILE',
+                        help='Poll FILE for references appended one per line; keeps the daemon running')
+    parser.add_argument('--watch-interval', type=float, default=2.0, metavar='SECONDS',
+                        help='Watch file poll interval (default: 2)')
+    parser.add_argument('--skip-existing', action='store_true',
+                        help='Ignore lines already in the watch file at startup')
+    parser.add_argument('--keep-running', action='store_true',
+                        help='Do not exit once the queue is drained')
+    parser.add_argument('--control-api', metavar='ADDRESS',
+                        help="Serve the JSON control API on 'host:port' or a Unix socket path "
+                             "(default: the control_api.address setting); keeps the daemon running")
+    parser.add_argument('--control-token', metavar='TOKEN',
+                        help='Token required by the control API (default: the control_api.token setting; '
+                             'on TCP one is generated into <config dir>/control_api.token if neither is set)')
+    parser.add_argument('--config-dir', type=Path,
+                        help='Configuration directory (default: the GUI one)')
+    parser.add_argument('--output-dir', help='Download folder for this run')
+    parser.add_argument('--quality', choices=('MP3_128', 'MP3_320', 'FLAC'),
+                        help='Download quality for this run')
+    parser.add_argument('--engine-mode', choices=('threads', 'asyncio', 'processes'),
+                        help='Download engine mode for this run')
+    parser.add_argument('--concurrent', type=int, metavar='N',
+                        help='Concurrent downloads for this run')
+    parser.add_argument('--log-level', default='WARNING',
+                        choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+                        help='Log level of the stderr log (default: WARNING)')
+    return parser
+
+
+def _apply_overrides(config, args):
+    """Apply per-run settings without writing them to the settings file"""
+    overrides = {
+        'downloads.path': args.output_dir,
+        'downloads.quality': args.quality,
+        'downloads.engine_mode': args.engine_mode,
+        'downloads.concurrent_downloads': args.concurrent,
+    }
+    for path, value in overrides.items():
+        if value is not None:
+            config.override_setting(path, value)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the daemon. Returns the process exit code."""
+    args = build_arg_parser().parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level), stream=sys.stderr,
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+
+    if not args.references and not args.watch:
+        logger.info("[DownloadDaemon] No references given, draining the persisted queue")
+
+    # Heavy imports after argument parsing so --help stays instant; only
+    # QtCore is needed, the widget libraries are never loaded
+    from PyQt6.QtCore import QCoreApplication, QTimer
+    from src.config_manager import ConfigManager
+    from src.services.background_loop import get_background_loop
+    from src.services.deezer_api import DeezerAPI
+    from src.services.download_service import DownloadService
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+    config = ConfigManager(args.config_dir)
+    _apply_overrides(config, args)
+
+    deezer_api = DeezerAPI(config)
+
+    service = DownloadService(config, deezer_api)
+    printer = JsonProgressPrinter(service)
+    watch_file = WatchFile(args.watch.expanduser(), from_start=not args.skip_existing) if args.watch else None
+
+    control_address = args.control_api or config.get_setting('control_api.address', None)
+    control_api = None
+    if control_address:
+        from src.services.control_api import ControlAPIServer
+        control_api = ControlAPIServer(service, control_address,
+                                       token=args.control_token or config.get_setting('control_api.token', None),
+                                       token_file=Path(config.config_dir) / 'control_api.token')
+
+    daemon = DownloadDaemon(service, printer, default_type=args.type, watch_file=watch_file,
+                            exit_when_idle=not (args.watch or args.keep_running or control_api))
+
+    signal.signal(signal.SIGINT, daemon.request_stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, daemon.request_stop)
+
+    exit_code = 0
+    try:
+        # Tokens have to be in place before the engine (and its worker
+        # processes, which copy them) starts
+        if not deezer_api.login_sync():
+            message = ("No ARL token configured (deezer.arl)" if not deezer_api.arl
+                       else "ARL token was rejected by Deezer, update deezer.arl")
+            logger.error(f"[DownloadDaemon] {message}")
+            printer.emit('error', error=message)
+            return 2
+
+        service.start()
+        if control_api:
+            control_api.start()
+        daemon.enqueue(args.references)
+        printer.emit('started', pid=os.getpid(), queue=service.get_queue_summary(),
+                     engine_mode=service.get_download_statistics().get('engine_mode'),
+                     control_api=control_api.get_url() if control_api else None,
+                     control_token_file=str(control_api.token_file) if control_api and control_api.token_generated else None)
+
+        # The timer also gives the interpreter a chance to run signal handlers
+        # while Qt's event loop is blocking in C++
+        def _tick():
+            if not daemon.tick():
+                app.quit()
+
+        timer = QTimer()
+        timer.timeout.connect(_tick)
+        timer.start(int(max(0.2, args.watch_interval if watch_file else 1.0) * 1000))
+
+        app.exec()
+        timer.stop()
+
+        summary = daemon.get_summary()
+        printer.emit('finished', **summary)
+        if summary['failed']:
+            exit_code = 1
+    except Exception as e:
+        logger.error(f"[DownloadDaemon] Fatal error: {e}", exc_info=True)
+        printer.emit('error', error=str(e))
+        exit_code = 2
+    finally:
+        if control_api:
+            control_api.stop()
+        printer.close()
+        service.stop()
+        try:
+            get_background_loop().run(deezer_api.close(), 5)
+        except Exception as e:
+            logger.debug(f"[DownloadDaemon] Error closing DeezerAPI: {e}")
+        get_background_loop().stop()
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
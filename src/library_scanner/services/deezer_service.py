@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 from urllib.parse import quote
 import logging
 
+from src.services.paginator import RateLimiter, collect_pages, paginate
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +26,9 @@ class DeezerService:
         self.private_api_base = "https://www.deezer.com/ajax/gw-light.php"
         self.api_token = None
         self.sid = None
+        self.page_size = 100
+        self.page_concurrency = 4
+        self._limiter = RateLimiter(max_calls=50, period=5.0)
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -79,47 +84,42 @@ class DeezerService:
             logger.error(f"Error searching artist {artist_name}: {e}")
             return None
             
+    async def _fetch_page(self, path: str, index: int, limit: int):
+        """Fetch one page of a list endpoint, returns (items or None, total or None)"""
+        try:
+            params = {"limit": limit, "index": index}
+            async with self.session.get(f"{self.api_base}{path}", params=params) as resp:
+                data = await resp.json()
+        except Exception as e:
+            logger.error(f"Error fetching {path} at index {index}: {e}")
+            return None, None
+        if not isinstance(data, dict) or data.get("error"):
+            logger.error(f"Error response for {path} at index {index}: {data}")
+            return None, None
+        return data.get("data") or [], data.get("total")
+
+    async def _get_all_pages(self, path: str) -> List[Dict[str, Any]]:
+        """Fetch every item of a list endpoint, the pages after the first one concurrently"""
+        pages = paginate(lambda index, limit: self._fetch_page(path, index, limit),
+                         page_size=self.page_size, concurrency=self.page_concurrency,
+                         limiter=self._limiter)
+        return await collect_pages(pages, dedupe_key=None)
+
     async def get_artist_albums(self, artist_id: int) -> List[Dict[str, Any]]:
         """Get all albums for an artist"""
-        albums = []
         try:
-            url = f"{self.api_base}/artist/{artist_id}/albums"
-            params = {"limit": 100}
-            
-            while url:
-                async with self.session.get(url, params=params if url == f"{self.api_base}/artist/{artist_id}/albums" else None) as resp:
-                    data = await resp.json()
-                    if data.get("data"):
-                        albums.extend(data["data"])
-                    
-                    # Check for next page
-                    url = data.get("next")
-                    
-            return albums
+            return await self._get_all_pages(f"/artist/{artist_id}/albums")
         except Exception as e:
             logger.error(f"Error getting albums for artist {artist_id}: {e}")
-            return albums
+            return []
             
     async def get_album_tracks(self, album_id: int) -> List[Dict[str, Any]]:
         """Get all tracks for an album"""
-        tracks = []
         try:
-            url = f"{self.api_base}/album/{album_id}/tracks"
-            params = {"limit": 100}
-            
-            while url:
-                async with self.session.get(url, params=params if url == f"{self.api_base}/album/{album_id}/tracks" else None) as resp:
-                    data = await resp.json()
-                    if data.get("data"):
-                        tracks.extend(data["data"])
-                    
-                    # Check for next page
-                    url = data.get("next")
-                    
-            return tracks
+            return await self._get_all_pages(f"/album/{album_id}/tracks")
         except Exception as e:
             logger.error(f"Error getting tracks for album {album_id}: {e}")
-            return tracks
+            return []
             
     async def search_track(self, title: str, artist: str = "", album: str = "") -> Optional[Dict[str, Any]]:
         """Search for a specific track"""
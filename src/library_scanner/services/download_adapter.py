@@ -165,8 +165,9 @@ class DownloadAdapter:
             }
             album_data['tracks']['data'].append(track_data)
         
-        # Add to new system
-        self.download_service.add_album(album_data)
+        # Add to new system as bulk work so interactive downloads overtake it
+        from src.models.queue_models import ItemPriority
+        self.download_service.add_album(album_data, priority=ItemPriority.BULK)
         return len(album_tracks)
     
     def add_to_queue(self, track_data: Dict[str, Any]) -> bool:
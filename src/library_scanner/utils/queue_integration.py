@@ -19,7 +19,7 @@ try:
     if str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
     
-    from src.models.queue_models import QueueItem, ItemType, TrackInfo
+    from src.models.queue_models import QueueItem, ItemType, TrackInfo, ItemPriority
     NEW_QUEUE_SYSTEM_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"New queue system not available: {e}")
@@ -484,7 +484,8 @@ class QueueIntegration:
                         logger.info(f"[QueueIntegration] Adding album {overall_index+1}/{len(selected_albums)}: '{missing_album.deezer_album.title}' by '{missing_album.deezer_album.artist}' (ID: {album_id})")
                         
                         # Use the download service to add the album
-                        success = self.download_service.download_album(album_id)
+                        # Library imports are bulk work and must not delay interactive downloads
+                        success = self.download_service.download_album(album_id, priority=ItemPriority.BULK)
                         
                         if success:
                             imported_count += 1
@@ -0,0 +1,182 @@
+"""
+Everything the artist page shows about one artist, loaded in one go.
+
+An ArtistSnapshot holds the artist, all releases, top tracks and related
+playlists/artists in the public API's shape, whether it was built from the
+private ``deezer.pageArtist`` call or from concurrent public API calls. The
+artist page tabs and the bulk download actions all read from the same
+snapshot instead of fetching releases again.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+IMAGE_BASE = "https://e-cdns-images.dzcdn.net/images"
+
+# gw-light album TYPE values
+GW_RECORD_TYPES = {'0': 'single', '1': 'album', '2': 'compile', '3': 'ep'}
+
+
+def _image_urls(kind: str, md5: Optional[str], prefix: str) -> Dict[str, str]:
+    """Public API style image fields (cover_xl, picture_big, ...) for an image MD5"""
+    if not md5:
+        return {}
+    sizes = {'small': 56, 'medium': 250, 'big': 500, 'xl': 1000}
+    urls = {f"{prefix}_{name}": f"{IMAGE_BASE}/{kind}/{md5}/{size}x{size}-000000-80-0-0.jpg"
+            for name, size in sizes.items()}
+    urls[prefix] = urls[f"{prefix}_medium"]
+    return urls
+
+
+def _to_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def artist_from_gw(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a gw-light artist (ART_ID, ART_NAME, ...) to the public API shape"""
+    artist = {
+        'id': _to_int(data.get('ART_ID')),
+        'name': data.get('ART_NAME', ''),
+        'nb_fan': _to_int(data.get('NB_FAN')),
+        'type': 'artist',
+    }
+    artist.update(_image_urls('artist', data.get('ART_PICTURE'), 'picture'))
+    return artist
+
+
+def album_from_gw(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a gw-light album (ALB_ID, ALB_TITLE, TYPE, ...) to the public API shape"""
+    album = {
+        'id': _to_int(data.get('ALB_ID')),
+        'title': data.get('ALB_TITLE', ''),
+        'record_type': GW_RECORD_TYPES.get(str(data.get('TYPE')), 'album'),
+        'release_date': (data.get('PHYSICAL_RELEASE_DATE') or data.get('DIGITAL_RELEASE_DATE')
+                         or data.get('ORIGINAL_RELEASE_DATE') or ''),
+        'artist': {'id': _to_int(data.get('ART_ID')), 'name': data.get('ART_NAME', '')},
+        'type': 'album',
+    }
+    if data.get('NUMBER_TRACK') is not None:
+        album['nb_tracks'] = _to_int(data.get('NUMBER_TRACK'))
+    explicit = (data.get('EXPLICIT_ALBUM_CONTENT') or {}).get('EXPLICIT_LYRICS_STATUS')
+    if explicit is not None:
+        album['explicit_lyrics'] = _to_int(explicit) in (1, 4)
+    album.update(_image_urls('cover', data.get('ALB_PICTURE'), 'cover'))
+    return album
+
+
+def track_from_gw(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a gw-light song (SNG_ID, SNG_TITLE, ...) to the public API shape"""
+    title = data.get('SNG_TITLE', '')
+    version = (data.get('VERSION') or '').strip()
+    if version and version not in title:
+        title = f"{title} {version}"
+    album = {'id': _to_int(data.get('ALB_ID')), 'title': data.get('ALB_TITLE', '')}
+    album.update(_image_urls('cover', data.get('ALB_PICTURE'), 'cover'))
+    return {
+        'id': _to_int(data.get('SNG_ID')),
+        'title': title,
+        'duration': _to_int(data.get('DURATION')),
+        'explicit_lyrics': bool(_to_int(data.get('EXPLICIT_LYRICS'))),
+        'rank': _to_int(data.get('RANK_SNG')),
+        'artist': {'id': _to_int(data.get('ART_ID')), 'name': data.get('ART_NAME', '')},
+        'album': album,
+        'type': 'track',
+    }
+
+
+def playlist_from_gw(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a gw-light playlist (PLAYLIST_ID, TITLE, ...) to the public API shape"""
+    playlist = {
+        'id': _to_int(data.get('PLAYLIST_ID')),
+        'title': data.get('TITLE', ''),
+        'nb_tracks': _to_int(data.get('NB_SONG')),
+        'user': {'id': _to_int(data.get('PARENT_USER_ID')), 'name': data.get('PARENT_USERNAME', '')},
+        'type': 'playlist',
+    }
+    playlist.update(_image_urls(data.get('PICTURE_TYPE') or 'playlist', data.get('PLAYLIST_PICTURE'), 'picture'))
+    return playlist
+
+
+@dataclass
+class ArtistSnapshot:
+    """Artist, releases, top tracks and related data in the public API's shape"""
+    artist: Dict[str, Any]
+    releases: List[Dict[str, Any]] = field(default_factory=list)
+    top_tracks: List[Dict[str, Any]] = field(default_factory=list)
+    playlists: List[Dict[str, Any]] = field(default_factory=list)
+    related_artists: List[Dict[str, Any]] = field(default_factory=list)
+    source: str = 'public'  # 'private' if built from deezer.pageArtist
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def artist_id(self) -> int:
+        return _to_int(self.artist.get('id'))
+
+    @property
+    def name(self) -> str:
+        return self.artist.get('name', '')
+
+    def albums(self) -> List[Dict[str, Any]]:
+        """Releases typed as albums"""
+        return [r for r in self.releases if (r.get('record_type') or '').lower() == 'album']
+
+    def singles(self) -> List[Dict[str, Any]]:
+        """Releases typed as singles, or with one or two tracks"""
+        return [r for r in self.releases
+                if (r.get('record_type') or '').lower() == 'single' or r.get('nb_tracks', 0) in (1, 2)]
+
+    def eps(self) -> List[Dict[str, Any]]:
+        """EPs, singles with four or more tracks, and untyped releases of 4-8 tracks"""
+        eps = []
+        for r in self.releases:
+            record_type = (r.get('record_type') or '').lower()
+            nb_tracks = r.get('nb_tracks', 0)
+            if (record_type == 'ep' or (record_type == 'single' and nb_tracks >= 4)
+                    or (not record_type and 4 <= nb_tracks <= 8)):
+                eps.append(r)
+        return eps
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for caching"""
+        return {
+            'artist': self.artist,
+            'releases': self.releases,
+            'top_tracks': self.top_tracks,
+            'playlists': self.playlists,
+            'related_artists': self.related_artists,
+            'source': self.source,
+            'created_at': self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ArtistSnapshot':
+        """Create from a to_dict() dictionary"""
+        return cls(
+            artist=data.get('artist') or {},
+            releases=data.get('releases') or [],
+            top_tracks=data.get('top_tracks') or [],
+            playlists=data.get('playlists') or [],
+            related_artists=data.get('related_artists') or [],
+            source=data.get('source', 'public'),
+            created_at=data.get('created_at', time.time()),
+        )
+
+    @classmethod
+    def from_page_artist(cls, results: Dict[str, Any]) -> 'ArtistSnapshot':
+        """Create from the results of the gw-light deezer.pageArtist method"""
+        def section(name: str) -> List[Dict[str, Any]]:
+            value = results.get(name) or {}
+            return value.get('data') or [] if isinstance(value, dict) else []
+
+        return cls(
+            artist=artist_from_gw(results.get('DATA') or {}),
+            releases=[album_from_gw(a) for a in section('ALBUMS')],
+            top_tracks=[track_from_gw(t) for t in section('TOP')],
+            playlists=[playlist_from_gw(p) for p in section('RELATED_PLAYLIST')],
+            related_artists=[artist_from_gw(a) for a in section('RELATED_ARTISTS')],
+            source='private',
+        )
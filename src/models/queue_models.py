@@ -23,6 +23,13 @@ class DownloadState(Enum):
     PAUSED = "paused"
 
 
+class ItemPriority(Enum):
+    """Priority classes for scheduling; lower values are served first"""
+    INTERACTIVE = 0  # Single items requested directly by the user
+    NORMAL = 1
+    BULK = 2  # Library imports and other large batch additions
+
+
 class ItemType(Enum):
     """Types of downloadable items"""
     ALBUM = "album"
@@ -164,6 +171,12 @@ class QueueItemState:
     error_message: Optional[str] = None
     updated_at: datetime = field(default_factory=datetime.now)
     retry_count: int = 0
+    expanding: bool = False  # True while remaining track pages are still being fetched
+    expansion_failed: bool = False  # Remaining pages could not be fetched; not persisted, resumed on retry/restart
+    priority: ItemPriority = ItemPriority.NORMAL
+    failed_track_ids: List[int] = field(default_factory=list)  # Tracks that failed in the last run
+    retry_track_ids: Optional[List[int]] = None  # When set, only these tracks are downloaded
+    retry_quality: Optional[str] = None  # Quality override for the next run
     
     def update(self, **kwargs):
         """Update state fields and timestamp"""
@@ -182,7 +195,12 @@ class QueueItemState:
             'failed_tracks': self.failed_tracks,
             'error_message': self.error_message,
             'updated_at': self.updated_at.isoformat(),
-            'retry_count': self.retry_count
+            'retry_count': self.retry_count,
+            'expanding': self.expanding,
+            'priority': self.priority.name.lower(),
+            'failed_track_ids': self.failed_track_ids,
+            'retry_track_ids': self.retry_track_ids,
+            'retry_quality': self.retry_quality
         }
     
     @classmethod
@@ -196,7 +214,12 @@ class QueueItemState:
             failed_tracks=data['failed_tracks'],
             error_message=data.get('error_message'),
             updated_at=datetime.fromisoformat(data['updated_at']),
-            retry_count=data.get('retry_count', 0)
+            retry_count=data.get('retry_count', 0),
+            expanding=data.get('expanding', False),
+            priority=ItemPriority[data.get('priority', 'normal').upper()],
+            failed_track_ids=data.get('failed_track_ids', []),
+            retry_track_ids=data.get('retry_track_ids'),
+            retry_quality=data.get('retry_quality')
         )
     
     @property
@@ -212,7 +235,9 @@ class QueueItemState:
     @property
     def can_retry(self) -> bool:
         """Check if item can be retried"""
-        return self.state == DownloadState.FAILED
+        return self.state == DownloadState.FAILED or (
+            self.state == DownloadState.COMPLETED and bool(self.failed_track_ids)
+        )
 
 
 @dataclass
@@ -248,6 +273,28 @@ class QueueSnapshot:
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
     
+    def save_to_binary_file(self, file_path: str):
+        """Save snapshot in the compact binary format (see queue_snapshot_binary)"""
+        from src.models.queue_snapshot_binary import save_binary
+        save_binary(self, file_path)
+    
+    @classmethod
+    def load_from_binary_file(cls, file_path: str) -> Optional['QueueSnapshot']:
+        """Load snapshot from the compact binary format"""
+        import logging
+        import struct
+        from src.models.queue_snapshot_binary import load_binary
+        logger = logging.getLogger(__name__)
+        
+        try:
+            return load_binary(file_path)
+        except FileNotFoundError:
+            logger.debug(f"Queue file not found: {file_path}")
+            return None
+        except (ValueError, struct.error, IndexError) as e:
+            logger.error(f"Invalid binary queue file {file_path}: {e}")
+            return None
+    
     @classmethod
     def load_from_file(cls, file_path: str) -> Optional['QueueSnapshot']:
         """Load snapshot from JSON file"""
@@ -274,6 +321,25 @@ class QueueSnapshot:
 
 
 # Factory functions for common operations
+def track_info_from_deezer_data(track_data: Dict[str, Any], position: Optional[int] = None) -> TrackInfo:
+    """
+    Create a TrackInfo from a Deezer track API object.
+    
+    Args:
+        track_data: Track object from an album/playlist tracks response
+        position: Fallback track number when the API provides none
+    """
+    api_track_number = track_data.get('track_position') or track_data.get('track_number')
+    return TrackInfo(
+        track_id=track_data['id'],
+        title=track_data['title'],
+        artist=track_data['artist']['name'],
+        duration=track_data['duration'],
+        track_number=api_track_number if api_track_number else position,
+        disc_number=track_data.get('disk_number') or track_data.get('disc_number') or 1
+    )
+
+
 def create_album_from_deezer_data(album_data: Dict[str, Any]) -> QueueItem:
     """Create a QueueItem from Deezer album API response"""
     tracks = []
@@ -364,25 +430,9 @@ async def create_album_from_deezer_data_complete(album_data: Dict[str, Any], dee
     if tracks_in_response < total_tracks_in_album and deezer_api:
         logger.info(f"Fetching complete track list for album '{album_title}' using pagination")
         try:
-            # Fetch all tracks using pagination
-            all_tracks = []
-            index = 0
-            limit = 100  # Fetch in batches of 100
-            
-            while len(all_tracks) < total_tracks_in_album:
-                batch_tracks = await deezer_api.get_album_tracks(album_id, limit=limit, index=index)
-                if not batch_tracks:
-                    logger.warning(f"No more tracks returned for album '{album_title}' at index {index}")
-                    break
-                
-                all_tracks.extend(batch_tracks)
-                logger.debug(f"Fetched {len(batch_tracks)} tracks for album '{album_title}' (total: {len(all_tracks)})")
-                
-                # If we got fewer tracks than requested, we've reached the end
-                if len(batch_tracks) < limit:
-                    break
-                    
-                index += limit
+            # Fetch all tracks; the remaining pages are requested concurrently
+            all_tracks = await deezer_api.get_album_tracks_all(album_id)
+            logger.debug(f"Fetched {len(all_tracks)} tracks for album '{album_title}'")
             
             if len(all_tracks) > tracks_in_response:
                 logger.info(f"Successfully fetched {len(all_tracks)} tracks for album '{album_title}' (was {tracks_in_response})")
@@ -450,27 +500,11 @@ def create_album_from_deezer_data_complete_sync(album_data: Dict[str, Any], deez
     
     # If we have fewer tracks than expected, fetch all tracks using pagination
     if tracks_in_response < total_tracks_in_album and deezer_api:
-        logger.info(f"Fetching complete track list for album '{album_title}' using synchronous pagination")
+        logger.info(f"Fetching complete track list for album '{album_title}' (sync)")
         try:
-            # Fetch all tracks using synchronous pagination
-            all_tracks = []
-            index = 0
-            limit = 100  # Fetch in batches of 100
-            
-            while len(all_tracks) < total_tracks_in_album:
-                batch_tracks = deezer_api.get_album_tracks_sync(album_id, limit=limit, index=index)
-                if not batch_tracks:
-                    logger.warning(f"No more tracks returned for album '{album_title}' at index {index}")
-                    break
-                
-                all_tracks.extend(batch_tracks)
-                logger.debug(f"Fetched {len(batch_tracks)} tracks for album '{album_title}' (total: {len(all_tracks)})")
-                
-                # If we got fewer tracks than requested, we've reached the end
-                if len(batch_tracks) < limit:
-                    break
-                    
-                index += limit
+            # Fetch all tracks; the remaining pages are requested concurrently
+            all_tracks = deezer_api.get_album_tracks_all_sync(album_id)
+            logger.debug(f"Fetched {len(all_tracks)} tracks for album '{album_title}'")
             
             if len(all_tracks) > tracks_in_response:
                 logger.info(f"Successfully fetched {len(all_tracks)} tracks for album '{album_title}' (was {tracks_in_response})")
@@ -0,0 +1,361 @@
+"""
+Compact binary format for queue snapshots.
+
+An optional alternative to the pretty-printed JSON written by
+QueueSnapshot.save_to_file. Records are length-prefixed so a reader can
+skip an item's track list without decoding it, strings (artist names,
+titles, IDs) are interned into a single table that is decoded lazily,
+enums are stored as one-byte codes and timestamps as epoch floats.
+
+File layout (little endian):
+
+    header      magic "DMQS", version, created_at, item_count, strings_offset
+    records     item_count x [u32 record length][item header][track records][retry info]
+    strings     u32 count, (count + 1) x u32 offsets, UTF-8 blob
+
+There is one version of the format. When downloads.queue_format is
+switched to "binary", QueueManager migrates an existing JSON queue file on
+first load. The file is memory-mapped on read. QueueManager always loads the full
+snapshot with load_binary(), which decodes every track; the gain over JSON
+comes from the compact encoding and decoding the string table in one go.
+read_queue_headers() lists the items without decoding track records, for
+tools that only need an overview of a queue file.
+"""
+
+import mmap
+import os
+import struct
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent
+if str(src_path.parent) not in sys.path:
+    sys.path.insert(0, str(src_path.parent))
+
+from src.models.queue_models import (
+    QueueItem, QueueItemState, QueueSnapshot, TrackInfo,
+    DownloadState, ItemType, ItemPriority
+)
+
+MAGIC = b"DMQS"
+VERSION = 1
+NO_STRING = 0xFFFFFFFF
+NO_NUMBER = -1
+
+_HEADER = struct.Struct("<4sHHdIQ")
+_RECORD_LEN = struct.Struct("<I")
+# id, type, state, priority, flags, deezer_id, title, artist, cover, total_tracks,
+# created_at, progress, completed, failed, retry_count, updated_at, error, track_count
+_ITEM = struct.Struct("<IBBBBqIIIIdfIIIdII")
+# track_id, title, artist, duration, track_number, disc_number
+_TRACK = struct.Struct("<qIIIii")
+# failed track count, retry track count (NO_STRING for none), retry quality,
+# followed by the failed and retry track IDs as int64
+_RETRY = struct.Struct("<III")
+_U32 = struct.Struct("<I")
+
+_FLAG_EXPANDING = 0x01
+
+_ITEM_TYPES = list(ItemType)
+_STATES = list(DownloadState)
+_PRIORITIES = list(ItemPriority)
+
+
+class _StringTable:
+    """Interns strings while writing"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        idx = self.index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.index[value] = idx
+            self.values.append(value)
+        return idx
+
+    def pack(self) -> bytes:
+        # NUL-separated so a full load can decode the whole blob in one go;
+        # the offsets still allow random access for header-only reads
+        encoded = [value.encode("utf-8") for value in self.values]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data) + 1)
+        return b"".join([
+            _U32.pack(len(encoded)),
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            b"\0".join(encoded),
+        ])
+
+
+class _StringReader:
+    """Decodes strings from a mapped string table, lazily or all at once"""
+
+    def __init__(self, buf, offset: int):
+        self.buf = buf
+        (count,) = _U32.unpack_from(buf, offset)
+        self.count = count
+        self.offsets_at = offset + _U32.size
+        self.data_at = self.offsets_at + (count + 1) * _U32.size
+        self._cache: Dict[int, str] = {}
+
+    def get(self, idx: int) -> Optional[str]:
+        if idx == NO_STRING:
+            return None
+        value = self._cache.get(idx)
+        if value is None:
+            start, end = struct.unpack_from("<II", self.buf, self.offsets_at + idx * _U32.size)
+            value = bytes(self.buf[self.data_at + start:self.data_at + end - 1]).decode("utf-8")
+            self._cache[idx] = value
+        return value
+
+    def all(self) -> List[str]:
+        """Decode the whole table"""
+        if not self.count:
+            return []
+        (end,) = _U32.unpack_from(self.buf, self.offsets_at + self.count * _U32.size)
+        values = bytes(self.buf[self.data_at:self.data_at + end - 1]).decode("utf-8").split("\0")
+        if len(values) != self.count:
+            # A string contained a NUL character - fall back to offsets
+            values = [self.get(idx) for idx in range(self.count)]
+        return values
+
+
+def _optional_number(value: Optional[int]) -> int:
+    return NO_NUMBER if value is None else value
+
+
+def save_binary(snapshot: QueueSnapshot, file_path: str):
+    """Write a snapshot in the binary format (atomically via a temp file)"""
+    strings = _StringTable()
+    records = []
+
+    for item_id, item in snapshot.items.items():
+        state = snapshot.states.get(item_id)
+        if state is None:
+            continue
+
+        tracks = b"".join(
+            _TRACK.pack(
+                track.track_id,
+                strings.add(track.title),
+                strings.add(track.artist),
+                track.duration or 0,
+                _optional_number(track.track_number),
+                _optional_number(track.disc_number),
+            )
+            for track in item.tracks
+        )
+        header = _ITEM.pack(
+            strings.add(item.id),
+            _ITEM_TYPES.index(item.item_type),
+            _STATES.index(state.state),
+            _PRIORITIES.index(state.priority),
+            _FLAG_EXPANDING if state.expanding else 0,
+            item.deezer_id,
+            strings.add(item.title),
+            strings.add(item.artist),
+            strings.add(item.album_cover_url),
+            item.total_tracks,
+            item.created_at.timestamp(),
+            state.progress,
+            state.completed_tracks,
+            state.failed_tracks,
+            state.retry_count,
+            state.updated_at.timestamp(),
+            strings.add(state.error_message),
+            len(item.tracks),
+        )
+        retry_ids = state.retry_track_ids
+        retry = _RETRY.pack(
+            len(state.failed_track_ids),
+            NO_STRING if retry_ids is None else len(retry_ids),
+            strings.add(state.retry_quality),
+        ) + struct.pack(f"<{len(state.failed_track_ids) + len(retry_ids or ())}q",
+                        *state.failed_track_ids, *(retry_ids or ()))
+        records.append(_RECORD_LEN.pack(len(header) + len(tracks) + len(retry)) + header + tracks + retry)
+
+    body = b"".join(records)
+    header = _HEADER.pack(MAGIC, VERSION, 0, snapshot.created_at.timestamp(),
+                          len(records), _HEADER.size + len(body))
+
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.write(strings.pack())
+    os.replace(tmp_path, file_path)
+
+
+def _open_mapped(file_path: str):
+    """Open and memory-map a snapshot, validating its header"""
+    with open(file_path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, _, created_at, item_count, strings_offset = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        buf.close()
+        raise ValueError(f"Not a binary queue snapshot: {file_path}")
+    if version != VERSION:
+        buf.close()
+        raise ValueError(f"Unsupported binary queue snapshot version {version}")
+    return buf, version, created_at, item_count, strings_offset
+
+
+def _iter_records(buf, item_count: int):
+    """Yield (item header fields, offset of track records) for each record"""
+    offset = _HEADER.size
+    for _ in range(item_count):
+        (record_len,) = _RECORD_LEN.unpack_from(buf, offset)
+        start = offset + _RECORD_LEN.size
+        yield _ITEM.unpack_from(buf, start), start + _ITEM.size
+        offset = start + record_len
+
+
+def read_queue_headers(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Read item headers without decoding any track records.
+
+    Returns:
+        List of dicts with id, item_type, state, priority, title, artist,
+        total_tracks, progress and created_at for every item
+    """
+    buf, _, _, item_count, strings_offset = _open_mapped(file_path)
+    try:
+        strings = _StringReader(buf, strings_offset)
+        headers = []
+        for fields, _ in _iter_records(buf, item_count):
+            headers.append({
+                'id': strings.get(fields[0]),
+                'item_type': _ITEM_TYPES[fields[1]],
+                'state': _STATES[fields[2]],
+                'priority': _PRIORITIES[fields[3]],
+                'title': strings.get(fields[6]),
+                'artist': strings.get(fields[7]),
+                'total_tracks': fields[9],
+                'created_at': datetime.fromtimestamp(fields[10]),
+                'progress': fields[11],
+            })
+        return headers
+    finally:
+        buf.close()
+
+
+def load_binary(file_path: str) -> QueueSnapshot:
+    """Load a full snapshot from the binary format"""
+    buf, version, created_at, item_count, strings_offset = _open_mapped(file_path)
+    try:
+        table = _StringReader(buf, strings_offset).all()
+        optional = lambda idx: None if idx == NO_STRING else table[idx]
+        items: Dict[str, QueueItem] = {}
+        states: Dict[str, QueueItemState] = {}
+
+        for fields, tracks_at in _iter_records(buf, item_count):
+            (id_idx, type_code, state_code, priority_code, flags, deezer_id, title_idx,
+             artist_idx, cover_idx, total_tracks, created, progress, completed, failed,
+             retry_count, updated, error_idx, track_count) = fields
+
+            tracks = [
+                TrackInfo(
+                    track_id=track_id,
+                    title=table[t_title],
+                    artist=table[t_artist],
+                    duration=duration,
+                    track_number=None if track_number == NO_NUMBER else track_number,
+                    disc_number=None if disc_number == NO_NUMBER else disc_number,
+                )
+                for track_id, t_title, t_artist, duration, track_number, disc_number
+                in _TRACK.iter_unpack(buf[tracks_at:tracks_at + track_count * _TRACK.size])
+            ]
+
+            retry_at = tracks_at + track_count * _TRACK.size
+            failed_count, retry_id_count, quality_idx = _RETRY.unpack_from(buf, retry_at)
+            ids_at = retry_at + _RETRY.size
+            failed_ids = list(struct.unpack_from(f"<{failed_count}q", buf, ids_at))
+            retry_ids = None
+            if retry_id_count != NO_STRING:
+                retry_ids = list(struct.unpack_from(f"<{retry_id_count}q", buf, ids_at + failed_count * 8))
+            retry_quality = optional(quality_idx)
+
+            item_id = table[id_idx]
+            items[item_id] = QueueItem(
+                id=item_id,
+                item_type=_ITEM_TYPES[type_code],
+                deezer_id=deezer_id,
+                title=table[title_idx],
+                artist=table[artist_idx],
+                total_tracks=total_tracks,
+                tracks=tracks,
+                created_at=datetime.fromtimestamp(created),
+                album_cover_url=optional(cover_idx),
+            )
+            states[item_id] = QueueItemState(
+                item_id=item_id,
+                state=_STATES[state_code],
+                progress=progress,
+                completed_tracks=completed,
+                failed_tracks=failed,
+                error_message=optional(error_idx),
+                updated_at=datetime.fromtimestamp(updated),
+                retry_count=retry_count,
+                expanding=bool(flags & _FLAG_EXPANDING),
+                priority=_PRIORITIES[priority_code],
+                failed_track_ids=failed_ids,
+                retry_track_ids=retry_ids,
+                retry_quality=retry_quality,
+            )
+
+        return QueueSnapshot(items=items, states=states, created_at=datetime.fromtimestamp(created_at))
+    finally:
+        buf.close()
+
+
+# Benchmark against the JSON format
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    def build_snapshot(item_count: int = 20000, tracks_per_item: int = 12) -> QueueSnapshot:
+        items, states = {}, {}
+        for i in range(item_count):
+            artist = f"Artist {i % 1500}"
+            tracks = [
+                TrackInfo(track_id=i * 100 + n, title=f"Track {n} of album {i}", artist=artist,
+                          duration=200 + n, track_number=n + 1, disc_number=1)
+                for n in range(tracks_per_item)
+            ]
+            item = QueueItem.create_album(deezer_id=i, title=f"Album {i}", artist=artist, tracks=tracks,
+                                          album_cover_url=f"https://e-cdns-images.dzcdn.net/images/cover/{i:032x}/1000x1000.jpg")
+            items[item.id] = item
+            states[item.id] = QueueItemState(item_id=item.id, state=DownloadState.QUEUED)
+        return QueueSnapshot(items=items, states=states)
+
+    def timed(label, func, repeat=3):
+        best = min(_time_once(func) for _ in range(repeat))
+        print(f"{label:<28} {best * 1000:8.1f} ms")
+
+    def _time_once(func):
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started
+
+    snapshot = build_snapshot()
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = str(Path(tmp) / "queue.json")
+        bin_path = str(Path(tmp) / "queue.bin")
+
+        timed("JSON save", lambda: snapshot.save_to_file(json_path))
+        timed("binary save", lambda: save_binary(snapshot, bin_path))
+        timed("JSON load", lambda: QueueSnapshot.load_from_file(json_path))
+        timed("binary load", lambda: load_binary(bin_path))
+        timed("binary headers only", lambda: read_queue_headers(bin_path))
+
+        print(f"{'JSON size':<28} {os.path.getsize(json_path) / 1e6:8.1f} MB")
+        print(f"{'binary size':<28} {os.path.getsize(bin_path) / 1e6:8.1f} MB")
@@ -0,0 +1,447 @@
+"""
+Tiered cache for Deezer API responses.
+
+A byte-budgeted in-process LRU sits in front of one SQLite database (WAL
+mode) that survives restarts. Entries expire after a per-endpoint TTL -
+chart data goes stale within minutes, album and track metadata practically
+never changes - and the database is trimmed to a size budget by evicting the
+least recently used entries.
+
+The memory tier stores pickled responses: the size is known exactly for the
+byte budget, unpickling is several times faster than parsing JSON, and every
+caller gets its own copy it can modify freely. The database stores JSON.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds an entry stays fresh, per endpoint (overridable with cache.ttl.<endpoint>)
+DEFAULT_TTLS = {
+    'track': 7 * 86400,
+    'album': 7 * 86400,
+    'artist': 86400,
+    'artist_top_tracks': 86400,
+    'artist_albums': 12 * 3600,
+    'playlist': 3600,
+    'search': 3600,
+    'chart': 15 * 60,
+    'editorial': 30 * 60,
+    'default': 86400,
+}
+
+
+class MemoryLRU:
+    """LRU of pickled values bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()  # key -> (blob, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Get (blob, expires_at) and mark the entry as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, blob: bytes, expires_at: float):
+        """Store a blob, evicting least recently used entries to stay in budget"""
+        size = len(blob)
+        if size > self.max_bytes // 4:
+            return  # A single huge entry would flush the whole tier
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old[0])
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+            self._entries[key] = (blob, expires_at)
+            self.current_bytes += size
+
+    def discard(self, key: str):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ApiResponseCache:
+    """
+    Memory LRU + SQLite cache of API responses.
+
+    Thread-safe. Values must be JSON-serializable.
+
+    Args:
+        cache_dir: Directory holding the database (api_cache.db)
+        memory_bytes: Budget of the in-process tier
+        disk_bytes: Budget of the database; trimmed to 90% when exceeded
+        ttls: Per-endpoint TTL overrides in seconds
+    """
+
+    DB_NAME = "api_cache.db"
+    TRIM_CHECK_INTERVAL = 200  # Writes between database size checks
+
+    def __init__(self, cache_dir: Path, memory_bytes: int = 32 * 1024 * 1024,
+                 disk_bytes: int = 256 * 1024 * 1024, ttls: Optional[Dict[str, int]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / self.DB_NAME
+        self.disk_bytes = disk_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+
+        self.memory = MemoryLRU(memory_bytes)
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes_since_trim = 0
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'expired': 0,
+            'writes': 0, 'evictions': 0, 'errors': 0,
+        }
+        self._lookup_time = 0.0
+        self._lookups = 0
+
+        self._open()
+
+    def _open(self):
+        """Open (or create) the database"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at)")
+            db.execute("DELETE FROM responses WHERE expires_at < ?", (time.time() - self._max_ttl(),))
+            self._db = db
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Could not open {self.db_path}, using the memory tier only: {e}")
+            self._db = None
+
+    def _max_ttl(self) -> int:
+        return max(self.ttls.values())
+
+    def ttl_for(self, endpoint: Optional[str]) -> int:
+        """TTL in seconds of an endpoint"""
+        return self.ttls.get(endpoint or 'default', self.ttls['default'])
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Look up a response.
+
+        Args:
+            key: Cache key
+            allow_stale: Also return expired entries still in the cache
+
+        Returns:
+            A fresh copy of the cached value, or None
+        """
+        value, _ = self.get_with_age(key, allow_stale)
+        return value
+
+    def get_with_age(self, key: str, allow_stale: bool = False) -> Tuple[Optional[Any], bool]:
+        """
+        Look up a response and whether it has expired.
+
+        Returns:
+            (value or None, True if the value is past its TTL)
+        """
+        started = time.perf_counter()
+        now = time.time()
+        try:
+            entry = self.memory.get(key)
+            if entry is not None:
+                blob, expires_at = entry
+                stale = expires_at < now
+                if not stale or allow_stale:
+                    self._count('memory_hits')
+                    return pickle.loads(blob), stale
+                self._count('expired')
+                return None, True
+
+            row = self._read_row(key)
+            if row is None:
+                self._count('misses')
+                return None, False
+
+            text, expires_at = row
+            stale = expires_at < now
+            if stale and not allow_stale:
+                self._count('expired')
+                return None, True
+
+            value = json.loads(text)
+            self.memory.put(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires_at)
+            self._count('disk_hits')
+            return value, stale
+
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error reading {key}: {e}")
+            self._count('errors')
+            return None, False
+        finally:
+            with self._stats_lock:
+                self._lookup_time += time.perf_counter() - started
+                self._lookups += 1
+
+    def set(self, key: str, value: Any, endpoint: Optional[str] = None, ttl: Optional[int] = None):
+        """
+        Store a response in both tiers.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+            endpoint: Endpoint name selecting the TTL (see DEFAULT_TTLS)
+            ttl: Explicit TTL in seconds, overrides the endpoint's
+        """
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.ttl_for(endpoint))
+        try:
+            self.memory.put(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires_at)
+            text = json.dumps(value, separators=(',', ':'))
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error serializing {key}: {e}")
+            self._count('errors')
+            return
+
+        self._count('writes')
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, value, size, created_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint or 'default', text, len(text), now, expires_at, now)
+                )
+                self._writes_since_trim += 1
+                if self._writes_since_trim >= self.TRIM_CHECK_INTERVAL:
+                    self._writes_since_trim = 0
+                    self._trim_locked()
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error writing {key}: {e}")
+            self._count('errors')
+
+    def invalidate(self, key: str):
+        """Drop one entry from both tiers"""
+        self.memory.discard(key)
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error invalidating {key}: {e}")
+
+    def clear(self):
+        """Drop everything"""
+        self.memory.clear()
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute("DELETE FROM responses")
+                self._db.execute("VACUUM")
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error clearing the cache: {e}")
+
+    def trim(self):
+        """Evict expired entries and the least recently used ones beyond the size budget"""
+        if self._db is None:
+            return
+        with self._db_lock:
+            self._trim_locked()
+
+    def _trim_locked(self):
+        """trim() with the database lock held"""
+        try:
+            evicted = self._db.execute("DELETE FROM responses WHERE expires_at < ?",
+                                       (time.time() - self._max_ttl(),)).rowcount
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.disk_bytes:
+                target = int(self.disk_bytes * 0.9)
+                # Walk the entries from least recently used and cut where the rest fits
+                cutoff, removed = None, 0
+                for accessed_at, size in self._db.execute("SELECT accessed_at, size FROM responses ORDER BY accessed_at"):
+                    if total - removed <= target:
+                        break
+                    removed += size
+                    cutoff = accessed_at
+                if cutoff is not None:
+                    evicted += self._db.execute("DELETE FROM responses WHERE accessed_at <= ?", (cutoff,)).rowcount
+            if evicted:
+                self._count('evictions', evicted)
+                logger.debug(f"[ApiResponseCache] Evicted {evicted} entries")
+        except Exception as e:
+            logger.error(f"[ApiResponseCache] Error trimming the cache: {e}")
+
+    def _read_row(self, key: str) -> Optional[Tuple[str, float]]:
+        """Read (value, expires_at) from the database and refresh its access time"""
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def add_counter(self, name: str, amount: int = 1):
+        """Count an event of a cooperating layer in the statistics"""
+        with self._stats_lock:
+            self._stats[name] = self._stats.get(name, 0) + amount
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Hit/miss counters, tier sizes and the mean lookup latency"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            lookups = self._lookups
+            stats['mean_lookup_ms'] = round(self._lookup_time / lookups * 1000, 3) if lookups else 0.0
+        hits = stats['memory_hits'] + stats['disk_hits']
+        stats['hit_rate'] = round(hits / lookups, 3) if lookups else 0.0
+        stats['memory_entries'] = len(self.memory)
+        stats['memory_bytes'] = self.memory.current_bytes
+
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    count, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+                stats['disk_entries'] = count
+                stats['disk_bytes'] = size
+            except Exception as e:
+                logger.error(f"[ApiResponseCache] Error reading cache size: {e}")
+        return stats
+
+    def remove_legacy_files(self, legacy_dir: Path):
+        """Delete the old one-file-per-key JSON cache in the background"""
+        legacy_dir = Path(legacy_dir)
+
+        def _remove():
+            removed = 0
+            try:
+                for path in legacy_dir.glob("*.json"):
+                    try:
+                        path.unlink()
+                        removed += 1
+                    except OSError:
+                        pass
+            except Exception as e:
+                logger.error(f"[ApiResponseCache] Error removing legacy cache files: {e}")
+            if removed:
+                logger.info(f"[ApiResponseCache] Removed {removed} legacy cache files from {legacy_dir}")
+
+        threading.Thread(target=_remove, name="ApiCacheLegacyCleanup", daemon=True).start()
+
+    def close(self):
+        """Close the database"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def response_cache_key(method, *args, **kwargs) -> str:
+    """
+    Cache key of a method call, the same for positional and keyword arguments.
+
+    Args:
+        method: The (decorated or plain) method, bound or unbound
+        *args, **kwargs: Call arguments without self
+    """
+    function = inspect.unwrap(getattr(method, '__func__', method))
+    bound = inspect.signature(function).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = list(bound.arguments.items())[1:]  # Drop self
+    return function.__name__ + ''.join(f"_{name}{value}" for name, value in arguments)
+
+
+def cached_response(endpoint: str):
+    """
+    Decorator caching the result of an async method in ``self.cache``.
+
+    Fresh entries are returned without calling the method; empty results
+    are not stored. Use DeezerAPI.peek_cached_response() to read the last
+    result even after it expired (stale-while-revalidate).
+
+    Args:
+        endpoint: Endpoint name selecting the TTL
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = response_cache_key(method, *args, **kwargs)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            result = await method(self, *args, **kwargs)
+            if result:
+                self.cache.set(key, result, endpoint=endpoint)
+            return result
+        return wrapper
+    return decorator
+
+
+# Shared instances, one per database
+_caches: Dict[str, ApiResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_api_cache(cache_dir: Path, **kwargs) -> ApiResponseCache:
+    """Get the shared cache of a directory, creating it with kwargs on first use"""
+    key = str(Path(cache_dir).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ApiResponseCache(Path(cache_dir), **kwargs)
+        return cache
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import tempfile
+
+    logging.basicConfig(level=logging.DEBUG)
+    cache = ApiResponseCache(Path(tempfile.mkdtemp()), memory_bytes=1024 * 1024)
+    cache.set("album_1", {"id": 1, "title": "Test Album"}, endpoint='album')
+    cache.set("chart_0", {"data": []}, ttl=-1)
+    print(f"Album: {cache.get('album_1')}")
+    print(f"Expired chart: {cache.get('chart_0')}, stale: {cache.get('chart_0', allow_stale=True)}")
+    print(f"Statistics: {cache.get_statistics()}")
+    cache.close()
@@ -0,0 +1,428 @@
+"""
+Asyncio download mode for the download engine.
+
+In the default thread mode every queue item occupies a QThreadPool thread and
+every track a thread of its own, which blocks for the whole CDN transfer. With
+slow streams that means dozens of mostly idle OS threads. In asyncio mode all
+track jobs run as tasks on one dedicated event loop thread: CDN transfers are
+streamed with aiohttp, API lookups are awaited on DeezerAPI's async core,
+file system work goes to a small I/O executor and the CPU-bound decryption
+and tagging go to a CPU executor. Progress is reported through the event bus
+exactly like the threaded worker does.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+import aiohttp
+
+# Import our new models and event system
+import sys
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import QueueItem, ItemType, TrackInfo
+from src.services.event_bus import EventBus, DownloadEvents, QueueEvents
+from src.services.new_download_worker import DownloadWorker
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDownloadRuntime:
+    """
+    Event loop thread, executors and HTTP session shared by all async workers.
+
+    Args:
+        config_manager: Used for the stream and executor size settings
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config_manager=None):
+        self.max_streams = 256
+        self.io_workers = 8
+        self.cpu_workers = os.cpu_count() or 4
+        if config_manager is not None:
+            self.max_streams = config_manager.get_setting('downloads.async_max_streams', self.max_streams)
+            self.io_workers = config_manager.get_setting('downloads.async_io_workers', self.io_workers)
+            self.cpu_workers = config_manager.get_setting('downloads.async_cpu_workers', self.cpu_workers)
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.io_executor: Optional[ThreadPoolExecutor] = None
+        self.cpu_executor: Optional[ThreadPoolExecutor] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stream_slots: Optional[asyncio.Semaphore] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._active_streams = 0
+
+    def start(self):
+        """Start the loop thread and the executors"""
+        if self.is_running():
+            return
+
+        self.io_executor = ThreadPoolExecutor(max_workers=max(1, self.io_workers),
+                                              thread_name_prefix="AsyncDownloadIo")
+        self.cpu_executor = ThreadPoolExecutor(max_workers=max(1, self.cpu_workers),
+                                               thread_name_prefix="AsyncDownloadCpu")
+
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="AsyncDownloadLoop", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+
+        logger.info(f"[AsyncDownloadRuntime] Started (max {self.max_streams} streams, "
+                    f"{self.io_workers} I/O / {self.cpu_workers} CPU workers)")
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel all jobs, close the session and stop the loop thread"""
+        if not self.is_running():
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"[AsyncDownloadRuntime] Jobs did not stop cleanly: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+        for executor in (self.io_executor, self.cpu_executor):
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self.io_executor = None
+        self.cpu_executor = None
+
+        logger.info("[AsyncDownloadRuntime] Stopped")
+
+    def is_running(self) -> bool:
+        """Check if the loop thread is alive"""
+        return bool(self._thread and self._thread.is_alive() and self.loop and self.loop.is_running())
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, callback: Callable, *args):
+        """Run a callback on the loop thread"""
+        if self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking I/O call (file system, artwork) on the I/O executor"""
+        return await self.loop.run_in_executor(self.io_executor, functools.partial(func, *args, **kwargs))
+
+    async def run_cpu(self, func: Callable, *args, **kwargs) -> Any:
+        """Run CPU-bound work (decryption, tagging) on the CPU executor"""
+        return await self.loop.run_in_executor(self.cpu_executor, functools.partial(func, *args, **kwargs))
+
+    async def stream_to_file(self, url: str, is_cancelled: Callable[[], bool]) -> Optional[Path]:
+        """
+        Stream a URL into a temporary file.
+
+        Returns:
+            Path of the temporary file, or None if cancelled
+        """
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.part')
+        temp_file = Path(temp_path)
+        complete = False
+
+        async with self._stream_slots:
+            self._active_streams += 1
+            try:
+                session = self._get_session()
+                with open(temp_fd, 'wb') as f:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                            if is_cancelled():
+                                return None
+                            f.write(chunk)
+                complete = True
+                return temp_file
+            finally:
+                self._active_streams -= 1
+                if not complete:
+                    temp_file.unlink(missing_ok=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get runtime statistics"""
+        jobs = 0
+        if self.is_running():
+            jobs = len(asyncio.all_tasks(self.loop))
+        return {
+            'async_tasks': jobs,
+            'active_streams': self._active_streams,
+            'max_streams': self.max_streams,
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared CDN session on first use (loop thread)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_streams),
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+            )
+        return self._session
+
+    def _run_loop(self):
+        """Loop thread body"""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._stream_slots = asyncio.Semaphore(max(1, self.max_streams))
+        self.loop.call_soon(self._ready.set)
+
+        try:
+            self.loop.run_forever()
+        except Exception as e:
+            logger.error(f"[AsyncDownloadRuntime] Event loop crashed: {e}", exc_info=True)
+        finally:
+            try:
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+    async def _shutdown(self):
+        """Cancel every other task on the loop and close the session"""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class AsyncDownloadWorker(DownloadWorker):
+    """
+    Download worker that runs its tracks as asyncio tasks.
+
+    Reuses the naming, directory, decryption and metadata logic of
+    DownloadWorker; only the scheduling and the CDN transfer differ. Started
+    with start() instead of being handed to a QThreadPool.
+    """
+
+    def __init__(self, item: QueueItem, deezer_api, config_manager, event_bus: EventBus,
+                 queue_manager=None, runtime: AsyncDownloadRuntime = None):
+        super().__init__(item, deezer_api, config_manager, event_bus, queue_manager)
+        self.runtime = runtime
+        self._future: Optional[Future] = None
+        self._track_tasks: Set[asyncio.Task] = set()
+        self._running = False
+
+    def start(self):
+        """Schedule the download on the runtime's loop"""
+        self._running = True
+        self._future = self.runtime.submit(self.run_async())
+
+    def cancel(self):
+        """Cancel the download and its in-flight track tasks."""
+        super().cancel()
+        self.runtime.call_soon(self._cancel_track_tasks)
+
+    def _cancel_track_tasks(self):
+        """Cancel running track tasks (loop thread)"""
+        for task in list(self._track_tasks):
+            task.cancel()
+
+    async def run_async(self):
+        """Execute the download task."""
+        try:
+            logger.info(f"[AsyncDownloadWorker] Starting download: {self.item.title} by {self.item.artist}")
+
+            # Emit download started event
+            self.event_bus.emit(DownloadEvents.DOWNLOAD_STARTED, self.item.id)
+
+            if self.queue_manager:
+                self.event_bus.subscribe(QueueEvents.ITEM_TRACKS_APPENDED, self._on_tracks_appended)
+                # Pick up tracks appended between scheduling and start
+                self.item = self.queue_manager.get_item(self.item.id) or self.item
+                self._apply_retry_settings()
+
+            if self.item.item_type in (ItemType.ALBUM, ItemType.PLAYLIST):
+                await self._download_album_async()
+            elif self.item.item_type == ItemType.TRACK:
+                await self._download_single_track_async()
+            else:
+                raise ValueError(f"Unknown item type: {self.item.item_type}")
+
+            if not self.cancelled:
+                self._check_track_list_complete()
+                logger.info(f"[AsyncDownloadWorker] Completed download: {self.item.title}")
+                self.event_bus.emit(DownloadEvents.DOWNLOAD_COMPLETED, self.item.id)
+
+        except asyncio.CancelledError:
+            logger.debug(f"[AsyncDownloadWorker] Download task cancelled: {self.item.title}")
+            raise
+
+        except Exception as e:
+            if not self.cancelled:
+                error_msg = f"Download failed: {str(e)}"
+                logger.error(f"[AsyncDownloadWorker] {error_msg}", exc_info=True)
+                self.event_bus.emit(DownloadEvents.DOWNLOAD_FAILED, self.item.id, error_msg)
+
+        finally:
+            self._running = False
+            if self.queue_manager:
+                self.event_bus.unsubscribe(QueueEvents.ITEM_TRACKS_APPENDED, self._on_tracks_appended)
+
+    async def _download_album_async(self):
+        """Download all tracks of an album or playlist as concurrent tasks."""
+        self._completed_tracks = 0
+        self._failed_tracks = 0
+        self._total_tracks = max(len(self.item.tracks), self.item.total_tracks)
+        if self.retry_track_ids is not None:
+            # Tracks outside the retry set already succeeded in an earlier run
+            self._completed_tracks = max(0, self._total_tracks - len(self.retry_track_ids))
+
+        if not await self._ensure_token_fresh():
+            logger.error(f"[AsyncDownloadWorker] Failed to ensure token freshness, aborting download of {self.item.title}")
+            return
+
+        await self.runtime.run_blocking(self._create_album_directory)
+        await self.runtime.run_blocking(self._prepare_album_artwork_for_multi_disc)
+
+        track_slots = asyncio.Semaphore(max(1, self.concurrent_tracks))
+        logger.info(f"[AsyncDownloadWorker] Starting download of {self._total_tracks} tracks, "
+                    f"{self.concurrent_tracks} at a time")
+
+        submitted = await self._submit_tracks_async(0, track_slots)
+
+        # Stream in tracks that are still being fetched in the background
+        while not self.cancelled and (self._is_expanding() or submitted < len(self.item.tracks)):
+            if self._expansion_failed() and submitted >= len(self.item.tracks):
+                break
+            if not self._tracks_appended.is_set():
+                await asyncio.sleep(0.25)
+                continue
+            self._tracks_appended.clear()
+
+            self.item = self.queue_manager.get_item(self.item.id) or self.item
+            with self._track_progress_lock:
+                self._total_tracks = max(len(self.item.tracks), self.item.total_tracks) if self._is_expanding() else len(self.item.tracks)
+
+            submitted = await self._submit_tracks_async(submitted, track_slots)
+
+        while self._track_tasks:
+            await asyncio.gather(*list(self._track_tasks), return_exceptions=True)
+
+        logger.info(f"[AsyncDownloadWorker] Album download completed: {self._completed_tracks}/{self._total_tracks} tracks successful")
+
+    async def _submit_tracks_async(self, start: int, track_slots: asyncio.Semaphore) -> int:
+        """
+        Create tasks for the item's tracks from position start onwards,
+        skipping tracks outside the retry set. Returns the position of the
+        first track not submitted.
+        """
+        for i in range(start, len(self.item.tracks)):
+            track_info = self.item.tracks[i]
+            if self.retry_track_ids is not None and track_info.track_id not in self.retry_track_ids:
+                continue
+
+            # Wait if paused
+            while self.paused and not self.cancelled:
+                await asyncio.sleep(0.1)
+            if self.cancelled:
+                return i
+
+            task = asyncio.create_task(self._run_track(track_info, i + 1, track_slots))
+            self._track_tasks.add(task)
+            task.add_done_callback(self._track_tasks.discard)
+        return len(self.item.tracks)
+
+    async def _run_track(self, track_info: TrackInfo, playlist_position: int, track_slots: asyncio.Semaphore):
+        """Download one track once a slot is free and report the result."""
+        async with track_slots:
+            if self.cancelled:
+                return
+            try:
+                success = await self._download_track_async(track_info, playlist_position)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[AsyncDownloadWorker] Error downloading track {track_info.track_id}: {e}")
+                success = False
+
+            if not self.cancelled:
+                self._on_track_completed(track_info, success)
+
+    async def _download_single_track_async(self):
+        """Download a single track."""
+        if not self.item.tracks:
+            raise ValueError("No track information available")
+
+        if not await self._ensure_token_fresh():
+            raise Exception("Failed to ensure token freshness")
+
+        track_info = self.item.tracks[0]
+        success = await self._download_track_async(track_info, playlist_position=1)
+
+        if success:
+            self.event_bus.emit(DownloadEvents.TRACK_COMPLETED, self.item.id, track_info.track_id)
+            self.event_bus.emit(DownloadEvents.DOWNLOAD_PROGRESS, self.item.id, 1.0, 1, 0)
+        elif not self.cancelled:
+            raise Exception("Failed to download track")
+
+    async def _download_track_async(self, track_info: TrackInfo, playlist_position: int = 1) -> bool:
+        """
+        Download a single track: resolve, stream, decrypt and tag it.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.cancelled:
+            return False
+
+        full_track_data = await self.deezer_api.get_track_details(track_info.track_id)
+        self._current_track_info = full_track_data if full_track_data else track_info.to_dict()
+
+        download_url = await self.deezer_api.get_track_download_url(track_info.track_id, quality=self.quality)
+        if not self._is_usable_download_url(track_info, download_url):
+            return False
+
+        filename = self._create_filename(track_info, playlist_position=playlist_position)
+        track_dir = await self.runtime.run_blocking(self._create_track_directory, track_info)
+        file_path = track_dir / filename
+
+        if await self.runtime.run_blocking(file_path.exists):
+            logger.info(f"[AsyncDownloadWorker] File already exists, skipping: {file_path}")
+            return not self.cancelled
+
+        try:
+            temp_file = await self.runtime.stream_to_file(download_url, lambda: self.cancelled)
+        except Exception as e:
+            logger.error(f"[AsyncDownloadWorker] Error downloading encrypted file: {e}")
+            return False
+        if not temp_file:
+            return False
+
+        decrypted_file = None
+        try:
+            decrypted_file = await self.runtime.run_cpu(self._decrypt_file, temp_file, str(track_info.track_id))
+            if not decrypted_file or self.cancelled:
+                return False
+
+            return await self.runtime.run_cpu(
+                self._finalize_track, decrypted_file, file_path, track_info, playlist_position=playlist_position
+            )
+        finally:
+            await self.runtime.run_blocking(self._cleanup_temp_files, temp_file, decrypted_file, file_path)
+
+    async def _ensure_token_fresh(self) -> bool:
+        """Refresh the API tokens if needed before a batch of track lookups"""
+        try:
+            return bool(await self.deezer_api.ensure_token_freshness())
+        except Exception as e:
+            logger.error(f"[AsyncDownloadWorker] Exception during token freshness check: {e}", exc_info=True)
+            return False
@@ -0,0 +1,145 @@
+"""
+Shared background asyncio event loop.
+
+Services that keep asyncio resources (aiohttp sessions, locks) run them on
+this one loop thread so the resources can be used from anywhere: coroutines
+running on other loops hop over with ``await loop.run_async(coro)`` and
+plain threads block on ``loop.run(coro)``.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundEventLoop:
+    """
+    An asyncio event loop running forever on a daemon thread.
+
+    Started lazily on first use.
+    """
+
+    def __init__(self, name: str = "BackgroundEventLoop"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def start(self):
+        """Start the loop thread if it isn't running yet"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_loop, name=self.name, daemon=True)
+            self._thread.start()
+        self._ready.wait(5.0)
+        logger.debug(f"[BackgroundEventLoop] {self.name} started")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the loop after cancelling its remaining tasks"""
+        with self._lock:
+            thread, loop = self._thread, self.loop
+            self._thread = None
+        if not thread or not loop or loop.is_closed():
+            return
+
+        loop.call_soon_threadsafe(self._cancel_tasks)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        logger.debug(f"[BackgroundEventLoop] {self.name} stopped")
+
+    def is_current(self) -> bool:
+        """Check if the caller is running on this loop's thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the loop from any thread"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Must not be called from the loop thread itself, which would deadlock.
+        """
+        if self.is_current():
+            coro.close()
+            raise RuntimeError(f"{self.name}.run() called from its own loop thread")
+        return self.submit(coro).result(timeout)
+
+    async def run_async(self, coro) -> Any:
+        """Await a coroutine on this loop from a coroutine running on any loop"""
+        if self.is_current():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def _run_loop(self):
+        """Loop thread body"""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+
+        try:
+            self.loop.run_forever()
+        except Exception as e:
+            logger.error(f"[BackgroundEventLoop] {self.name} crashed: {e}", exc_info=True)
+        finally:
+            try:
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+    def _cancel_tasks(self):
+        """Cancel every task still running on the loop (loop thread)"""
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+
+
+# Global instance
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Get the shared background event loop"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = BackgroundEventLoop("SharedAsyncLoop")
+        return _background_loop
+
+
+def on_background_loop(method):
+    """
+    Decorator for async methods that must run on the shared background loop,
+    e.g. because they use an aiohttp session created there.
+
+    Calls made on the background loop run directly; calls from any other
+    loop are forwarded and awaited.
+    """
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        return await get_background_loop().run_async(method(*args, **kwargs))
+    return wrapper
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+
+    @on_background_loop
+    async def where_am_i():
+        await asyncio.sleep(0.01)
+        return threading.current_thread().name
+
+    print(f"Sync caller: {get_background_loop().run(where_am_i())}")
+    print(f"Async caller: {asyncio.run(where_am_i())}")
+    get_background_loop().stop()
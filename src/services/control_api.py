@@ -0,0 +1,603 @@
+"""
+Local JSON control API for the download service.
+
+Lets scripts query and drive an unattended download service (usually the
+headless daemon) over HTTP on localhost or over a Unix socket:
+
+    GET    /api/status                     Queue summary and engine statistics
+    GET    /api/queue?offset=&limit=&state= One page of the queue
+    GET    /api/queue/<id>[?tracks=1]      One item
+    POST   /api/queue                      Add items: {"references": [...], "type": "album", "priority": "bulk"}
+    DELETE /api/queue/<id>                 Remove an item
+    POST   /api/queue/<id>/<action>        pause, resume, cancel, retry, priority ({"priority": "normal"})
+    POST   /api/actions                    Same actions for many items: {"action": "cancel", "item_ids": [...]}
+    POST   /api/retry-failed               Retry all failed items
+    GET    /api/events[?events=a,b&item_id=] Progress as server-sent events
+
+Listings come from a QueueIndex, so paging through a queue of tens of
+thousands of items never copies the queue. Every request needs an
+'Authorization: Bearer <token>' header (or a ?token= query parameter, for
+EventSource clients). On TCP a token is always required: if none is
+configured one is generated at startup and written to the token file. Only
+the owner-only Unix socket may run without one. To keep web pages out,
+request bodies must be application/json, the Host header must name the
+bound address (or an IP literal / localhost) and cross-origin requests are
+rejected.
+"""
+
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import queue
+import secrets
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Import our new system components
+import sys
+from pathlib import Path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import DownloadState, ItemPriority
+from src.services.progress_feed import ProgressFeed
+from src.services.queue_index import QueueIndex
+from src.utils.deezer_links import ITEM_TYPES, parse_reference, split_references
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 1000
+MAX_BODY_SIZE = 8 * 1024 * 1024
+ITEM_ACTIONS = ('pause', 'resume', 'cancel', 'retry', 'priority', 'remove')
+
+
+class APIError(Exception):
+    """Error answered with an HTTP status code and a JSON error body"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _SSEClient:
+    """Bounded record queue of one event stream; the oldest records are dropped when it overflows"""
+
+    def __init__(self, events: Optional[Set[str]], item_id: Optional[str], max_pending: int = 1000):
+        self.events = events
+        self.item_id = item_id
+        self.records: "queue.Queue[Dict[str, Any]]" = queue.Queue(max_pending)
+        self.dropped = 0
+
+    def offer(self, record: Dict[str, Any]):
+        """Queue a record if it matches the client's filters (any thread)"""
+        if self.events and record['event'] not in self.events:
+            return
+        if self.item_id and record.get('item_id') != self.item_id:
+            return
+        while True:
+            try:
+                self.records.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.records.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ControlAPIServer:
+    """
+    Serves the control API for a DownloadService on a background thread.
+
+    Args:
+        service: DownloadService to control
+        address: 'host:port', ':port', or a Unix socket path ('unix:/path' or any path with a '/')
+        token: Shared secret required on every request; generated for TCP if not given
+        add_workers: Threads fetching item details for POST /api/queue
+        token_file: Where a generated token is written (owner-only), so scripts can read it
+    """
+
+    def __init__(self, service, address: str = '127.0.0.1:8765', token: Optional[str] = None,
+                 add_workers: int = 4, token_file: Optional[Path] = None):
+        self.service = service
+        self.address = address
+        self.token = token or None
+        self.token_file = Path(token_file) if token_file else None
+        self.token_generated = False
+        self.index = QueueIndex(service.queue_manager, service.event_bus)
+        self.feed: Optional[ProgressFeed] = None
+
+        self._add_executor = ThreadPoolExecutor(max_workers=max(1, add_workers), thread_name_prefix="ControlAPIAdd")
+        self._clients: List[_SSEClient] = []
+        self._clients_lock = threading.Lock()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._socket_path: Optional[str] = None
+        self._stopping = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start listening"""
+        if self.is_running:
+            return
+
+        handler = self._make_handler()
+        unix_path = self._unix_socket_path(self.address)
+        if unix_path:
+            if not hasattr(socket, 'AF_UNIX'):
+                raise RuntimeError("Unix sockets are not supported on this platform")
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)  # Left over from a previous run
+            self._server = _UnixHTTPServer(unix_path, handler)
+            os.chmod(unix_path, 0o600)
+            self._socket_path = unix_path
+        else:
+            if not self.token:
+                self._generate_token()
+            host, _, port = self.address.rpartition(':')
+            self._server = ThreadingHTTPServer((host or '127.0.0.1', int(port)), handler)
+            self._server.daemon_threads = True
+
+        self._stopping.clear()
+        self.index.start()
+        self.feed = ProgressFeed(self.service, self._broadcast)
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ControlAPIServer", daemon=True)
+        self._thread.start()
+        logger.info(f"[ControlAPIServer] Listening on {self.get_url()}")
+
+    def stop(self):
+        """Stop listening and close the event streams"""
+        if not self._server:
+            return
+
+        self._stopping.set()
+        if self.feed:
+            self.feed.close()
+            self.feed = None
+        self.index.stop()
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+        self._add_executor.shutdown(wait=False, cancel_futures=True)
+
+        if self._socket_path and os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+        self._socket_path = None
+        logger.info("[ControlAPIServer] Stopped")
+
+    def get_url(self) -> str:
+        """Where the API is reachable"""
+        if self._socket_path:
+            return f"unix:{self._socket_path}"
+        if self._server:
+            host, port = self._server.server_address[:2]
+            return f"http://{host}:{port}"
+        return self.address
+
+    def _generate_token(self):
+        """Create a random token for a TCP listener and store it in the token file"""
+        self.token = secrets.token_urlsafe(32)
+        self.token_generated = True
+        if self.token_file:
+            self.token_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.token + '\n')
+            os.chmod(self.token_file, 0o600)
+            logger.info(f"[ControlAPIServer] No token configured, generated one in {self.token_file}")
+        else:
+            logger.warning("[ControlAPIServer] No token configured, generated one for this run "
+                           "(pass token_file to make it readable by clients)")
+
+    @staticmethod
+    def _unix_socket_path(address: str) -> Optional[str]:
+        """Socket path of a Unix socket address, None for host:port"""
+        if address.startswith('unix:'):
+            return os.path.expanduser(address[len('unix:'):])
+        if '/' in address or address.endswith('.sock'):
+            return os.path.expanduser(address)
+        return None
+
+    # Event streams
+
+    def _broadcast(self, record: Dict[str, Any]):
+        """Hand a progress record to every event stream (event bus threads)"""
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.offer(record)
+
+    def _add_client(self, client: _SSEClient):
+        with self._clients_lock:
+            self._clients.append(client)
+
+    def _remove_client(self, client: _SSEClient):
+        with self._clients_lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    # Requests
+
+    def check_host(self, headers) -> bool:
+        """
+        Validate the Host and Origin headers of a TCP request.
+
+        Host must carry the bound port and name the bound host, localhost or
+        an IP literal; names that a web page could re-point at this machine
+        (DNS rebinding) are rejected. An Origin header must match the Host.
+        """
+        if self._socket_path or not self._server:
+            return True
+        host_header = headers.get('Host', '')
+        if not host_header:
+            return False
+        hostname, _, port = host_header.rpartition(':')
+        if not hostname or ']' in port:
+            hostname, port = host_header, '80'  # No port, or a bare IPv6 literal
+        hostname = hostname.strip('[]').lower()
+
+        bound_host, bound_port = self._server.server_address[:2]
+        if port != str(bound_port):
+            return False
+        configured_host = self.address.rpartition(':')[0].strip('[]').lower()
+        if hostname not in ('localhost', str(bound_host).lower(), configured_host):
+            try:
+                ipaddress.ip_address(hostname)
+            except ValueError:
+                return False
+
+        origin = headers.get('Origin')
+        if origin and origin.lower() != f"http://{host_header.lower()}":
+            return False
+        return True
+
+    def check_token(self, headers, query: Dict[str, List[str]]) -> bool:
+        """Validate the shared secret of a request"""
+        if not self.token:
+            return True
+        supplied = headers.get('Authorization', '')
+        if supplied.startswith('Bearer '):
+            supplied = supplied[len('Bearer '):]
+        else:
+            supplied = query.get('token', [''])[0]
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    def get_status(self) -> Dict[str, Any]:
+        """Queue summary and engine statistics"""
+        return {
+            'queue': self.index.counts(),
+            'total': len(self.index),
+            'active': self.service.get_active_downloads(),
+            'engine': self.service.get_download_statistics(),
+            'event_streams': len(self._clients),
+        }
+
+    def list_queue(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """One page of the queue"""
+        offset = self._int_param(query, 'offset', 0)
+        limit = min(self._int_param(query, 'limit', 50), MAX_PAGE_SIZE)
+        state = None
+        if query.get('state'):
+            try:
+                state = DownloadState(query['state'][0])
+            except ValueError:
+                raise APIError(400, f"Unknown state: {query['state'][0]}")
+
+        item_ids, total = self.index.page(offset, limit, state)
+        items = [entry for entry in (self.describe_item(item_id) for item_id in item_ids) if entry]
+        return {
+            'items': items,
+            'offset': offset,
+            'limit': limit,
+            'total': total,
+            'has_more': offset + len(item_ids) < total,
+        }
+
+    def describe_item(self, item_id: str, include_tracks: bool = False) -> Optional[Dict[str, Any]]:
+        """JSON view of an item and its state"""
+        item = self.service.get_queue_item(item_id)
+        state = self.service.get_queue_state(item_id)
+        if not item or not state:
+            return None
+
+        entry = {
+            'id': item.id,
+            'type': item.item_type.value,
+            'deezer_id': item.deezer_id,
+            'title': item.title,
+            'artist': item.artist,
+            'total_tracks': item.total_tracks,
+            'created_at': item.created_at.isoformat(),
+        }
+        entry.update(state.to_dict())
+        del entry['item_id']
+        if include_tracks:
+            entry['tracks'] = [track.to_dict() for track in item.tracks]
+        return entry
+
+    def add_items(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add albums, playlists and tracks.
+
+        The body holds 'references' (URLs, 'type:id' or bare IDs, also as
+        comma separated strings) and/or 'items' ([{"type": ..., "id": ...}]),
+        plus optional 'type' for bare IDs and 'priority' for all of them.
+        Item details are fetched concurrently.
+        """
+        default_type = body.get('type', 'album')
+        if default_type not in ITEM_TYPES:
+            raise APIError(400, f"Unknown item type: {default_type}")
+        priority = self._parse_priority(body['priority']) if body.get('priority') else None
+
+        references = body.get('references', [])
+        if isinstance(references, str):
+            references = [references]
+        jobs: List[Tuple[str, Optional[Tuple[str, int]]]] = [
+            (text, parse_reference(text, default_type)) for text in split_references(references)
+        ]
+        for entry in body.get('items', []):
+            try:
+                item_type, deezer_id = entry['type'], int(entry['id'])
+            except (KeyError, TypeError, ValueError):
+                jobs.append((json.dumps(entry), None))
+                continue
+            jobs.append((f"{item_type}:{deezer_id}", (item_type, deezer_id) if item_type in ITEM_TYPES else None))
+
+        def add(job):
+            text, reference = job
+            if not reference:
+                return {'reference': text, 'status': 'invalid'}
+            item_type, deezer_id = reference
+            try:
+                item_id = self.service.download_item(item_type, deezer_id, priority)
+            except Exception as e:
+                return {'reference': text, 'type': item_type, 'deezer_id': deezer_id, 'status': 'error', 'error': str(e)}
+            status = 'added' if item_id else 'duplicate'
+            return {'reference': text, 'type': item_type, 'deezer_id': deezer_id, 'status': status, 'item_id': item_id}
+
+        results = list(self._add_executor.map(add, jobs))
+        return {
+            'added': sum(1 for result in results if result['status'] == 'added'),
+            'results': results,
+        }
+
+    def apply_action(self, action: str, item_id: str, body: Dict[str, Any]) -> bool:
+        """Run an item action. Returns False if it did not apply to the item."""
+        service = self.service
+        state = service.get_queue_state(item_id)
+        if state is None:
+            return False
+
+        if action == 'pause':
+            if item_id in service.get_active_downloads():
+                return service.pause_download(item_id)
+            if state.state == DownloadState.QUEUED:
+                # Parked until resumed; the scheduler only starts QUEUED items
+                service.queue_manager.update_state(item_id, state=DownloadState.PAUSED)
+                return True
+            return False
+        if action == 'resume':
+            if item_id in service.get_active_downloads():
+                return service.resume_download(item_id)
+            if state.state == DownloadState.PAUSED:
+                service.queue_manager.update_state(item_id, state=DownloadState.QUEUED)
+                return True
+            return False
+        if action == 'cancel':
+            if item_id in service.get_active_downloads():
+                return service.cancel_download(item_id)
+            if state.state in (DownloadState.QUEUED, DownloadState.PAUSED):
+                service.queue_manager.update_state(item_id, state=DownloadState.CANCELLED)
+                return True
+            return False
+        if action == 'retry':
+            return service.retry_item(item_id, body.get('quality'))
+        if action == 'priority':
+            return service.set_item_priority(item_id, self._parse_priority(body.get('priority')))
+        if action == 'remove':
+            if item_id in service.get_active_downloads():
+                service.cancel_download(item_id)
+            return service.remove_item(item_id)
+        raise APIError(404, f"Unknown action: {action}")
+
+    def apply_bulk_action(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one action on many items"""
+        action = body.get('action')
+        if action not in ITEM_ACTIONS:
+            raise APIError(400, f"Unknown action: {action}")
+        if action == 'priority':
+            self._parse_priority(body.get('priority'))  # Fail before touching any item
+
+        item_ids = body.get('item_ids') or []
+        if body.get('state'):
+            try:
+                state = DownloadState(body['state'])
+            except ValueError:
+                raise APIError(400, f"Unknown state: {body['state']}")
+            item_ids = list(item_ids) + self.index.page(0, len(self.index), state)[0]
+
+        applied = [item_id for item_id in item_ids if self.apply_action(action, item_id, body)]
+        return {'action': action, 'applied': len(applied), 'skipped': len(item_ids) - len(applied)}
+
+    @staticmethod
+    def _parse_priority(name) -> ItemPriority:
+        try:
+            return ItemPriority[str(name).upper()]
+        except KeyError:
+            raise APIError(400, f"Unknown priority: {name} (use {', '.join(p.name.lower() for p in ItemPriority)})")
+
+    @staticmethod
+    def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+        try:
+            return max(0, int(query.get(name, [default])[0]))
+        except ValueError:
+            raise APIError(400, f"'{name}' must be an integer")
+
+    def _make_handler(self):
+        """Request handler class bound to this server"""
+        api = self
+
+        class Handler(_ControlAPIHandler):
+            server_api = api
+
+        return Handler
+
+
+class _ControlAPIHandler(BaseHTTPRequestHandler):
+    """Routes control API requests to the ControlAPIServer"""
+
+    server_api: ControlAPIServer = None
+    protocol_version = 'HTTP/1.1'
+    server_version = 'DeeMusicControlAPI/1.0'
+
+    def log_message(self, format, *args):
+        logger.debug(f"[ControlAPIServer] {format % args}")
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split('/') if part]
+        api = self.server_api
+
+        try:
+            if not api.check_host(self.headers):
+                raise APIError(403, "Host or origin not allowed")
+            if not api.check_token(self.headers, query):
+                raise APIError(401, "Missing or invalid token")
+            if parts[:1] != ['api']:
+                raise APIError(404, "Not found")
+            route = parts[1:]
+
+            if method == 'GET' and route == ['events']:
+                self._stream_events(query)
+                return
+
+            if method == 'GET' and route == ['status']:
+                result = api.get_status()
+            elif method == 'GET' and route == ['queue']:
+                result = api.list_queue(query)
+            elif method == 'GET' and len(route) == 2 and route[0] == 'queue':
+                result = api.describe_item(route[1], include_tracks=query.get('tracks', ['0'])[0] in ('1', 'true'))
+                if result is None:
+                    raise APIError(404, f"Unknown item: {route[1]}")
+            elif method == 'POST' and route == ['queue']:
+                result = api.add_items(self._read_body())
+            elif method == 'POST' and len(route) == 3 and route[0] == 'queue':
+                if route[2] not in ITEM_ACTIONS:
+                    raise APIError(404, f"Unknown action: {route[2]}")
+                if api.service.get_queue_state(route[1]) is None:
+                    raise APIError(404, f"Unknown item: {route[1]}")
+                result = {'applied': api.apply_action(route[2], route[1], self._read_body())}
+            elif method == 'DELETE' and len(route) == 2 and route[0] == 'queue':
+                if api.service.get_queue_state(route[1]) is None:
+                    raise APIError(404, f"Unknown item: {route[1]}")
+                result = {'applied': api.apply_action('remove', route[1], {})}
+            elif method == 'POST' and route == ['actions']:
+                result = api.apply_bulk_action(self._read_body())
+            elif method == 'POST' and route == ['retry-failed']:
+                result = {'retried': api.service.retry_failed(self._read_body().get('quality'))}
+            else:
+                raise APIError(404, "Not found")
+
+            self._send_json(200, result)
+
+        except APIError as e:
+            self._send_json(e.status, {'error': str(e)})
+        except Exception as e:
+            logger.error(f"[ControlAPIServer] Error handling {method} {self.path}: {e}", exc_info=True)
+            self._send_json(500, {'error': str(e)})
+
+    def _read_body(self) -> Dict[str, Any]:
+        """Parse the JSON request body (empty bodies are {})"""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            raise APIError(413, "Request body too large")
+        # Browsers only send cross-origin requests without a preflight for
+        # form and text/plain bodies, so anything but JSON is refused
+        content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+        if (length or content_type) and content_type != 'application/json':
+            raise APIError(415, "Content-Type must be application/json")
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise APIError(400, f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise APIError(400, "Request body must be a JSON object")
+        return body
+
+    def _send_json(self, status: int, payload: Any):
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _stream_events(self, query: Dict[str, List[str]]):
+        """Send progress records as server-sent events until the client goes away"""
+        api = self.server_api
+        events = {name for value in query.get('events', []) for name in value.split(',') if name}
+        client = _SSEClient(events or None, query.get('item_id', [None])[0])
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        api._add_client(client)
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while not api._stopping.is_set():
+                try:
+                    record = client.records.get(timeout=15)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+                data = json.dumps(record, ensure_ascii=False, default=str)
+                self.wfile.write(f"event: {record['event']}\ndata: {data}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            api._remove_client(client)
+            if client.dropped:
+                logger.info(f"[ControlAPIServer] Event stream closed, {client.dropped} records were dropped for a slow client")
@@ -7,35 +7,52 @@ import requests
 import aiohttp
 import asyncio
 import time
-import threading
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import deezer  # Import the deezer-python module correctly
 from pathlib import Path
 from yarl import URL
 from src.config_manager import ConfigManager
+from src.models.artist_snapshot import ArtistSnapshot
+from src.services.background_loop import get_background_loop, on_background_loop
+from src.services.api_cache import ApiResponseCache, cached_response, get_api_cache, response_cache_key
+from src.services.single_flight import SingleFlight, make_key, single_flight
+from src.services.paginator import RateLimiter, collect_pages, paginate
 import random
 
 logger = logging.getLogger(__name__)
 
 class DeezerAPI:
-    """Service for interacting with the Deezer API."""
+    """Service for interacting with the Deezer API.
+    
+    All requests go through one async core running on the shared background
+    event loop: one aiohttp session (connection pool, proxy, ARL cookie), one
+    set of tokens and one cache. Public async methods can be awaited from any
+    event loop, and the ``*_sync`` methods are thin wrappers that run the same
+    coroutines for worker threads.
+    """
     
     # API Base URLs
     PUBLIC_API_BASE = "https://api.deezer.com"
     PRIVATE_API_BASE = "https://www.deezer.com/ajax/gw-light.php"
+    MEDIA_API_URL = "https://media.deezer.com/v1/get_url"
+    
+    # Items per request when paginating public list endpoints
+    LIST_PAGE_SIZE = 100
+    
+    # Client addresses sent with lyrics requests for US region availability
+    US_REGION_IPS = ['173.252.74.22', '142.250.191.14', '23.185.0.2', '151.101.193.140']
     
     # Cache settings
     CACHE_DIR = Path.home() / ".config" / "deemusic" / "cache"
-    CACHE_DURATION = 86400  # 24 hours
+    _legacy_cache_checked = False
     
     def __init__(self, config: ConfigManager, loop: asyncio.AbstractEventLoop = None):
         """Initialize the DeezerAPI service."""
         self.config = config
-        # Store the passed loop, MUST exist for threadsafe calls
+        # The caller's (UI) loop; requests themselves run on the background loop
         self.loop = loop 
         if not self.loop:
-            # This should ideally not happen if called correctly from MainWindow
-            logger.warning("DeezerAPI initialized without an explicit event loop. Trying to get current.")
+            logger.debug("DeezerAPI initialized without an explicit event loop. Trying to get current.")
             try:
                 self.loop = asyncio.get_event_loop()
             except RuntimeError:
@@ -54,11 +71,16 @@ class DeezerAPI:
         self.token_created_at = None  # Track when token was created
         self.token_refresh_interval = 300  # Refresh every 5 minutes (more conservative for download stability)
         # Simplified token management - no complex error tracking
-        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._proxy_url: Optional[str] = None  # Store proxy URL for requests
-        self.sync_session = None  # Initialize persistent sync session
-        self._token_refresh_lock = threading.RLock()  # Thread-safe token refresh
-        self._session_lock = threading.RLock()  # Thread-safe session management
+        self.cache = self._create_cache()  # Memory LRU + SQLite response cache
+        # Identical requests in flight at the same time share one (core loop only)
+        self._flights = SingleFlight(on_coalesced=lambda key: self.cache.add_counter('coalesced'))
+        self._proxy_url: Optional[str] = self._build_proxy_url()  # Proxy for API requests
+        # Paginated list requests share one rate limit (Deezer allows 50 per 5 s)
+        self._list_limiter = RateLimiter(max_calls=config.get_setting('deezer.list_requests_per_5s', 50), period=5.0)
+        self._page_concurrency = max(1, int(config.get_setting('deezer.pagination_concurrency', 4)))
+        self._enrich_concurrency = max(1, int(config.get_setting('deezer.enrich_concurrency', 8)))
+        self._core = get_background_loop()  # Loop owning the session and tokens
+        self._token_lock: Optional[asyncio.Lock] = None  # Created on the background loop
         
         # CSRF retry tracking - initialize missing attributes
         self.csrf_retry_count = 0
@@ -99,14 +121,15 @@ class DeezerAPI:
         # Check if tokens need proactive refresh
         if self._should_refresh_tokens():
             logger.info("Tokens are old, proactively refreshing...")
-            await self._get_tokens()
+            await self._refresh_tokens()
         elif not self.api_token or not self.csrf_token: # Or just self.user_id if that's a good proxy
             logger.debug("API token or CSRF token missing, attempting to fetch tokens.")
-            if not await self._get_tokens():
+            if not await self._refresh_tokens():
                 logger.error("Failed to get tokens in _ensure_session_and_tokens.")
                 return False
         return True
 
+    @on_background_loop
     async def initialize(self) -> bool:
         """Initialize the API service (setting basic state)."""
         if self.initialized:
@@ -124,6 +147,7 @@ class DeezerAPI:
             logger.error(f"Error during basic API init: {e}")
             return False
             
+    @on_background_loop
     async def close(self) -> None:
         """Close the API service's session if it exists."""
         if self.session and not self.session.closed:
@@ -132,16 +156,20 @@ class DeezerAPI:
         self.session = None
         self.initialized = False
             
-    async def _get_session(self) -> Optional[aiohttp.ClientSession]:
-        """Get the existing session or create a new one on demand."""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the existing session or create a new one on demand.
+        
+        The session lives on the shared background loop, so this must only be
+        awaited from methods running there (see on_background_loop). The
+        proxy is passed on each request (the ClientSession proxy argument
+        needs aiohttp 3.11).
+        
+        Raises:
+            RuntimeError: If the session can't be created
+        """
         if self.session and not self.session.closed:
             return self.session
 
-        # Create session if it doesn't exist or is closed
-        if not self.loop:
-            logger.error("Cannot create session: DeezerAPI has no event loop instance.")
-            return None
-
         try:
             # Create session with timeout and connector settings
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
@@ -154,26 +182,20 @@ class DeezerAPI:
                 enable_cleanup_closed=True
             )
 
-            # Create session with additional error handling
-            try:
-                self.session = aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout,
-                    loop=self.loop,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                    }
-                )
-            except RuntimeError as e:
-                if "Event loop is closed" in str(e):
-                    logger.error(f"Cannot create session due to event loop issues: {e}")
-                    return None
-                raise
+            # Brotli ('br') is left out: without the brotli package responses
+            # could not be decoded
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'DNT': '1',
+                    'Connection': 'keep-alive',
+                    'Upgrade-Insecure-Requests': '1',
+                }
+            )
 
             # If ARL exists, set the cookie on the new session
             if self.arl:
@@ -181,11 +203,11 @@ class DeezerAPI:
 
             return self.session
         except Exception as e:
+            # A session that can't be built is a setup error (e.g. an aiohttp
+            # incompatibility), not a failed request - don't hide it as None
             logger.error(f"Failed to create aiohttp ClientSession: {e}")
-            self.session = None # Ensure session is None if creation fails
-            # Add a small delay to prevent rapid recreation attempts
-            await asyncio.sleep(0.1)
-            return None
+            self.session = None
+            raise RuntimeError(f"Could not create the HTTP session for the Deezer API: {e}") from e
 
     async def _set_cookie(self) -> None:
         """Set the ARL cookie for Deezer authentication."""
@@ -209,6 +231,7 @@ class DeezerAPI:
         self.session.cookie_jar.update_cookies(cookies, URL('https://www.deezer.com'))
         logger.debug("ARL cookie set on session")
         
+    @on_background_loop
     async def ensure_session_ready(self) -> bool:
         """Ensure the session is ready for API calls. Returns True if ready, False otherwise."""
         try:
@@ -222,19 +245,185 @@ class DeezerAPI:
             logger.error(f"Error ensuring session ready: {e}")
             return False
         
-    async def _make_request(self, method: str, url: str, **kwargs):
-        """Make HTTP request with proxy support if configured."""
+    async def _private_request(self, method: str, params: Dict, json_data: Optional[Dict] = None,
+                               headers: Optional[Dict] = None) -> Optional[Dict]:
+        """Call the private gw-light API and return the decoded JSON body.
+        
+        Args:
+            method (str): HTTP method, 'GET' or 'POST'
+            params (Dict): Query parameters (API method, token, ...)
+            json_data (Optional[Dict]): JSON body for POST requests
+            headers (Optional[Dict]): Extra request headers
+            
+        Returns:
+            Optional[Dict]: Response data or None on HTTP/network errors
+        """
+        key = make_key('private', method, params, json_data, headers)
+        if key is None:
+            return await self._send_private_request(method, params, json_data, headers)
+        return await self._flights.run(key, lambda: self._send_private_request(method, params, json_data, headers))
+
+    async def _send_private_request(self, method: str, params: Dict, json_data: Optional[Dict] = None,
+                                    headers: Optional[Dict] = None) -> Optional[Dict]:
+        """Send one gw-light API request (see _private_request)."""
         session = await self._get_session()
         if not session:
             return None
+
+        try:
+            async with session.request(method, self.PRIVATE_API_BASE, params=params,
+                                       json=json_data, headers=headers, proxy=self._proxy_url) as response:
+                if response.status != 200:
+                    logger.error(f"Private API {params.get('method')} failed: HTTP {response.status}")
+                    return None
+                data = await response.json(content_type=None)
+                if data is None:
+                    logger.error(f"Private API {params.get('method')} returned an empty or non-JSON body")
+                return data
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"Private API {params.get('method')} request error: {e}")
+            return None
+
+    async def _fetch_list_page(self, path: str, index: int, limit: int, params: Optional[Dict] = None,
+                               endpoint: Optional[str] = None) -> Tuple[Optional[List[Dict]], Optional[int]]:
+        """Fetch one page of a public list endpoint.
+        
+        Args:
+            path (str): Endpoint path, e.g. '/album/302127/tracks'
+            index (int): Index of the first item
+            limit (int): Number of items to request
+            params (Optional[Dict]): Extra query parameters (e.g. the search query)
+            endpoint (Optional[str]): Cache TTL class; pages are only cached if set
+            
+        Returns:
+            Tuple[Optional[List[Dict]], Optional[int]]: The page items (None on
+            error) and the total reported by the API (None if missing)
+        """
+        query = dict(params or {}, limit=limit, index=index)
+        cache_key = None
+        if endpoint:
+            cache_key = "list" + path.replace('/', '_') + "".join(f"_{k}{v}" for k, v in sorted(query.items()))
+            cached = self._load_from_cache(cache_key)
+            if isinstance(cached, dict) and isinstance(cached.get('data'), list):
+                return cached['data'], cached.get('total')
+
+        session = await self._get_session()
+        if not session:
+            return None, None
+
+        try:
+            async with session.get(f"{self.PUBLIC_API_BASE}{path}", params=query, proxy=self._proxy_url) as response:
+                if response.status != 200:
+                    logger.error(f"[DeezerAPI] List request {path} (index {index}) failed: HTTP {response.status}")
+                    return None, None
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"[DeezerAPI] List request {path} (index {index}) error: {e}")
+            return None, None
+
+        if not isinstance(data, dict) or 'error' in data or not isinstance(data.get('data'), list):
+            logger.error(f"[DeezerAPI] Invalid list response for {path} (index {index}): {str(data)[:200]}")
+            return None, None
+
+        if cache_key:
+            self._save_to_cache(cache_key, data, endpoint=endpoint)
+        return data['data'], data.get('total')
+
+    def iter_list_pages(self, path: str, params: Optional[Dict] = None, start: int = 0,
+                        max_items: Optional[int] = None, page_size: Optional[int] = None,
+                        endpoint: Optional[str] = None):
+        """Stream the pages of a public list endpoint in order.
+        
+        The first page reveals the total, the remaining pages are fetched
+        concurrently under the shared list rate limit. Must be iterated on the
+        background loop (i.e. from methods decorated with on_background_loop).
+        
+        Args:
+            path (str): Endpoint path, e.g. '/playlist/908622995/tracks'
+            params (Optional[Dict]): Extra query parameters
+            start (int): Index of the first item
+            max_items (Optional[int]): Stop after this many items (None for all)
+            page_size (Optional[int]): Items per request (default LIST_PAGE_SIZE)
+            endpoint (Optional[str]): Cache TTL class of the pages, None to not cache them
             
-        # Add proxy to request if configured
-        if hasattr(self, '_proxy_url') and self._proxy_url:
-            kwargs['proxy'] = self._proxy_url
+        Returns:
+            AsyncIterator[List[Dict]]: The pages
+        """
+        async def fetch_page(index: int, limit: int):
+            return await self._fetch_list_page(path, index, limit, params=params, endpoint=endpoint)
+
+        return paginate(fetch_page, page_size=page_size or self.LIST_PAGE_SIZE, start=start,
+                        max_items=max_items, concurrency=self._page_concurrency,
+                        limiter=self._list_limiter)
+
+    async def _get_list_all(self, path: str, params: Optional[Dict] = None, start: int = 0,
+                            max_items: Optional[int] = None, page_size: Optional[int] = None,
+                            endpoint: Optional[str] = None, dedupe_key: Optional[str] = 'id') -> List[Dict]:
+        """Collect every page of a public list endpoint (see iter_list_pages).
+        
+        Returns:
+            List[Dict]: The items in order, de-duplicated by dedupe_key
+        """
+        pages = self.iter_list_pages(path, params=params, start=start, max_items=max_items,
+                                     page_size=page_size, endpoint=endpoint)
+        return await collect_pages(pages, dedupe_key=dedupe_key)
+
+    async def _refresh_tokens(self) -> bool:
+        """Refresh the API tokens, once for all callers waiting at the same time.
+        
+        Returns:
+            bool: True if valid tokens are available afterwards
+        """
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        created_at = self.token_created_at
+        async with self._token_lock:
+            if self.api_token and self.token_created_at != created_at:
+                # Another caller refreshed the tokens while we were waiting
+                return True
+            return await self._get_tokens()
+
+    def _run_sync(self, coro, default: Any = None, timeout: Optional[float] = 120) -> Any:
+        """Run a coroutine of the async core from a synchronous caller.
+        
+        Args:
+            coro: Coroutine to run on the shared background loop
+            default: Returned if the coroutine raises or times out
+            timeout (Optional[float]): Seconds to wait for the result
             
-        # Make the request
-        async with session.request(method, url, **kwargs) as response:
-            return response
+        Returns:
+            The coroutine's result, or default on error
+        """
+        try:
+            return self._core.run(coro, timeout)
+        except Exception as e:
+            logger.error(f"Error running {getattr(coro, '__qualname__', coro)} synchronously: {e}")
+            return default
+
+    def _build_proxy_url(self) -> Optional[str]:
+        """Build the proxy URL for API requests from the network.proxy setting."""
+        proxy_config = self.config.get_setting('network.proxy', {}) or {}
+        if not (proxy_config.get('enabled', False) and proxy_config.get('use_for_api', True)):
+            return None
+
+        proxy_host = proxy_config.get('host', '')
+        proxy_port = proxy_config.get('port', '')
+        proxy_type = proxy_config.get('type', 'http')
+        proxy_username = proxy_config.get('username', '')
+        proxy_password = proxy_config.get('password', '')
+
+        if not (proxy_host and proxy_port):
+            logger.warning("Proxy enabled but host/port not configured properly")
+            return None
+        if proxy_type not in ('http', 'https'):
+            logger.warning(f"Proxy type '{proxy_type}' is not supported for API requests, connecting directly")
+            return None
+
+        logger.info(f"Using proxy for API requests: {proxy_type}://{proxy_host}:{proxy_port}")
+        if proxy_username and proxy_password:
+            return f"{proxy_type}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
+        return f"{proxy_type}://{proxy_host}:{proxy_port}"
 
     async def _get_tokens(self) -> bool:
         """Get API tokens from Deezer (Requires session)."""
@@ -246,19 +435,9 @@ class DeezerAPI:
                 'api_token': ''
             }
             
-            # Use proxy-aware request method
-            response = await self._make_request('GET', self.PRIVATE_API_BASE, params=params)
-            if not response:
-                logger.error("Failed to create session for token request")
-                return False
-                
-            if response.status != 200:
-                logger.error(f"Failed to get tokens: HTTP {response.status}")
-                return False
-                
-            data = await response.json()
+            data = await self._private_request('GET', params)
             if data is None:
-                logger.error("Token response body was empty or non-JSON")
+                logger.error("Failed to get tokens")
                 return False
                 
             if (data.get('error') and len(data['error']) > 0) or 'results' not in data:
@@ -276,15 +455,18 @@ class DeezerAPI:
             user_dict = result.get('USER')
             self.user_id = user_dict.get('USER_ID', None) if isinstance(user_dict, dict) else None
             
-            # Get license token
-            await self._get_license_token()
+            # The same response carries the license token needed for downloads
+            options_dict = user_dict.get('OPTIONS') if isinstance(user_dict, dict) else None
+            license_token = options_dict.get('license_token', '') if isinstance(options_dict, dict) else ''
+            if license_token:
+                self.license_token = license_token
+            else:
+                await self._get_license_token()
             
             # Track when tokens were created and reset error count
-            current_time = time.time()
-            self.token_created_at = current_time
+            self.token_created_at = time.time()
             # Reset CSRF retry counter on successful token creation
             self.csrf_retry_count = 0
-            # Token created successfully
             
             return bool(self.api_token and self.csrf_token)
                 
@@ -293,6 +475,7 @@ class DeezerAPI:
             # Token refresh failed
             return False
             
+
     async def _get_license_token(self) -> Optional[str]:
         """Get Deezer license token required for downloads.
         
@@ -313,7 +496,7 @@ class DeezerAPI:
                 'api_token': self.api_token or ''
             }
             
-            async with session.get(self.PRIVATE_API_BASE, params=params) as response:
+            async with session.get(self.PRIVATE_API_BASE, params=params, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     return None
                     
@@ -350,10 +533,10 @@ class DeezerAPI:
         if not session: return None
         # Ensure tokens/user_id are fetched first
         if not self.user_id:
-             if not await self._get_tokens(): return None # Propagate failure
+             if not await self._refresh_tokens(): return None # Propagate failure
         if not self.user_id: return None # Check again
         try:
-            async with session.get(f"{self.PUBLIC_API_BASE}/user/{self.user_id}") as response:
+            async with session.get(f"{self.PUBLIC_API_BASE}/user/{self.user_id}", proxy=self._proxy_url) as response:
                 if response.status != 200:
                     return None
                     
@@ -368,6 +551,7 @@ class DeezerAPI:
             logger.error(f"Error getting user info: {e}")
             return None
             
+    @on_background_loop
     async def login_via_arl(self, arl_token: str) -> bool:
         """Login to Deezer using ARL token.
         
@@ -380,14 +564,14 @@ class DeezerAPI:
         self.arl = arl_token
         self.config.set_setting('deezer.arl', arl_token)
         
-        # Reset session with proper locking to prevent race conditions
-        async with self._session_lock:
-            if self.session:
-                await self.session.close()
-                self.session = None
+        # Start over with a fresh session carrying the new cookie; the session
+        # is only touched from the background loop so no lock is needed
+        if self.session:
+            await self.session.close()
+            self.session = None
         
         # Get tokens (will call _get_session)
-        if not await self._get_tokens(): return False
+        if not await self._refresh_tokens(): return False
         
         # Get user info (will call _get_session indirectly)
         user_info = await self._get_user_info()
@@ -399,35 +583,25 @@ class DeezerAPI:
         self.initialized = True
         return True
         
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for a key.
-        
-        Args:
-            key (str): Cache key
-            
-        Returns:
-            Path: Path to cache file
-        """
-        # Create a safe filename from the key
-        safe_key = "".join(c if c.isalnum() else "_" for c in key)
-        return self.CACHE_DIR / f"{safe_key}.json"
-        
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if cache is valid and not expired.
+
+    def _create_cache(self) -> ApiResponseCache:
+        """Create (or reuse) the tiered response cache from the cache.* settings.
         
-        Args:
-            cache_path (Path): Path to cache file
-            
         Returns:
-            bool: True if cache is valid, False otherwise
+            ApiResponseCache: Shared cache in CACHE_DIR
         """
-        if not cache_path.exists():
-            return False
-            
-        # Check if cache is expired
-        modified_time = cache_path.stat().st_mtime
-        current_time = time.time()
-        return (current_time - modified_time) < self.CACHE_DURATION
+        ttls = self.config.get_setting('cache.ttl', {}) or {}
+        cache = get_api_cache(
+            self.CACHE_DIR,
+            memory_bytes=int(self.config.get_setting('cache.memory_mb', 32)) * 1024 * 1024,
+            disk_bytes=int(self.config.get_setting('cache.disk_mb', 256)) * 1024 * 1024,
+            ttls={endpoint: int(seconds) for endpoint, seconds in ttls.items()}
+        )
+        if not DeezerAPI._legacy_cache_checked:
+            # The cache used to be one JSON file per key in the same directory
+            DeezerAPI._legacy_cache_checked = True
+            cache.remove_legacy_files(self.CACHE_DIR)
+        return cache
         
     def _load_from_cache(self, key: str) -> Optional[Dict]:
         """Load data from cache.
@@ -436,32 +610,55 @@ class DeezerAPI:
             key (str): Cache key
             
         Returns:
-            Optional[Dict]: Cached data or None if not available
+            Optional[Dict]: Cached data or None if not available or expired
         """
-        cache_path = self._get_cache_path(key)
-        if not self._is_cache_valid(cache_path):
-            return None
+        return self.cache.get(key)
             
-        try:
-            with open(cache_path, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return None
-            
-    def _save_to_cache(self, key: str, data: Dict) -> None:
+    def _save_to_cache(self, key: str, data: Dict, endpoint: Optional[str] = None) -> None:
         """Save data to cache.
         
         Args:
             key (str): Cache key
             data (Dict): Data to cache
+            endpoint (Optional[str]): Endpoint name selecting the TTL (see api_cache.DEFAULT_TTLS)
         """
-        cache_path = self._get_cache_path(key)
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(data, f)
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        self.cache.set(key, data, endpoint=endpoint)
+    
+    def peek_cached_response(self, api_call, *args, **kwargs) -> Tuple[Optional[Any], bool]:
+        """Get the last cached result of a @cached_response method without a request.
+        
+        Expired results are returned too, so callers can show them right away
+        and refresh in the background (stale-while-revalidate).
+        
+        Args:
+            api_call: The method, e.g. self.get_chart_albums
+            *args, **kwargs: The arguments it would be called with
             
+        Returns:
+            Tuple[Optional[Any], bool]: (cached result or None, True if it has expired)
+        """
+        try:
+            key = response_cache_key(api_call, *args, **kwargs)
+        except TypeError as e:
+            logger.error(f"Cannot build cache key for {getattr(api_call, '__name__', api_call)}: {e}")
+            return None, False
+        return self.cache.get_with_age(key, allow_stale=True)
+    
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """Get response cache hit/miss counters, sizes and lookup latency.
+        
+        Returns:
+            Dict[str, Any]: Cache statistics, including the number of requests
+            that joined an identical request in flight ('coalesced')
+        """
+        stats = self.cache.get_statistics()
+        stats.setdefault('coalesced', 0)
+        stats['requests_started'] = self._flights.started
+        stats['requests_in_flight'] = self._flights.in_flight()
+        return stats
+            
+    @on_background_loop
+    @single_flight
     async def get_track(self, track_id: int) -> Optional[Dict]:
         """Get track information from the Deezer API.
         
@@ -480,7 +677,7 @@ class DeezerAPI:
         session = await self._get_session()
         if not session: return None
         try:
-            async with session.get(f"{self.PUBLIC_API_BASE}/track/{track_id}") as response:
+            async with session.get(f"{self.PUBLIC_API_BASE}/track/{track_id}", proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get track {track_id}: HTTP {response.status}")
                     return None
@@ -491,13 +688,15 @@ class DeezerAPI:
                     return None
                     
                 # Cache the result
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='track')
                 return data
                 
         except Exception as e:
             logger.error(f"Error getting track {track_id}: {e}")
             return None
             
+    @on_background_loop
+    @single_flight
     async def get_album(self, album_id: int) -> Optional[Dict]:
         """Get album information from the Deezer API.
         
@@ -516,7 +715,7 @@ class DeezerAPI:
         session = await self._get_session()
         if not session: return None
         try:
-            async with session.get(f"{self.PUBLIC_API_BASE}/album/{album_id}") as response:
+            async with session.get(f"{self.PUBLIC_API_BASE}/album/{album_id}", proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get album {album_id}: HTTP {response.status}")
                     return None
@@ -527,13 +726,15 @@ class DeezerAPI:
                     return None
                     
                 # Cache the result
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='album')
                 return data
                 
         except Exception as e:
             logger.error(f"Error getting album {album_id}: {e}")
             return None
             
+    @on_background_loop
+    @single_flight
     async def search(self, query: str, search_type: Optional[str] = None, limit: int = 20) -> List[Dict]:
         """Search Deezer using the public API.
 
@@ -568,7 +769,7 @@ class DeezerAPI:
             loop_state = f"running={session.loop.is_running() if session.loop else 'N/A'}"
             logger.debug(f"Using session: {session} on loop: {getattr(session, 'loop', 'N/A')} ({loop_state})")
 
-            async with session.get(endpoint, params=params) as response:
+            async with session.get(endpoint, params=params, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Search failed: HTTP {response.status} - {await response.text()}")
                     return []
@@ -589,13 +790,16 @@ class DeezerAPI:
                 else: # Existing logic for when search_type is specified
                     results = data.get('data', [])
                 
-                self._save_to_cache(cache_key, results) # Caches the list of items
+                self._save_to_cache(cache_key, results, endpoint='search') # Caches the list of items
                 return results
 
         except Exception as e:
             logger.error(f"Error during search: {e}", exc_info=True)
             return []
 
+    @on_background_loop
+    @cached_response('chart')
+    @single_flight
     async def get_chart_playlists(self, limit: int = 10) -> Optional[List[Dict]]:
         """
         Get the global chart playlists.
@@ -625,7 +829,7 @@ class DeezerAPI:
             if not fresh_session or fresh_session.closed:
                 logger.error("Cannot get fresh session for chart playlists fetch")
                 return None
-            async with fresh_session.get(request_url) as response:
+            async with fresh_session.get(request_url, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get chart playlists: HTTP {response.status} - {await response.text()}")
                     return None
@@ -664,6 +868,9 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching chart playlists: {e}")
             return None
 
+    @on_background_loop
+    @cached_response('chart')
+    @single_flight
     async def get_chart_artists(self, limit: int = 10) -> Optional[List[Dict]]:
         """
         Get the global chart artists.
@@ -684,7 +891,7 @@ class DeezerAPI:
         try:
             logger.info(f"Fetching chart artists from: {request_url}")
             # Use the validated session directly
-            async with session.get(request_url) as response:
+            async with session.get(request_url, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get chart artists: HTTP {response.status} - {await response.text()}")
                     return None
@@ -722,6 +929,9 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching chart artists: {e}")
             return None
 
+    @on_background_loop
+    @cached_response('chart')
+    @single_flight
     async def get_chart_albums(self, limit: int = 10) -> Optional[List[Dict]]:
         """
         Get the global chart albums.
@@ -742,7 +952,7 @@ class DeezerAPI:
         try:
             logger.info(f"Fetching chart albums from: {request_url}")
             # Use the validated session directly
-            async with session.get(request_url) as response:
+            async with session.get(request_url, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get chart albums: HTTP {response.status} - {await response.text()}")
                     return None
@@ -784,6 +994,9 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching chart albums: {e}")
             return None
 
+    @on_background_loop
+    @cached_response('editorial')
+    @single_flight
     async def get_editorial_releases(self, limit: int = 10) -> Optional[List[Dict]]:
         """
         Get the editorial new releases from Deezer.
@@ -809,7 +1022,7 @@ class DeezerAPI:
             
             try:
                 logger.info(f"Fetching editorial releases from: {request_url} (attempt {attempt + 1})")
-                async with session.get(request_url) as response:
+                async with session.get(request_url, proxy=self._proxy_url) as response:
                     if response.status != 200:
                         logger.error(f"Failed to get editorial releases: HTTP {response.status} - {await response.text()}")
                         return None
@@ -857,156 +1070,63 @@ class DeezerAPI:
         
         return None
 
-    async def _get_track_info(self, track_id: str) -> Optional[Dict]:
-        """Get additional track information including tokens.
+    async def _get_media_item(self, track_token: str, api_format: str) -> Optional[Dict]:
+        """Ask the media API for a track's sources in one format.
         
         Args:
-            track_id (str): Track ID
+            track_token (str): TRACK_TOKEN from the private track data
+            api_format (str): MP3_128, MP3_320 or FLAC
             
         Returns:
-            Optional[Dict]: Track information or None if not found
+            Optional[Dict]: The first entry of the response's 'data' array
+            (with 'media' or 'errors'), or None on request errors
         """
         session = await self._get_session()
-        if not session: return None
-        if not self.api_token or not self.csrf_token:
-             await self._get_tokens()
-        
-        # Preemptive token refresh check before making API call
-        if self._should_refresh_tokens():
-            logger.info("Tokens are old, preemptively refreshing before async pageTrack call...")
-            if await self._get_tokens():
-                logger.info("Preemptive async token refresh successful")
-            else:
-                logger.warning("Preemptive async token refresh failed, continuing with existing token")
-        
-        try:
-            params = {
-                'method': 'deezer.pageTrack',
-                'input': '3',
-                'api_version': '1.0',
-                'api_token': self.csrf_token or '',
-                'sng_id': track_id
-            }
-            logger.debug(f"Calling deezer.pageTrack with params: {params}")
-            async with session.get(self.PRIVATE_API_BASE, params=params) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get track info: HTTP {response.status}")
-                    return None
-                data = await response.json()
-                logger.debug(f"Private API response for {track_id}: {data}")
-                if 'error' in data and data['error']:
-                    if 'VALID_TOKEN_REQUIRED' in data['error']:
-                        # Simple CSRF error handling like the working July 15th version
-                        logger.debug(f"CSRF token expired, refreshing tokens...")
-                        
-                        if await self._get_tokens():
-                            logger.debug("Token refreshed successfully, retrying request")
-                            return await self._get_track_info(track_id)
-                        else:
-                            logger.warning("Failed to refresh CSRF token")
-                            return None
-                    logger.error(f"API error: {data['error']}")
-                    return None
-                if 'results' not in data or not data['results']:
-                    logger.error(f"No results in API response")
-                    return None
-                results = data.get('results', {})
-                track_data = results.get('DATA')
-                lyrics_data = results.get('LYRICS')
-                if not track_data:
-                    logger.warning(f"No 'DATA' found in pageTrack results for track {track_id}")
-                    return None
-                if lyrics_data:
-                    track_data['LYRICS'] = lyrics_data
-                
-                # Successful API call
-                
-                return track_data
-        except Exception as e:
-            logger.exception(f"Error getting track info for {track_id}: {e}", exc_info=True)
+        if not session:
             return None
-            
-    async def _get_track_url(self, track_data: Dict, quality: str = 'MP3_320') -> Optional[str]:
-        """Generate download URL for a track using the /v1/get_url endpoint.
-        
-        Args:
-            track_data (Dict): Track data from _get_track_info (needs SNG_ID and TRACK_TOKEN).
-            quality (str, optional): Quality - MP3_128, MP3_320, or FLAC. Defaults to 'MP3_320'.
-            
-        Returns:
-            Optional[str]: Download URL or None if not available
-        """
-        session = await self._get_session()
-        if not session: return None
-        # Ensure license token is fetched
-        if not self.license_token:
-             if not await self._get_license_token(): return None # Propagate failure
-        if not self.license_token: return None # Check again
+
+        payload = {
+            "license_token": self.license_token,
+            "media": [{"type": "FULL", "formats": [{"cipher": "BF_CBC_STRIPE", "format": api_format}]}],
+            "track_tokens": [track_token]
+        }
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
         try:
-            track_token = track_data.get('TRACK_TOKEN')
-            if not track_token:
-                 logger.error("No track token available in track_data for URL retrieval")
-                 return None
-                 
-            # Map quality string to API format string
-            quality_format_map = {
-                'MP3_128': 'MP3_128',
-                'MP3_320': 'MP3_320',
-                'FLAC': 'FLAC'
-            }
-            api_format = quality_format_map.get(quality, 'MP3_320')
-            
-            # Construct the payload
-            payload = {
-                "license_token": self.license_token,
-                "media": [
-                    {
-                        "type": "FULL",
-                        "formats": [
-                            {"cipher": "BF_CBC_STRIPE", "format": api_format}
-                        ]
-                    }
-                ],
-                "track_tokens": [track_token]
-            }
-            
-            media_url = "https://media.deezer.com/v1/get_url"
-            logger.debug(f"Calling {media_url} with payload: {payload}")
-            
-            # Restore the indented block for the async with statement
-            async with session.post(media_url, json=payload) as response:
+            async with session.post(self.MEDIA_API_URL, json=payload, headers=headers, proxy=self._proxy_url) as response:
                 if response.status != 200:
-                    logger.error(f"Failed to get download URL via {media_url}: HTTP {response.status} - {await response.text()}")
-                    return None
-                    
-                data = await response.json()
-                logger.debug(f"{media_url} response: {data}")
-                
-                if 'error' in data and data['error']:
-                    logger.error(f"API error from {media_url}: {data['error']}")
-                    return None
-                    
-                if 'data' in data and data['data'] and 'media' in data['data'][0] and data['data'][0]['media'] and 'sources' in data['data'][0]['media'][0] and data['data'][0]['media'][0]['sources']:
-                    sources = data['data'][0]['media'][0]['sources']
-                    if sources:
-                        track_url = sources[0].get('url')
-                        if track_url:
-                             logger.debug(f"Got download URL: {track_url[:50]}...")
-                             return track_url
-                        else:
-                             logger.error("No URL found in sources array")
-                             return None
-                    else:
-                        logger.error("Empty sources array in response")
-                        return None
-                else:
-                    logger.error(f"Unexpected response structure from {media_url}: {data}")
+                    logger.error(f"Failed to get download URL via {self.MEDIA_API_URL}: HTTP {response.status} - {await response.text()}")
                     return None
-                    
-        except Exception as e:
-            logger.exception(f"Error getting track URL via {media_url}: {e}", exc_info=True)
+                media_data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"Request/JSON error calling {self.MEDIA_API_URL}: {e}")
             return None
-            
+
+        if not isinstance(media_data, dict):
+            logger.error(f"Unexpected response from {self.MEDIA_API_URL}: {str(media_data)[:200]}")
+            return None
+        if 'error' in media_data and media_data['error']:
+            logger.error(f"Media API error: {media_data['error']}")
+            return None
+        items = media_data.get('data')
+        if not isinstance(items, list) or not items:
+            logger.error(f"Unexpected response structure from {self.MEDIA_API_URL}: 'data' array missing or empty. Response: {str(media_data)[:300]}")
+            return None
+        return items[0]
+
+    @staticmethod
+    def _media_item_url(media_item: Optional[Dict]) -> Optional[str]:
+        """Get the first source URL of a media API item, if it has one."""
+        if not media_item or media_item.get('errors'):
+            return None
+        media = media_item.get('media')
+        if not isinstance(media, list) or not media:
+            return None
+        sources = media[0].get('sources')
+        if not isinstance(sources, list) or not sources:
+            return None
+        return sources[0].get('url')
+
     def _generate_legacy_url(self, track_data: Dict, quality: int) -> Optional[str]:
         """Generate legacy download URL for a track.
         
@@ -1037,39 +1157,93 @@ class DeezerAPI:
             logger.error(f"Error generating legacy URL: {e}")
             return None
             
+    @on_background_loop
     async def get_track_download_url(self, track_id: int, quality: str = 'MP3_320') -> Optional[str]:
         """Get track download URL.
         
+        Combines getting the private track info (for the track token) and the
+        download URL from the media API.
+        
         Args:
             track_id (int): Track ID.
             quality (str, optional): Quality - MP3_128, MP3_320, or FLAC. Defaults to 'MP3_320'.
             
         Returns:
-            Optional[str]: Download URL or None if not available.
+            Optional[str]: Download URL, None if not available, or a string
+            starting with 'RIGHTS_ERROR:', 'API_ERROR:' or 'QUALITY_SKIP:'
+            explaining why the track cannot be downloaded.
         """
         if not self.is_authenticated():
             logger.warning("Not authenticated. Cannot get download URL.")
             return None
             
         try:
-            # Get track tokens and info
-            track_data = await self._get_track_info(str(track_id))
-            if not track_data:
-                logger.error(f"Could not get track info for {track_id}")
+            # Ensure API and license tokens
+            if self._should_refresh_tokens() or not self.api_token:
+                if not await self._refresh_tokens() and not self.api_token:
+                    logger.error("API token unavailable. Cannot get download URL.")
+                    return None
+            if not self.license_token:
+                await self._get_license_token()
+            if not self.license_token:
+                logger.error("License token unavailable. Cannot get download URL.")
                 return None
-                
-            # Get download URL
-            url = await self._get_track_url(track_data, quality)
-            if not url:
-                logger.error(f"Could not get download URL for track {track_id}")
+            
+            # Get track token (private API)
+            track_info = await self._get_track_info_private(track_id)
+            track_token = track_info.get('track_token') if track_info else None
+            if not track_token:
+                logger.error(f"Could not get track token for {track_id}")
+                return None
+            
+            quality_format_map = {'MP3_128': 'MP3_128', 'MP3_320': 'MP3_320', 'FLAC': 'FLAC'}
+            api_format = quality_format_map.get(quality, 'MP3_320')
+            
+            media_item = await self._get_media_item(track_token, api_format)
+            if media_item is None:
                 return None
+            
+            errors = media_item.get('errors')
+            if errors:
+                logger.error(f"Media API returned errors for track {track_id}: {errors}")
+                if not isinstance(errors, list):
+                    return None
+                error_code = errors[0].get('code')
+                error_message = errors[0].get('message', 'Unknown error')
                 
-            return url
+                if error_code == 2002:
+                    # Licensing/rights issue for the requested quality
+                    if quality == 'MP3_320' and await self._is_only_mp3_128(track_token):
+                        return "QUALITY_SKIP: Track only available in MP3_128, skipped per user preference"
+                    return f"RIGHTS_ERROR: Track not available - {error_message}"
+                if error_code in [2001, 4]:  # Other common rights-related errors
+                    return f"RIGHTS_ERROR: Geographic restriction or subscription required - {error_message}"
+                return f"API_ERROR: {error_message} (Code: {error_code})"
+            
+            url = self._media_item_url(media_item)
+            if url:
+                logger.debug(f"Got download URL for track {track_id}: {url[:70]}...")
+                return url
+            
+            # No media for the requested quality
+            if quality == 'MP3_320' and await self._is_only_mp3_128(track_token):
+                return "QUALITY_SKIP: Track only available in MP3_128, skipped per user preference"
+            logger.error(f"No download URL available for track {track_id} at any quality")
+            return None
             
         except Exception as e:
-            logger.error(f"Failed to get download URL for track {track_id}: {e}")
+            logger.error(f"Failed to get download URL for track {track_id}: {e}", exc_info=True)
             return None
+    
+    async def _is_only_mp3_128(self, track_token: str) -> bool:
+        """Check if a track that has no MP3_320 media is available in MP3_128."""
+        logger.info("MP3_320 not available for this track, checking MP3_128 availability...")
+        available = self._media_item_url(await self._get_media_item(track_token, 'MP3_128')) is not None
+        if available:
+            logger.info("Track only available in MP3_128 - SKIPPING (user preference: 320 only)")
+        return available
             
+
     def is_authenticated(self) -> bool:
         """Check if the API is authenticated.
         
@@ -1116,57 +1290,40 @@ class DeezerAPI:
         if not self.arl:
             logger.error("No ARL token configured")
             return False
+        return self._run_sync(self._check_arl(), default=False)
+    
+    async def _check_arl(self) -> bool:
+        """Fetch user data once to see if the ARL is accepted."""
+        params = {'method': 'deezer.getUserData', 'input': '3', 'api_version': '1.0', 'api_token': ''}
+        data = await self._private_request('GET', params)
+        if data is None:
+            logger.error("ARL validation failed: no response")
+            return False
         
-        try:
-            import requests
-            with requests.Session() as test_session:
-                # Set ARL cookie
-                test_session.cookies.set('arl', self.arl, domain='.deezer.com')
-                
-                # Try to get user data
-                params = {'method': 'deezer.getUserData', 'input': '3', 'api_version': '1.0', 'api_token': ''}
-                response = test_session.get(self.PRIVATE_API_BASE, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                
-                if 'error' in data and data['error']:
-                    logger.error(f"ARL validation failed: {data['error']}")
-                    return False
-                
-                if 'results' in data and 'checkForm' in data['results']:
-                    logger.info("ARL token validation successful")
-                    return True
-                else:
-                    logger.error("ARL validation failed: Invalid response format")
-                    return False
-                    
-        except Exception as e:
-            logger.error(f"ARL validation failed with exception: {e}")
+        if 'error' in data and data['error']:
+            logger.error(f"ARL validation failed: {data['error']}")
             return False
+        
+        if 'results' in data and 'checkForm' in data['results']:
+            logger.info("ARL token validation successful")
+            return True
+        logger.error("ARL validation failed: Invalid response format")
+        return False
     
     # Removed reset_csrf_error_state method - no longer needed with simplified approach
     
+
     def force_token_refresh_test(self):
         """Force a token refresh for testing purposes."""
         logger.info("TESTING: Forcing token refresh...")
-        try:
-            import requests
-            with requests.Session() as test_session:
-                # Set ARL cookie
-                test_session.cookies.set('arl', self.arl, domain='.deezer.com')
-                
-                # Try to refresh token
-                refreshed_token = self._refresh_token_sync(test_session)
-                if refreshed_token:
-                    logger.info(f"TESTING: Token refresh successful: {refreshed_token[:10]}...")
-                    return True
-                else:
-                    logger.error("TESTING: Token refresh failed")
-                    return False
-        except Exception as e:
-            logger.error(f"TESTING: Token refresh exception: {e}")
-            return False
+        if self._run_sync(self._get_tokens(), default=False):
+            logger.info(f"TESTING: Token refresh successful: {self.api_token[:10]}...")
+            return True
+        logger.error("TESTING: Token refresh failed")
+        return False
 
+    @on_background_loop
+    @single_flight
     async def get_track_details(self, track_id: int) -> Optional[Dict]:
         """Get detailed track information.
         
@@ -1190,7 +1347,7 @@ class DeezerAPI:
                 logger.debug(f"Using cached track details for {track_id}")
                 return cached
                 
-            async with session.get(f"{self.PUBLIC_API_BASE}/track/{track_id}") as response:
+            async with session.get(f"{self.PUBLIC_API_BASE}/track/{track_id}", proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get track details: HTTP {response.status}")
                     return None
@@ -1201,13 +1358,15 @@ class DeezerAPI:
                     return None
                     
                 # Cache the results
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='track')
                 return data
                 
         except Exception as e:
             logger.error(f"Error getting track details: {e}")
             return None
             
+    @on_background_loop
+    @single_flight
     async def get_album_details(self, album_id: int) -> Optional[Dict]:
         """Get detailed information for a specific album using public API."""
         session = await self._get_session()
@@ -1218,13 +1377,13 @@ class DeezerAPI:
         if cached_data: return cached_data
 
         try:
-            async with session.get(f"{self.PUBLIC_API_BASE}/album/{album_id}") as response:
+            async with session.get(f"{self.PUBLIC_API_BASE}/album/{album_id}", proxy=self._proxy_url) as response:
                 response.raise_for_status() # Raise an exception for bad status codes
                 data = await response.json()
                 if 'error' in data:
                     logger.warning(f"Error fetching album details for {album_id} from public API: {data['error']}")
                     return None
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='album')
                 return data
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching album details for {album_id}: {e}")
@@ -1234,10 +1393,7 @@ class DeezerAPI:
             return None
 
     def get_track_details_sync(self, track_id: int) -> Optional[Dict]:
-        """Synchronous version of get_track_details.
-        
-        This method is used by the DownloadWorker class to get track details
-        in a synchronous way, avoiding asyncio context issues.
+        """Synchronous version of get_track_details for worker threads.
         
         Args:
             track_id (int): The ID of the track
@@ -1245,33 +1401,11 @@ class DeezerAPI:
         Returns:
             Optional[Dict]: Track details or None if not available
         """
-        try:
-            url = f"{self.PUBLIC_API_BASE}/track/{track_id}"
-            logger.debug(f"Getting track details for {track_id} (sync)")
-            
-            # Use requests library for synchronous request
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            track_data = response.json()
-            if 'error' in track_data:
-                logger.error(f"Error getting track details: {track_data['error']}")
-                return None
-                
-            return track_data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error getting track details: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting track details: {e}")
-            return None
+        return self._run_sync(self.get_track_details(track_id))
             
+
     def get_album_details_sync(self, album_id: int) -> Optional[Dict]:
-        """Synchronous version of get_album_details.
-        
-        This method is used by the DownloadWorker class to get album details
-        in a synchronous way, avoiding asyncio context issues.
+        """Synchronous version of get_album_details for worker threads.
         
         Args:
             album_id (int): The ID of the album
@@ -1279,32 +1413,10 @@ class DeezerAPI:
         Returns:
             Optional[Dict]: Album details or None if not available
         """
-        try:
-            url = f"{self.PUBLIC_API_BASE}/album/{album_id}"
-            logger.debug(f"Getting album details for {album_id} (sync)")
-            
-            # Use requests library for synchronous request
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            album_data = response.json()
-            if 'error' in album_data:
-                logger.error(f"Error getting album details: {album_data['error']}")
-                return None
-                
-            return album_data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error getting album details: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting album details: {e}")
-            return None
+        return self._run_sync(self.get_album_details(album_id))
 
     def get_album_tracks_sync(self, album_id: int, limit: int = 50, index: int = 0) -> list:
-        """Synchronous version of get_album_tracks.
-        
-        This method is used to fetch album tracks synchronously, avoiding asyncio context issues.
+        """Synchronous version of get_album_tracks for worker threads.
         
         Args:
             album_id (int): The ID of the album
@@ -1314,60 +1426,97 @@ class DeezerAPI:
         Returns:
             list: List of track data or empty list if not available
         """
-        try:
-            url = f"{self.PUBLIC_API_BASE}/album/{album_id}/tracks"
-            params = {"limit": limit, "index": index}
-            
-            logger.debug(f"Getting album tracks for {album_id} (sync) with params: {params}")
-            
-            # Use requests library for synchronous request
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if 'error' in data:
-                logger.error(f"Error getting album tracks: {data['error']}")
-                return []
-                
-            if not data or 'data' not in data:
-                logger.error(f"Invalid album tracks response for {album_id}: 'data' field missing")
-                return []
-                
-            tracks_data = data.get('data', [])
-            logger.debug(f"Successfully fetched {len(tracks_data)} tracks for album {album_id} (sync)")
-            return tracks_data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error getting album tracks: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Error getting album tracks: {e}")
-            return []
+        return self._run_sync(self.get_album_tracks(album_id, limit=limit, index=index), default=[])
 
-    async def _get_track_info_private(self, track_id: str) -> Optional[Dict]:
-        """Get detailed track information from Deezer's private API.
-        
-        This method addresses the 'track_token_expire' issue by using Deezer's
-        private API endpoints which include additional fields needed by deemix.
+    def get_album_tracks_all_sync(self, album_id: int, max_items: Optional[int] = None) -> list:
+        """Synchronous version of get_album_tracks_all for worker threads.
+        
+        Args:
+            album_id (int): The ID of the album
+            max_items (Optional[int]): Stop after this many tracks (None for all)
+            
+        Returns:
+            list: Track data in album order, empty if not available
+        """
+        return self._run_sync(self.get_album_tracks_all(album_id, max_items=max_items), default=[])
+
+    def get_list_page_sync(self, path: str, index: int, limit: int,
+                           endpoint: Optional[str] = None) -> Optional[List[Dict]]:
+        """Synchronous version of _fetch_list_page for worker threads.
+        
+        Unlike the other list facades this tells a failed request apart from
+        an empty page.
+        
+        Args:
+            path (str): Endpoint path, e.g. '/album/302127/tracks'
+            index (int): Index of the first item
+            limit (int): Number of items to request
+            endpoint (Optional[str]): Cache TTL class; pages are only cached if set
+            
+        Returns:
+            Optional[List[Dict]]: The page items, or None if the request failed
+        """
+        items, _ = self._run_sync(self._fetch_list_page(path, index, limit, endpoint=endpoint),
+                                  default=(None, None))
+        return items
+
+    def get_playlist_details_sync(self, playlist_id: int) -> Optional[Dict]:
+        """Synchronous version of get_playlist_details.
+
+        Args:
+            playlist_id (int): The ID of the playlist
+
+        Returns:
+            Optional[Dict]: Playlist details or None if not available
+        """
+        return self._run_sync(self.get_playlist_details(playlist_id))
+
+    def get_playlist_tracks_sync(self, playlist_id: int, limit: int = 100, index: int = 0) -> list:
+        """Synchronous, paginated version of get_playlist_tracks.
+
+        Args:
+            playlist_id (int): The ID of the playlist
+            limit (int): Maximum number of tracks to fetch per request
+            index (int): Starting index for pagination
+
+        Returns:
+            list: List of track data or empty list if not available
+        """
+        return self._run_sync(self.get_playlist_tracks(playlist_id, limit=limit, index=index)) or []
+
+    async def _get_track_info_private(self, track_id: str, retry: bool = True) -> Optional[Dict]:
+        """Get detailed track information from Deezer's private API.
+        
+        This method addresses the 'track_token_expire' issue by using Deezer's
+        private API endpoints which include additional fields needed by deemix.
         
         Args:
             track_id (str): Deezer track ID
+            retry (bool): Refresh the token and retry once if it was rejected
             
         Returns:
             Optional[Dict]: Detailed track info including all deemix required fields or None if failed
         """
-        session = await self._get_session()
-        if not session:
+        if not self.arl:
+            logger.error("ARL token is missing. Cannot get private track details.")
             return None
-            
-        # Ensure tokens are fetched
+        
+        # Validate ARL format (should be 192 characters)
+        if len(self.arl) != 192:
+            logger.error(f"ARL token has invalid length: {len(self.arl)} characters (expected 192). Please verify your ARL token.")
+            return None
+        
+        # Ensure tokens are fetched, and refresh them if they are really old
         if not self.api_token:
-            if not await self._get_tokens():
+            if not await self._refresh_tokens():
                 logger.error("Failed to get API tokens for private track info")
                 return None
+        elif self.token_created_at and time.time() - self.token_created_at > 600:
+            logger.info("Token is older than 10 minutes, refreshing before pageTrack call...")
+            if not await self._refresh_tokens():
+                logger.warning("Token refresh failed, continuing with existing token")
                 
         try:
-            # Prepare request parameters for the private API
             params = {
                 'method': 'deezer.pageTrack',
                 'api_version': '1.0',
@@ -1375,143 +1524,34 @@ class DeezerAPI:
                 'input': '3',
                 'cid': int(time.time())
             }
-            
-            json_data = {
-                'sng_id': track_id
-            }
-            
-            # Make the request to the private API
-            async with session.post(
-                self.PRIVATE_API_BASE,
-                params=params,
-                json=json_data
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"Error fetching track from private API: HTTP {response.status}")
-                    return None
-                    
-                data = await response.json()
+            data = await self._private_request('POST', params, json_data={'sng_id': str(track_id)})
+            if data is None:
+                return None
                 
-                # Check for errors in response
-                if 'error' in data and data['error']:
-                    logger.error(f"Error in private API response: {data['error']}")
-                    return None
-                    
-                # Extract track data from results
-                if 'results' not in data:
-                    logger.error("No results in private API response")
-                    return None
-                    
-                track_data = data['results']['DATA']
+            if 'error' in data and data['error']:
+                logger.warning(f"pageTrack returned error for {track_id}: {data['error']}. Retrying: {retry}")
+                if isinstance(data['error'], dict) and 'VALID_TOKEN_REQUIRED' in data['error'] and retry:
+                    logger.info("Refreshing token (VALID_TOKEN_REQUIRED found)...")
+                    if await self._refresh_tokens():
+                        return await self._get_track_info_private(track_id, retry=False)
+                    logger.error("Token refresh failed. Cannot get private track details.")
+                return None
                 
-                # TEMPORARY DEBUG LOGGING:
-                logger.debug(f"ASYNC Raw DATA for track {track_id}: {track_data}")
-                logger.debug(f"ASYNC Keys in raw DATA for track {track_id}: {list(track_data.keys())}")
-
-                # Check if track_token_expire exists, which is what deemix needs
-                if 'TRACK_TOKEN_EXPIRE' in track_data:
-                    # Convert to lowercase keys to match what deemix expects
-                    result = {}
-                    for key, value in track_data.items():
-                        result[key.lower()] = value
-                        
-                    # Ensure the key is explicitly set to avoid future issues
-                    result['track_token_expire'] = track_data['TRACK_TOKEN_EXPIRE']
-                    
-                    # Add additional fields required by deemix
-                    if 'track_token' not in result and 'TRACK_TOKEN' in track_data:
-                        result['track_token'] = track_data['TRACK_TOKEN']
-                        
-                    # Convert any nested structures too
-                    if 'ALBUM' in track_data:
-                        result['album'] = {}
-                        for key, value in track_data['ALBUM'].items():
-                            result['album'][key.lower()] = value
-                            
-                    if 'ARTIST' in track_data:
-                        result['artist'] = {}
-                        for key, value in track_data['ARTIST'].items():
-                            result['artist'][key.lower()] = value
-                    
-                    # Ensure 'artist' dictionary exists and has a 'name' key for deemix
-                    if not isinstance(result.get('artist'), dict) or 'name' not in result.get('artist', {}):
-                        logger.debug(f"Artist dictionary missing or incomplete for track {track_id}. Attempting fallback.")
-                        artist_name_fallback = result.get('art_name') or track_data.get('ART_NAME')
-                        if artist_name_fallback:
-                            logger.debug(f"Using fallback artist name: {artist_name_fallback}")
-                            # Ensure result['artist'] is a dictionary before assigning name
-                            if not isinstance(result.get('artist'), dict):
-                                result['artist'] = {}
-                            result['artist']['name'] = artist_name_fallback
-                        else:
-                            logger.warning(f"Could not find artist name for track {track_id}. Setting to 'Unknown Artist'.")
-                            result['artist'] = {'name': 'Unknown Artist'}
-                    
-                    # Ensure 'filesizes' dictionary is present for deemix
-                    result['filesizes'] = {}
-                    filesize_keys_map = {
-                        'FILESIZE_MP3_128': 'MP3_128',
-                        'FILESIZE_MP3_256': 'MP3_256', # Might exist
-                        'FILESIZE_MP3_320': 'MP3_320',
-                        'FILESIZE_FLAC': 'FLAC',
-                        # Add mappings for other potential qualities if needed
-                    }
-                    for api_key, deemix_key in filesize_keys_map.items():
-                        if api_key in track_data:
-                            try:
-                                result['filesizes'][deemix_key] = int(track_data[api_key])
-                            except (ValueError, TypeError):
-                                logger.warning(f"Could not convert {api_key} value '{track_data[api_key]}' to int for track {track_id}")
-                        # Check lowercase version as well, just in case
-                        elif api_key.lower() in result: 
-                            try:
-                                result['filesizes'][deemix_key] = int(result[api_key.lower()])
-                            except (ValueError, TypeError):
-                                logger.warning(f"Could not convert {api_key.lower()} value '{result[api_key.lower()]}' to int for track {track_id}")
-
-                    if not result['filesizes']:
-                         logger.warning(f"No filesize information found in track_data for track {track_id}. Deemix might fail.")
-
-                    # Ensure 'release_date' is present for deemix
-                    if 'release_date' not in result:
-                        release_date_fallback = result.get('physical_release_date') # Check lowercase primary first
-                        if not release_date_fallback and isinstance(result.get('album'), dict):
-                            release_date_fallback = result['album'].get('release_date') # Check lowercase album dict
-                        if not release_date_fallback:
-                             release_date_fallback = track_data.get('PHYSICAL_RELEASE_DATE') # Check original uppercase
-                             if not release_date_fallback and isinstance(track_data.get('ALBUM'), dict):
-                                  release_date_fallback = track_data['ALBUM'].get('release_date') # Check original album dict
-                        
-                        if release_date_fallback:
-                            result['release_date'] = release_date_fallback
-                            logger.debug(f"Copied release date ({release_date_fallback}) to 'release_date' for track {track_id}")
-                        else:
-                            logger.warning(f"Could not find release date for track {track_id}. Using '1970-01-01'. Deemix might have issues.")
-                            result['release_date'] = "1970-01-01" # Provide a default to prevent KeyError
-
-                    # TEMPORARY DEBUG LOGGING FOR PROCESSED INFO (ASYNC):
-                    logger.debug(f"ASYNC Processed result for track {track_id}: {result}")
-                    logger.debug(f"ASYNC Keys in processed result for track {track_id}: {list(result.keys())}")
-                    # Specifically check for disk_number
-                    logger.debug(f"ASYNC disk_number in processed result: {result.get('disk_number')}")
-
-
-                    logger.debug(f"Successfully fetched track data from private API with track_token_expire")
-                    return result
-                else:
-                    logger.error("track_token_expire field missing from private API response")
-                    return None
+            if 'results' not in data or 'DATA' not in data['results']:
+                logger.error(f"Invalid response structure from pageTrack for {track_id}: {data}")
+                return None
+                
+            return self._process_track_data_private(data['results']['DATA'], str(track_id))
                     
         except Exception as e:
             logger.error(f"Error getting track info from private API: {e}", exc_info=True)
             return None
             
+
     def get_track_details_sync_private(self, track_id: int) -> Optional[Dict]:
         """Get track details synchronously using the private API.
         
-        This is a synchronous version of the private API track getter,
-        suitable for use in background threads where the asyncio event loop
-        is not available.
+        Synchronous version of _get_track_info_private for worker threads.
         
         Args:
             track_id (int): Deezer track ID
@@ -1519,210 +1559,9 @@ class DeezerAPI:
         Returns:
             Optional[Dict]: Track details or None if not found/error
         """
-        logger.info(f"[SYNC_PRIVATE] get_track_details_sync_private called for track_id: {track_id}")
-        logger.info(f"[SYNC_PRIVATE] Current ARL: {self.arl[:20] if self.arl else None}..., API token: {self.api_token[:10] if self.api_token else None}...")
-        # Use persistent sync session for token continuity
-        if not hasattr(self, 'sync_session') or not self.sync_session:
-            import requests
-            self.sync_session = requests.Session()
-            # Set ARL cookie on the persistent session
-            if self.arl:
-                self.sync_session.cookies.set('arl', self.arl, domain='.deezer.com')
-            # Configure proxy for requests session if enabled
-            proxy_config = self.config.get_setting('network.proxy', {})
-            if proxy_config.get('enabled', False) and proxy_config.get('use_for_api', True):
-                proxy_host = proxy_config.get('host', '')
-                proxy_port = proxy_config.get('port', '')
-                proxy_type = proxy_config.get('type', 'http')
-                proxy_username = proxy_config.get('username', '')
-                proxy_password = proxy_config.get('password', '')
+        return self._run_sync(self._get_track_info_private(str(track_id)))
                 
-                if proxy_host and proxy_port:
-                    # Build proxy URL for requests
-                    if proxy_username and proxy_password:
-                        proxy_url = f"{proxy_type}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-                    else:
-                        proxy_url = f"{proxy_type}://{proxy_host}:{proxy_port}"
-                    
-                    # Set proxies for requests session
-                    self.sync_session.proxies = {
-                        'http': proxy_url,
-                        'https': proxy_url
-                    }
-                    logger.info(f"[SYNC_URL_FETCH] Using proxy for sync requests: {proxy_type}://{proxy_host}:{proxy_port}")
-                else:
-                    logger.warning("[SYNC_URL_FETCH] Proxy enabled but host/port not configured properly")
-        
-        sync_session = self.sync_session
-        try:
-            
-            try:
-                # ARL cookie already set on persistent session
-                if not self.arl:
-                    logger.error("[SYNC_PRIVATE] ARL token is missing. Cannot get private track details.")
-                    return None
-                
-                # Validate ARL format (should be 192 characters)
-                if len(self.arl) != 192:
-                    logger.error(f"[SYNC_PRIVATE] ARL token has invalid length: {len(self.arl)} characters (expected 192). Please verify your ARL token.")
-                    return None
 
-                # Ensure API token is available and fresh before making the request
-                current_api_token = self.api_token # Work with a local variable
-                if not current_api_token:
-                    logger.info("[SYNC_PRIVATE] API token not found, attempting synchronous fetch within session...")
-                    init_token_params = {
-                        'method': 'deezer.getUserData', 'input': '3', 
-                        'api_version': '1.0', 'api_token': ''
-                    }
-                    try:
-                        # Use the single session to fetch the token
-                        init_token_response = sync_session.get(
-                            self.PRIVATE_API_BASE, params=init_token_params, timeout=10
-                        )
-                        init_token_response.raise_for_status()
-                        init_token_data = init_token_response.json()
-                        
-                        if (init_token_data.get('error') and len(init_token_data['error']) > 0) or 'results' not in init_token_data:
-                            logger.error(f"[SYNC_PRIVATE] Failed to get initial token: Invalid response {init_token_data}")
-                            return None # Cannot proceed without token
-                            
-                        initial_api_token = init_token_data.get('results', {}).get('checkForm', '')
-                        if initial_api_token:
-                            logger.info(f"[SYNC_PRIVATE] Successfully obtained initial API token: {initial_api_token[:5]}...")
-                            current_api_token = initial_api_token
-                            # Update instance variables for sharing with other threads
-                            self.api_token = initial_api_token
-                            self.csrf_token = initial_api_token
-                            self.token_created_at = time.time()
-                        else:
-                            logger.error("[SYNC_PRIVATE] Failed to get initial token: 'checkForm' missing.")
-                            return None # Cannot proceed without token
-                            
-                    except requests.exceptions.RequestException as init_token_err:
-                         logger.error(f"[SYNC_PRIVATE] HTTP error during nested token fetch: {init_token_err}")
-                         return None # Network or HTTP error
-                    except Exception as init_inner_e:
-                         logger.error(f"[SYNC_PRIVATE] Unexpected error during nested token fetch: {init_inner_e}")
-                         return None # Other error
-
-                # If after attempting fetch, token is still missing, abort.
-                if not current_api_token:
-                     logger.error("[SYNC_PRIVATE] API token is missing after fetch attempt. Cannot get private track details.")
-                     return None
-
-                # Get the freshest available token before making API request
-                # Check if instance has a newer token than our local copy
-                if self.api_token and self.token_created_at:
-                    current_time = time.time()
-                    token_age = current_time - self.token_created_at
-                    if token_age < 600 and self.api_token != current_api_token:  # Token is less than 10 minutes old
-                        logger.debug(f"[SYNC_PRIVATE] Using fresher token from instance (age: {token_age:.1f}s)")
-                        current_api_token = self.api_token
-
-                # --- Inner function remains similar but uses the outer session --- 
-                def make_api_request(api_token_to_use, retry=True):
-                    
-                    logger.info(f"[SYNC_PRIVATE] make_api_request called for track {track_id} with retry={retry}")
-                    
-                    # Less aggressive token refresh check - only refresh if really old
-                    if self.token_created_at:
-                        current_time = time.time()
-                        age = current_time - self.token_created_at
-                        # Only refresh if token is older than 10 minutes (instead of 6)
-                        if age > 600:  # 10 minutes
-                            logger.info(f"[SYNC_PRIVATE] Token is old ({age:.1f}s), refreshing before pageTrack call...")
-                            refreshed_token = self._refresh_token_sync(sync_session)
-                            if refreshed_token:
-                                api_token_to_use = refreshed_token
-                                logger.info(f"[SYNC_PRIVATE] Token refresh successful: {refreshed_token[:8]}...")
-                            else:
-                                logger.warning(f"[SYNC_PRIVATE] Token refresh failed, continuing with existing token")
-                        else:
-                            logger.debug(f"[SYNC_PRIVATE] Token is still fresh ({age:.1f}s), no refresh needed")
-                    
-                    # Use the existing sync_session 
-                    params = {
-                        'method': 'deezer.pageTrack',
-                        'api_version': '1.0',
-                        'api_token': api_token_to_use, # Use the token passed to this attempt
-                        'input': '3',
-                        'cid': int(time.time())
-                    }
-                    json_data = {'sng_id': str(track_id)}
-                    
-                    logger.debug(f"Making sync private API request (pageTrack) for track {track_id} with token {api_token_to_use[:5]}... (Retry={retry})")
-                    
-                    try:
-                        response = sync_session.post(
-                            self.PRIVATE_API_BASE,
-                            params=params,
-                            json=json_data,
-                            timeout=10
-                        )
-                        logger.info(f"[SYNC_PRIVATE] pageTrack response status: {response.status_code}")
-                        response.raise_for_status()
-                        track_data_response = response.json()
-
-                        if 'error' in track_data_response and track_data_response['error']:
-                            logger.warning(f"pageTrack returned error for {track_id}: {track_data_response['error']}. Retrying: {retry}")
-                            # Specific handling for "VALID_TOKEN_REQUIRED"
-                            # Check if the error dictionary ITSELF contains VALID_TOKEN_REQUIRED as a key
-                            if isinstance(track_data_response['error'], dict) and 'VALID_TOKEN_REQUIRED' in track_data_response['error']:
-                                if retry: # Only retry once for token issues
-                                    logger.info("Attempting sync token refresh within session (VALID_TOKEN_REQUIRED found)...")
-                                    # Refresh token using the same sync_session
-                                    refreshed_token = self._refresh_token_sync(sync_session)
-                                    if refreshed_token:
-                                        return make_api_request(refreshed_token, retry=False) 
-                                    else:
-                                        logger.error("Token refresh failed. Cannot get private track details.")
-                                        return None 
-                                else:
-                                    logger.error("Token still invalid after refresh attempt.")
-                                    return None # Failed after retry
-                            # For other errors, don't retry or handle as needed
-                            return None 
-
-                        if 'results' not in track_data_response or 'DATA' not in track_data_response['results']:
-                            logger.error(f"Invalid response structure from pageTrack for {track_id}: {track_data_response}")
-                            return None
-
-                        raw_track_data_from_api = track_data_response.get('results', {}).get('DATA', {})
-                        
-                        # TEMPORARY DEBUG LOGGING:
-                        logger.debug(f"SYNC Raw DATA for track {track_id}: {raw_track_data_from_api}") 
-                        logger.debug(f"SYNC Keys in raw DATA for track {track_id}: {list(raw_track_data_from_api.keys())}")
-
-                        # Process data (this function should handle key conversion, etc.)
-                        processed_track_info = self._process_track_data_private(raw_track_data_from_api, str(track_id))
-                        
-                        if processed_track_info:
-                             # TEMPORARY DEBUG LOGGING FOR PROCESSED INFO:
-                            logger.debug(f"SYNC Processed track_info for {track_id}: {processed_track_info}")
-                            logger.debug(f"SYNC Keys in processed track_info for {track_id}: {list(processed_track_info.keys())}")
-                            # Specifically check for disk_number
-                            logger.debug(f"SYNC disk_number in processed_track_info: {processed_track_info.get('disk_number')}")
-                            
-                            # Successful API call
-
-                        return processed_track_info
-
-                    except requests.exceptions.RequestException as http_err:
-                        logger.error(f"HTTP error during pageTrack call: {http_err}")
-                        return None
-                
-                # Initial call to make_api_request - This should be the last line before the except
-                result = make_api_request(current_api_token, retry=True) 
-                return result
-
-            except Exception as e:
-                logger.error(f"Outer exception in get_track_details_sync_private for {track_id}: {e}", exc_info=True)
-                return None
-        except Exception as e:
-            logger.error(f"Session error in get_track_details_sync_private for {track_id}: {e}", exc_info=True)
-            return None
-                
     def _process_track_data_private(self, raw_data: Dict[str, Any], track_id_str: str) -> Optional[Dict[str, Any]]:
         """Helper to consistently process raw track data from pageTrack into a standardized dict."""
         if not raw_data:
@@ -1928,35 +1767,8 @@ class DeezerAPI:
         logger.debug(f"Final processed_info for {track_id_str} (keys: {list(processed_info.keys())})")
         return processed_info
 
-    def _refresh_token_sync(self, sync_session: requests.Session) -> Optional[str]:
-        """Synchronously refreshes the API token (checkForm) using the given session."""
-        logger.info("Attempting to refresh API token synchronously...")
-        params = {'method': 'deezer.getUserData', 'input': '3', 'api_version': '1.0', 'api_token': ''}
-        try:
-            response = sync_session.get(self.PRIVATE_API_BASE, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if 'error' in data and data['error']:
-                logger.error(f"Error refreshing token: {data['error']}")
-                return None
-            if 'results' in data and 'checkForm' in data['results']:
-                new_api_token = data['results']['checkForm']
-                logger.info(f"Successfully refreshed API token: {new_api_token[:5]}...")
-                self.api_token = new_api_token
-                self.csrf_token = new_api_token # CSRF token is usually the same as API token
-                self.token_created_at = time.time()  # Update timestamp
-                return new_api_token
-            else:
-                logger.error(f"Failed to refresh token: 'checkForm' not in response results. Response: {data}")
-                return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP error during token refresh: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error during token refresh: {e}", exc_info=True)
-            return None
-
-    def ensure_token_freshness_sync(self) -> bool:
+    @on_background_loop
+    async def ensure_token_freshness(self) -> bool:
         """Ensure tokens are fresh for upcoming download operations.
         
         This method should be called by download workers before starting
@@ -1966,11 +1778,7 @@ class DeezerAPI:
         Returns:
             bool: True if tokens are fresh/refreshed successfully, False otherwise
         """
-        logger.info("[TOKEN_FRESHNESS] ensure_token_freshness_sync() method called")
         try:
-            logger.info(f"[TOKEN_FRESHNESS] Starting token freshness check. ARL set: {bool(self.arl)}, ARL length: {len(self.arl) if self.arl else 0}, Current API token: {bool(self.api_token)}, Token timestamp: {self.token_created_at}")
-            
-            # DEBUG: Log early return conditions
             if not self.arl:
                 logger.error("[TOKEN_FRESHNESS] Cannot ensure token freshness: No ARL token available")
                 return False
@@ -1980,489 +1788,97 @@ class DeezerAPI:
                 logger.error(f"[TOKEN_FRESHNESS] ARL token appears too short (length: {len(self.arl)}), may be invalid")
                 return False
                 
-            logger.info("[TOKEN_FRESHNESS] ARL validation passed, proceeding with session setup")
-            # Use persistent sync session for token continuity
-            if not hasattr(self, 'sync_session') or not self.sync_session:
-                import requests
-                logger.info("[TOKEN_FRESHNESS] Creating new sync session")
-                self.sync_session = requests.Session()
-                # Set basic headers to avoid compression issues
-                self.sync_session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'application/json, text/html, */*',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'identity',  # Disable compression
-                    'DNT': '1',
-                    'Connection': 'keep-alive'
-                })
-                # Set ARL cookie on the persistent session
-                if self.arl:
-                    self.sync_session.cookies.set('arl', self.arl, domain='.deezer.com')
-                    logger.info(f"[TOKEN_FRESHNESS] ARL cookie set on sync session (domain: .deezer.com, value length: {len(self.arl)})")
-                    
-            # Check if tokens need refresh (more aggressive threshold for batch operations)
             if not self.token_created_at:
                 logger.info("[TOKEN_FRESHNESS] No token timestamp found, refreshing token for download session...")
-                refresh_result = self._refresh_token_sync(self.sync_session)
-                if refresh_result:
-                    logger.info(f"[TOKEN_FRESHNESS] Initial token refresh successful: {refresh_result[:8]}...")
-                    return True
-                else:
-                    logger.error("[TOKEN_FRESHNESS] Initial token refresh failed")
-                    return False
+                return await self._refresh_tokens()
                 
-            current_time = time.time()
-            age = current_time - self.token_created_at
-            
             # For download operations, be more conservative about token freshness
             # Refresh if tokens are older than 6 minutes to prevent CSRF issues
+            age = time.time() - self.token_created_at
             max_age_for_downloads = 360  # 6 minutes
             
             if age > max_age_for_downloads:
                 logger.info(f"[TOKEN_FRESHNESS] Token age is {age:.1f}s (>{max_age_for_downloads}s), refreshing for download session...")
-                refresh_result = self._refresh_token_sync(self.sync_session)
-                if refresh_result:
-                    logger.info(f"[TOKEN_FRESHNESS] Token refresh successful: {refresh_result[:8]}..., storing in instance variables")
-                    # Store the refreshed tokens in instance variables
-                    self.api_token = refresh_result
-                    self.csrf_token = refresh_result
-                    return True
-                else:
-                    logger.error("[TOKEN_FRESHNESS] Token refresh failed")
-                    return False
-            else:
-                logger.info(f"[TOKEN_FRESHNESS] Token age is {age:.1f}s (<{max_age_for_downloads}s), token is fresh enough for downloads")
-                return True
+                return await self._refresh_tokens()
+            
+            logger.debug(f"[TOKEN_FRESHNESS] Token age is {age:.1f}s, token is fresh enough for downloads")
+            return True
                 
         except Exception as e:
             logger.error(f"[TOKEN_FRESHNESS] Exception during token freshness check: {e}", exc_info=True)
             return False
 
-    def get_track_download_url_sync(self, track_id: int, quality: str = 'MP3_320') -> Optional[str]:
-        """Synchronous version to get track download URL.
+    def login_sync(self) -> bool:
+        """Fetch session tokens with the configured ARL and mark the API initialized.
+        
+        Used by callers without the UI's startup sequence (e.g. the headless
+        daemon) before any download is started.
+        
+        Returns:
+            bool: True if the ARL was accepted and tokens were fetched, False otherwise
+        """
+        if not self.arl:
+            logger.error("No ARL token configured")
+            return False
+        if not self._run_sync(self._get_tokens(), default=False):
+            logger.error("Failed to fetch tokens, the ARL token may be invalid or expired")
+            return False
+        return bool(self._run_sync(self.initialize(), default=False))
+
+    def ensure_token_freshness_sync(self) -> bool:
+        """Synchronous version of ensure_token_freshness for worker threads.
+        
+        Returns:
+            bool: True if tokens are fresh/refreshed successfully, False otherwise
+        """
+        return bool(self._run_sync(self.ensure_token_freshness(), default=False))
 
-        Combines getting track info (private) and download URL (media API).
+    def get_track_download_url_sync(self, track_id: int, quality: str = 'MP3_320') -> Optional[str]:
+        """Synchronous version of get_track_download_url for worker threads.
 
         Args:
             track_id (int): Track ID.
             quality (str, optional): Quality - MP3_128, MP3_320, or FLAC. Defaults to 'MP3_320'.
 
         Returns:
-            Optional[str]: Download URL or None if not available.
+            Optional[str]: Download URL, None, or a RIGHTS_ERROR/API_ERROR/QUALITY_SKIP reason.
         """
-        logger.info(f"[SYNC_URL_FETCH] Enter get_track_download_url_sync for {track_id}")
-        logger.debug(f"[SYNC_URL_FETCH] Enter get_track_download_url_sync for {track_id}. Current self.api_token: '{self.api_token[:10] if self.api_token else None}...' Current self.license_token: '{self.license_token[:10] if self.license_token else None}...' ARL set: {bool(self.arl)}")
-        logger.debug(f"[SYNC_URL_FETCH] Token freshness check - token_created_at: {self.token_created_at}")
-
-        if not self.is_authenticated(): # Check basic auth state first
-            logger.warning("[SYNC_URL_FETCH] Not authenticated (is_authenticated failed). Cannot get sync download URL.")
-            logger.info(f"[SYNC_URL_FETCH] is_authenticated returned False. ARL: {bool(self.arl)}, API token: {bool(self.api_token)}")
-            return None
-
-        # Use persistent sync session for token continuity
-        if not hasattr(self, 'sync_session') or not self.sync_session:
-            import requests
-            logger.info("[SYNC_URL_FETCH] Creating new sync session for download URL")
-            self.sync_session = requests.Session()
-            # Set basic headers to avoid compression issues
-            self.sync_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/json, text/html, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'identity',  # Disable compression globally for sync session
-                'DNT': '1',
-                'Connection': 'keep-alive'
-            })
-            # Set ARL cookie on the persistent session
-            if self.arl:
-                logger.info(f"[SYNC_URL_FETCH] Setting ARL cookie. ARL length: {len(self.arl) if self.arl else 0}")
-                self.sync_session.cookies.set('arl', self.arl, domain='.deezer.com')
-                logger.info(f"[SYNC_URL_FETCH] ARL cookie set. Cookies: {dict(self.sync_session.cookies)}")
-            # Configure proxy for requests session if enabled
-            proxy_config = self.config.get_setting('network.proxy', {})
-            if proxy_config.get('enabled', False) and proxy_config.get('use_for_api', True):
-                proxy_host = proxy_config.get('host', '')
-                proxy_port = proxy_config.get('port', '')
-                proxy_type = proxy_config.get('type', 'http')
-                proxy_username = proxy_config.get('username', '')
-                proxy_password = proxy_config.get('password', '')
-                
-                if proxy_host and proxy_port:
-                    # Build proxy URL for requests
-                    if proxy_username and proxy_password:
-                        proxy_url = f"{proxy_type}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-                    else:
-                        proxy_url = f"{proxy_type}://{proxy_host}:{proxy_port}"
-                    
-                    # Set proxies for requests session
-                    self.sync_session.proxies = {
-                        'http': proxy_url,
-                        'https': proxy_url
-                    }
-                    logger.info(f"[SYNC_URL_FETCH] Using proxy for sync requests: {proxy_type}://{proxy_host}:{proxy_port}")
-                else:
-                    logger.warning("[SYNC_URL_FETCH] Proxy enabled but host/port not configured properly")
-        
-        sync_session = self.sync_session
-        try:
-            
-            try:
-                # --- 1. ARL Cookie Check --- 
-                if not self.arl:
-                    logger.error("[SYNC_URL_FETCH] ARL token missing. Cannot get sync download URL.")
-                    return None
-
-                # --- 2. Ensure API Token and License Token --- 
-                # Check if we need to proactively refresh tokens
-                logger.info("[SYNC_URL_FETCH] Checking if tokens need to be refreshed")
-                should_refresh = self._should_refresh_tokens()
-                logger.info(f"[SYNC_URL_FETCH] should_refresh_tokens returned: {should_refresh}")
-                if should_refresh:
-                    logger.info("[SYNC_URL_FETCH] Tokens are stale, proactively refreshing before download...")
-                    # Force refresh by clearing current token
-                    self.api_token = None
-                    self.csrf_token = None
-                
-                current_api_token = self.api_token
-                if not current_api_token:
-                    logger.info("[SYNC_URL_FETCH] API token not found on instance, attempting nested sync fetch for API token...")
-                    init_token_params = {'method': 'deezer.getUserData', 'input': '3',
-                                       'api_version': '1.0', 'api_token': ''}
-                    try:
-                        init_token_response = sync_session.get(
-                            self.PRIVATE_API_BASE, params=init_token_params, timeout=10
-                        )
-                        init_token_response.raise_for_status()
-                        init_token_data = init_token_response.json()
-                        if (init_token_data.get('error') and len(init_token_data['error']) > 0) or 'results' not in init_token_data:
-                            logger.error(f"[SYNC_URL_FETCH] Failed nested API token fetch: Invalid response {init_token_data}")
-                            return None
-                        initial_api_token = init_token_data.get('results', {}).get('checkForm', '')
-                        if initial_api_token:
-                            logger.info(f"[SYNC_URL_FETCH] Successfully obtained nested API token: {initial_api_token[:5]}...")
-                            current_api_token = initial_api_token
-                            self.api_token = initial_api_token # Store on instance
-                            self.csrf_token = initial_api_token # Store on instance
-                        else:
-                            logger.error("[SYNC_URL_FETCH] Nested API token fetch failed: 'checkForm' missing from response.")
-                            return None
-                    except requests.exceptions.RequestException as init_token_err:
-                        logger.error(f"[SYNC_URL_FETCH] HTTP error during nested API token fetch: {init_token_err}")
-                        return None
-                    except Exception as init_inner_e:
-                        logger.error(f"[SYNC_URL_FETCH] Unexpected error during nested API token fetch: {init_inner_e}", exc_info=True)
-                        return None
-                
-                # Now, ensure license_token using the current_api_token
-                if not self.license_token: # Check instance's license_token
-                    logger.info(f"[SYNC_URL_FETCH] License token not found on instance. Attempting sync fetch for license token using API token {current_api_token[:5] if current_api_token else 'None'}...")
-                    if not current_api_token: # Should have been fetched above if was None
-                         logger.error("[SYNC_URL_FETCH] Cannot fetch license token: API token is unexpectedly still unavailable.")
-                         return None
-
-                    license_params = {
-                        'method': 'deezer.getUserData', 'input': '3',
-                        'api_version': '1.0', 'api_token': current_api_token
-                    }
-                    try:
-                        lic_response = sync_session.get(self.PRIVATE_API_BASE, params=license_params, timeout=10)
-                        lic_response.raise_for_status()
-                        lic_data = lic_response.json()
-
-                        if (lic_data.get('error') and len(lic_data['error']) > 0) or 'results' not in lic_data:
-                            logger.error(f"[SYNC_URL_FETCH] Failed sync license token fetch: Invalid response {lic_data}")
-                            self.license_token = None # Clear any old one
-                        else:
-                            user_data_results = lic_data.get('results', {})
-                            user_dict = user_data_results.get('USER')
-                            options_dict = user_dict.get('OPTIONS') if isinstance(user_dict, dict) else None
-                            fetched_license_token = options_dict.get('license_token', '') if isinstance(options_dict, dict) else ''
-                            if fetched_license_token:
-                                self.license_token = fetched_license_token # Store on instance
-                                logger.info(f"[SYNC_URL_FETCH] Successfully fetched sync license token: {self.license_token[:10]}...")
-                            else:
-                                 logger.warning("[SYNC_URL_FETCH] Sync license token fetch succeeded but token was empty in response.")
-                                 self.license_token = None # Ensure it's None
-                    except requests.exceptions.RequestException as lic_err:
-                        logger.error(f"[SYNC_URL_FETCH] HTTP error fetching sync license token: {lic_err}")
-                        self.license_token = None 
-                    except Exception as lic_inner_e:
-                        logger.error(f"[SYNC_URL_FETCH] Unexpected error fetching sync license token: {lic_inner_e}", exc_info=True)
-                        self.license_token = None
-                
-                # Final check for license token
-                if not self.license_token:
-                    logger.error("[SYNC_URL_FETCH] License token unavailable after all attempts. Cannot get download URL.")
-                    return None
-
-                # --- 3. Get Track Info (Private API, handles its own token logic) --- 
-                logger.debug("[SYNC_URL_FETCH] Attempting to get track details via get_track_details_sync_private...")
-                logger.info(f"[SYNC_URL_FETCH] Calling get_track_details_sync_private for track {track_id}")
-                track_info = self.get_track_details_sync_private(track_id) # This uses its own session and token logic
-                logger.info(f"[SYNC_URL_FETCH] get_track_details_sync_private returned: {track_info is not None}")
-                if not track_info:
-                    logger.error(f"[SYNC_URL_FETCH] Failed to get sync track details for {track_id} via get_track_details_sync_private.")
-                    return None
-
-                track_token_from_details = track_info.get('track_token') # Ensure using the correct key from processed data
-                if not track_token_from_details:
-                     logger.error(f"[SYNC_URL_FETCH] No 'track_token' found in processed track_info for {track_id}. track_info: {track_info.keys() if track_info else 'None'}")
-                     return None
-                logger.debug(f"[SYNC_URL_FETCH] Obtained track_token from details: {track_token_from_details[:10]}...")
-
-
-                # --- 4. Get Download URL (Media API) --- 
-                quality_format_map = {
-                    'MP3_128': 'MP3_128', 'MP3_320': 'MP3_320', 'FLAC': 'FLAC'
-                }
-                api_format = quality_format_map.get(quality, 'MP3_320')
-
-                payload = {
-                    "license_token": self.license_token, # Use the now confirmed license_token
-                    "media": [{"type": "FULL", "formats": [{"cipher": "BF_CBC_STRIPE", "format": api_format}]}],
-                    "track_tokens": [track_token_from_details]
-                }
-
-                media_url = "https://media.deezer.com/v1/get_url"
-                logger.debug(f"[SYNC_URL_FETCH] Calling {media_url} with payload: {{license_token: '{self.license_token[:10]}...', ..., track_tokens: ['{track_token_from_details[:10]}...']}}")
-
-                # Use the *same* sync_session for this call to maintain cookies if necessary (though typically token-based)
-                # Add specific headers for media API to avoid compression issues
-                media_headers = {
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json',
-                    'Accept-Encoding': 'identity',  # Disable compression to avoid garbled responses
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                logger.info(f"[SYNC_URL_FETCH] Making media API request to {media_url}")
-                logger.info(f"[SYNC_URL_FETCH] Payload: {{license_token: '{self.license_token[:10]}...' if self.license_token else None, track_tokens: ['{track_token_from_details[:10]}...'] if track_token_from_details else None}}")
-                media_response = sync_session.post(media_url, json=payload, headers=media_headers, timeout=15)
-                logger.info(f"[SYNC_URL_FETCH] Media API response status: {media_response.status_code}")
-                media_response.raise_for_status()
-                
-                # Check response headers for debugging
-                logger.debug(f"[SYNC_URL_FETCH] Response headers: {dict(media_response.headers)}")
-                logger.debug(f"[SYNC_URL_FETCH] Response encoding: {media_response.encoding}")
-                
-                # Validate response before parsing JSON
-                response_text = media_response.text.strip()
-                if not response_text:
-                    logger.error(f"[SYNC_URL_FETCH] Empty response from {media_url}")
-                    return None
-                
-                # Check if response looks like binary data (common signs of compression issues)
-                if any(ord(char) < 32 and char not in '\n\r\t' for char in response_text[:100]):
-                    logger.error(f"[SYNC_URL_FETCH] Response appears to be binary/compressed data, not JSON. First 100 chars: {repr(response_text[:100])}")
-                    return None
-                
-                try:
-                    media_data = media_response.json()
-                    logger.info(f"[SYNC_URL_FETCH] Media API response parsed successfully")
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.error(f"[SYNC_URL_FETCH] Invalid JSON response from {media_url}: {response_text[:200]} - Error: {e}")
-                    return None
-                logger.debug(f"[SYNC_URL_FETCH] {media_url} response: {str(media_data)[:200]}...") # Log snippet
-                logger.info(f"[SYNC_URL_FETCH] Media API response keys: {list(media_data.keys()) if isinstance(media_data, dict) else 'Not a dict'}")
-
-                if 'error' in media_data and media_data['error']: # Check for explicit error array
-                    logger.error(f"[SYNC_URL_FETCH] Media API error: {media_data['error']}")
-                    logger.info(f"[SYNC_URL_FETCH] Media API error type: {type(media_data['error'])}")
-                    return None
-
-                # Check new deezer api response structure
-                if 'data' in media_data and isinstance(media_data['data'], list) and media_data['data']:
-                    first_item_data = media_data['data'][0]
-                    logger.info(f"[SYNC_URL_FETCH] First item data keys: {list(first_item_data.keys()) if isinstance(first_item_data, dict) else 'Not a dict'}")
-                    if 'errors' in first_item_data and first_item_data['errors']:
-                        errors = first_item_data['errors']
-                        logger.error(f"[SYNC_URL_FETCH] Media API returned errors in 'data[0].errors': {errors}")
-                        
-                        # Check for specific error codes and provide better error messages
-                        if errors and isinstance(errors, list) and len(errors) > 0:
-                            first_error = errors[0]
-                            error_code = first_error.get('code')
-                            error_message = first_error.get('message', 'Unknown error')
-                            
-                            if error_code == 2002:
-                                # This is a licensing/rights issue for the requested quality
-                                # If we were requesting MP3_320, try MP3_128 before giving up
-                                if quality == 'MP3_320':
-                                    logger.info(f"[SYNC_URL_FETCH] MP3_320 rights error (code 2002), trying MP3_128 fallback...")
-                                    
-                                    fallback_payload = {
-                                        "license_token": self.license_token,
-                                        "media": [{"type": "FULL", "formats": [{"cipher": "BF_CBC_STRIPE", "format": "MP3_128"}]}],
-                                        "track_tokens": [track_token_from_details]
-                                    }
-                                    
-                                    try:
-                                        fallback_response = sync_session.post(media_url, json=fallback_payload, headers=media_headers, timeout=15)
-                                        fallback_response.raise_for_status()
-                                        
-                                        # Validate fallback response
-                                        fallback_text = fallback_response.text.strip()
-                                        if not fallback_text:
-                                            logger.warning(f"[SYNC_URL_FETCH] Empty fallback response")
-                                            return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                        
-                                        # Check if fallback response looks like binary data
-                                        if any(ord(char) < 32 and char not in '\n\r\t' for char in fallback_text[:100]):
-                                            logger.warning(f"[SYNC_URL_FETCH] Fallback response appears to be binary/compressed data")
-                                            return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                        
-                                        try:
-                                            fallback_data = fallback_response.json()
-                                        except (json.JSONDecodeError, ValueError) as e:
-                                            logger.warning(f"[SYNC_URL_FETCH] Invalid JSON in fallback response: {e}")
-                                            return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                        
-                                        # Check if MP3_128 has errors too
-                                        if ('data' in fallback_data and fallback_data['data'] and 
-                                            'errors' in fallback_data['data'][0] and fallback_data['data'][0]['errors']):
-                                            logger.info(f"[SYNC_URL_FETCH] MP3_128 also has rights errors, track truly unavailable")
-                                            return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                        
-                                        # Check if MP3_128 has media
-                                        if ('data' in fallback_data and fallback_data['data'] and 
-                                            'media' in fallback_data['data'][0] and fallback_data['data'][0]['media']):
-                                            
-                                            fallback_media = fallback_data['data'][0]['media'][0]
-                                            if 'sources' in fallback_media and fallback_media['sources']:
-                                                fallback_url = fallback_media['sources'][0].get('url')
-                                                if fallback_url:
-                                                    logger.info(f"[SYNC_URL_FETCH] Track only available in MP3_128 - SKIPPING (user preference: 320 only)")
-                                                    return "QUALITY_SKIP: Track only available in MP3_128, skipped per user preference"
-                                        
-                                        # If we get here, MP3_128 also failed
-                                        logger.info(f"[SYNC_URL_FETCH] MP3_128 fallback also failed, track unavailable")
-                                        return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                        
-                                    except (requests.exceptions.RequestException, json.JSONDecodeError, ValueError) as fallback_e:
-                                        logger.warning(f"[SYNC_URL_FETCH] MP3_128 fallback request failed: {fallback_e}")
-                                        return f"RIGHTS_ERROR: Track not available - {error_message}"
-                                else:
-                                    # For non-320 requests, return the rights error directly
-                                    return f"RIGHTS_ERROR: Track not available - {error_message}"
-                            elif error_code in [2001, 4]:  # Other common rights-related errors
-                                return f"RIGHTS_ERROR: Geographic restriction or subscription required - {error_message}"
-                            else:
-                                # Generic error
-                                return f"API_ERROR: {error_message} (Code: {error_code})"
-                        
-                        return None
-                    if 'media' in first_item_data and isinstance(first_item_data['media'], list) and first_item_data['media']:
-                        media_item = first_item_data['media'][0]
-                        logger.info(f"[SYNC_URL_FETCH] Media item keys: {list(media_item.keys()) if isinstance(media_item, dict) else 'Not a dict'}")
-                        if 'sources' in media_item and isinstance(media_item['sources'], list) and media_item['sources']:
-                            sources = media_item['sources']
-                            logger.info(f"[SYNC_URL_FETCH] Sources count: {len(sources)}")
-                            final_url = sources[0].get('url')
-                            if final_url:
-                                 logger.info(f"[SYNC_URL_FETCH] Successfully got sync download URL: {final_url[:70]}...")
-                                 return final_url
-                            else:
-                                 logger.error("[SYNC_URL_FETCH] No 'url' found in media API sources[0].")
-                                 return None
-                        else:
-                            logger.error("[SYNC_URL_FETCH] 'sources' array missing or empty in media_item.")
-                            return None
-                    else:
-                        logger.warning("[SYNC_URL_FETCH] 'media' array missing or empty in first_item_data for requested quality.")
-                        
-                        # QUALITY CHECK: If MP3_320 is not available, check if MP3_128 is available
-                        if quality == 'MP3_320':
-                            logger.info("[SYNC_URL_FETCH] MP3_320 not available for this track, checking MP3_128 availability...")
-                            
-                            fallback_payload = {
-                                "license_token": self.license_token,
-                                "media": [{"type": "FULL", "formats": [{"cipher": "BF_CBC_STRIPE", "format": "MP3_128"}]}],
-                                "track_tokens": [track_token_from_details]
-                            }
-                            
-                            try:
-                                fallback_response = sync_session.post(media_url, json=fallback_payload, headers=media_headers, timeout=15)
-                                fallback_response.raise_for_status()
-                                
-                                # Validate second fallback response
-                                fallback_text = fallback_response.text.strip()
-                                if not fallback_text:
-                                    logger.warning(f"[SYNC_URL_FETCH] Empty second fallback response")
-                                elif any(ord(char) < 32 and char not in '\n\r\t' for char in fallback_text[:100]):
-                                    logger.warning(f"[SYNC_URL_FETCH] Second fallback response appears to be binary/compressed data")
-                                    fallback_data = None
-                                else:
-                                    try:
-                                        fallback_data = fallback_response.json()
-                                    except (json.JSONDecodeError, ValueError) as e:
-                                        logger.warning(f"[SYNC_URL_FETCH] Invalid JSON in second fallback response: {e}")
-                                        fallback_data = None
-                                
-                                if fallback_data and ('data' in fallback_data and fallback_data['data'] and 
-                                    'media' in fallback_data['data'][0] and fallback_data['data'][0]['media']):
-                                    
-                                    fallback_media = fallback_data['data'][0]['media'][0]
-                                    if 'sources' in fallback_media and fallback_media['sources']:
-                                        fallback_url = fallback_media['sources'][0].get('url')
-                                        if fallback_url:
-                                            logger.info(f"[SYNC_URL_FETCH] Track only available in MP3_128 - SKIPPING (user preference: 320 only)")
-                                            # Return special code to indicate 128-only track
-                                            return "QUALITY_SKIP: Track only available in MP3_128, skipped per user preference"
-                                        
-                            except (requests.exceptions.RequestException, json.JSONDecodeError, ValueError) as fallback_e:
-                                logger.warning(f"[SYNC_URL_FETCH] MP3_128 availability check failed: {fallback_e}")
-                        
-                        logger.error(f"[SYNC_URL_FETCH] No download URL available for track at any quality")
-                        return None
-                else:
-                    logger.error(f"[SYNC_URL_FETCH] Unexpected response structure from {media_url}: 'data' array missing or empty. Response: {str(media_data)[:300]}")
-                    return None
-
-            except (requests.exceptions.RequestException, json.JSONDecodeError, ValueError) as e:
-                logger.error(f"[SYNC_URL_FETCH] Request/JSON error during sync URL retrieval for {track_id}: {e}")
-                return None
-            except Exception as e:
-                logger.error(f"[SYNC_URL_FETCH] Unexpected error during sync URL retrieval for {track_id}: {e}", exc_info=True)
-                return None
-        except Exception as e:
-            logger.error(f"[SYNC_URL_FETCH] Session error during sync URL retrieval for {track_id}: {e}", exc_info=True)
-            return None
+        return self._run_sync(self.get_track_download_url(track_id, quality=quality))
 
+    @on_background_loop
+    @single_flight
     async def get_album_tracks(self, album_id: int, limit: int = 50, index: int = 0) -> list:
-        """Fetches tracks for a given album ID using limit and index parameters."""
-        session = await self._get_session()
-        if not session:
-            logger.error(f"Cannot get album tracks for {album_id}: no session.")
-            return [] # Return empty list on session error
+        """Fetches tracks for a given album ID using limit and index parameters.
+        
+        Limits above LIST_PAGE_SIZE are fetched as concurrent pages. Pages
+        are kept in the response cache (album TTL).
+        """
+        logger.info(f"Fetching tracks for album {album_id} (limit={limit}, index={index})")
+        tracks_data = await self._get_list_all(f"/album/{album_id}/tracks", start=index,
+                                               max_items=limit, endpoint='album', dedupe_key=None)
+        logger.info(f"Fetched {len(tracks_data)} tracks for album {album_id}.")
+        return tracks_data
 
-        request_url = f"{self.PUBLIC_API_BASE}/album/{album_id}/tracks"
-        params = {"limit": limit, "index": index}
+    @on_background_loop
+    @single_flight
+    async def get_album_tracks_all(self, album_id: int, max_items: Optional[int] = None) -> list:
+        """Fetch the complete track list of an album.
         
-        try:
-            logger.info(f"Fetching tracks for album {album_id} from: {request_url} with params: {params}")
-            async with session.get(request_url, params=params) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get album tracks for {album_id}: HTTP {response.status} - {await response.text()}")
-                    return [] # Return empty list on HTTP error
-                
-                data = await response.json()
-                if not data or 'data' not in data:
-                    logger.error(f"Invalid album tracks response for {album_id}: 'data' field missing. Response: {data}")
-                    return [] # Return empty list on invalid data
-                
-                tracks_data = data.get('data', [])
-                logger.info(f"Successfully fetched {len(tracks_data)} tracks for album {album_id}.")
-                return tracks_data
-        except aiohttp.ClientError as e: # Specific exception for network issues with aiohttp
-            logger.error(f"Network error fetching tracks for album {album_id}: {e}")
-            return []
-        except json.JSONDecodeError as e: # Specific exception for JSON parsing issues
-            logger.error(f"JSON decode error fetching tracks for album {album_id}: {e}. Response: {await response.text()[:200]}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error fetching tracks for album {album_id}: {e}", exc_info=True)
-            return []
+        Pages are kept in the response cache (album TTL), so the album page,
+        its download action and queue item creation share one fetch.
+        
+        Args:
+            album_id (int): The ID of the album
+            max_items (Optional[int]): Stop after this many tracks (None for all)
+            
+        Returns:
+            list: Track data in album order, empty if not available
+        """
+        return await self._get_list_all(f"/album/{album_id}/tracks", max_items=max_items,
+                                        endpoint='album', dedupe_key=None)
 
+    @on_background_loop
+    @single_flight
     async def get_artist_details(self, artist_id: int) -> dict | None:
         """
         Fetches detailed information about a specific artist from the Deezer API.
@@ -2495,14 +1911,14 @@ class DeezerAPI:
 
         try:
             logger.info(f"Fetching artist details for {artist_id} from: {url}")
-            async with session.get(url) as response:
+            async with session.get(url, proxy=self._proxy_url) as response:
                 response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
                 data = await response.json()
                 if 'error' in data and data['error']:
                     logger.error(f"API error for artist {artist_id}: {data['error']}")
                     return None
                 logger.debug(f"Successfully fetched details for artist {artist_id}.")
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='artist')
                 return data
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching artist {artist_id}: {e}")
@@ -2511,6 +1927,8 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching artist {artist_id}: {e}", exc_info=True)
             return None
 
+    @on_background_loop
+    @single_flight
     async def get_artist_top_tracks(self, artist_id: int, limit: int = 25, index: int = 0) -> list:
         """
         Get top tracks for a specific artist.
@@ -2544,7 +1962,7 @@ class DeezerAPI:
         logger.info(f"[DeezerAPI] Fetching artist top tracks from: {url}")
         
         try:
-            async with session.get(url) as response:
+            async with session.get(url, proxy=self._proxy_url) as response:
                 if response.status == 200:
                     response_text = await response.text()
                     try:
@@ -2552,7 +1970,7 @@ class DeezerAPI:
                         if 'data' in data and isinstance(data['data'], list):
                             tracks = data['data']
                             logger.info(f"[DeezerAPI] Successfully fetched {len(tracks)} top tracks for artist {artist_id}")
-                            self._save_to_cache(cache_key, data)
+                            self._save_to_cache(cache_key, data, endpoint='artist_top_tracks')
                             return tracks
                         elif 'error' in data:
                             logger.error(f"[DeezerAPI] API error fetching top tracks for artist {artist_id}: {data['error']}")
@@ -2573,6 +1991,8 @@ class DeezerAPI:
             logger.error(f"[DeezerAPI] Unexpected error fetching top tracks for artist {artist_id}: {e}", exc_info=True)
             return []
 
+    @on_background_loop
+    @single_flight
     async def get_artist_albums_generic(self, artist_id: int, limit: int = 25, index: int = 0) -> Optional[List[Dict]]:
         """Fetches albums for a given artist from the public Deezer API."""
         if not artist_id:
@@ -2596,12 +2016,12 @@ class DeezerAPI:
         try:
             # Use optimized timeout for artist albums requests
             timeout = aiohttp.ClientTimeout(total=8)  # Reduced from 20 to 8 seconds for better performance
-            async with session.get(url, timeout=timeout) as response:
+            async with session.get(url, timeout=timeout, proxy=self._proxy_url) as response:
                 response_text = await response.text()
                 if response.status == 200:
                     data = json.loads(response_text)
                     if 'data' in data and isinstance(data['data'], list):
-                        self._save_to_cache(cache_key, data)
+                        self._save_to_cache(cache_key, data, endpoint='artist_albums')
                         return data['data']
                     elif 'error' in data:
                         logger.error(f"API error fetching albums for artist {artist_id}: {data['error']}")
@@ -2625,6 +2045,8 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching albums for artist {artist_id}: {e}", exc_info=True)
             return None
 
+    @on_background_loop
+    @single_flight
     async def get_artist_albums_all(self, artist_id: int, page_size: int = 100, max_pages: int = 10) -> Optional[List[Dict]]:
         """Fetch all artist releases by paginating through the public API.
         Returns a combined list of releases (albums/singles/EPs), de-duplicated by ID.
@@ -2640,137 +2062,43 @@ class DeezerAPI:
             logger.debug(f"Returning cached ALL albums for artist {artist_id} (count={len(cached)})")
             return cached
 
-        all_items: List[Dict] = []
-        seen_ids = set()
-        index = 0
-
-        # Optimize by fetching first few pages concurrently
-        if max_pages > 1:
-            # Fetch first 3 pages concurrently for better performance
-            concurrent_pages = min(3, max_pages)
-            tasks = []
-            for page in range(concurrent_pages):
-                page_index = page * page_size
-                task = asyncio.create_task(
-                    self.get_artist_albums_generic(artist_id, limit=page_size, index=page_index)
-                )
-                tasks.append((page, task))
-            
-            # Wait for concurrent pages with timeout
-            try:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*[task for _, task in tasks], return_exceptions=True),
-                    timeout=15  # Total timeout for concurrent requests
-                )
-                
-                # Process concurrent results
-                for page, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"[DeezerAPI] Page {page} failed: {result}")
-                        continue
-                    
-                    if not result:
-                        continue
-                        
-                    # De-duplicate by 'id'
-                    new_count = 0
-                    for item in result:
-                        item_id = item.get('id')
-                        if item_id is None or item_id in seen_ids:
-                            continue
-                        seen_ids.add(item_id)
-                        all_items.append(item)
-                        new_count += 1
-                    
-                    logger.info(f"[DeezerAPI] Concurrent page {page+1}: fetched={len(result)}, added={new_count}, total={len(all_items)}")
-                
-                # Continue with remaining pages sequentially if needed
-                if max_pages > concurrent_pages and len(results) > 0 and len(results[-1]) >= page_size:
-                    for page in range(concurrent_pages, max_pages):
-                        page_index = page * page_size
-                        page_items = await self.get_artist_albums_generic(artist_id, limit=page_size, index=page_index)
-                        if not page_items:
-                            break
-                        
-                        # De-duplicate by 'id'
-                        new_count = 0
-                        for item in page_items:
-                            item_id = item.get('id')
-                            if item_id is None or item_id in seen_ids:
-                                continue
-                            seen_ids.add(item_id)
-                            all_items.append(item)
-                            new_count += 1
-                        
-                        logger.info(f"[DeezerAPI] Sequential page {page+1}: fetched={len(page_items)}, added={new_count}, total={len(all_items)}")
-                        
-                        if len(page_items) < page_size:
-                            break
-                            
-            except asyncio.TimeoutError:
-                logger.warning(f"[DeezerAPI] Concurrent page fetching timed out for artist {artist_id}")
-                # Fall back to sequential fetching for first page only
-                page_items = await self.get_artist_albums_generic(artist_id, limit=page_size, index=0)
-                if page_items:
-                    for item in page_items:
-                        item_id = item.get('id')
-                        if item_id is not None and item_id not in seen_ids:
-                            seen_ids.add(item_id)
-                            all_items.append(item)
-        else:
-            # Single page request
-            page_items = await self.get_artist_albums_generic(artist_id, limit=page_size, index=0)
-            if page_items:
-                for item in page_items:
-                    item_id = item.get('id')
-                    if item_id is not None:
-                        all_items.append(item)
+        all_items = await self._get_list_all(f"/artist/{artist_id}/albums", page_size=page_size,
+                                             max_items=page_size * max_pages)
+        logger.info(f"[DeezerAPI] Fetched {len(all_items)} releases for artist {artist_id}")
 
         # Cache aggregated result for faster artist page loads
         try:
-            self._save_to_cache(agg_cache_key, all_items)
+            self._save_to_cache(agg_cache_key, all_items, endpoint='artist_albums')
         except Exception:
             pass
 
         return all_items
 
-    async def get_playlist_tracks(self, playlist_id: int, limit: int = 500) -> Optional[List[Dict]]:
+    @on_background_loop
+    @single_flight
+    async def get_playlist_tracks(self, playlist_id: int, limit: int = 500, index: int = 0) -> List[Dict]:
         """
         Get tracks for a specific playlist.
 
+        Limits above LIST_PAGE_SIZE are fetched as concurrent pages. Pages
+        are kept in the response cache (playlist TTL).
+
         Args:
             playlist_id (int): The ID of the playlist.
             limit (int): Maximum number of tracks to retrieve.
+            index (int): Starting index for pagination.
 
         Returns:
-            Optional[List[Dict]]: A list of track details, or None on error.
+            List[Dict]: A list of track details, empty on error.
         """
-        session = await self._get_session()
-        if not session:
-            logger.error(f"Cannot get playlist tracks for {playlist_id}: no session.")
-            return None
-
-        request_url = f"{self.PUBLIC_API_BASE}/playlist/{playlist_id}/tracks?limit={limit}"
-        
-        try:
-            logger.info(f"Fetching tracks for playlist {playlist_id} from: {request_url}")
-            async with session.get(request_url) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get playlist tracks for {playlist_id}: HTTP {response.status} - {await response.text()}")
-                    return None
-                
-                data = await response.json()
-                if not data or 'data' not in data:
-                    logger.error(f"Invalid playlist tracks response for {playlist_id}: 'data' field missing. Response: {data}")
-                    return None
-                
-                tracks_data = data.get('data', [])
-                logger.info(f"Successfully fetched {len(tracks_data)} tracks for playlist {playlist_id}.")
-                return tracks_data
-        except Exception as e:
-            logger.error(f"Unexpected error fetching tracks for playlist {playlist_id}: {e}")
-            return None 
-
+        logger.info(f"Fetching tracks for playlist {playlist_id} (limit={limit}, index={index})")
+        tracks_data = await self._get_list_all(f"/playlist/{playlist_id}/tracks", start=index,
+                                               max_items=limit, endpoint='playlist', dedupe_key=None)
+        logger.info(f"Fetched {len(tracks_data)} tracks for playlist {playlist_id}.")
+        return tracks_data
+
+    @on_background_loop
+    @single_flight
     async def get_playlist_details(self, playlist_id: int) -> Optional[Dict]:
         """Get detailed information for a specific playlist using public API."""
         session = await self._get_session()
@@ -2788,7 +2116,7 @@ class DeezerAPI:
         try:
             url = f"{self.PUBLIC_API_BASE}/playlist/{playlist_id}"
             logger.debug(f"Fetching playlist details for {playlist_id} from {url}")
-            async with session.get(url) as response:
+            async with session.get(url, proxy=self._proxy_url) as response:
                 # response.raise_for_status() # Raise an exception for bad status codes
                 if response.status != 200:
                     error_text = await response.text()
@@ -2800,7 +2128,7 @@ class DeezerAPI:
                     logger.warning(f"API error fetching playlist details for {playlist_id}: {data['error']}")
                     return None
                 
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, endpoint='playlist')
                 logger.debug(f"Fetched and cached playlist details for {playlist_id}.")
                 return data
         except aiohttp.ClientError as e:
@@ -2813,6 +2141,8 @@ class DeezerAPI:
             logger.error(f"Unexpected error fetching playlist details for {playlist_id}: {e}", exc_info=True)
             return None
 
+    @on_background_loop
+    @single_flight
     async def get_artist(self, artist_id: int) -> dict | None:
         """
         Get details for a specific artist.
@@ -2827,19 +2157,122 @@ class DeezerAPI:
         """
         return await self.get_artist_details(artist_id)
 
-    async def get_track_lyrics(self, track_id: int) -> Optional[Dict]:
+    @on_background_loop
+    @single_flight
+    async def get_artist_snapshot(self, artist_id: int) -> Optional[ArtistSnapshot]:
+        """
+        Load the artist, all releases, top tracks and related playlists at once.
+        
+        With an ARL this is a single private deezer.pageArtist call (plus the
+        public releases list if the page didn't include every release);
+        otherwise the public artist, top tracks and releases are requested
+        concurrently. The snapshot is cached like artist release lists.
+        
+        Args:
+            artist_id (int): The artist ID
+            
+        Returns:
+            Optional[ArtistSnapshot]: The snapshot, or None if the artist couldn't be loaded
+        """
+        if not artist_id:
+            logger.error("get_artist_snapshot: artist_id is required.")
+            return None
+
+        cache_key = f"artist_{artist_id}_snapshot_v1"
+        cached = self._load_from_cache(cache_key)
+        if isinstance(cached, dict) and cached.get('artist'):
+            logger.debug(f"[DeezerAPI] Returning cached snapshot for artist {artist_id}")
+            return ArtistSnapshot.from_dict(cached)
+
+        snapshot = None
+        if self.arl:
+            snapshot = await self._get_artist_snapshot_private(artist_id)
+        if snapshot is None:
+            snapshot = await self._get_artist_snapshot_public(artist_id)
+        if snapshot is None:
+            return None
+
+        logger.info(f"[DeezerAPI] Artist {artist_id} snapshot ({snapshot.source}): "
+                    f"{len(snapshot.releases)} releases, {len(snapshot.top_tracks)} top tracks, "
+                    f"{len(snapshot.playlists)} playlists")
+        self._save_to_cache(cache_key, snapshot.to_dict(), endpoint='artist_albums')
+        return snapshot
+
+    async def _get_artist_snapshot_private(self, artist_id: int, retry: bool = True) -> Optional[ArtistSnapshot]:
+        """Build an artist snapshot from the private deezer.pageArtist method."""
+        if not self.api_token and not await self._refresh_tokens():
+            logger.warning("[DeezerAPI] No API token for pageArtist, using the public API")
+            return None
+
+        params = {
+            'method': 'deezer.pageArtist',
+            'api_version': '1.0',
+            'api_token': self.api_token,
+            'input': '3',
+            'cid': int(time.time())
+        }
+        data = await self._private_request('POST', params, json_data={'art_id': str(artist_id), 'lang': 'en', 'tab': 0})
+        if not data:
+            return None
+
+        if data.get('error'):
+            if isinstance(data['error'], dict) and 'VALID_TOKEN_REQUIRED' in data['error'] and retry:
+                if await self._refresh_tokens():
+                    return await self._get_artist_snapshot_private(artist_id, retry=False)
+            logger.warning(f"[DeezerAPI] pageArtist returned error for {artist_id}: {data['error']}")
+            return None
+
+        results = data.get('results')
+        if not isinstance(results, dict) or not results.get('DATA'):
+            logger.warning(f"[DeezerAPI] Invalid pageArtist response for {artist_id}")
+            return None
+
+        try:
+            snapshot = ArtistSnapshot.from_page_artist(results)
+        except Exception as e:
+            logger.error(f"[DeezerAPI] Error converting pageArtist response for {artist_id}: {e}")
+            return None
+
+        # The page only embeds the first releases of large discographies
+        total = (results.get('ALBUMS') or {}).get('total', 0) or 0
+        if total > len(snapshot.releases):
+            releases = await self.get_artist_albums_all(artist_id, page_size=100, max_pages=10)
+            if releases:
+                snapshot.releases = releases
+        return snapshot
+
+    async def _get_artist_snapshot_public(self, artist_id: int) -> Optional[ArtistSnapshot]:
+        """Build an artist snapshot from concurrent public API calls."""
+        artist, top_tracks, releases = await asyncio.gather(
+            self.get_artist_details(artist_id),
+            self.get_artist_top_tracks(artist_id),
+            self.get_artist_albums_all(artist_id, page_size=100, max_pages=10),
+            return_exceptions=True
+        )
+        if not isinstance(artist, dict) or not artist:
+            logger.error(f"[DeezerAPI] Failed to load artist {artist_id} for snapshot: {artist}")
+            return None
+        return ArtistSnapshot(
+            artist=artist,
+            releases=releases if isinstance(releases, list) else [],
+            top_tracks=top_tracks if isinstance(top_tracks, list) else [],
+        )
+
+    @on_background_loop
+    @single_flight
+    async def get_track_lyrics(self, track_id: int, retry: bool = True) -> Optional[Dict]:
         """
         Get synchronized lyrics for a track using Deezer private API.
         
         Args:
             track_id (int): The track ID to fetch lyrics for
+            retry (bool): Refresh the token and retry once if it was rejected
             
         Returns:
             Optional[Dict]: Lyrics data containing sync info and plain text, or None if not found/error
         """
-        session = await self._get_session()
-        if not session:
-            logger.error(f"Cannot get lyrics for track {track_id}: no session.")
+        if not self.arl:
+            logger.error("ARL token is missing. Cannot get lyrics.")
             return None
 
         # Ensure tokens are available
@@ -2855,42 +2288,40 @@ class DeezerAPI:
                 'input': '3',
                 'cid': int(time.time())
             }
-            json_data = {'sng_id': str(track_id)}
             
             # Headers to simulate US region for better lyrics availability
+            us_ip = random.choice(self.US_REGION_IPS)
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'X-Forwarded-For': '8.8.8.8',  # Google DNS (US)
+                'X-Forwarded-For': us_ip,
+                'X-Real-IP': us_ip,
+                'X-Client-IP': us_ip,
                 'CF-IPCountry': 'US',  # Cloudflare country header
-                'X-Real-IP': '8.8.8.8'
+                'X-Forwarded-Country': 'US',
+                'X-Country-Code': 'US'
             }
             
-            logger.debug(f"Fetching lyrics for track {track_id} with US region headers")
+            logger.debug(f"Fetching lyrics for track {track_id} with US region headers (IP: {us_ip})")
             
-            async with session.post(
-                self.PRIVATE_API_BASE,
-                params=params,
-                json=json_data,
-                headers=headers
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get lyrics for track {track_id}: HTTP {response.status}")
-                    return None
-                    
-                data = await response.json()
-                
-                if 'error' in data and data['error']:
-                    logger.warning(f"Lyrics API returned error for track {track_id}: {data['error']}")
-                    return None
-                
-                if 'results' not in data:
-                    logger.warning(f"No lyrics results found for track {track_id}")
-                    return None
+            data = await self._private_request('POST', params, json_data={'sng_id': str(track_id)}, headers=headers)
+            if data is None:
+                return None
                 
-                lyrics_data = data['results']
-                logger.debug(f"Successfully fetched lyrics for track {track_id} with US region")
-                return lyrics_data
+            if 'error' in data and data['error']:
+                logger.warning(f"Lyrics API returned error for track {track_id}: {data['error']}")
+                if isinstance(data['error'], dict) and 'VALID_TOKEN_REQUIRED' in data['error'] and retry:
+                    logger.info("Refreshing token for lyrics (VALID_TOKEN_REQUIRED found)...")
+                    if await self._refresh_tokens():
+                        return await self.get_track_lyrics(track_id, retry=False)
+                return None
+            
+            if 'results' not in data:
+                logger.warning(f"No lyrics results found for track {track_id}")
+                return None
+            
+            logger.debug(f"Successfully fetched lyrics for track {track_id} with US region")
+            return data['results']
                 
         except Exception as e:
             logger.error(f"Error fetching lyrics for track {track_id}: {e}", exc_info=True)
@@ -2900,8 +2331,7 @@ class DeezerAPI:
         """
         Get synchronized lyrics for a track synchronously.
         
-        This is a synchronous version suitable for use in background threads
-        where the asyncio event loop is not available.
+        Synchronous version of get_track_lyrics for worker threads.
         
         Args:
             track_id (int): The track ID to fetch lyrics for
@@ -2909,157 +2339,10 @@ class DeezerAPI:
         Returns:
             Optional[Dict]: Lyrics data containing sync info and plain text, or None if not found/error
         """
-        # Use persistent sync session for token continuity
-        if not hasattr(self, 'sync_session') or not self.sync_session:
-            import requests
-            self.sync_session = requests.Session()
-            # Set ARL cookie on the persistent session
-            if self.arl:
-                self.sync_session.cookies.set('arl', self.arl, domain='.deezer.com')
-        
-        sync_session = self.sync_session
-        try:
-            try:
-                # ARL cookie already set on persistent session
-                if not self.arl:
-                    logger.error("ARL token is missing. Cannot get lyrics.")
-                    return None
-
-                # Enhanced headers to simulate US region for better lyrics availability
-                # Using multiple US IP ranges and comprehensive headers
-                us_ips = [
-                    '173.252.74.22',   # Facebook US server
-                    '142.250.191.14',  # Google US server  
-                    '23.185.0.2',      # Akamai US CDN
-                    '151.101.193.140'  # Reddit US server
-                ]
-                import random
-                us_ip = random.choice(us_ips)
-                
-                sync_session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'application/json, text/plain, */*',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'empty',
-                    'Sec-Fetch-Mode': 'cors',
-                    'Sec-Fetch-Site': 'same-origin',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache',
-                    # IP spoofing headers
-                    'X-Forwarded-For': us_ip,
-                    'X-Real-IP': us_ip,
-                    'X-Originating-IP': us_ip,
-                    'X-Remote-IP': us_ip,
-                    'X-Remote-Addr': us_ip,
-                    'X-Client-IP': us_ip,
-                    # Cloudflare/CDN headers
-                    'CF-IPCountry': 'US',
-                    'CF-RAY': '8b8b8b8b8b8b8b8b-ORD',
-                    'CF-Visitor': '{"scheme":"https"}',
-                    # ISP headers
-                    'X-Forwarded-Country': 'US',
-                    'X-Country-Code': 'US',
-                    'X-GeoIP-Country': 'US'
-                })
-
-                # Get API token if not available
-                current_api_token = self.api_token
-                if not current_api_token:
-                    logger.info("API token not found, attempting synchronous fetch for lyrics...")
-                    init_token_params = {
-                        'method': 'deezer.getUserData', 'input': '3', 
-                        'api_version': '1.0', 'api_token': ''
-                    }
-                    try:
-                        init_token_response = sync_session.get(
-                            self.PRIVATE_API_BASE, params=init_token_params, timeout=10
-                        )
-                        init_token_response.raise_for_status()
-                        init_token_data = init_token_response.json()
-                        
-                        if (init_token_data.get('error') and len(init_token_data['error']) > 0) or 'results' not in init_token_data:
-                            logger.error(f"Failed to get token for lyrics: {init_token_data}")
-                            return None
-                            
-                        current_api_token = init_token_data.get('results', {}).get('checkForm', '')
-                        if current_api_token:
-                            self.api_token = current_api_token
-                            self.csrf_token = current_api_token
-                        else:
-                            logger.error("Failed to get token for lyrics: 'checkForm' missing.")
-                            return None
-                            
-                    except requests.exceptions.RequestException as e:
-                        logger.error(f"HTTP error during token fetch for lyrics: {e}")
-                        return None
-
-                if not current_api_token:
-                    logger.error("API token is missing after fetch attempt. Cannot get lyrics.")
-                    return None
-
-                # Inner function to make API request with retry logic
-                def make_lyrics_request(api_token_to_use, retry=True):
-                    params = {
-                        'method': 'song.getLyrics',
-                        'api_version': '1.0',
-                        'api_token': api_token_to_use,
-                        'input': '3',
-                        'cid': int(time.time())
-                    }
-                    json_data = {'sng_id': str(track_id)}
-                    
-                    logger.debug(f"Fetching lyrics for track {track_id} (sync) with enhanced US region spoofing (IP: {us_ip})...")
-                    
-                    try:
-                        response = sync_session.post(
-                            self.PRIVATE_API_BASE,
-                            params=params,
-                            json=json_data,
-                            timeout=10
-                        )
-                        response.raise_for_status()
-                        data = response.json()
-                        
-                        if 'error' in data and data['error']:
-                            logger.warning(f"Lyrics API returned error for track {track_id}: {data['error']}")
-                            # Simple token error handling like the earlier version
-                            if isinstance(data['error'], dict) and 'VALID_TOKEN_REQUIRED' in data['error']:
-                                if retry:
-                                    logger.info("Attempting sync token refresh for lyrics (VALID_TOKEN_REQUIRED found)...")
-                                    refreshed_token = self._refresh_token_sync(sync_session)
-                                    if refreshed_token:
-                                        return make_lyrics_request(refreshed_token, retry=False)
-                                    else:
-                                        logger.error("Token refresh failed for lyrics. Cannot get lyrics.")
-                                        return None
-                            return None
-                        
-                        if 'results' not in data:
-                            logger.warning(f"No lyrics results found for track {track_id}")
-                            return None
-                        
-                        lyrics_data = data['results']
-                        logger.debug(f"Successfully fetched lyrics for track {track_id} (sync) with enhanced US region spoofing")
-                        return lyrics_data
-                        
-                    except requests.exceptions.RequestException as e:
-                        logger.error(f"HTTP error during lyrics fetch for track {track_id}: {e}")
-                        return None
-
-                # Make the request with retry logic
-                return make_lyrics_request(current_api_token)
-                
-            except Exception as e:
-                logger.error(f"Error fetching lyrics for track {track_id} (sync): {e}", exc_info=True)
-                return None
-        except Exception as e:
-            logger.error(f"Session error fetching lyrics for track {track_id}: {e}", exc_info=True)
-            return None
+        return self._run_sync(self.get_track_lyrics(track_id))
 
+    @on_background_loop
+    @single_flight
     async def search_tracks_by_artist_name(self, artist_name: str, limit: int = 50, index: int = 0) -> Optional[List[Dict]]:
         """Search tracks by artist name using the public search API."""
         if not artist_name:
@@ -3076,7 +2359,7 @@ class DeezerAPI:
         logger.info(f"Searching tracks by artist name: {artist_name} -> {url}")
 
         try:
-            async with session.get(url) as response:
+            async with session.get(url, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Track search failed: HTTP {response.status}")
                     return None
@@ -3086,6 +2369,8 @@ class DeezerAPI:
             logger.error(f"Error searching tracks by artist '{artist_name}': {e}")
             return None
 
+    @on_background_loop
+    @single_flight
     async def search_albums_by_artist_name(self, artist_name: str, limit: int = 100, index: int = 0) -> Optional[List[Dict]]:
         """Search albums by artist name using the public search API."""
         if not artist_name:
@@ -3101,7 +2386,7 @@ class DeezerAPI:
         logger.info(f"Searching albums by artist name: {artist_name} -> {url}")
 
         try:
-            async with session.get(url) as response:
+            async with session.get(url, proxy=self._proxy_url) as response:
                 if response.status != 200:
                     logger.error(f"Album search failed: HTTP {response.status}")
                     return None
@@ -3113,83 +2398,70 @@ class DeezerAPI:
 
     async def _search_albums_paginated(self, query: str, page_size: int = 100, max_pages: int = 10) -> List[Dict]:
         """Generic helper to paginate album search queries."""
-        session = await self._get_session()
-        if not session:
-            return []
-        results: List[Dict] = []
-        seen = set()
-        for page in range(max_pages):
-            index = page * page_size
-            url = f"{self.PUBLIC_API_BASE}/search/album?q={requests.utils.quote(query)}&limit={page_size}&index={index}"
-            try:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        break
-                    data = await response.json()
-                    items = data.get('data', []) if isinstance(data, dict) else []
-                    if not items:
-                        break
-                    added = 0
-                    for it in items:
-                        iid = it.get('id')
-                        if iid in seen:
-                            continue
-                        seen.add(iid)
-                        results.append(it)
-                        added += 1
-                    if len(items) < page_size:
-                        break
-            except Exception:
-                break
-        return results
+        return await self._get_list_all("/search/album", params={'q': query}, page_size=page_size,
+                                        max_items=page_size * max_pages, endpoint='search')
 
     async def _search_tracks_by_artist_paginated(self, artist_name: str, page_size: int = 100, max_pages: int = 10) -> List[Dict]:
-        session = await self._get_session()
-        if not session:
-            return []
-        query = f"artist:\"{artist_name}\""
-        results: List[Dict] = []
-        seen = set()
-        for page in range(max_pages):
-            index = page * page_size
-            url = f"{self.PUBLIC_API_BASE}/search/track?q={requests.utils.quote(query)}&limit={page_size}&index={index}"
-            try:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        break
-                    data = await response.json()
-                    items = data.get('data', []) if isinstance(data, dict) else []
-                    if not items:
-                        break
-                    for it in items:
-                        tid = it.get('id')
-                        if tid in seen:
-                            continue
-                        seen.add(tid)
-                        results.append(it)
-                    if len(items) < page_size:
-                        break
-            except Exception:
-                break
-        return results
-
-    async def get_artist_singles_full(self, artist_id: int, max_enrich: int = 200) -> List[Dict]:
+        """Paginate a track search for everything by an artist name."""
+        return await self._get_list_all("/search/track", params={'q': f'artist:"{artist_name}"'},
+                                        page_size=page_size, max_items=page_size * max_pages,
+                                        endpoint='search')
+
+    @on_background_loop
+    @single_flight
+    async def get_artist_singles_full(self, artist_id: int, max_enrich: int = 200,
+                                      on_partial: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
         """Comprehensively collect singles for an artist by combining multiple sources.
         - Paginated artist releases (public API)
         - Album search queries (artist:"name" single, artist:"name" (feat ...))
         - Track search grouped by album
         Applies de-duplication and light heuristics (record_type == 'single' OR nb_tracks <= 2).
+        
+        The sources are fetched concurrently and album details for the
+        enrichment run with bounded concurrency. on_partial, if given, is
+        called on the background loop thread with the singles found so far
+        after each source and enrichment batch. The result is cached.
         """
+        cache_key = f"artist_{artist_id}_singles_full_v1"
+        cached = self._load_from_cache(cache_key)
+        if isinstance(cached, list) and cached:
+            logger.debug(f"[SinglesAggregator] Returning cached singles for artist {artist_id} (count={len(cached)})")
+            return cached
+
+        def publish():
+            if not on_partial:
+                return
+            try:
+                # Copies, the enrichment keeps updating the originals
+                on_partial([dict(it) for it in self._filter_singles(singles_map.values())])
+            except Exception as e:
+                logger.debug(f"[SinglesAggregator] on_partial callback failed: {e}")
+
+        pending: List[asyncio.Future] = []
         try:
             artist = await self.get_artist_details(artist_id)
             if not artist:
                 return []
             name = artist.get('name', '')
+            singles_map: Dict[int, Dict] = {}
+
+            # All three sources are requested at once, merged in priority order
+            releases_task = asyncio.ensure_future(self.get_artist_albums_all(artist_id, page_size=100, max_pages=10))
+            search_task = asyncio.ensure_future(asyncio.gather(
+                self._search_albums_paginated(f'artist:"{name}" single', page_size=100, max_pages=5),
+                self._search_albums_paginated(f'artist:"{name}" (feat', page_size=100, max_pages=5),
+                self._search_tracks_by_artist_paginated(name, page_size=100, max_pages=5),
+                return_exceptions=True
+            ))
+            pending = [releases_task, search_task]
  
             # 1) Artist releases (authoritative)
-            releases = await self.get_artist_albums_all(artist_id, page_size=100, max_pages=10) or []
+            try:
+                releases = await releases_task or []
+            except Exception as e:
+                logger.warning(f"[SinglesAggregator] releases failed for artist {artist_id}: {e}")
+                releases = []
             logger.info(f"[SinglesAggregator] releases count: {len(releases)} for artist {artist_id} '{name}'")
-            singles_map: Dict[int, Dict] = {}
             for it in releases:
                 rid = it.get('id')
                 record_type = (it.get('record_type') or '').lower()
@@ -3198,13 +2470,15 @@ class DeezerAPI:
                     if rid is not None:
                         singles_map[rid] = it
             logger.info(f"[SinglesAggregator] after releases filter -> unique singles: {len(singles_map)}")
+            publish()
+
+            search_results = await search_task
+            album_search_results, feat_search_results, track_results = [
+                result if isinstance(result, list) else [] for result in search_results
+            ]
  
             # 2) Album search queries
-            q1 = f'artist:"{name}" single'
-            q2 = f'artist:"{name}" (feat'
-            album_search_results = []
-            album_search_results += await self._search_albums_paginated(q1, page_size=100, max_pages=5)
-            album_search_results += await self._search_albums_paginated(q2, page_size=100, max_pages=5)
+            album_search_results = album_search_results + feat_search_results
             logger.info(f"[SinglesAggregator] album search results: {len(album_search_results)}")
             for a in album_search_results:
                 aid = a.get('id')
@@ -3214,7 +2488,6 @@ class DeezerAPI:
             logger.info(f"[SinglesAggregator] after album search merge -> unique singles: {len(singles_map)}")
  
             # 3) Track search grouped by album
-            track_results = await self._search_tracks_by_artist_paginated(name, page_size=100, max_pages=5)
             logger.info(f"[SinglesAggregator] track search results: {len(track_results)}")
             for t in track_results:
                 album = t.get('album') or {}
@@ -3229,31 +2502,33 @@ class DeezerAPI:
                         'record_type': 'single'
                     }
             logger.info(f"[SinglesAggregator] after track search merge -> unique singles: {len(singles_map)}")
+            publish()
  
             # 4) Optional enrichment: fetch album details for up to max_enrich new items to confirm type
             final_list: List[Dict] = list(singles_map.values())
             enrich_candidates = [it for it in final_list if ('record_type' not in it or 'nb_tracks' not in it)]
             logger.info(f"[SinglesAggregator] enrichment candidates: {len(enrich_candidates)} (cap {max_enrich})")
-            for it in enrich_candidates[:max_enrich]:
-                aid = it.get('id')
-                details = await self.get_album_details(aid)
+            semaphore = asyncio.Semaphore(self._enrich_concurrency)
+
+            async def enrich(it: Dict):
+                async with semaphore:
+                    await self._list_limiter.acquire()
+                    details = await self.get_album_details(it.get('id'))
                 if details:
                     it.update(details)
+
+            pending = [asyncio.ensure_future(enrich(it)) for it in enrich_candidates[:max_enrich]]
+            for done, future in enumerate(asyncio.as_completed(pending), 1):
+                try:
+                    await future
+                except Exception as e:
+                    logger.debug(f"[SinglesAggregator] enrichment failed: {e}")
+                if done % 25 == 0 and done < len(pending):
+                    publish()
+            pending = []
  
             # 5) Filter to singles definitively or likely singles
-            filtered: List[Dict] = []
-            seen_ids: set = set()
-            for it in final_list:
-                aid = it.get('id')
-                if aid in seen_ids:
-                    continue
-                seen_ids.add(aid)
-                record_type = (it.get('record_type') or '').lower()
-                nb_tracks = it.get('nb_tracks', 0)
-                title = (it.get('title') or '').lower()
-                if record_type == 'single' or nb_tracks in (1, 2) or '(feat' in title or '(with' in title:
-                    filtered.append(it)
- 
+            filtered = self._filter_singles(final_list)
             logger.info(f"[SinglesAggregator] filtered final count: {len(filtered)}")
  
             # 6) Fallback: if still empty, use basic releases list filter
@@ -3270,9 +2545,31 @@ class DeezerAPI:
                     if record_type == 'single' or nb_tracks in (1, 2):
                         basic.append(it)
                 logger.warning(f"[SinglesAggregator] fallback basic singles count: {len(basic)}")
-                return basic
+                filtered = basic
  
+            if filtered:
+                self._save_to_cache(cache_key, filtered, endpoint='artist_albums')
             return filtered
         except Exception as e:
             logger.error(f"get_artist_singles_full failed for {artist_id}: {e}")
-            return []
\ No newline at end of file
+            return []
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _filter_singles(items) -> List[Dict]:
+        """Keep the definite and likely singles of a release list, de-duplicated by ID."""
+        filtered: List[Dict] = []
+        seen_ids: set = set()
+        for it in items:
+            aid = it.get('id')
+            if aid in seen_ids:
+                continue
+            seen_ids.add(aid)
+            record_type = (it.get('record_type') or '').lower()
+            nb_tracks = it.get('nb_tracks', 0)
+            title = (it.get('title') or '').lower()
+            if record_type == 'single' or nb_tracks in (1, 2) or '(feat' in title or '(with' in title:
+                filtered.append(it)
+        return filtered
\ No newline at end of file
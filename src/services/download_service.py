@@ -16,9 +16,12 @@ src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-from src.models.queue_models import QueueItem, QueueItemState, DownloadState, ItemType, TrackInfo, create_album_from_deezer_data, create_track_from_deezer_data, create_album_from_deezer_data_complete, create_album_from_deezer_data_complete_sync
+from src.models.queue_models import QueueItem, QueueItemState, DownloadState, ItemType, create_album_from_deezer_data, create_track_from_deezer_data, create_album_from_deezer_data_complete, create_album_from_deezer_data_complete_sync, track_info_from_deezer_data, ItemPriority
 from src.services.new_queue_manager import QueueManager
+from src.services.queue_scheduler import SchedulingPolicy
 from src.services.new_download_engine import DownloadEngine
+from src.services.track_list_expander import TrackListExpander
+from src.services.queue_validator import QueueValidator
 from src.services.event_bus import EventBus, QueueEvents, DownloadEvents, get_event_bus
 
 logger = logging.getLogger(__name__)
@@ -39,7 +42,10 @@ class DownloadService:
         
         # Initialize core components
         self.queue_manager = QueueManager(config_manager, self.event_bus)
-        self.download_engine = DownloadEngine(self.queue_manager, deezer_api, config_manager)
+        self.queue_validator = QueueValidator(self.queue_manager, self._get_expected_file_path, config_manager)
+        self.download_engine = DownloadEngine(self.queue_manager, deezer_api, config_manager,
+                                              validator=self.queue_validator)
+        self.track_expander = TrackListExpander(self.queue_manager, deezer_api, config_manager)
         
         # Service state
         self._is_running = False
@@ -55,14 +61,23 @@ class DownloadService:
         # Reset cancelled items to queued on startup
         self._reset_cancelled_items_on_startup()
         
-        # Fix track numbering in existing queue items
-        self._fix_track_numbering_in_queue()
+        # Fix track numbering and validate queued items against existing files
+        # in the background; the engine validates the items it is about to
+        # start on demand, so the queue is usable right away
+        self.queue_validator.start()
         
-        # Validate queue states against actual files
-        self._validate_queue_states_on_startup()
+        # Resume track expansion interrupted by the last shutdown
+        self._resume_interrupted_expansions()
         
-        # Validate items that are about to be processed
-        self._validate_priority_items()
+        # Opt-in warning for subscribers that stall event delivery
+        slow_subscriber_ms = self.config.get_setting('downloads.slow_subscriber_warning_ms', None)
+        if slow_subscriber_ms:
+            self.event_bus.set_slow_subscriber_threshold(slow_subscriber_ms)
+        
+        # Optionally move event delivery off the download threads
+        if self.config.get_setting('downloads.async_event_dispatch', False):
+            coalesce_ms = self.config.get_setting('downloads.event_coalesce_ms', 100)
+            self.event_bus.enable_async_dispatch(coalesce_window=coalesce_ms / 1000)
         
         self._is_running = True
         self.download_engine.start()
@@ -80,6 +95,7 @@ class DownloadService:
                         state.error_message = None
                         state.updated_at = datetime.now()
                         cancelled_count += 1
+                        self.queue_manager._sync_schedule(item_id)
                         self.event_bus.emit(QueueEvents.ITEM_STATE_CHANGED, item_id, state)
                 
                 if cancelled_count > 0:
@@ -89,187 +105,36 @@ class DownloadService:
         except Exception as e:
             logger.error(f"[DownloadService] Error resetting cancelled items: {e}")
     
-    def _fix_track_numbering_in_queue(self):
-        """Fix track numbering in existing queue items where all tracks have number 1."""
+    def _resume_interrupted_expansions(self, item_ids: Optional[List[str]] = None):
+        """
+        Restart background track fetching for items that were still expanding.
+        
+        Args:
+            item_ids: Only resume these items (default: every expanding item)
+        """
         try:
-            fixed_count = 0
             with self.queue_manager._lock:
-                for item_id, item in self.queue_manager.items.items():
-                    if item.item_type == ItemType.ALBUM:
-                        # Check if all tracks have track_number = 1 (indicating the bug)
-                        all_tracks_are_one = all(track.track_number == 1 for track in item.tracks)
-                        if all_tracks_are_one and len(item.tracks) > 1:
-                            # Fix track numbering by enumerating
-                            fixed_tracks = []
-                            for index, track in enumerate(item.tracks, 1):
-                                fixed_track = TrackInfo(
-                                    track_id=track.track_id,
-                                    title=track.title,
-                                    artist=track.artist,
-                                    duration=track.duration,
-                                    track_number=index,  # Use enumerated position
-                                    disc_number=track.disc_number
-                                )
-                                fixed_tracks.append(fixed_track)
-                            
-                            # Create new item with fixed tracks
-                            fixed_item = QueueItem(
-                                id=item.id,
-                                item_type=item.item_type,
-                                deezer_id=item.deezer_id,
-                                title=item.title,
-                                artist=item.artist,
-                                total_tracks=item.total_tracks,
-                                tracks=fixed_tracks,
-                                created_at=item.created_at,
-                                album_cover_url=getattr(item, 'album_cover_url', None)
-                            )
-                            
-                            # Replace the item
-                            self.queue_manager.items[item_id] = fixed_item
-                            fixed_count += 1
-                
-                if fixed_count > 0:
-                    self.queue_manager._persist_queue()
-                    logger.info(f"[DownloadService] Fixed track numbering for {fixed_count} album(s) in queue")
-                    
-        except Exception as e:
-            logger.error(f"[DownloadService] Error fixing track numbering: {e}")
-    
-    def _validate_queue_states_on_startup(self):
-        """Validate queue states against actual files on startup to prevent unnecessary processing."""
-        try:
-            from pathlib import Path
-            import os
-            
-            logger.info("[DownloadService] Starting queue state validation...")
-            validated_count = 0
-            queued_count = 0
-            completed_count = 0
-            with self.queue_manager._lock:
-                for item_id, item in self.queue_manager.items.items():
-                    state = self.queue_manager.states.get(item_id)
-                    if not state:
-                        continue
-                    
-                    if state.state == DownloadState.QUEUED:
-                        queued_count += 1
-                    elif state.state == DownloadState.COMPLETED:
-                        completed_count += 1
-                    
-                    # Skip items that are currently downloading or failed
-                    if state.state in [DownloadState.DOWNLOADING, DownloadState.FAILED, DownloadState.CANCELLED]:
-                        continue
-                    
-                    # Check if all files for this item already exist
-                    all_files_exist = True
-                    checked_files = 0
-                    
-                    if item.item_type == ItemType.ALBUM:
-                        # Check all tracks in the album
-                        for track in item.tracks:
-                            file_path = self._get_expected_file_path(item, track)
-                            checked_files += 1
-                            if not file_path or not file_path.exists():
-                                all_files_exist = False
-                                break
-                    else:
-                        # Single track
-                        file_path = self._get_expected_file_path(item, item.tracks[0] if item.tracks else None)
-                        checked_files += 1
-                        if not file_path or not file_path.exists():
-                            all_files_exist = False
-                    
-                    # Debug logging for first few items
-                    if queued_count <= 3:
-                        logger.info(f"[DownloadService] Validation check: {item.title} - {checked_files} files checked, all exist: {all_files_exist}")
-                        if item.item_type == ItemType.ALBUM and item.tracks:
-                            first_track_path = self._get_expected_file_path(item, item.tracks[0])
-                            logger.info(f"[DownloadService] First track expected path: {first_track_path}")
-                            if first_track_path:
-                                logger.info(f"[DownloadService] Path exists: {first_track_path.exists()}")
-                    
-                    # Update state based on file existence
-                    if all_files_exist:
-                        # All files exist - mark as completed (only if not already completed)
-                        if state.state != DownloadState.COMPLETED:
-                            state.state = DownloadState.COMPLETED
-                            state.progress = 1.0
-                            state.completed_tracks = item.total_tracks
-                            state.failed_tracks = 0
-                            state.status_message = "Files already exist"
-                            state.updated_at = datetime.now()
-                            validated_count += 1
-                    else:
-                        # Some files missing - only reset to queued if it was never properly completed
-                        # If it was completed before, respect that status even if files are moved/deleted
-                        if state.state == DownloadState.COMPLETED:
-                            logger.info(f"[DownloadService] Download was completed previously, keeping completed status even though files are missing: {item.title}")
-                            # Keep the completed status - user may have moved/deleted files intentionally
-                        elif state.state == DownloadState.QUEUED:
-                            # This was never completed, so we can validate it
-                            logger.info(f"[DownloadService] Queued download has missing files, will need to download: {item.title}")
-                        # Don't reset completed items back to queued
-                
-                if validated_count > 0:
-                    self.queue_manager._persist_queue()
-                    logger.info(f"[DownloadService] Validated {validated_count} items as completed on startup")
-                
-                logger.info(f"[DownloadService] Queue state summary: {queued_count} queued, {completed_count} completed, {validated_count} validated")
-                    
-        except Exception as e:
-            logger.error(f"[DownloadService] Error validating queue states: {e}", exc_info=True)
-    
-    def _validate_priority_items(self):
-        """Validate items that are about to be processed by the download engine."""
-        try:
-            logger.info("[DownloadService] Validating priority items that will be processed...")
-            
-            # Get the same items that the download engine will process
-            queued_items = self.queue_manager.get_next_queued_items(limit=20)
-            validated_count = 0
-            
-            for item in queued_items:
-                # Check if all files for this item already exist
-                all_files_exist = True
-                
-                if item.item_type == ItemType.ALBUM:
-                    # Check all tracks in the album
-                    for track in item.tracks:
-                        file_path = self._get_expected_file_path(item, track)
-                        if not file_path or not file_path.exists():
-                            all_files_exist = False
-                            break
-                else:
-                    # Single track
-                    file_path = self._get_expected_file_path(item, item.tracks[0] if item.tracks else None)
-                    if not file_path or not file_path.exists():
-                        all_files_exist = False
-                
-                # If all files exist, mark as completed
-                if all_files_exist:
-                    with self.queue_manager._lock:
-                        state = self.queue_manager.states.get(item.id)
-                        if state and state.state == DownloadState.QUEUED:
-                            state.state = DownloadState.COMPLETED
-                            state.progress = 1.0
-                            state.status_message = "Files already exist"
-                            state.updated_at = datetime.now()
-                            validated_count += 1
-                            logger.info(f"[DownloadService] Marked as completed: {item.title}")
-            
-            if validated_count > 0:
-                self.queue_manager._persist_queue()
-                logger.info(f"[DownloadService] Validated {validated_count} priority items as completed")
-            else:
-                logger.info("[DownloadService] No priority items needed validation")
+                pending = [
+                    item for item_id, item in self.queue_manager.items.items()
+                    if (item_ids is None or item_id in item_ids)
+                    and self.queue_manager.states.get(item_id) and self.queue_manager.states[item_id].expanding
+                ]
+            
+            for item in pending:
+                logger.info(f"[DownloadService] Resuming track expansion for {item.title} ({len(item.tracks)}/{item.total_tracks} tracks)")
+                self.track_expander.expand(
+                    item.id, item.item_type, item.deezer_id,
+                    start_index=len(item.tracks),
+                    total=item.total_tracks if item.total_tracks > len(item.tracks) else None
+                )
                 
         except Exception as e:
-            logger.error(f"[DownloadService] Error validating priority items: {e}", exc_info=True)
+            logger.error(f"[DownloadService] Error resuming track expansion: {e}")
     
     def _get_expected_file_path(self, item, track=None):
         """Get the expected file path for an item/track."""
         try:
+            import re
             from pathlib import Path
             
             # Get download settings
@@ -291,6 +156,12 @@ class DownloadService:
             else:
                 path = downloads_dir
             
+            # Multi-disc albums keep each disc in its own folder (see DownloadWorker._create_track_directory)
+            if (track and item.item_type == ItemType.ALBUM and folder_structure.get('create_cd_folders', True)
+                    and len({t.disc_number or 1 for t in item.tracks}) > 1):
+                cd_template = (folder_structure.get('templates') or {}).get('cd', 'CD %disc_number%')
+                path = path / re.sub(r'[<>:"/\\|?*]', '_', cd_template.replace('%disc_number%', str(track.disc_number or 1)))
+            
             # Generate filename
             if track:
                 if folder_structure.get('include_track_number', True):
@@ -301,7 +172,6 @@ class DownloadService:
                 filename = f"{item.artist} - {item.title}{ext}"
             
             # Clean filename
-            import re
             filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
             
             return path / filename
@@ -316,38 +186,54 @@ class DownloadService:
             return
         
         self._is_running = False
+        self.queue_validator.stop()
+        self.track_expander.shutdown()
         self.download_engine.stop()
+        self.event_bus.disable_async_dispatch()
         
         logger.info("[DownloadService] Download service stopped")
     
     # Queue Management Methods
     
-    def add_album(self, album_data: Dict[str, Any]) -> str:
+    def add_album(self, album_data: Dict[str, Any], priority: ItemPriority = ItemPriority.NORMAL) -> str:
         """
         Add album to download queue.
         
+        Albums whose response holds fewer tracks than ``nb_tracks`` are enqueued
+        immediately with the tracks at hand; the remaining pages are fetched in
+        the background and appended while the first tracks download.
+        
         Args:
             album_data: Album data from Deezer API
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
         """
         try:
-            # Create queue item from Deezer data with complete track fetching
-            import asyncio
-            import concurrent.futures
-            
-            # Use the synchronous version to avoid async context issues
-            try:
-                logger.info("[DownloadService] Using synchronous complete album creation")
-                queue_item = create_album_from_deezer_data_complete_sync(album_data, self.deezer_api)
-            except Exception as e:
-                # If complete function fails, fall back to basic function
-                logger.warning(f"[DownloadService] Synchronous complete album creation failed ({e}), falling back to basic creation")
-                queue_item = create_album_from_deezer_data(album_data)
+            track_list = album_data.get('tracks', {}).get('data', [])
+            total_tracks = album_data.get('nb_tracks') or len(track_list)
+            
+            if len(track_list) < total_tracks and self.deezer_api:
+                tracks = [track_info_from_deezer_data(track_data, position)
+                          for position, track_data in enumerate(track_list, 1)]
+                queue_item = QueueItem(
+                    id="",  # Will be generated
+                    item_type=ItemType.ALBUM,
+                    deezer_id=album_data['id'],
+                    title=album_data['title'],
+                    artist=album_data['artist']['name'],
+                    total_tracks=total_tracks,
+                    tracks=tracks,
+                    created_at=datetime.now(),
+                    album_cover_url=album_data.get('cover_xl')
+                )
+                return self._add_expanding_item(queue_item, priority=priority)
+            
+            queue_item = create_album_from_deezer_data(album_data)
             
             # Add to queue
-            item_id = self.queue_manager.add_item(queue_item)
+            item_id = self.queue_manager.add_item(queue_item, priority=priority)
             
             logger.info(f"[DownloadService] Added album to queue: {queue_item.title} by {queue_item.artist} ({len(queue_item.tracks)} tracks)")
             return item_id
@@ -380,12 +266,16 @@ class DownloadService:
             logger.error(f"[DownloadService] Error adding album to queue (async): {e}")
             raise
     
-    def add_track(self, track_data: Dict[str, Any]) -> str:
+    def add_track(self, track_data: Dict[str, Any], priority: ItemPriority = ItemPriority.INTERACTIVE) -> str:
         """
         Add single track to download queue.
         
+        Single tracks are usually clicked directly by the user, so they are
+        scheduled as interactive by default and overtake bulk imports.
+        
         Args:
             track_data: Track data from Deezer API
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
@@ -395,7 +285,7 @@ class DownloadService:
             queue_item = create_track_from_deezer_data(track_data)
             
             # Add to queue
-            item_id = self.queue_manager.add_item(queue_item)
+            item_id = self.queue_manager.add_item(queue_item, priority=priority)
             
             logger.info(f"[DownloadService] Added track to queue: {queue_item.title} by {queue_item.artist}")
             return item_id
@@ -404,54 +294,47 @@ class DownloadService:
             logger.error(f"[DownloadService] Error adding track to queue: {e}")
             raise
     
-    def add_playlist(self, playlist_data: Dict[str, Any]) -> str:
+    def add_playlist(self, playlist_data: Dict[str, Any], priority: ItemPriority = ItemPriority.NORMAL) -> str:
         """
         Add playlist to download queue.
         
+        The playlist is enqueued immediately with whatever tracks the data
+        already holds; missing pages are fetched concurrently in the background
+        and appended, so the first tracks can download while the rest expand.
+        
         Args:
             playlist_data: Playlist data from Deezer API (may be basic or full)
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
         """
         try:
-            # Check if we have full playlist data with tracks, or just basic data
             tracks = []
-            if 'tracks' in playlist_data and 'data' in playlist_data['tracks']:
-                # Full playlist data - extract tracks directly
-                for track_data in playlist_data['tracks']['data']:
-                    track_info = TrackInfo(
-                        track_id=track_data['id'],
-                        title=track_data['title'],
-                        artist=track_data['artist']['name'],
-                        duration=track_data['duration']
-                    )
-                    tracks.append(track_info)
-            else:
-                # Basic playlist data - need to fetch tracks from API
-                playlist_id = playlist_data.get('id')
-                if playlist_id and self.deezer_api:
-                    logger.info(f"[DownloadService] Fetching tracks for playlist {playlist_id}")
-                    # Since we're in a sync context but need async, we'll defer the track fetching
-                    # to the download worker which can handle async operations properly
-                    logger.info(f"[DownloadService] Will fetch playlist tracks during download process")
-                else:
-                    logger.error(f"[DownloadService] No playlist ID or DeezerAPI available for fetching tracks")
+            track_list = playlist_data.get('tracks', {}).get('data', [])
+            for position, track_data in enumerate(track_list, 1):
+                tracks.append(track_info_from_deezer_data(track_data, position))
+            
+            # nb_tracks is present in both basic (search) and full playlist data
+            total_tracks = playlist_data.get('nb_tracks')
+            needs_expansion = bool(self.deezer_api) and (total_tracks is None or len(tracks) < total_tracks)
             
-            # Create playlist queue item
             queue_item = QueueItem(
                 id="",  # Will be generated
                 item_type=ItemType.PLAYLIST,
                 deezer_id=playlist_data['id'],
                 title=playlist_data['title'],
                 artist=playlist_data.get('creator', {}).get('name', 'Various Artists'),
-                total_tracks=len(tracks),
+                total_tracks=total_tracks if needs_expansion and total_tracks else len(tracks),
                 tracks=tracks,
                 created_at=datetime.now()
             )
             
+            if needs_expansion:
+                return self._add_expanding_item(queue_item, total_known=total_tracks is not None, priority=priority)
+            
             # Add to queue
-            item_id = self.queue_manager.add_item(queue_item)
+            item_id = self.queue_manager.add_item(queue_item, priority=priority)
             
             logger.info(f"[DownloadService] Added playlist to queue: {queue_item.title} ({len(tracks)} tracks)")
             return item_id
@@ -460,6 +343,23 @@ class DownloadService:
             logger.error(f"[DownloadService] Error adding playlist to queue: {e}")
             raise
     
+    def _add_expanding_item(self, queue_item: QueueItem, total_known: bool = True,
+                            priority: ItemPriority = ItemPriority.NORMAL) -> Optional[str]:
+        """Enqueue a partially populated item and stream its remaining tracks in."""
+        item_id = self.queue_manager.add_item(queue_item, expanding=True, priority=priority)
+        if not item_id:
+            return None
+        
+        self.track_expander.expand(
+            item_id, queue_item.item_type, queue_item.deezer_id,
+            start_index=len(queue_item.tracks),
+            total=queue_item.total_tracks if total_known else None
+        )
+        
+        logger.info(f"[DownloadService] Added {queue_item.item_type.value} to queue: {queue_item.title} "
+                    f"({len(queue_item.tracks)}/{queue_item.total_tracks} tracks, expanding in background)")
+        return item_id
+    
     def remove_item(self, item_id: str) -> bool:
         """
         Remove item from queue.
@@ -575,24 +475,92 @@ class DownloadService:
         except Exception as e:
             logger.error(f"[DownloadService] Error clearing all downloads: {e}")
     
-    def retry_failed(self) -> int:
+    def set_item_priority(self, item_id: str, priority: ItemPriority) -> bool:
+        """
+        Move an item to a different priority class.
+        
+        Args:
+            item_id: Queue item ID
+            priority: New priority class
+            
+        Returns:
+            True if the item was found
+        """
+        try:
+            return self.queue_manager.set_priority(item_id, priority)
+            
+        except Exception as e:
+            logger.error(f"[DownloadService] Error setting item priority: {e}")
+            return False
+    
+    def set_scheduling_policy(self, policy: SchedulingPolicy):
+        """Switch the order in which queued items of the same priority are started."""
+        try:
+            self.download_engine.set_scheduling_policy(policy)
+            
+        except Exception as e:
+            logger.error(f"[DownloadService] Error setting scheduling policy: {e}")
+    
+    def retry_failed(self, quality: str = None) -> int:
         """
         Retry all failed downloads.
         
+        Items whose last run completed with some failed tracks only download
+        those tracks again.
+        
+        Args:
+            quality: Optional quality for the retry (e.g. 'MP3_320' after a FLAC failure)
+        
         Returns:
             Number of items set to retry
         """
         try:
-            count = self.queue_manager.retry_failed_items()
+            # Failed items whose track list was left incomplete fetch the rest again
+            stalled = [
+                item.id for item in self.queue_manager.get_items_by_state(DownloadState.FAILED)
+                if self.queue_manager.get_state(item.id) and self.queue_manager.get_state(item.id).expanding
+            ]
+            count = self.queue_manager.retry_failed_items(quality)
             logger.info(f"[DownloadService] Set {count} failed items to retry")
+            if count and stalled:
+                self._resume_interrupted_expansions(stalled)
             return count
             
         except Exception as e:
             logger.error(f"[DownloadService] Error retrying failed downloads: {e}")
             return 0
     
+    def retry_item(self, item_id: str, quality: str = None) -> bool:
+        """
+        Retry a single download, limited to its failed tracks if known.
+        
+        Args:
+            item_id: Queue item ID
+            quality: Optional quality for the retry
+            
+        Returns:
+            True if the item was set to retry
+        """
+        try:
+            retried = self.queue_manager.retry_item(item_id, quality)
+            if retried:
+                logger.info(f"[DownloadService] Set item {item_id} to retry")
+                self._resume_interrupted_expansions([item_id])
+            return retried
+            
+        except Exception as e:
+            logger.error(f"[DownloadService] Error retrying item: {e}")
+            return False
+    
     # Status and Information Methods
     
+    def get_event_metrics(self) -> Dict[str, Any]:
+        """Get event bus emit rates and subscriber latencies (see EventBus.get_metrics)."""
+        metrics = self.event_bus.get_metrics()
+        metrics['dispatch'] = self.event_bus.get_dispatch_stats()
+        metrics['leaks'] = self.event_bus.get_leak_report()
+        return metrics
+    
     def get_queue_items(self) -> List[QueueItem]:
         """Get all queue items."""
         return self.queue_manager.get_all_items()
@@ -681,9 +649,9 @@ class DownloadService:
     
     # Event System Access
     
-    def subscribe_to_events(self, event_type: str, callback):
-        """Subscribe to download events."""
-        self.event_bus.subscribe(event_type, callback)
+    def subscribe_to_events(self, event_type: str, callback, weak: bool = False):
+        """Subscribe to download events (weak=True for widgets, see EventBus.subscribe)."""
+        self.event_bus.subscribe(event_type, callback, weak=weak)
     
     def unsubscribe_from_events(self, event_type: str, callback):
         """Unsubscribe from download events."""
@@ -691,12 +659,13 @@ class DownloadService:
     
     # Legacy Compatibility Methods (for migration)
     
-    def download_album(self, album_id: int) -> str:
+    def download_album(self, album_id: int, priority: ItemPriority = ItemPriority.NORMAL) -> str:
         """
         Legacy method for downloading album by ID.
         
         Args:
             album_id: Deezer album ID
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
@@ -707,18 +676,19 @@ class DownloadService:
             if not album_data:
                 raise ValueError(f"Could not fetch album data for ID {album_id}")
             
-            return self.add_album(album_data)
+            return self.add_album(album_data, priority=priority)
             
         except Exception as e:
             logger.error(f"[DownloadService] Error downloading album {album_id}: {e}")
             raise
     
-    def download_track(self, track_id: int) -> str:
+    def download_track(self, track_id: int, priority: ItemPriority = ItemPriority.INTERACTIVE) -> str:
         """
         Legacy method for downloading track by ID.
         
         Args:
             track_id: Deezer track ID
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
@@ -729,18 +699,19 @@ class DownloadService:
             if not track_data:
                 raise ValueError(f"Could not fetch track data for ID {track_id}")
             
-            return self.add_track(track_data)
+            return self.add_track(track_data, priority=priority)
             
         except Exception as e:
             logger.error(f"[DownloadService] Error downloading track {track_id}: {e}")
             raise
     
-    def download_playlist(self, playlist_id: int) -> str:
+    def download_playlist(self, playlist_id: int, priority: ItemPriority = ItemPriority.NORMAL) -> str:
         """
         Legacy method for downloading playlist by ID.
         
         Args:
             playlist_id: Deezer playlist ID
+            priority: Scheduling priority class
             
         Returns:
             Queue item ID
@@ -751,12 +722,36 @@ class DownloadService:
             if not playlist_data:
                 raise ValueError(f"Could not fetch playlist data for ID {playlist_id}")
             
-            return self.add_playlist(playlist_data)
+            return self.add_playlist(playlist_data, priority=priority)
             
         except Exception as e:
             logger.error(f"[DownloadService] Error downloading playlist {playlist_id}: {e}")
             raise
 
+    def download_item(self, item_type: str, deezer_id: int, priority: Optional[ItemPriority] = None) -> str:
+        """
+        Download an album, playlist or track by type name and ID.
+
+        Args:
+            item_type: 'album', 'playlist' or 'track'
+            deezer_id: Deezer ID of the item
+            priority: Scheduling priority class (the type's default if None)
+
+        Returns:
+            Queue item ID, or None if the item is already queued
+        """
+        methods = {
+            ItemType.ALBUM.value: self.download_album,
+            ItemType.PLAYLIST.value: self.download_playlist,
+            ItemType.TRACK.value: self.download_track,
+        }
+        if item_type not in methods:
+            raise ValueError(f"Unknown item type: {item_type}")
+
+        if priority is None:
+            return methods[item_type](deezer_id)
+        return methods[item_type](deezer_id, priority=priority)
+
 
 # Factory function for easy creation
 def create_download_service(config_manager, deezer_api) -> DownloadService:
@@ -7,12 +7,159 @@ to communicate without tight coupling or complex signal management.
 
 import threading
 import logging
-from typing import Dict, List, Callable, Any
-from collections import defaultdict
+import time
+import weakref
+from typing import Dict, List, Callable, Any, Optional, Tuple
+from collections import defaultdict, deque
+
+try:
+    from PyQt6 import sip
+except ImportError:  # Qt is optional for the bus itself
+    sip = None
 
 logger = logging.getLogger(__name__)
 
 
+# Topics whose events only matter in their latest form per item; in async
+# dispatch mode they are coalesced to one event per item per window. The
+# first positional argument of these events is the item ID.
+COALESCED_EVENTS = frozenset({
+    "download.progress",
+    "queue.item_state_changed",
+})
+
+
+def _subscriber_name(callback: Callable) -> str:
+    """Readable name for a subscriber, e.g. 'DownloadEngine._on_download_completed'"""
+    owner = getattr(callback, '__self__', None)
+    name = getattr(callback, '__name__', None) or type(callback).__name__
+    if owner is not None:
+        return f"{type(owner).__name__}.{name}"
+    return f"{getattr(callback, '__module__', '?')}.{getattr(callback, '__qualname__', name)}"
+
+
+def _is_qt_deleted(obj) -> bool:
+    """Check if obj wraps a Qt object whose C++ side has been destroyed"""
+    if sip is None or not isinstance(obj, sip.simplewrapper):
+        return False
+    try:
+        return sip.isdeleted(obj)
+    except TypeError:
+        return False
+
+
+class _Subscription:
+    """
+    A subscribed callback, held strongly or through a weak reference.
+
+    Weak subscriptions to bound methods only reference the owner weakly, so
+    subscribing does not keep a widget alive; they resolve to None once the
+    owner is garbage collected or, for Qt objects, destroyed.
+    """
+
+    __slots__ = ('callback', 'ref', 'owner_ref', 'name', 'owner_type')
+
+    def __init__(self, callback: Callable, weak: bool, on_dead: Callable):
+        self.name = _subscriber_name(callback)
+        owner = getattr(callback, '__self__', None)
+        self.owner_type = type(owner).__name__ if owner is not None else None
+        self.owner_ref = None
+        if owner is not None:
+            try:
+                self.owner_ref = weakref.ref(owner)
+            except TypeError:
+                pass
+
+        if weak:
+            self.callback = None
+            if owner is not None:
+                self.ref = weakref.WeakMethod(callback, lambda _: on_dead())
+            else:
+                self.ref = weakref.ref(callback, lambda _: on_dead())
+        else:
+            self.callback = callback
+            self.ref = None
+
+    @property
+    def weak(self) -> bool:
+        return self.ref is not None
+
+    def owner(self):
+        return self.owner_ref() if self.owner_ref is not None else None
+
+    def resolve(self) -> Optional[Callable]:
+        """The callback, or None if a weak subscription's owner is gone"""
+        if self.ref is None:
+            return self.callback
+        callback = self.ref()
+        if callback is not None and _is_qt_deleted(getattr(callback, '__self__', None)):
+            return None
+        return callback
+
+    def matches(self, callback: Callable) -> bool:
+        target = self.resolve()
+        return target is not None and target == callback
+
+
+class _SubscriberStats:
+    """Call count, latency and error counters for one subscriber of one topic"""
+    
+    __slots__ = ('calls', 'errors', 'last_error', 'total_time', 'max_time', 'recent')
+    
+    RECENT_SAMPLES = 256  # Latencies kept for the p95
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.recent = deque(maxlen=self.RECENT_SAMPLES)
+    
+    def record(self, elapsed: float, error: Optional[Exception]):
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if error is not None:
+            self.errors += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+        self.recent.append(elapsed)
+    
+    def p95(self) -> float:
+        if not self.recent:
+            return 0.0
+        samples = sorted(self.recent)
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+class _TopicStats:
+    """Emit counter with per-second buckets for the recent emit rate"""
+    
+    __slots__ = ('emitted', 'buckets')
+    
+    RATE_WINDOW = 10  # Seconds the emit rate is averaged over
+    
+    def __init__(self):
+        self.emitted = 0
+        self.buckets = deque(maxlen=self.RATE_WINDOW + 1)  # [second, count]
+    
+    def record(self, now: float):
+        self.emitted += 1
+        second = int(now)
+        if self.buckets and self.buckets[-1][0] == second:
+            self.buckets[-1][1] += 1
+        else:
+            self.buckets.append([second, 1])
+    
+    def rate(self, now: float) -> float:
+        """Average emits per second over the last RATE_WINDOW completed seconds"""
+        current = int(now)
+        recent = sum(count for second, count in self.buckets
+                     if current - self.RATE_WINDOW <= second < current)
+        return recent / self.RATE_WINDOW
+
+
 class EventBus:
     """
     Thread-safe event bus for component communication.
@@ -22,21 +169,55 @@ class EventBus:
     """
     
     def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self.subscribers: Dict[str, List[_Subscription]] = defaultdict(list)
         self._lock = threading.RLock()
         self._event_count = 0
+        
+        # Set by weak reference callbacks; dead subscriptions are purged lazily
+        # because those callbacks can run in the middle of any GC
+        self._has_dead = False
+        self._auto_removed: Dict[str, int] = defaultdict(int)  # subscriber name -> count
+        
+        # Per-thread stacks of open EventBatch collections
+        self._local = threading.local()
+        
+        # Asynchronous dispatch (off by default, see enable_async_dispatch)
+        self._async = False
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_cond = threading.Condition(threading.Lock())
+        self._queues: Dict[str, deque] = {}  # topic -> deque of (seq, args, kwargs)
+        self._coalesced: Dict[str, Dict[Any, Tuple[int, tuple, dict]]] = {}  # topic -> key -> latest
+        self._coalesced_since: Optional[float] = None
+        self._seq = 0
+        self._max_queue_size = 10000
+        self._coalesce_window = 0.1
+        self._in_flight = 0
+        self._dropped_count = 0
+        self._coalesced_count = 0
+        
+        # Instrumentation, see get_metrics()
+        self._metrics_lock = threading.Lock()
+        self._topic_stats: Dict[str, _TopicStats] = defaultdict(_TopicStats)
+        self._subscriber_stats: Dict[Tuple[str, str], _SubscriberStats] = defaultdict(_SubscriberStats)
+        self._slow_threshold: Optional[float] = None
     
-    def subscribe(self, event_type: str, callback: Callable):
+    def subscribe(self, event_type: str, callback: Callable, weak: bool = False):
         """
         Subscribe to an event type.
         
         Args:
             event_type: The type of event to listen for
             callback: Function to call when event is emitted
+            weak: Hold the callback through a weak reference. The subscription
+                then doesn't keep the callback's owner alive and drops itself
+                once the owner is garbage collected or its Qt object destroyed.
+                Use for widgets and other objects with a limited lifetime.
         """
         with self._lock:
-            self.subscribers[event_type].append(callback)
-            logger.debug(f"[EventBus] Subscribed to '{event_type}' (total subscribers: {len(self.subscribers[event_type])})")
+            self._purge_dead()
+            self.subscribers[event_type].append(_Subscription(callback, weak, self._mark_dead))
+            logger.debug(f"[EventBus] Subscribed to '{event_type}'{' (weak)' if weak else ''} "
+                         f"(total subscribers: {len(self.subscribers[event_type])})")
     
     def unsubscribe(self, event_type: str, callback: Callable):
         """
@@ -48,25 +229,85 @@ class EventBus:
         """
         with self._lock:
             if event_type in self.subscribers:
-                try:
-                    self.subscribers[event_type].remove(callback)
-                    logger.debug(f"[EventBus] Unsubscribed from '{event_type}'")
-                except ValueError:
-                    logger.warning(f"[EventBus] Callback not found for '{event_type}'")
+                for subscription in self.subscribers[event_type]:
+                    if subscription.matches(callback):
+                        self.subscribers[event_type].remove(subscription)
+                        logger.debug(f"[EventBus] Unsubscribed from '{event_type}'")
+                        return
+                logger.warning(f"[EventBus] Callback not found for '{event_type}'")
+    
+    def unsubscribe_owner(self, owner: Any) -> int:
+        """
+        Remove every subscription whose callback is a method of owner.
+        
+        Returns:
+            Number of subscriptions removed
+        """
+        removed = 0
+        with self._lock:
+            for event_type in list(self.subscribers):
+                remaining = [sub for sub in self.subscribers[event_type] if sub.owner() is not owner]
+                removed += len(self.subscribers[event_type]) - len(remaining)
+                self.subscribers[event_type] = remaining
+        if removed:
+            logger.debug(f"[EventBus] Removed {removed} subscriptions of {type(owner).__name__}")
+        return removed
+    
+    def _mark_dead(self):
+        """Weak reference callback: a weak subscriber's owner was collected"""
+        self._has_dead = True
+    
+    def _purge_dead(self):
+        """Drop subscriptions whose weak callback has died (call under lock)"""
+        if not self._has_dead:
+            return
+        self._has_dead = False
+        for event_type in list(self.subscribers):
+            alive = []
+            for subscription in self.subscribers[event_type]:
+                if subscription.resolve() is None:
+                    self._auto_removed[subscription.name] += 1
+                else:
+                    alive.append(subscription)
+            if len(alive) != len(self.subscribers[event_type]):
+                logger.debug(f"[EventBus] Dropped {len(self.subscribers[event_type]) - len(alive)} "
+                             f"dead subscribers of '{event_type}'")
+                self.subscribers[event_type] = alive
     
     def emit(self, event_type: str, *args, **kwargs):
         """
         Emit an event to all subscribers.
         
+        In async dispatch mode the event is queued and this returns
+        immediately; subscribers run on the dispatcher thread.
+        
         Args:
             event_type: The type of event to emit
             *args: Positional arguments to pass to callbacks
             **kwargs: Keyword arguments to pass to callbacks
         """
+        now = time.monotonic()
+        with self._metrics_lock:
+            self._topic_stats[event_type].record(now)
+        
+        batches = getattr(self._local, 'batches', None)
+        if batches:
+            batches[-1].append((event_type, args, kwargs))
+            return
+        
+        if self._async:
+            self._enqueue(event_type, args, kwargs)
+            return
+        
+        self._dispatch(event_type, args, kwargs)
+    
+    def _dispatch(self, event_type: str, args: tuple, kwargs: dict):
+        """Run the subscribers of an event on the calling thread"""
         with self._lock:
             self._event_count += 1
             event_id = self._event_count
             
+            self._purge_dead()
             if event_type not in self.subscribers:
                 logger.debug(f"[EventBus] No subscribers for event '{event_type}' (#{event_id})")
                 return
@@ -76,11 +317,266 @@ class EventBus:
         # Call subscribers outside the lock to prevent deadlocks
         logger.debug(f"[EventBus] Emitting '{event_type}' to {len(subscribers)} subscribers (#{event_id})")
         
-        for callback in subscribers:
+        for subscription in subscribers:
+            callback = subscription.resolve()
+            if callback is None:
+                # Owner collected or its Qt object destroyed
+                self._has_dead = True
+                continue
+            
+            error = None
+            started = time.perf_counter()
             try:
                 callback(*args, **kwargs)
             except Exception as e:
-                logger.error(f"[EventBus] Error in callback for '{event_type}': {e}", exc_info=True)
+                error = e
+            elapsed = time.perf_counter() - started
+            
+            name = subscription.name
+            with self._metrics_lock:
+                self._subscriber_stats[(event_type, name)].record(elapsed, error)
+            
+            if error is not None:
+                logger.error(f"[EventBus] Error in callback for '{event_type}': {error}", exc_info=error)
+            
+            if self._slow_threshold is not None and elapsed >= self._slow_threshold:
+                logger.warning(f"[EventBus] Slow subscriber {name} took {elapsed * 1000:.1f}ms "
+                               f"for '{event_type}' on thread {threading.current_thread().name}")
+    
+    # Instrumentation
+    
+    def set_slow_subscriber_threshold(self, threshold_ms: Optional[float]):
+        """
+        Log a warning for every callback slower than threshold_ms.
+        
+        Args:
+            threshold_ms: Threshold in milliseconds, or None to disable
+        """
+        self._slow_threshold = None if threshold_ms is None else threshold_ms / 1000
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get per-topic emit counts/rates and per-subscriber latencies.
+        
+        Returns:
+            Dict with 'total_events', 'topics' (topic -> emitted, rate_per_sec)
+            and 'subscribers', a list of per-subscriber stats sorted by
+            cumulative callback time (slowest first). Times are in ms.
+        """
+        now = time.monotonic()
+        with self._metrics_lock:
+            topics = {
+                topic: {'emitted': stats.emitted, 'rate_per_sec': round(stats.rate(now), 2)}
+                for topic, stats in self._topic_stats.items()
+            }
+            subscribers = [
+                {
+                    'topic': topic,
+                    'subscriber': name,
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'last_error': stats.last_error,
+                    'total_ms': round(stats.total_time * 1000, 3),
+                    'avg_ms': round(stats.total_time * 1000 / stats.calls, 3) if stats.calls else 0.0,
+                    'p95_ms': round(stats.p95() * 1000, 3),
+                    'max_ms': round(stats.max_time * 1000, 3),
+                }
+                for (topic, name), stats in self._subscriber_stats.items()
+            ]
+        
+        subscribers.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        return {
+            'total_events': sum(topic['emitted'] for topic in topics.values()),
+            'topics': topics,
+            'subscribers': subscribers,
+        }
+    
+    def format_metrics(self, limit: int = 10) -> str:
+        """Human readable summary of get_metrics() for logs and debugging"""
+        metrics = self.get_metrics()
+        lines = [f"EventBus: {metrics['total_events']} events emitted"]
+        for topic, stats in sorted(metrics['topics'].items(), key=lambda t: -t[1]['emitted']):
+            lines.append(f"  {topic:<32} {stats['emitted']:>8} total {stats['rate_per_sec']:>8.1f}/s")
+        lines.append("Slowest subscribers (cumulative):")
+        for entry in metrics['subscribers'][:limit]:
+            lines.append(f"  {entry['subscriber']:<48} {entry['topic']:<32} calls={entry['calls']} "
+                         f"total={entry['total_ms']:.1f}ms p95={entry['p95_ms']:.2f}ms "
+                         f"max={entry['max_ms']:.1f}ms errors={entry['errors']}")
+        return "\n".join(lines)
+    
+    def reset_metrics(self):
+        """Clear all collected metrics"""
+        with self._metrics_lock:
+            self._topic_stats.clear()
+            self._subscriber_stats.clear()
+    
+    # Asynchronous dispatch
+    
+    def enable_async_dispatch(self, coalesce_window: float = 0.1, max_queue_size: int = 10000):
+        """
+        Switch to asynchronous dispatch.
+        
+        emit() then only appends to a bounded per-topic queue, so emitting
+        threads (download workers) never run or wait for subscribers. A
+        dispatcher thread delivers events in emission order. Events of
+        COALESCED_EVENTS topics are reduced to the latest one per item and
+        delivered at most once per coalesce window.
+        
+        Args:
+            coalesce_window: Seconds to collect coalescable events before delivery
+            max_queue_size: Per-topic queue bound; the oldest events are dropped beyond it
+        """
+        with self._dispatch_cond:
+            self._coalesce_window = coalesce_window
+            self._max_queue_size = max_queue_size
+            if self._async:
+                return
+            self._async = True
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop, name="EventBusDispatcher", daemon=True
+            )
+            self._dispatch_thread.start()
+        logger.info(f"[EventBus] Async dispatch enabled (coalesce window {coalesce_window * 1000:.0f}ms)")
+    
+    def disable_async_dispatch(self, timeout: float = 2.0):
+        """Return to synchronous dispatch after delivering the queued events"""
+        with self._dispatch_cond:
+            if not self._async:
+                return
+            self._async = False
+            self._dispatch_cond.notify_all()
+            thread = self._dispatch_thread
+            self._dispatch_thread = None
+        
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+        logger.info("[EventBus] Async dispatch disabled")
+    
+    def is_async(self) -> bool:
+        """Check if async dispatch is enabled"""
+        return self._async
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until all queued events have been delivered.
+        
+        Returns:
+            True if the queues drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._dispatch_cond:
+            self._coalesced_since = 0.0  # Deliver coalesced events without waiting for the window
+            self._dispatch_cond.notify_all()
+            while self._async and (self._pending_count() or self._in_flight):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._dispatch_cond.wait(remaining)
+        return True
+    
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """Get queue depth and drop/coalesce counters of the async dispatcher"""
+        with self._dispatch_cond:
+            return {
+                'async': self._async,
+                'pending': self._pending_count(),
+                'dropped': self._dropped_count,
+                'coalesced': self._coalesced_count,
+            }
+    
+    def _pending_count(self) -> int:
+        """Number of queued events (call with the dispatch condition held)"""
+        return (sum(len(queue) for queue in self._queues.values()) +
+                sum(len(latest) for latest in self._coalesced.values()))
+    
+    def _enqueue(self, event_type: str, args: tuple, kwargs: dict):
+        """Queue an event for the dispatcher thread without blocking on subscribers"""
+        with self._dispatch_cond:
+            if self._async:
+                self._seq += 1
+                if event_type in COALESCED_EVENTS and args:
+                    latest = self._coalesced.setdefault(event_type, {})
+                    if args[0] in latest:
+                        self._coalesced_count += 1
+                    latest[args[0]] = (self._seq, args, kwargs)
+                    if self._coalesced_since is None:
+                        self._coalesced_since = time.monotonic()
+                else:
+                    queue = self._queues.setdefault(event_type, deque())
+                    if len(queue) >= self._max_queue_size:
+                        queue.popleft()
+                        self._dropped_count += 1
+                        if self._dropped_count % 1000 == 1:
+                            logger.warning(f"[EventBus] Queue for '{event_type}' is full, dropping oldest events "
+                                           f"({self._dropped_count} dropped so far)")
+                    queue.append((self._seq, args, kwargs))
+                self._dispatch_cond.notify()
+                return
+        
+        # Async dispatch was disabled while we were waiting for the lock
+        self._dispatch(event_type, args, kwargs)
+    
+    def _take_ready(self) -> List[Tuple[int, str, tuple, dict]]:
+        """
+        Take the events that are ready for delivery, in emission order
+        (call with the dispatch condition held).
+        
+        Coalesced events are held back until their window has elapsed, unless
+        a later regular event is being delivered - those are released with it
+        so a stale progress update never arrives after a completion event.
+        """
+        ready = []
+        for event_type, queue in self._queues.items():
+            ready.extend((seq, event_type, args, kwargs) for seq, args, kwargs in queue)
+            queue.clear()
+        
+        if self._coalesced_since is not None:
+            window_elapsed = time.monotonic() - self._coalesced_since >= self._coalesce_window
+            barrier = max((entry[0] for entry in ready), default=0)
+            remaining = False
+            for event_type, latest in self._coalesced.items():
+                for key in list(latest):
+                    seq, args, kwargs = latest[key]
+                    if window_elapsed or seq < barrier:
+                        ready.append((seq, event_type, args, kwargs))
+                        del latest[key]
+                    else:
+                        remaining = True
+            if window_elapsed or not remaining:
+                self._coalesced_since = time.monotonic() if remaining else None
+        
+        ready.sort(key=lambda entry: entry[0])
+        return ready
+    
+    def _dispatch_loop(self):
+        """Dispatcher thread: deliver queued events until async mode is disabled"""
+        while True:
+            with self._dispatch_cond:
+                while True:
+                    ready = self._take_ready()
+                    if ready or not self._async:
+                        break
+                    if self._coalesced_since is not None:
+                        wait = self._coalesce_window - (time.monotonic() - self._coalesced_since)
+                        self._dispatch_cond.wait(max(wait, 0.001))
+                    else:
+                        self._dispatch_cond.wait()
+                
+                if not ready and not self._async:
+                    # Disabled - deliver whatever coalesced events are left
+                    self._coalesced_since = 0.0
+                    ready = self._take_ready()
+                    if not ready:
+                        self._dispatch_cond.notify_all()
+                        return
+                self._in_flight = len(ready)
+            
+            for _, event_type, args, kwargs in ready:
+                self._dispatch(event_type, args, kwargs)
+            
+            with self._dispatch_cond:
+                self._in_flight = 0
+                self._dispatch_cond.notify_all()
     
     def clear_subscribers(self, event_type: str = None):
         """
@@ -103,8 +599,36 @@ class EventBus:
     def get_subscriber_count(self, event_type: str) -> int:
         """Get the number of subscribers for an event type"""
         with self._lock:
+            self._purge_dead()
             return len(self.subscribers.get(event_type, []))
     
+    def get_leak_report(self) -> Dict[str, Any]:
+        """
+        Report subscriptions that look leaked.
+        
+        Returns:
+            Dict with 'deleted_owners' (strong subscriptions whose Qt object
+            has been destroyed - these keep the Python wrapper alive and still
+            receive every event), 'by_owner' (subscription count per owner
+            class - a count that grows while pages are opened and closed
+            points at a missing unsubscribe), and 'auto_removed' (weak
+            subscriptions dropped after their owner went away)
+        """
+        with self._lock:
+            self._purge_dead()
+            deleted_owners = []
+            by_owner: Dict[str, int] = defaultdict(int)
+            for event_type, subscriptions in self.subscribers.items():
+                for subscription in subscriptions:
+                    by_owner[subscription.owner_type or '<function>'] += 1
+                    if not subscription.weak and _is_qt_deleted(subscription.owner()):
+                        deleted_owners.append({'topic': event_type, 'subscriber': subscription.name})
+            return {
+                'deleted_owners': deleted_owners,
+                'by_owner': dict(sorted(by_owner.items(), key=lambda entry: -entry[1])),
+                'auto_removed': dict(self._auto_removed),
+            }
+    
     def get_all_event_types(self) -> List[str]:
         """Get all event types that have subscribers"""
         with self._lock:
@@ -117,6 +641,7 @@ class QueueEvents:
     ITEM_ADDED = "queue.item_added"
     ITEM_REMOVED = "queue.item_removed"
     ITEM_STATE_CHANGED = "queue.item_state_changed"
+    ITEM_TRACKS_APPENDED = "queue.item_tracks_appended"
     QUEUE_CLEARED = "queue.cleared"
     QUEUE_LOADED = "queue.loaded"
 
@@ -161,9 +686,9 @@ def reset_event_bus():
 
 
 # Convenience functions for common operations
-def subscribe(event_type: str, callback: Callable):
+def subscribe(event_type: str, callback: Callable, weak: bool = False):
     """Subscribe to an event using the global event bus"""
-    get_event_bus().subscribe(event_type, callback)
+    get_event_bus().subscribe(event_type, callback, weak=weak)
 
 
 def unsubscribe(event_type: str, callback: Callable):
@@ -203,29 +728,30 @@ class EventBatch:
     """
     Context manager for batching events.
     
-    Events emitted within the context are collected and emitted
-    as a single batch event when the context exits.
+    Events emitted by the current thread within the context are collected
+    and emitted as a single batch event when the context exits. Other
+    threads keep emitting normally, and batches may be nested.
     """
     
-    def __init__(self, batch_event_type: str):
+    def __init__(self, batch_event_type: str, event_bus: EventBus = None):
         self.batch_event_type = batch_event_type
+        self.event_bus = event_bus
         self.events = []
-        self.original_emit = None
     
     def __enter__(self):
-        self.original_emit = get_event_bus().emit
-        
-        def batched_emit(event_type, *args, **kwargs):
-            self.events.append((event_type, args, kwargs))
-        
-        get_event_bus().emit = batched_emit
+        if self.event_bus is None:
+            self.event_bus = get_event_bus()
+        local = self.event_bus._local
+        if not hasattr(local, 'batches'):
+            local.batches = []
+        local.batches.append(self.events)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        get_event_bus().emit = self.original_emit
+        self.event_bus._local.batches.pop()
         
         if not exc_type:  # Only emit batch if no exception occurred
-            get_event_bus().emit(self.batch_event_type, self.events)
+            self.event_bus.emit(self.batch_event_type, self.events)
 
 
 # Example usage:
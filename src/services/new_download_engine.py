@@ -21,6 +21,9 @@ if str(src_path) not in sys.path:
 from src.models.queue_models import QueueItem, DownloadState, ItemType
 from src.services.event_bus import EventBus, DownloadEvents, QueueEvents, get_event_bus
 from src.services.new_download_worker import DownloadWorker
+from src.services.async_download_worker import AsyncDownloadRuntime, AsyncDownloadWorker
+from src.services.process_download_worker import ProcessDownloadPool, ProcessDownloadWorker
+from src.services.queue_scheduler import SchedulingPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -31,15 +34,19 @@ class DownloadEngine:
     
     This is responsible for:
     - Managing the thread pool and worker lifecycle
+    - Running workers on an asyncio loop instead when the
+      ``downloads.engine_mode`` setting is ``'asyncio'``, or handing their
+      tracks to worker processes when it is ``'processes'``
     - Coordinating with the queue manager
     - Handling concurrency limits
     - Processing download requests
     """
     
-    def __init__(self, queue_manager, deezer_api, config_manager):
+    def __init__(self, queue_manager, deezer_api, config_manager, validator=None):
         self.queue_manager = queue_manager
         self.deezer_api = deezer_api
         self.config = config_manager
+        self.validator = validator  # Optional QueueValidator consulted before each start
         self.event_bus = get_event_bus()
         
         # Worker management
@@ -48,6 +55,13 @@ class DownloadEngine:
         self.max_concurrent = self.config.get_setting('downloads.concurrent_downloads', 5)
         self.thread_pool.setMaxThreadCount(self.max_concurrent)
         
+        # 'threads' runs each item on the thread pool, 'asyncio' runs track
+        # jobs as tasks on a dedicated event loop thread and 'processes'
+        # runs them in a pool of worker processes
+        self.engine_mode = self.config.get_setting('downloads.engine_mode', 'threads')
+        self.async_runtime: Optional[AsyncDownloadRuntime] = None
+        self.process_pool: Optional[ProcessDownloadPool] = None
+        
         # State tracking
         self._lock = threading.RLock()
         self._is_running = False
@@ -60,7 +74,7 @@ class DownloadEngine:
         self.event_bus.subscribe(DownloadEvents.DOWNLOAD_FAILED, self._on_download_failed)
         self.event_bus.subscribe(DownloadEvents.DOWNLOAD_CANCELLED, self._on_download_cancelled)
         
-        logger.info(f"[DownloadEngine] Initialized with max {self.max_concurrent} concurrent downloads")
+        logger.info(f"[DownloadEngine] Initialized with max {self.max_concurrent} concurrent downloads ({self.engine_mode} mode)")
     
     def start(self):
         """Start the download engine"""
@@ -71,6 +85,13 @@ class DownloadEngine:
             
             self._is_running = True
             
+            if self.engine_mode == 'asyncio':
+                self.async_runtime = AsyncDownloadRuntime(self.config)
+                self.async_runtime.start()
+            elif self.engine_mode == 'processes':
+                self.process_pool = ProcessDownloadPool(self.config, self.deezer_api)
+                self.process_pool.start()
+            
             # Start processing timer
             self._processing_timer = QTimer()
             self._processing_timer.timeout.connect(self._process_queue)
@@ -114,6 +135,13 @@ class DownloadEngine:
                 self.thread_pool = QThreadPool()
                 self.thread_pool.setMaxThreadCount(4)
             
+            if self.async_runtime:
+                self.async_runtime.stop()
+                self.async_runtime = None
+            if self.process_pool:
+                self.process_pool.stop()
+                self.process_pool = None
+            
             logger.info(f"[DownloadEngine] Stopped ({len(active_workers)} downloads cancelled)")
     
     def _process_queue(self):
@@ -140,6 +168,11 @@ class DownloadEngine:
                 if len(self.workers) >= self.max_concurrent:
                     break
                 
+                # Skip items still being validated (off this thread) or
+                # whose files turn out to exist already
+                if self.validator and not self.validator.ensure_validated(item):
+                    continue
+                
                 self._start_download(item)
     
     def _start_download(self, item: QueueItem):
@@ -154,12 +187,32 @@ class DownloadEngine:
                 return
             
             # Create worker
-            worker = DownloadWorker(
-                item=item,
-                deezer_api=self.deezer_api,
-                config_manager=self.config,
-                event_bus=self.event_bus
-            )
+            if self.async_runtime:
+                worker = AsyncDownloadWorker(
+                    item=item,
+                    deezer_api=self.deezer_api,
+                    config_manager=self.config,
+                    event_bus=self.event_bus,
+                    queue_manager=self.queue_manager,
+                    runtime=self.async_runtime
+                )
+            elif self.process_pool:
+                worker = ProcessDownloadWorker(
+                    item=item,
+                    deezer_api=self.deezer_api,
+                    config_manager=self.config,
+                    event_bus=self.event_bus,
+                    queue_manager=self.queue_manager,
+                    process_pool=self.process_pool
+                )
+            else:
+                worker = DownloadWorker(
+                    item=item,
+                    deezer_api=self.deezer_api,
+                    config_manager=self.config,
+                    event_bus=self.event_bus,
+                    queue_manager=self.queue_manager
+                )
             
             # Track worker
             self.workers[item.id] = worker
@@ -167,8 +220,11 @@ class DownloadEngine:
             # Update queue state
             self.queue_manager.update_state(item.id, state=DownloadState.DOWNLOADING)
             
-            # Start worker in thread pool
-            self.thread_pool.start(worker)
+            # Start worker on the event loop or in the thread pool
+            if self.async_runtime:
+                worker.start()
+            else:
+                self.thread_pool.start(worker)
             
             logger.info(f"[DownloadEngine] Started download: {item.title} by {item.artist}")
             
@@ -246,17 +302,33 @@ class DownloadEngine:
             if self.max_concurrent > old_limit:
                 self._process_queue()
     
+    def set_scheduling_policy(self, policy: SchedulingPolicy):
+        """Change the order in which queued items are started"""
+        self.queue_manager.set_scheduling_policy(policy)
+        
+        logger.info(f"[DownloadEngine] Scheduling policy: {policy.value}")
+        
+        if self._is_running:
+            self._process_queue()
+    
     def get_statistics(self) -> Dict[str, any]:
         """Get download engine statistics"""
         with self._lock:
-            return {
+            stats = {
+                'engine_mode': self.engine_mode,
                 'active_downloads': len(self.workers),
                 'max_concurrent': self.max_concurrent,
                 'thread_pool_active': self.thread_pool.activeThreadCount(),
                 'thread_pool_max': self.thread_pool.maxThreadCount(),
                 'is_running': self._is_running,
-                'available_slots': self.max_concurrent - len(self.workers)
+                'available_slots': self.max_concurrent - len(self.workers),
+                'scheduling_policy': self.queue_manager.get_scheduling_policy().value
             }
+            if self.async_runtime:
+                stats.update(self.async_runtime.get_statistics())
+            if self.process_pool:
+                stats.update(self.process_pool.get_statistics())
+            return stats
     
     # Event handlers
     def _on_item_added(self, item_id: str):
@@ -274,15 +346,14 @@ class DownloadEngine:
     def _on_download_completed(self, item_id: str):
         """Handle download completion"""
         with self._lock:
-            if item_id in self.workers:
-                del self.workers[item_id]
+            worker = self.workers.pop(item_id, None)
+            if worker:
                 logger.debug(f"[DownloadEngine] Removed completed worker: {item_id}")
             
-            # Update queue state
-            self.queue_manager.update_state(item_id, 
-                state=DownloadState.COMPLETED, 
-                progress=1.0
-            )
+            # Update queue state, remembering which tracks failed so a retry
+            # only has to download those
+            failed_track_ids = worker.get_failed_track_ids() if worker else []
+            self.queue_manager.record_run_result(item_id, DownloadState.COMPLETED, failed_track_ids)
             
             # Process next items
             if self._is_running:
@@ -291,15 +362,16 @@ class DownloadEngine:
     def _on_download_failed(self, item_id: str, error_message: str):
         """Handle download failure"""
         with self._lock:
-            if item_id in self.workers:
-                del self.workers[item_id]
+            worker = self.workers.pop(item_id, None)
+            if worker:
                 logger.debug(f"[DownloadEngine] Removed failed worker: {item_id}")
             
-            # Update queue state
-            self.queue_manager.update_state(item_id, 
-                state=DownloadState.FAILED,
-                error_message=error_message
-            )
+            # A failed full run is retried as a whole; a failed track-level
+            # retry keeps the tracks it did not get through
+            failed_track_ids = []
+            if worker and worker.retry_track_ids is not None:
+                failed_track_ids = worker.get_failed_track_ids()
+            self.queue_manager.record_run_result(item_id, DownloadState.FAILED, failed_track_ids, error_message)
             
             # Process next items
             if self._is_running:
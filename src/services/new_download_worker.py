@@ -12,7 +12,7 @@ import shutil
 import threading
 import signal
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set
 from PyQt6.QtCore import QRunnable, QThreadPool
 import requests
 from PIL import Image
@@ -36,7 +36,7 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 from src.models.queue_models import QueueItem, DownloadState, ItemType, TrackInfo
-from src.services.event_bus import EventBus, DownloadEvents
+from src.services.event_bus import EventBus, DownloadEvents, QueueEvents
 from src.utils.lyrics_utils import LyricsProcessor
 
 logger = logging.getLogger(__name__)
@@ -89,12 +89,13 @@ class DownloadWorker(QRunnable):
     - Clean resource management
     """
     
-    def __init__(self, item: QueueItem, deezer_api, config_manager, event_bus: EventBus):
+    def __init__(self, item: QueueItem, deezer_api, config_manager, event_bus: EventBus, queue_manager=None):
         super().__init__()
         self.item = item
         self.deezer_api = deezer_api
         self.config = config_manager
         self.event_bus = event_bus
+        self.queue_manager = queue_manager
         
         # Worker state
         self.cancelled = False
@@ -123,6 +124,14 @@ class DownloadWorker(QRunnable):
         # Cache album artwork for multi-disc distribution
         self._cached_album_artwork = None
         
+        # Signalled when the queue manager appends tracks to a still-expanding item
+        self._tracks_appended = threading.Event()
+        
+        # Track-level retry: when set, only these track IDs are downloaded
+        self.retry_track_ids: Optional[Set[int]] = None
+        self._succeeded_track_ids: Set[int] = set()
+        self._failed_track_ids: List[int] = []
+        
         logger.info(f"[DownloadWorker] Created worker for {self.item.item_type.value}: {self.item.title} by {self.item.artist}")
     
     def run(self):
@@ -134,6 +143,12 @@ class DownloadWorker(QRunnable):
             # Emit download started event
             self.event_bus.emit(DownloadEvents.DOWNLOAD_STARTED, self.item.id)
             
+            if self.queue_manager:
+                self.event_bus.subscribe(QueueEvents.ITEM_TRACKS_APPENDED, self._on_tracks_appended)
+                # Pick up tracks appended between scheduling and start
+                self.item = self.queue_manager.get_item(self.item.id) or self.item
+                self._apply_retry_settings()
+            
             if self.item.item_type == ItemType.ALBUM:
                 self._download_album()
             elif self.item.item_type == ItemType.PLAYLIST:
@@ -144,6 +159,7 @@ class DownloadWorker(QRunnable):
                 raise ValueError(f"Unknown item type: {self.item.item_type}")
             
             if not self.cancelled:
+                self._check_track_list_complete()
                 logger.info(f"[DownloadWorker] Completed download: {self.item.title}")
                 self.event_bus.emit(DownloadEvents.DOWNLOAD_COMPLETED, self.item.id)
             
@@ -152,6 +168,58 @@ class DownloadWorker(QRunnable):
                 error_msg = f"Download failed: {str(e)}"
                 logger.error(f"[DownloadWorker] {error_msg}", exc_info=True)
                 self.event_bus.emit(DownloadEvents.DOWNLOAD_FAILED, self.item.id, error_msg)
+        
+        finally:
+            if self.queue_manager:
+                self.event_bus.unsubscribe(QueueEvents.ITEM_TRACKS_APPENDED, self._on_tracks_appended)
+    
+    def _apply_retry_settings(self):
+        """Limit this run to the tracks and quality requested by a retry."""
+        state = self.queue_manager.get_state(self.item.id)
+        if not state:
+            return
+        if state.retry_quality:
+            self.quality = state.retry_quality
+        if state.retry_track_ids is not None and self.item.item_type != ItemType.TRACK:
+            self.retry_track_ids = set(state.retry_track_ids)
+            logger.info(f"[DownloadWorker] Retrying {len(self.retry_track_ids)} failed tracks of {self.item.title} ({self.quality})")
+    
+    def get_failed_track_ids(self) -> List[int]:
+        """
+        Get the tracks that still need downloading after this run.
+        
+        For a track-level retry, tracks that were never attempted (e.g. after
+        an early abort) count as failed so they are kept for the next retry.
+        """
+        with self._track_progress_lock:
+            if self.retry_track_ids is not None:
+                return [track_id for track_id in self.retry_track_ids if track_id not in self._succeeded_track_ids]
+            return list(self._failed_track_ids)
+    
+    def _on_tracks_appended(self, item_id: str, count: int, final: bool):
+        """Wake the submission loop when tracks stream into this item."""
+        if item_id == self.item.id:
+            self._tracks_appended.set()
+    
+    def _is_expanding(self) -> bool:
+        """Check if more tracks are still being fetched for this item."""
+        if not self.queue_manager:
+            return False
+        state = self.queue_manager.get_state(self.item.id)
+        return bool(state and state.expanding)
+    
+    def _expansion_failed(self) -> bool:
+        """Check if fetching the remaining tracks of this item failed."""
+        if not self.queue_manager:
+            return False
+        state = self.queue_manager.get_state(self.item.id)
+        return bool(state and state.expanding and state.expansion_failed)
+    
+    def _check_track_list_complete(self):
+        """Fail the run if the item's track list could not be fetched completely."""
+        if self._expansion_failed():
+            raise RuntimeError(f"Track list incomplete: only {len(self.item.tracks)} of "
+                               f"{self.item.total_tracks} tracks could be fetched")
     
     def cancel(self):
         """Cancel the download."""
@@ -170,9 +238,11 @@ class DownloadWorker(QRunnable):
         with self._track_progress_lock:
             if success:
                 self._completed_tracks += 1
+                self._succeeded_track_ids.add(track_info.track_id)
                 self.event_bus.emit(DownloadEvents.TRACK_COMPLETED, self.item.id, track_info.track_id)
             else:
                 self._failed_tracks += 1
+                self._failed_track_ids.append(track_info.track_id)
                 self.event_bus.emit(DownloadEvents.TRACK_FAILED, self.item.id, track_info.track_id, "Download failed")
             
             # Emit real-time progress update
@@ -198,7 +268,10 @@ class DownloadWorker(QRunnable):
         # Reset counters for this download
         self._completed_tracks = 0
         self._failed_tracks = 0
-        self._total_tracks = len(self.item.tracks)
+        self._total_tracks = max(len(self.item.tracks), self.item.total_tracks)
+        if self.retry_track_ids is not None:
+            # Tracks outside the retry set already succeeded in an earlier run
+            self._completed_tracks = max(0, self._total_tracks - len(self.retry_track_ids))
         
         # Ensure token freshness before starting concurrent downloads
         # This helps prevent CSRF token expiration issues during batch operations
@@ -225,8 +298,7 @@ class DownloadWorker(QRunnable):
         self._prepare_album_artwork_for_multi_disc()
         
         # Create thread pool for concurrent track downloads
-        self.track_thread_pool = QThreadPool()
-        self.track_thread_pool.setMaxThreadCount(self.concurrent_tracks)
+        self._start_track_pool()
         
         # Track download workers
         track_workers = []
@@ -235,55 +307,99 @@ class DownloadWorker(QRunnable):
         
         try:
             # Submit all tracks to thread pool
-            for i, track_info in enumerate(self.item.tracks):
-                if self.cancelled:
-                    break
+            submitted = self._submit_tracks(0, track_workers)
+            
+            # Stream in tracks that are still being fetched in the background
+            while not self.cancelled and (self._is_expanding() or submitted < len(self.item.tracks)):
+                self._tracks_appended.wait(0.5)
+                self._tracks_appended.clear()
                 
-                # Wait if paused
-                while self.paused and not self.cancelled:
-                    time.sleep(0.1)
+                self.item = self.queue_manager.get_item(self.item.id) or self.item
+                with self._track_progress_lock:
+                    self._total_tracks = max(len(self.item.tracks), self.item.total_tracks) if self._is_expanding() else len(self.item.tracks)
                 
-                if self.cancelled:
+                submitted = self._submit_tracks(submitted, track_workers)
+                if self._expansion_failed() and submitted >= len(self.item.tracks):
                     break
-                
-                # Create track worker
-                track_worker = TrackDownloadRunnable(
-                    parent_worker=self,
-                    track_info=track_info,
-                    playlist_position=i+1
-                )
-                
-                track_workers.append(track_worker)
-                self.track_thread_pool.start(track_worker)
-                
-                # Add small delay between starting workers to reduce API call clustering
-                # This helps prevent multiple workers from hitting expired tokens simultaneously
-                if i > 0 and i % 2 == 0:  # Every 2 tracks, pause briefly
-                    time.sleep(0.05)  # 50ms delay
             
             # Wait for all downloads to complete with real-time progress updates
             if not self.cancelled:
-                # Monitor progress while downloads are running
-                while self.track_thread_pool.activeThreadCount() > 0:
-                    if self.cancelled:
-                        break
-                    time.sleep(0.1)  # Small delay to prevent excessive CPU usage
-                
-                # Wait for thread pool to finish
-                self.track_thread_pool.waitForDone(30000)  # 30 second timeout
+                self._wait_for_tracks()
         
         except Exception as e:
             logger.error(f"[DownloadWorker] Error during concurrent album download: {e}")
         
         finally:
-            # Clean up thread pool
-            if self.track_thread_pool:
-                self.track_thread_pool.clear()
-                self.track_thread_pool.waitForDone(1000)  # 1 second cleanup timeout
-                self.track_thread_pool = None
+            self._stop_track_pool()
         
         logger.info(f"[DownloadWorker] Album download completed: {self._completed_tracks}/{self._total_tracks} tracks successful")
     
+    def _start_track_pool(self):
+        """Create the thread pool that runs this item's track downloads."""
+        self.track_thread_pool = QThreadPool()
+        self.track_thread_pool.setMaxThreadCount(self.concurrent_tracks)
+    
+    def _wait_for_tracks(self):
+        """Block until all submitted tracks finished or the download is cancelled."""
+        # Monitor progress while downloads are running
+        while self.track_thread_pool.activeThreadCount() > 0:
+            if self.cancelled:
+                break
+            time.sleep(0.1)  # Small delay to prevent excessive CPU usage
+        
+        # Wait for thread pool to finish
+        self.track_thread_pool.waitForDone(30000)  # 30 second timeout
+    
+    def _stop_track_pool(self):
+        """Drop tracks not started yet and release the track thread pool."""
+        if self.track_thread_pool:
+            self.track_thread_pool.clear()
+            self.track_thread_pool.waitForDone(1000)  # 1 second cleanup timeout
+            self.track_thread_pool = None
+    
+    def _submit_tracks(self, start: int, track_workers: list) -> int:
+        """
+        Submit the item's tracks from position start onwards, skipping tracks
+        outside the retry set. Returns the position of the first track not
+        submitted.
+        """
+        for i in range(start, len(self.item.tracks)):
+            track_info = self.item.tracks[i]
+            if self.retry_track_ids is not None and track_info.track_id not in self.retry_track_ids:
+                continue
+            if not self._submit_track(track_info, i, track_workers):
+                return i
+        return len(self.item.tracks)
+    
+    def _submit_track(self, track_info: TrackInfo, index: int, track_workers: list) -> bool:
+        """Submit one track to the track thread pool. Returns False if cancelled."""
+        if self.cancelled:
+            return False
+        
+        # Wait if paused
+        while self.paused and not self.cancelled:
+            time.sleep(0.1)
+        
+        if self.cancelled:
+            return False
+        
+        # Create track worker
+        track_worker = TrackDownloadRunnable(
+            parent_worker=self,
+            track_info=track_info,
+            playlist_position=index+1
+        )
+        
+        track_workers.append(track_worker)
+        self.track_thread_pool.start(track_worker)
+        
+        # Add small delay between starting workers to reduce API call clustering
+        # This helps prevent multiple workers from hitting expired tokens simultaneously
+        if index > 0 and index % 2 == 0:  # Every 2 tracks, pause briefly
+            time.sleep(0.05)  # 50ms delay
+        
+        return True
+    
     def _download_playlist(self):
         """Download all tracks in a playlist."""
         # Ensure token freshness before starting concurrent downloads
@@ -348,16 +464,8 @@ class DownloadWorker(QRunnable):
             )
             logger.info(f"[DownloadWorker] get_track_download_url_sync returned: {download_url}")
             
-            if not download_url or isinstance(download_url, str) and download_url.startswith(('RIGHTS_ERROR:', 'API_ERROR:')):
-                logger.warning(f"[DownloadWorker] Cannot get download URL for track {track_info.track_id}: {download_url}")
-                logger.info(f"[DownloadWorker] download_url type: {type(download_url)}, value: {download_url}")
-                return False
-            
-            # Handle quality skip
-            if isinstance(download_url, str) and download_url.startswith('QUALITY_SKIP:'):
-                logger.info(f"[DownloadWorker] Skipping track {track_info.track_id}: {download_url}")
+            if not self._is_usable_download_url(track_info, download_url):
                 return False
-            logger.info(f"[DownloadWorker] Proceeding with download URL: {download_url[:50] if download_url else None}...")
             
             # Create filename and directory (including disc folders if needed)
             filename = self._create_filename(track_info, playlist_position=playlist_position)
@@ -390,13 +498,7 @@ class DownloadWorker(QRunnable):
             success = self._finalize_track(decrypted_file, file_path, track_info, playlist_position=playlist_position)
             
             # Cleanup temp files
-            try:
-                if temp_file and temp_file.exists():
-                    temp_file.unlink()
-                if decrypted_file and decrypted_file.exists() and decrypted_file != file_path:
-                    decrypted_file.unlink()
-            except Exception as e:
-                logger.warning(f"[DownloadWorker] Error cleaning up temp files: {e}")
+            self._cleanup_temp_files(temp_file, decrypted_file, file_path)
             
             return success
             
@@ -404,6 +506,30 @@ class DownloadWorker(QRunnable):
             logger.error(f"[DownloadWorker] Error downloading track {track_info.track_id}: {e}")
             return False
     
+    def _is_usable_download_url(self, track_info: TrackInfo, download_url) -> bool:
+        """Check a download URL lookup result, logging why a track is skipped."""
+        if not download_url or isinstance(download_url, str) and download_url.startswith(('RIGHTS_ERROR:', 'API_ERROR:')):
+            logger.warning(f"[DownloadWorker] Cannot get download URL for track {track_info.track_id}: {download_url}")
+            logger.info(f"[DownloadWorker] download_url type: {type(download_url)}, value: {download_url}")
+            return False
+        
+        # Handle quality skip
+        if isinstance(download_url, str) and download_url.startswith('QUALITY_SKIP:'):
+            logger.info(f"[DownloadWorker] Skipping track {track_info.track_id}: {download_url}")
+            return False
+        logger.info(f"[DownloadWorker] Proceeding with download URL: {download_url[:50] if download_url else None}...")
+        return True
+    
+    def _cleanup_temp_files(self, temp_file: Optional[Path], decrypted_file: Optional[Path], file_path: Path):
+        """Remove the encrypted and decrypted temporary files of a track."""
+        try:
+            if temp_file and temp_file.exists():
+                temp_file.unlink()
+            if decrypted_file and decrypted_file.exists() and decrypted_file != file_path:
+                decrypted_file.unlink()
+        except Exception as e:
+            logger.warning(f"[DownloadWorker] Error cleaning up temp files: {e}")
+    
     def _download_encrypted_file(self, download_url: str) -> Optional[Path]:
         """Download the encrypted file from Deezer."""
         try:
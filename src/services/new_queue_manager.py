@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from datetime import datetime
+from dataclasses import replace
 
 import sys
 from pathlib import Path
@@ -21,9 +22,10 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 from src.models.queue_models import (
-    QueueItem, QueueItemState, QueueSnapshot, DownloadState, ItemType
+    QueueItem, QueueItemState, QueueSnapshot, DownloadState, ItemType, TrackInfo, ItemPriority
 )
 from src.services.event_bus import EventBus, QueueEvents, get_event_bus
+from src.services.queue_scheduler import QueueScheduler, SchedulingPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -46,20 +48,36 @@ class QueueManager:
         self.items: Dict[str, QueueItem] = {}
         self.states: Dict[str, QueueItemState] = {}
         
-        # Persistence
-        self.queue_file = Path(config_manager.config_dir) / "new_queue_state.json"
+        # Scheduling index over QUEUED items
+        policy_name = config_manager.get_setting('downloads.scheduling_policy', SchedulingPolicy.FIFO.value)
+        try:
+            policy = SchedulingPolicy(policy_name)
+        except ValueError:
+            logger.warning(f"[QueueManager] Unknown scheduling policy '{policy_name}', using FIFO")
+            policy = SchedulingPolicy.FIFO
+        self.scheduler = QueueScheduler(policy)
+        
+        # Persistence - JSON by default, or the compact binary format when
+        # downloads.queue_format is "binary" (tools reading the JSON file
+        # directly, like the library scanner, need the JSON format)
+        self.use_binary_format = config_manager.get_setting('downloads.queue_format', 'json') == 'binary'
+        self.json_queue_file = Path(config_manager.config_dir) / "new_queue_state.json"
+        self.queue_file = self.json_queue_file.with_suffix('.bin') if self.use_binary_format else self.json_queue_file
         
         # Load existing queue on startup
         self._load_queue()
         
         logger.info(f"[QueueManager] Initialized with {len(self.items)} items")
     
-    def add_item(self, item: QueueItem) -> str:
+    def add_item(self, item: QueueItem, expanding: bool = False,
+                 priority: ItemPriority = ItemPriority.NORMAL) -> str:
         """
         Add item to queue.
         
         Args:
             item: The queue item to add
+            expanding: True if more tracks will be appended via append_tracks()
+            priority: Priority class used when scheduling the item
             
         Returns:
             The item ID
@@ -74,8 +92,11 @@ class QueueManager:
             self.items[item.id] = item
             self.states[item.id] = QueueItemState(
                 item_id=item.id,
-                state=DownloadState.QUEUED
+                state=DownloadState.QUEUED,
+                expanding=expanding,
+                priority=priority
             )
+            self.scheduler.push(item, priority)
             
             # Persist and notify
             self._persist_queue()
@@ -109,6 +130,7 @@ class QueueManager:
             # Remove from storage
             del self.items[item_id]
             del self.states[item_id]
+            self.scheduler.remove(item_id)
             
             # Persist and notify
             self._persist_queue()
@@ -117,6 +139,136 @@ class QueueManager:
             logger.info(f"[QueueManager] Removed {item.item_type.value}: {item.title}")
             return True
     
+    def append_tracks(self, item_id: str, tracks: List[TrackInfo], final: bool = False) -> bool:
+        """
+        Append tracks to an item that is still being expanded.
+        
+        Args:
+            item_id: ID of item to extend
+            tracks: Tracks to append, in playlist/album order
+            final: True if no more tracks will follow
+            
+        Returns:
+            True if the item was updated, False if not found
+        """
+        with self._lock:
+            item = self.items.get(item_id)
+            state = self.states.get(item_id)
+            if not item or not state:
+                logger.debug(f"[QueueManager] Cannot append tracks to unknown item: {item_id}")
+                return False
+            
+            all_tracks = item.tracks + list(tracks)
+            total_tracks = item.total_tracks
+            if final and len(all_tracks) != total_tracks:
+                # The API reported a different total than it actually served
+                logger.info(f"[QueueManager] Expansion of {item.title} finished with {len(all_tracks)}/{total_tracks} tracks")
+                total_tracks = len(all_tracks)
+            
+            self.items[item_id] = replace(item, tracks=all_tracks, total_tracks=total_tracks)
+            state.update(expanding=not final, expansion_failed=False)
+            if total_tracks != item.total_tracks and item_id in self.scheduler:
+                # The shortest-job key depends on the track count
+                self._sync_schedule(item_id)
+            
+            self._persist_queue()
+            self.event_bus.emit(QueueEvents.ITEM_TRACKS_APPENDED, item_id, len(tracks), final)
+            
+            logger.debug(f"[QueueManager] Appended {len(tracks)} tracks to {item.title} ({len(all_tracks)}/{total_tracks}, final={final})")
+            return True
+    
+    def fail_expansion(self, item_id: str, error_message: str) -> bool:
+        """
+        Record that the remaining tracks of an expanding item could not be fetched.
+        
+        The item keeps its tracks, its expected total and its expanding flag,
+        so the expansion resumes from where it stopped on retry or restart.
+        A download running for the item stops after the tracks at hand and
+        fails instead of completing with a partial track list.
+        
+        Args:
+            item_id: ID of the expanding item
+            error_message: Why the expansion stopped
+            
+        Returns:
+            True if the item was updated, False if not found
+        """
+        with self._lock:
+            item = self.items.get(item_id)
+            state = self.states.get(item_id)
+            if not item or not state:
+                return False
+            
+            state.update(expansion_failed=True, error_message=error_message)
+            # Wake workers waiting for more tracks
+            self.event_bus.emit(QueueEvents.ITEM_TRACKS_APPENDED, item_id, 0, False)
+            
+            logger.warning(f"[QueueManager] Expansion of {item.title} stopped at {len(item.tracks)}/{item.total_tracks} tracks: {error_message}")
+            return True
+    
+    def replace_items(self, replacements: Dict[str, QueueItem]) -> int:
+        """
+        Replace stored items with corrected copies (e.g. fixed track numbering).
+        
+        Items that gained tracks since the copy was made are left untouched.
+        
+        Args:
+            replacements: Mapping of item ID to replacement item
+            
+        Returns:
+            Number of items replaced
+        """
+        with self._lock:
+            replaced = 0
+            for item_id, new_item in replacements.items():
+                current = self.items.get(item_id)
+                if not current or len(current.tracks) != len(new_item.tracks):
+                    continue
+                self.items[item_id] = new_item
+                replaced += 1
+            
+            if replaced:
+                self._persist_queue()
+            return replaced
+    
+    def mark_completed_on_disk(self, item_ids: List[str]) -> int:
+        """
+        Mark queued items whose files already exist as completed.
+        
+        Applies the whole batch with a single persist.
+        
+        Args:
+            item_ids: IDs of items found complete on disk
+            
+        Returns:
+            Number of items marked completed
+        """
+        with self._lock:
+            marked = []
+            for item_id in item_ids:
+                item = self.items.get(item_id)
+                state = self.states.get(item_id)
+                if not item or not state or state.state != DownloadState.QUEUED:
+                    continue
+                state.update(
+                    state=DownloadState.COMPLETED,
+                    progress=1.0,
+                    completed_tracks=item.total_tracks,
+                    failed_tracks=0
+                )
+                self.scheduler.remove(item_id)
+                marked.append(item_id)
+            
+            if not marked:
+                return 0
+            
+            self._persist_queue()
+            for item_id in marked:
+                self.event_bus.emit(QueueEvents.ITEM_STATE_CHANGED, item_id, self.states[item_id])
+            
+            logger.info(f"[QueueManager] Marked {len(marked)} items as completed (files already exist)")
+            return len(marked)
+    
     def update_state(self, item_id: str, **kwargs):
         """
         Update item state.
@@ -134,6 +286,9 @@ class QueueManager:
             self.states[item_id].update(**kwargs)
             new_state = self.states[item_id].state
             
+            if old_state != new_state:
+                self._sync_schedule(item_id)
+            
             # Always persist when state is updated (not just when state enum changes)
             self._persist_queue()
             
@@ -145,6 +300,62 @@ class QueueManager:
             else:
                 logger.debug(f"[QueueManager] State updated for {item_id}: {kwargs}")
     
+    def set_priority(self, item_id: str, priority: ItemPriority) -> bool:
+        """
+        Change the priority class of an item.
+        
+        Args:
+            item_id: ID of item to reprioritize
+            priority: New priority class
+            
+        Returns:
+            True if the item was found
+        """
+        with self._lock:
+            state = self.states.get(item_id)
+            if not state:
+                logger.warning(f"[QueueManager] Cannot reprioritize unknown item: {item_id}")
+                return False
+            
+            state.update(priority=priority)
+            self._sync_schedule(item_id)
+            
+            self._persist_queue()
+            self.event_bus.emit(QueueEvents.ITEM_STATE_CHANGED, item_id, state)
+            
+            logger.info(f"[QueueManager] Set priority of {item_id} to {priority.name.lower()}")
+            return True
+    
+    def set_scheduling_policy(self, policy: SchedulingPolicy):
+        """Switch the order in which items of the same priority are served"""
+        with self._lock:
+            if policy == self.scheduler.policy:
+                return
+            self._rebuild_schedule(policy)
+            logger.info(f"[QueueManager] Scheduling policy set to {policy.value}")
+    
+    def get_scheduling_policy(self) -> SchedulingPolicy:
+        """Get the active scheduling policy"""
+        return self.scheduler.policy
+    
+    def _sync_schedule(self, item_id: str):
+        """Keep the scheduling index in step with an item's state (call under lock)"""
+        item = self.items.get(item_id)
+        state = self.states.get(item_id)
+        if item and state and state.state == DownloadState.QUEUED:
+            self.scheduler.push(item, state.priority)
+        else:
+            self.scheduler.remove(item_id)
+    
+    def _rebuild_schedule(self, policy: SchedulingPolicy = None):
+        """Rebuild the scheduling index from all QUEUED items (call under lock)"""
+        queued = [
+            self.items[item_id] for item_id, state in self.states.items()
+            if state.state == DownloadState.QUEUED and item_id in self.items
+        ]
+        priorities = {item_id: state.priority for item_id, state in self.states.items()}
+        self.scheduler.rebuild(queued, priorities, policy)
+    
     def get_item(self, item_id: str) -> Optional[QueueItem]:
         """Get queue item by ID"""
         with self._lock:
@@ -177,6 +388,14 @@ class QueueManager:
                 summary[state.state.value] += 1
             return summary
     
+    def has_pending_work(self) -> bool:
+        """Check if any item is queued, downloading or still expanding"""
+        with self._lock:
+            return any(
+                state.state in (DownloadState.QUEUED, DownloadState.DOWNLOADING) or state.expanding
+                for state in self.states.values()
+            )
+    
     def clear_by_state(self, states: List[DownloadState]):
         """
         Clear items with specific states.
@@ -201,6 +420,7 @@ class QueueManager:
                     logger.debug(f"[QueueManager] Clearing {item.item_type.value}: {item.title}")
                 del self.items[item_id]
                 del self.states[item_id]
+                self.scheduler.remove(item_id)
             
             # Persist and notify
             self._persist_queue()
@@ -221,6 +441,7 @@ class QueueManager:
             # Clear all
             self.items.clear()
             self.states.clear()
+            self._rebuild_schedule()
             
             # Persist and notify
             self._persist_queue()
@@ -228,32 +449,124 @@ class QueueManager:
             
             logger.info(f"[QueueManager] Cleared all {count} items from queue")
     
-    def retry_failed_items(self) -> int:
+    def retry_item(self, item_id: str, quality: str = None) -> bool:
+        """
+        Retry a single item.
+        
+        If its last run finished with failed tracks, only those tracks are
+        scheduled again; otherwise the whole item is requeued.
+        
+        Args:
+            item_id: ID of item to retry
+            quality: Optional quality to use for the retry instead of the configured one
+            
+        Returns:
+            True if the item was set to retry
+        """
+        with self._lock:
+            if not self._prepare_retry(item_id, quality):
+                return False
+            
+            self._persist_queue()
+            self.event_bus.emit(QueueEvents.ITEM_STATE_CHANGED, item_id, self.states[item_id])
+            return True
+    
+    def retry_failed_items(self, quality: str = None) -> int:
         """
-        Retry all failed items.
+        Retry all failed items and the failed tracks of completed items.
+        
+        Args:
+            quality: Optional quality to use for the retry instead of the configured one
         
         Returns:
             Number of items set to retry
         """
         with self._lock:
-            failed_items = [
+            retry_items = [
                 item_id for item_id, state in self.states.items()
-                if state.state == DownloadState.FAILED
+                if state.can_retry and self._prepare_retry(item_id, quality)
             ]
             
-            for item_id in failed_items:
-                self.states[item_id].update(
-                    state=DownloadState.QUEUED,
-                    error_message=None,
-                    retry_count=self.states[item_id].retry_count + 1
-                )
+            for item_id in retry_items:
                 self.event_bus.emit(QueueEvents.ITEM_STATE_CHANGED, item_id, self.states[item_id])
             
-            if failed_items:
+            if retry_items:
                 self._persist_queue()
-                logger.info(f"[QueueManager] Set {len(failed_items)} failed items to retry")
+                logger.info(f"[QueueManager] Set {len(retry_items)} failed items to retry")
             
-            return len(failed_items)
+            return len(retry_items)
+    
+    def _prepare_retry(self, item_id: str, quality: str = None) -> bool:
+        """Requeue an item for retry, limited to its failed tracks if known (call under lock)"""
+        item = self.items.get(item_id)
+        state = self.states.get(item_id)
+        if not item or not state or state.state in [DownloadState.QUEUED, DownloadState.DOWNLOADING]:
+            return False
+        
+        if state.expanding:
+            # The track list is incomplete, so the whole item runs again once
+            # the expansion has resumed
+            state.update(
+                state=DownloadState.QUEUED,
+                error_message=None,
+                retry_count=state.retry_count + 1,
+                retry_track_ids=None,
+                retry_quality=quality,
+                expansion_failed=False
+            )
+        elif state.failed_track_ids and item.item_type != ItemType.TRACK:
+            # Only the failed tracks are downloaded again; progress starts
+            # from the tracks that already succeeded
+            retry_ids = list(state.failed_track_ids)
+            done = max(0, len(item.tracks) - len(retry_ids))
+            state.update(
+                state=DownloadState.QUEUED,
+                error_message=None,
+                retry_count=state.retry_count + 1,
+                retry_track_ids=retry_ids,
+                retry_quality=quality,
+                completed_tracks=done,
+                failed_tracks=0,
+                progress=done / len(item.tracks) if item.tracks else 0.0
+            )
+            logger.info(f"[QueueManager] Retrying {len(retry_ids)} failed tracks of {item.title}")
+        elif state.state == DownloadState.COMPLETED:
+            return False
+        else:
+            state.update(
+                state=DownloadState.QUEUED,
+                error_message=None,
+                retry_count=state.retry_count + 1,
+                retry_track_ids=None,
+                retry_quality=quality
+            )
+        
+        self._sync_schedule(item_id)
+        return True
+    
+    def record_run_result(self, item_id: str, state: DownloadState,
+                          failed_track_ids: List[int], error_message: str = None):
+        """
+        Record the outcome of a download run with a single persist.
+        
+        Args:
+            item_id: ID of the item that finished
+            state: COMPLETED or FAILED
+            failed_track_ids: Tracks that still need downloading
+            error_message: Error for failed runs
+        """
+        changes = dict(
+            state=state,
+            failed_track_ids=list(failed_track_ids),
+            failed_tracks=len(failed_track_ids),
+            retry_track_ids=None,
+            retry_quality=None
+        )
+        if state == DownloadState.COMPLETED:
+            changes['progress'] = 1.0
+        else:
+            changes['error_message'] = error_message
+        self.update_state(item_id, **changes)
     
     def get_next_queued_items(self, limit: int = None) -> List[QueueItem]:
         """
@@ -263,22 +576,26 @@ class QueueManager:
             limit: Maximum number of items to return
             
         Returns:
-            List of queued items, ordered by creation time
+            List of queued items, ordered by priority class and then by the
+            active scheduling policy
         """
         with self._lock:
-            queued_items = []
-            
-            for item_id, state in self.states.items():
-                if state.state == DownloadState.QUEUED and item_id in self.items:
-                    queued_items.append(self.items[item_id])
-            
-            # Sort by creation time (oldest first)
-            queued_items.sort(key=lambda x: x.created_at)
-            
-            if limit:
-                queued_items = queued_items[:limit]
-            
-            return queued_items
+            while True:
+                queued_items = []
+                stale = False
+                
+                for item_id in self.scheduler.peek(limit):
+                    item = self.items.get(item_id)
+                    state = self.states.get(item_id)
+                    if item and state and state.state == DownloadState.QUEUED:
+                        queued_items.append(item)
+                    else:
+                        # State was changed behind the index's back - drop the entry
+                        self.scheduler.remove(item_id)
+                        stale = True
+                
+                if not stale:
+                    return queued_items
     
     def _has_duplicate(self, item: QueueItem) -> bool:
         """Check if item is already in queue"""
@@ -300,7 +617,10 @@ class QueueManager:
             self.queue_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Save to file
-            snapshot.save_to_file(str(self.queue_file))
+            if self.use_binary_format:
+                snapshot.save_to_binary_file(str(self.queue_file))
+            else:
+                snapshot.save_to_file(str(self.queue_file))
             
             logger.debug(f"[QueueManager] Persisted queue with {len(self.items)} items")
             
@@ -310,12 +630,24 @@ class QueueManager:
     def _load_queue(self):
         """Load queue from disk"""
         try:
+            if self.use_binary_format and not self.queue_file.exists() and self.json_queue_file.exists():
+                # First start after switching formats - migrate the JSON queue
+                logger.info(f"[QueueManager] Migrating queue from {self.json_queue_file} to binary format")
+                snapshot = QueueSnapshot.load_from_file(str(self.json_queue_file))
+                if snapshot:
+                    self.items = snapshot.items
+                    self.states = snapshot.states
+                    self._persist_queue()
+            
             if not self.queue_file.exists():
                 logger.info("[QueueManager] No existing queue file found")
                 return
             
             logger.info(f"[QueueManager] Loading queue from {self.queue_file}")
-            snapshot = QueueSnapshot.load_from_file(str(self.queue_file))
+            if self.use_binary_format:
+                snapshot = QueueSnapshot.load_from_binary_file(str(self.queue_file))
+            else:
+                snapshot = QueueSnapshot.load_from_file(str(self.queue_file))
             if snapshot:
                 self.items = snapshot.items
                 self.states = snapshot.states
@@ -331,6 +663,8 @@ class QueueManager:
                     logger.info(f"[QueueManager] Reset {reset_count} interrupted downloads to queued")
                     self._persist_queue()
                 
+                self._rebuild_schedule()
+                
                 logger.info(f"[QueueManager] Loaded queue with {len(self.items)} items")
                 self.event_bus.emit(QueueEvents.QUEUE_LOADED, len(self.items))
             else:
@@ -348,7 +682,7 @@ class QueueManager:
                 # Create backup with timestamp
                 from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_file = self.queue_file.with_suffix(f'.corrupted_{timestamp}.json')
+                backup_file = self.queue_file.with_suffix(f'.corrupted_{timestamp}{self.queue_file.suffix}')
                 
                 # Move corrupted file to backup
                 import shutil
@@ -0,0 +1,149 @@
+"""
+Concurrent pagination of Deezer list endpoints.
+
+Deezer list responses carry the overall ``total`` next to the page ``data``.
+The first page is fetched on its own to learn the total; the remaining
+offsets are then requested with bounded concurrency, and the pages are
+yielded strictly in order as soon as they (and every page before them) have
+arrived. Responses without a total are followed page by page until a short
+page comes back.
+"""
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# fetch_page(index, limit) -> (items or None on error, total or None if unknown)
+PageFetcher = Callable[[int, int], Awaitable[Tuple[Optional[List[Dict]], Optional[int]]]]
+
+
+class RateLimiter:
+    """
+    Sliding-window request limiter of one event loop.
+
+    Args:
+        max_calls: Requests allowed per period
+        period: Window length in seconds
+    """
+
+    def __init__(self, max_calls: int = 50, period: float = 5.0):
+        self.max_calls = max(1, int(max_calls))
+        self.period = period
+        self._calls: collections.deque = collections.deque()
+        self._lock: Optional[asyncio.Lock] = None  # Created on the loop using it
+
+    async def acquire(self):
+        """Wait until another request may be sent"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+
+async def paginate(fetch_page: PageFetcher, page_size: int = 100, start: int = 0,
+                   max_items: Optional[int] = None, concurrency: int = 4,
+                   limiter: Optional[RateLimiter] = None) -> AsyncIterator[List[Dict]]:
+    """
+    Yield the pages of a list endpoint in order.
+
+    Stops at the first page that failed or came back empty; pages still in
+    flight are cancelled, also when the consumer stops iterating early.
+
+    Args:
+        fetch_page: Fetches one page, see PageFetcher
+        page_size: Items requested per page
+        start: Index of the first item
+        max_items: Stop after this many items (None for all)
+        concurrency: Pages requested at the same time after the first one
+        limiter: Optional rate limiter every request has to pass
+
+    Yields:
+        Lists of items, the last one truncated to max_items
+    """
+    end = start + max_items if max_items is not None else None
+
+    async def fetch(index: int):
+        if limiter:
+            await limiter.acquire()
+        limit = page_size if end is None else min(page_size, end - index)
+        return await fetch_page(index, limit)
+
+    if end is not None and end <= start:
+        return
+
+    items, total = await fetch(start)
+    if not items:
+        return
+    yield items
+
+    if total is None:
+        # Unknown total - follow pages until a short one comes back
+        index = start + len(items)
+        while len(items) >= page_size and (end is None or index < end):
+            items, _ = await fetch(index)
+            if not items:
+                return
+            yield items
+            index += len(items)
+        return
+
+    stop = total if end is None else min(total, end)
+    offsets = iter(range(start + page_size, stop, page_size))
+    pending: collections.deque = collections.deque()
+
+    def schedule():
+        for offset in offsets:
+            pending.append((offset, asyncio.ensure_future(fetch(offset))))
+            if len(pending) >= max(1, concurrency):
+                break
+
+    try:
+        schedule()
+        while pending:
+            offset, task = pending.popleft()
+            items, _ = await task
+            if not items:
+                logger.debug(f"[Paginator] Empty page at index {offset} of {total}, stopping")
+                return
+            schedule()
+            yield items
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+async def collect_pages(pages: AsyncIterator[List[Dict]], dedupe_key: Optional[str] = 'id') -> List[Dict]:
+    """
+    Concatenate the pages of paginate(), optionally de-duplicated.
+
+    Args:
+        pages: Page iterator
+        dedupe_key: Drop items whose value for this key was already seen
+            (items without it are kept); None keeps duplicates
+
+    Returns:
+        All items in order
+    """
+    results: List[Dict] = []
+    seen = set()
+    async for page in pages:
+        for item in page:
+            if dedupe_key is not None:
+                value: Any = item.get(dedupe_key) if isinstance(item, dict) else None
+                if value is not None:
+                    if value in seen:
+                        continue
+                    seen.add(value)
+            results.append(item)
+    return results
@@ -0,0 +1,342 @@
+"""
+Multi-process download mode for the download engine.
+
+Decryption and tagging are CPU-bound Python code, so with the default thread
+mode all downloads share one core with the Qt GUI. With the
+``downloads.engine_mode`` setting set to ``'processes'`` each track job runs
+in a pool of worker processes instead. Every process has its own DeezerAPI
+(HTTP pool and token copy) and runs the regular DownloadWorker track code.
+Results come back over the pool's pipe and are reported on the main
+process's event bus by the item's ProcessDownloadWorker. Events the track
+code emits inside a worker process go back over a multiprocessing queue and
+are re-emitted on the main bus by the same ProcessDownloadWorker.
+"""
+
+import copy
+import functools
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Import our new models and event system
+import sys
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import QueueItem, TrackInfo
+from src.services.event_bus import EventBus
+from src.services.new_download_worker import DownloadWorker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackJob:
+    """A single track download sent to a worker process"""
+    item: QueueItem
+    track_info: TrackInfo
+    playlist_position: int
+    quality: str
+
+
+@dataclass
+class TrackJobResult:
+    """Outcome of a TrackJob, sent back to the main process"""
+    track_id: int
+    success: bool
+    duration: float
+    pid: int
+
+
+# State of a worker process, set up by _init_download_process()
+_process_config = None
+_process_api = None
+_process_events = None
+_process_workers: "OrderedDict[str, DownloadWorker]" = OrderedDict()
+_MAX_CACHED_WORKERS = 8
+
+
+class _ForwardingEventBus(EventBus):
+    """Event bus of a worker process that sends every event to the main process"""
+
+    def __init__(self, item_id: str, events):
+        super().__init__()
+        self.item_id = item_id
+        self.events = events
+
+    def emit(self, event_type: str, *args, **kwargs):
+        try:
+            self.events.put_nowait((self.item_id, event_type, args, kwargs))
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"[ProcessDownloadWorker] Dropped event {event_type}: {e}")
+
+
+def _init_download_process(config_dir: str, settings: Dict[str, Any], tokens: Dict[str, Any], events=None):
+    """Build the process-local config and DeezerAPI (worker process)"""
+    global _process_config, _process_api, _process_events
+
+    # Ctrl+C is handled by the main process, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [pid {os.getpid()}] %(name)s %(levelname)s: %(message)s")
+
+    from src.config_manager import ConfigManager
+    from src.services.deezer_api import DeezerAPI
+
+    _process_config = ConfigManager(Path(config_dir))
+    _process_config.config = settings
+
+    _process_api = DeezerAPI(_process_config)
+    for name, value in tokens.items():
+        setattr(_process_api, name, value)
+    _process_events = events
+
+
+def _worker_for(job: TrackJob) -> DownloadWorker:
+    """Reuse one DownloadWorker per item so its caches survive between tracks (worker process)"""
+    worker = _process_workers.get(job.item.id)
+    if worker is None:
+        event_bus = _ForwardingEventBus(job.item.id, _process_events) if _process_events is not None else EventBus()
+        worker = DownloadWorker(job.item, _process_api, _process_config, event_bus)
+        _process_workers[job.item.id] = worker
+        while len(_process_workers) > _MAX_CACHED_WORKERS:
+            _process_workers.popitem(last=False)
+    else:
+        _process_workers.move_to_end(job.item.id)
+        worker.item = job.item  # May have grown while the item was expanding
+    worker.quality = job.quality
+    return worker
+
+
+def run_track_job(job: TrackJob) -> TrackJobResult:
+    """Download, decrypt and tag one track (worker process)"""
+    started = time.monotonic()
+    success = False
+    try:
+        success = _worker_for(job)._download_track(job.track_info, playlist_position=job.playlist_position)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"[ProcessDownloadWorker] Error downloading track {job.track_info.track_id}: {e}", exc_info=True)
+    return TrackJobResult(job.track_info.track_id, bool(success), time.monotonic() - started, os.getpid())
+
+
+class ProcessDownloadPool:
+    """
+    Pool of download worker processes shared by all items.
+
+    Args:
+        config_manager: Settings copied into every worker process
+        deezer_api: Main process API whose current tokens seed the workers
+    """
+
+    TOKEN_ATTRIBUTES = ('api_token', 'csrf_token', 'license_token', 'token_created_at', 'user_id')
+
+    def __init__(self, config_manager, deezer_api):
+        self.config = config_manager
+        self.deezer_api = deezer_api
+        self.max_workers = config_manager.get_setting('downloads.process_workers', 0) or os.cpu_count() or 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs_completed = 0
+        self._jobs_failed = 0
+        self._busy_time = 0.0
+        self._events = None
+        self._event_thread: Optional[threading.Thread] = None
+        self._event_listeners: Dict[str, Callable] = {}
+        self._listeners_lock = threading.Lock()
+
+    def start(self):
+        """Start the worker processes"""
+        if self._executor is not None:
+            return
+
+        tokens = {name: getattr(self.deezer_api, name, None) for name in self.TOKEN_ATTRIBUTES}
+        # Spawned rather than forked: forking a process running Qt and
+        # several threads is not safe
+        context = multiprocessing.get_context('spawn')
+        self._events = context.Queue()
+        self._event_thread = threading.Thread(target=self._forward_events, args=(self._events,),
+                                              name="ProcessDownloadEvents", daemon=True)
+        self._event_thread.start()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_download_process,
+            initargs=(str(self.config.config_dir), copy.deepcopy(self.config.config), tokens, self._events)
+        )
+        logger.info(f"[ProcessDownloadPool] Started {self.max_workers} worker processes")
+
+    def stop(self):
+        """Drop queued jobs and shut the worker processes down"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("[ProcessDownloadPool] Stopped")
+        events, self._events = self._events, None
+        if events is not None:
+            events.put(None)  # Ends the forwarding thread
+        self._event_thread = None
+
+    def add_event_listener(self, item_id: str, callback: Callable):
+        """Receive the events worker processes emit for an item as callback(event_type, args, kwargs)"""
+        with self._listeners_lock:
+            self._event_listeners[item_id] = callback
+
+    def remove_event_listener(self, item_id: str):
+        """Stop receiving an item's events"""
+        with self._listeners_lock:
+            self._event_listeners.pop(item_id, None)
+
+    def _forward_events(self, events):
+        """Hand events from the worker processes to their item's listener (forwarding thread)"""
+        while True:
+            try:
+                record = events.get()
+            except (EOFError, OSError):
+                return
+            if record is None:
+                return
+            item_id, event_type, args, kwargs = record
+            with self._listeners_lock:
+                callback = self._event_listeners.get(item_id)
+            if callback is None:
+                continue  # The item's run already ended
+            try:
+                callback(event_type, args, kwargs)
+            except Exception as e:
+                logger.error(f"[ProcessDownloadPool] Error forwarding {event_type} for {item_id}: {e}")
+
+    def submit(self, job: TrackJob) -> Future:
+        """Queue a track job, restarting the pool once if a worker process died"""
+        if self._executor is None:
+            self.start()
+        try:
+            future = self._executor.submit(run_track_job, job)
+        except BrokenProcessPool:
+            logger.warning("[ProcessDownloadPool] A worker process died, restarting the pool")
+            self.stop()
+            self.start()
+            future = self._executor.submit(run_track_job, job)
+        future.add_done_callback(self._record_result)
+        return future
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            'process_workers': self.max_workers,
+            'process_jobs_completed': self._jobs_completed,
+            'process_jobs_failed': self._jobs_failed,
+            'process_busy_seconds': round(self._busy_time, 1),
+        }
+
+    def _record_result(self, future: Future):
+        """Update the job counters"""
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception:
+            self._jobs_failed += 1
+            return
+        self._busy_time += result.duration
+        if result.success:
+            self._jobs_completed += 1
+        else:
+            self._jobs_failed += 1
+
+
+class ProcessDownloadWorker(DownloadWorker):
+    """
+    Download worker that hands its tracks to a ProcessDownloadPool.
+
+    Runs on the engine's thread pool like DownloadWorker, but only
+    coordinates: the per-track download, decryption and tagging happen in
+    the worker processes.
+    """
+
+    def __init__(self, item: QueueItem, deezer_api, config_manager, event_bus: EventBus,
+                 queue_manager=None, process_pool: ProcessDownloadPool = None):
+        super().__init__(item, deezer_api, config_manager, event_bus, queue_manager)
+        self.process_pool = process_pool
+        self._track_futures: List[Future] = []
+
+    def cancel(self):
+        """Cancel the download and drop its queued track jobs."""
+        super().cancel()
+        for future in list(self._track_futures):
+            future.cancel()
+
+    def _make_job(self, track_info: TrackInfo, playlist_position: int) -> TrackJob:
+        """Build the job for one track of this item"""
+        return TrackJob(self.item, track_info, playlist_position, self.quality)
+
+    def _start_track_pool(self):
+        """Track jobs go to the shared process pool; only listen for their events."""
+        self._track_futures = []
+        self.process_pool.add_event_listener(self.item.id, self._on_process_event)
+
+    def _on_process_event(self, event_type: str, args: tuple, kwargs: dict):
+        """Re-emit an event from a worker process on the main event bus"""
+        if not self.cancelled:
+            self.event_bus.emit(event_type, *args, **kwargs)
+
+    def _submit_track(self, track_info: TrackInfo, index: int, track_workers: list) -> bool:
+        """Send one track to the process pool. Returns False if cancelled."""
+        if self.cancelled:
+            return False
+
+        # Wait if paused
+        while self.paused and not self.cancelled:
+            time.sleep(0.1)
+
+        if self.cancelled:
+            return False
+
+        future = self.process_pool.submit(self._make_job(track_info, index + 1))
+        future.add_done_callback(functools.partial(self._on_track_job_done, track_info))
+        self._track_futures.append(future)
+        return True
+
+    def _on_track_job_done(self, track_info: TrackInfo, future: Future):
+        """Report a finished track job on the event bus"""
+        if future.cancelled() or self.cancelled:
+            return
+        try:
+            success = future.result().success
+        except Exception as e:
+            logger.error(f"[ProcessDownloadWorker] Track job for {track_info.track_id} failed: {e}")
+            success = False
+        self._on_track_completed(track_info, success)
+
+    def _wait_for_tracks(self):
+        """Block until all track jobs finished or the download is cancelled."""
+        pending = set(self._track_futures)
+        while pending and not self.cancelled:
+            _, pending = wait(pending, timeout=0.1)
+
+    def _stop_track_pool(self):
+        """Drop track jobs that have not started yet."""
+        for future in self._track_futures:
+            future.cancel()
+        self._track_futures = []
+        self.process_pool.remove_event_listener(self.item.id)
+
+    def _download_track(self, track_info: TrackInfo, playlist_position: int = 1) -> bool:
+        """Download a single-track item in a worker process and wait for it."""
+        if self.cancelled:
+            return False
+        self.process_pool.add_event_listener(self.item.id, self._on_process_event)
+        try:
+            return self.process_pool.submit(self._make_job(track_info, playlist_position)).result().success
+        except Exception as e:
+            logger.error(f"[ProcessDownloadWorker] Error downloading track {track_info.track_id}: {e}")
+            return False
+        finally:
+            self.process_pool.remove_event_listener(self.item.id)
@@ -0,0 +1,133 @@
+"""
+Machine-readable progress records from download and queue events.
+
+Used by the headless daemon (JSON lines on stdout) and the control API
+(server-sent events). Each event becomes a flat JSON-serializable dict with
+an ``event`` name and a ``time`` stamp, handed to a sink callable.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+# Import our new system components
+import sys
+from pathlib import Path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.services.event_bus import DownloadEvents, QueueEvents
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressFeed:
+    """
+    Turns DownloadService events into progress records.
+
+    Events arrive on worker threads; the sink is called on those threads.
+    Queue state changes are only reported when the state itself changes,
+    progress is reported by the 'progress' records.
+
+    Args:
+        service: DownloadService whose events are reported
+        sink: Called with every record
+    """
+
+    def __init__(self, service, sink: Callable[[Dict[str, Any]], None]):
+        self.service = service
+        self.sink = sink
+        self._lock = threading.Lock()
+        self._last_states: Dict[str, str] = {}
+
+        self._subscriptions = [
+            (QueueEvents.ITEM_ADDED, self._on_item_added),
+            (QueueEvents.ITEM_REMOVED, self._on_item_removed),
+            (QueueEvents.ITEM_STATE_CHANGED, self._on_state_changed),
+            (QueueEvents.QUEUE_CLEARED, self._on_queue_cleared),
+            (DownloadEvents.DOWNLOAD_STARTED, self._on_download_started),
+            (DownloadEvents.DOWNLOAD_PROGRESS, self._on_download_progress),
+            (DownloadEvents.DOWNLOAD_COMPLETED, self._on_download_completed),
+            (DownloadEvents.DOWNLOAD_FAILED, self._on_download_failed),
+            (DownloadEvents.DOWNLOAD_CANCELLED, self._on_download_cancelled),
+            (DownloadEvents.TRACK_COMPLETED, self._on_track_completed),
+            (DownloadEvents.TRACK_FAILED, self._on_track_failed),
+        ]
+        for event_type, callback in self._subscriptions:
+            service.subscribe_to_events(event_type, callback)
+
+    def close(self):
+        """Stop reporting events"""
+        for event_type, callback in self._subscriptions:
+            self.service.unsubscribe_from_events(event_type, callback)
+
+    def emit(self, event: str, **fields: Any):
+        """Send one record to the sink"""
+        record = {'event': event, 'time': round(time.time(), 3)}
+        record.update(fields)
+        try:
+            self.sink(record)
+        except Exception as e:
+            logger.error(f"[ProgressFeed] Error delivering '{event}' record: {e}")
+
+    def describe(self, item_id: str) -> Dict[str, Any]:
+        """Title, artist and type of a queue item"""
+        item = self.service.queue_manager.get_item(item_id)
+        if not item:
+            return {'item_id': item_id}
+        return {
+            'item_id': item_id,
+            'type': item.item_type.value,
+            'deezer_id': item.deezer_id,
+            'title': item.title,
+            'artist': item.artist,
+            'total_tracks': item.total_tracks,
+        }
+
+    def _on_item_added(self, item_id: str):
+        self.emit('item_added', **self.describe(item_id))
+
+    def _on_item_removed(self, item_id: str):
+        with self._lock:
+            self._last_states.pop(item_id, None)
+        self.emit('item_removed', item_id=item_id)
+
+    def _on_state_changed(self, item_id: str, state):
+        value = state.state.value
+        with self._lock:
+            if self._last_states.get(item_id) == value:
+                return
+            self._last_states[item_id] = value
+        self.emit('state', item_id=item_id, state=value, error=state.error_message)
+
+    def _on_queue_cleared(self, states, removed_ids):
+        with self._lock:
+            if not removed_ids:
+                self._last_states.clear()  # clear_all() doesn't list the IDs
+            for item_id in removed_ids:
+                self._last_states.pop(item_id, None)
+        self.emit('queue_cleared', states=[state.value for state in states], removed=len(removed_ids))
+
+    def _on_download_started(self, item_id: str):
+        self.emit('download_started', **self.describe(item_id))
+
+    def _on_download_progress(self, item_id: str, progress: float, completed_tracks: int = 0, failed_tracks: int = 0):
+        self.emit('progress', item_id=item_id, progress=round(progress, 4),
+                  completed_tracks=completed_tracks, failed_tracks=failed_tracks)
+
+    def _on_download_completed(self, item_id: str, *args):
+        self.emit('download_completed', **self.describe(item_id))
+
+    def _on_download_failed(self, item_id: str, error_message: str = None, *args):
+        self.emit('download_failed', error=error_message, **self.describe(item_id))
+
+    def _on_download_cancelled(self, item_id: str, *args):
+        self.emit('download_cancelled', item_id=item_id)
+
+    def _on_track_completed(self, item_id: str, track_id: int, *args):
+        self.emit('track_completed', item_id=item_id, track_id=track_id)
+
+    def _on_track_failed(self, item_id: str, track_id: int, error_message: str = None, *args):
+        self.emit('track_failed', item_id=item_id, track_id=track_id, error=error_message)
@@ -0,0 +1,145 @@
+"""
+Ordered index of queue item IDs by state, for cheap paginated listings.
+
+Listing a page of a large queue through QueueManager means copying every
+item and scanning every state under the queue lock. The index keeps the item
+order and the per-state membership up to date from queue events instead,
+like the queue widget's counters, so a page costs O(offset + limit) without
+touching the queue lock.
+"""
+
+import logging
+import threading
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+# Import our new system components
+import sys
+from pathlib import Path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import DownloadState
+from src.services.event_bus import EventBus, QueueEvents
+
+logger = logging.getLogger(__name__)
+
+
+class QueueIndex:
+    """
+    Queue order and per-state item IDs maintained from queue events.
+
+    All items are listed in the order they were added; items of one state
+    are listed in the order they entered that state.
+
+    Args:
+        queue_manager: QueueManager the index mirrors
+        event_bus: Bus the queue manager emits on
+    """
+
+    def __init__(self, queue_manager, event_bus: EventBus):
+        self.queue_manager = queue_manager
+        self.event_bus = event_bus
+
+        self._lock = threading.Lock()
+        self._order: Dict[str, None] = {}  # Insertion ordered set
+        self._states: Dict[str, DownloadState] = {}
+        self._by_state: Dict[DownloadState, Dict[str, None]] = {state: {} for state in DownloadState}
+
+        self._subscriptions = [
+            (QueueEvents.ITEM_ADDED, self._on_item_added),
+            (QueueEvents.ITEM_REMOVED, self._on_item_removed),
+            (QueueEvents.ITEM_STATE_CHANGED, self._on_state_changed),
+            (QueueEvents.QUEUE_CLEARED, self._on_queue_reset),
+            (QueueEvents.QUEUE_LOADED, self._on_queue_reset),
+        ]
+
+    def start(self):
+        """Subscribe to queue events and build the index from the current queue"""
+        for event_type, callback in self._subscriptions:
+            self.event_bus.subscribe(event_type, callback)
+        self.rebuild()
+
+    def stop(self):
+        """Stop following the queue"""
+        for event_type, callback in self._subscriptions:
+            self.event_bus.unsubscribe(event_type, callback)
+
+    def rebuild(self):
+        """Re-read the whole queue (after clears and reloads)"""
+        queue_manager = self.queue_manager
+        with queue_manager._lock:
+            # Held while swapping so no event can slip in between
+            with self._lock:
+                self._order = {}
+                self._states = {}
+                self._by_state = {state: {} for state in DownloadState}
+                for item_id in queue_manager.items:
+                    state = queue_manager.states.get(item_id)
+                    if state:
+                        self._order[item_id] = None
+                        self._states[item_id] = state.state
+                        self._by_state[state.state][item_id] = None
+        logger.debug(f"[QueueIndex] Rebuilt index of {len(self._order)} items")
+
+    def page(self, offset: int = 0, limit: int = 50,
+             state: Optional[DownloadState] = None) -> Tuple[List[str], int]:
+        """
+        Get one page of item IDs.
+
+        Args:
+            offset: Number of items to skip
+            limit: Maximum number of IDs returned
+            state: Only list items in this state
+
+        Returns:
+            (item IDs of the page, total number of matching items)
+        """
+        with self._lock:
+            ids = self._order if state is None else self._by_state[state]
+            return list(islice(ids, max(0, offset), max(0, offset) + max(0, limit))), len(ids)
+
+    def get_state(self, item_id: str) -> Optional[DownloadState]:
+        """Indexed state of an item"""
+        with self._lock:
+            return self._states.get(item_id)
+
+    def counts(self) -> Dict[str, int]:
+        """Item counts keyed by state value, like QueueManager.get_queue_summary()"""
+        with self._lock:
+            return {state.value: len(ids) for state, ids in self._by_state.items()}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._order)
+
+    def _set_state(self, item_id: str, state: DownloadState):
+        """Move an item to a state bucket (call under lock)"""
+        old_state = self._states.get(item_id)
+        if old_state == state:
+            return
+        if old_state is not None:
+            self._by_state[old_state].pop(item_id, None)
+        self._states[item_id] = state
+        self._by_state[state][item_id] = None
+
+    def _on_item_added(self, item_id: str):
+        with self._lock:
+            self._order[item_id] = None
+            self._set_state(item_id, DownloadState.QUEUED)
+
+    def _on_item_removed(self, item_id: str):
+        with self._lock:
+            self._order.pop(item_id, None)
+            old_state = self._states.pop(item_id, None)
+            if old_state is not None:
+                self._by_state[old_state].pop(item_id, None)
+
+    def _on_state_changed(self, item_id: str, state):
+        with self._lock:
+            if item_id in self._order:
+                self._set_state(item_id, state.state)
+
+    def _on_queue_reset(self, *args):
+        self.rebuild()
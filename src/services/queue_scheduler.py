@@ -0,0 +1,142 @@
+"""
+Priority-aware scheduling index for the download queue.
+
+Keeps the QUEUED items in a binary heap ordered by priority class first and
+by the active scheduling policy second, so that picking the next items,
+adding an item and reprioritizing one are all O(log n) instead of a full
+sort of the queue on every engine tick.
+"""
+
+import heapq
+import itertools
+import logging
+from enum import Enum
+from typing import Dict, List, Optional
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import QueueItem, ItemPriority
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulingPolicy(Enum):
+    """Order in which items of the same priority class are served"""
+    FIFO = "fifo"
+    SHORTEST_JOB_FIRST = "shortest_job_first"
+    ROUND_ROBIN_ARTIST = "round_robin_artist"
+
+
+class QueueScheduler:
+    """
+    Heap of schedulable queue items with lazy deletion.
+
+    Removed or reprioritized items are only marked invalid; stale heap
+    entries are discarded when they reach the top. Not thread-safe on its
+    own - the QueueManager calls it under its lock.
+    """
+
+    _REMOVED = "<removed>"
+
+    def __init__(self, policy: SchedulingPolicy = SchedulingPolicy.FIFO):
+        self.policy = policy
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._counter = itertools.count()
+
+        # Round-robin bookkeeping: next round per artist and the round last served
+        self._artist_rounds: Dict[str, int] = {}
+        self._current_round = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._entries
+
+    def _policy_key(self, item: QueueItem):
+        """Secondary sort key within a priority class"""
+        if self.policy == SchedulingPolicy.SHORTEST_JOB_FIRST:
+            return item.total_tracks
+        if self.policy == SchedulingPolicy.ROUND_ROBIN_ARTIST:
+            artist = item.artist.casefold()
+            # Fair-queueing style virtual round: an artist that shows up late
+            # starts at the current round instead of jumping every other artist
+            round_number = max(self._artist_rounds.get(artist, 0), self._current_round)
+            self._artist_rounds[artist] = round_number + 1
+            return round_number
+        return 0
+
+    def push(self, item: QueueItem, priority: ItemPriority):
+        """
+        Add or reposition an item.
+
+        A repositioned item keeps its round-robin round, so reprioritizing
+        doesn't push back the artist's other items; the shortest-job key is
+        recomputed from the current track count.
+        """
+        existing = self._entries.get(item.id)
+        if existing is not None and self.policy == SchedulingPolicy.ROUND_ROBIN_ARTIST:
+            policy_key = existing[1]
+        else:
+            policy_key = self._policy_key(item)
+        if existing is not None:
+            self.remove(item.id)
+        entry = [priority.value, policy_key, item.created_at.timestamp(),
+                 next(self._counter), item.id]
+        self._entries[item.id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, item_id: str) -> bool:
+        """Mark an item as no longer schedulable"""
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return False
+        entry[-1] = self._REMOVED
+
+        # Compact once stale entries dominate the heap
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+        return True
+
+    def peek(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Return the IDs of the next items to schedule without removing them.
+
+        Pops up to ``limit`` live entries and pushes them back, which keeps the
+        cost at O(limit * log n).
+        """
+        taken = []
+        while self._heap and (limit is None or len(taken) < limit):
+            entry = heapq.heappop(self._heap)
+            if entry[-1] is self._REMOVED:
+                continue
+            taken.append(entry)
+
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+
+        if taken and self.policy == SchedulingPolicy.ROUND_ROBIN_ARTIST:
+            self._current_round = max(self._current_round, taken[0][1])
+
+        return [entry[-1] for entry in taken]
+
+    def rebuild(self, items: List[QueueItem], priorities: Dict[str, ItemPriority],
+                policy: Optional[SchedulingPolicy] = None):
+        """Rebuild the heap from scratch, e.g. after loading or a policy change"""
+        if policy is not None:
+            self.policy = policy
+        self._heap = []
+        self._entries = {}
+        self._artist_rounds = {}
+        self._current_round = 0
+        for item in sorted(items, key=lambda x: x.created_at):
+            self.push(item, priorities.get(item.id, ItemPriority.NORMAL))
+        logger.debug(f"[QueueScheduler] Rebuilt index with {len(self._entries)} items ({self.policy.value})")
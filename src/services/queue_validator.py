@@ -0,0 +1,316 @@
+"""
+Background validation of queued items against files already on disk.
+
+On startup every queued album is checked for existing files so it can be
+marked completed instead of being downloaded again. Doing that with one
+``Path.exists()`` per track under the queue lock blocked startup for minutes
+on large queues over SMB. This validator instead lists each album directory
+once with ``os.scandir``, lists remote (UNC) directories on a thread pool,
+runs off the UI thread and streams results into the queue in batches. An
+item the engine wants to start before the pass reached it is validated
+ahead of the others on a separate thread; the engine skips it until then,
+so no directory is ever listed on the UI thread. Multi-disc albums are
+checked in every disc directory.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Set
+
+import sys
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import QueueItem, TrackInfo, DownloadState, ItemType
+
+logger = logging.getLogger(__name__)
+
+
+def fix_track_numbering(item: QueueItem) -> Optional[QueueItem]:
+    """
+    Return a copy of an album item with enumerated track numbers if all of
+    its tracks carry number 1 (left behind by an old bug), otherwise None.
+    """
+    if item.item_type != ItemType.ALBUM or len(item.tracks) <= 1:
+        return None
+    if not all(track.track_number == 1 for track in item.tracks):
+        return None
+
+    fixed_tracks = [replace(track, track_number=index) for index, track in enumerate(item.tracks, 1)]
+    return replace(item, tracks=fixed_tracks)
+
+
+class QueueValidator:
+    """
+    Validates queued items against the download folder in the background.
+
+    Args:
+        queue_manager: QueueManager whose QUEUED items are validated
+        path_resolver: Callable (item, track) -> Optional[Path] giving the
+            expected file path of a track
+        config_manager: Used for the worker count setting
+    """
+
+    BATCH_SIZE = 50
+    FLUSH_INTERVAL = 1.0  # Seconds between persisted batches
+
+    def __init__(self, queue_manager, path_resolver: Callable, config_manager=None):
+        self.queue_manager = queue_manager
+        self.path_resolver = path_resolver
+
+        self.max_workers = 8
+        if config_manager is not None:
+            self.max_workers = config_manager.get_setting('downloads.validation_workers', 8)
+
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._listings: Dict[Path, FrozenSet[str]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = False
+        self._requested: Set[str] = set()  # Items handed to the priority thread
+        self._priority_pool: Optional[ThreadPoolExecutor] = None
+
+        # Batched results waiting to be applied to the queue
+        self._completed_batch: List[str] = []
+        self._fixed_batch: Dict[str, QueueItem] = {}
+        self._last_flush = time.monotonic()
+
+    def start(self):
+        """Snapshot the queue and validate it on a background thread."""
+        with self.queue_manager._lock:
+            items = list(self.queue_manager.items.values())
+            queued_ids = {
+                item_id for item_id, state in self.queue_manager.states.items()
+                if state.state == DownloadState.QUEUED and not state.expanding
+            }
+
+        with self._lock:
+            self._pending = set(queued_ids)
+            self._cancelled = False
+
+        self._thread = threading.Thread(
+            target=self._run, args=(items,), name="QueueValidator", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[QueueValidator] Validating {len(queued_ids)} queued items in the background")
+
+    def stop(self):
+        """Abandon validation of the remaining items."""
+        with self._lock:
+            self._cancelled = True
+            self._pending.clear()
+            self._requested.clear()
+            pool, self._priority_pool = self._priority_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def is_running(self) -> bool:
+        """Check if the background pass is still in progress"""
+        return bool(self._thread and self._thread.is_alive())
+
+    def ensure_validated(self, item: QueueItem) -> bool:
+        """
+        Check if an item may be started, validating it first if needed.
+
+        Called by the download engine (UI thread) right before starting an
+        item. An item the background pass hasn't reached is handed to the
+        priority thread instead of being checked here.
+
+        Returns:
+            True if the item is validated and still needs downloading, False
+            if it is still being validated (try again on a later tick)
+        """
+        with self._lock:
+            if item.id not in self._pending:
+                return True
+            if item.id not in self._requested and not self._cancelled:
+                self._requested.add(item.id)
+                if self._priority_pool is None:
+                    self._priority_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="QueueValidatorPriority")
+                self._priority_pool.submit(self._validate_item, item)
+        return False
+
+    def _validate_item(self, item: QueueItem):
+        """Validate one item ahead of the background pass (priority thread)"""
+        with self._lock:
+            self._requested.discard(item.id)
+            if item.id not in self._pending:
+                return  # Evaluated by the background pass meanwhile
+            self._pending.discard(item.id)
+
+        try:
+            fixed = fix_track_numbering(item)
+            if fixed is not None:
+                self.queue_manager.replace_items({item.id: fixed})
+                item = fixed
+
+            expected = self._expected_paths(item)
+            self._list_directories(set(expected))
+
+            if self._all_files_exist(expected):
+                logger.info(f"[QueueValidator] Files already exist, marking as completed: {item.title}")
+                self.queue_manager.mark_completed_on_disk([item.id])
+        except Exception as e:
+            logger.error(f"[QueueValidator] Error validating {item.title}: {e}")
+
+    # Background pass
+
+    def _run(self, items: List[QueueItem]):
+        """Fix track numbering, list album directories once and apply results."""
+        started = time.monotonic()
+        fixed_count = 0
+        completed_count = 0
+
+        try:
+            by_directory: Dict[Path, List[QueueItem]] = {}
+            group_dirs: Dict[Path, Set[Path]] = {}
+            for item in items:
+                fixed = fix_track_numbering(item)
+                if fixed is not None:
+                    self._fixed_batch[item.id] = fixed
+                    fixed_count += 1
+                    item = fixed
+
+                with self._lock:
+                    if item.id not in self._pending:
+                        continue
+
+                expected = self._expected_paths(item)
+                if not expected:
+                    continue
+                # Items are grouped by the directory of their first track;
+                # a group lists every directory of its items (disc folders)
+                first = next(iter(expected))
+                by_directory.setdefault(first, []).append(item)
+                group_dirs.setdefault(first, set()).update(expected)
+
+            self._flush(force=True)
+
+            local_dirs = [d for d in by_directory if not self._is_remote_path(d)]
+            remote_dirs = [d for d in by_directory if self._is_remote_path(d)]
+
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="QueueValidatorList") as pool:
+                futures = {pool.submit(self._list_directories, group_dirs[d]): d for d in remote_dirs}
+
+                # Local listings are cheap - run them inline while remote ones are in flight
+                for directory in local_dirs:
+                    if self._cancelled:
+                        break
+                    self._list_directories(group_dirs[directory])
+                    completed_count += self._evaluate(by_directory[directory])
+
+                for future in as_completed(futures):
+                    if self._cancelled:
+                        break
+                    completed_count += self._evaluate(by_directory[futures[future]])
+
+            self._flush(force=True)
+
+        except Exception as e:
+            logger.error(f"[QueueValidator] Error validating queue: {e}", exc_info=True)
+
+        finally:
+            with self._lock:
+                self._pending.clear()
+                self._listings.clear()
+
+        logger.info(f"[QueueValidator] Validation finished in {time.monotonic() - started:.2f}s: "
+                    f"{completed_count} items already on disk, {fixed_count} track numberings fixed")
+
+    def _evaluate(self, items: List[QueueItem]) -> int:
+        """Evaluate items whose directories have been listed"""
+        completed = 0
+        for item in items:
+            with self._lock:
+                if item.id not in self._pending:
+                    continue  # Claimed by ensure_validated()
+                self._pending.discard(item.id)
+
+            if self._all_files_exist(self._expected_paths(item)):
+                self._completed_batch.append(item.id)
+                completed += 1
+
+        self._flush()
+        return completed
+
+    def _flush(self, force: bool = False):
+        """Apply batched results to the queue with a single persist"""
+        due = (len(self._completed_batch) >= self.BATCH_SIZE or
+               time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL)
+        if not (force or due):
+            return
+
+        if self._fixed_batch:
+            self.queue_manager.replace_items(self._fixed_batch)
+            logger.info(f"[QueueValidator] Fixed track numbering for {len(self._fixed_batch)} album(s) in queue")
+            self._fixed_batch = {}
+
+        if self._completed_batch:
+            self.queue_manager.mark_completed_on_disk(self._completed_batch)
+            self._completed_batch = []
+
+        self._last_flush = time.monotonic()
+
+    # Filesystem helpers
+
+    def _expected_paths(self, item: QueueItem) -> Dict[Path, List[str]]:
+        """Map each directory to the file names expected in it"""
+        tracks: List[Optional[TrackInfo]] = list(item.tracks) if item.item_type == ItemType.ALBUM else item.tracks[:1]
+        if not tracks:
+            tracks = [None]
+
+        expected: Dict[Path, List[str]] = {}
+        for track in tracks:
+            file_path = self.path_resolver(item, track)
+            if not file_path:
+                return {}
+            expected.setdefault(file_path.parent, []).append(file_path.name)
+        return expected
+
+    def _all_files_exist(self, expected: Dict[Path, List[str]]) -> bool:
+        """Check expected names against cached directory listings"""
+        if not expected:
+            return False
+        for directory, names in expected.items():
+            listing = self._listings.get(directory)
+            if listing is None:
+                listing = self._list_directory(directory)
+            if not all(name in listing for name in names):
+                return False
+        return True
+
+    def _list_directories(self, directories: Set[Path]):
+        """List several directories (e.g. the disc folders of an album)"""
+        for directory in directories:
+            self._list_directory(directory)
+
+    def _list_directory(self, directory: Path) -> FrozenSet[str]:
+        """List a directory once with os.scandir and cache the file names"""
+        listing = self._listings.get(directory)
+        if listing is not None:
+            return listing
+
+        try:
+            with os.scandir(directory) as entries:
+                listing = frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            listing = frozenset()
+        except OSError as e:
+            logger.debug(f"[QueueValidator] Cannot list {directory}: {e}")
+            listing = frozenset()
+
+        self._listings[directory] = listing
+        return listing
+
+    @staticmethod
+    def _is_remote_path(directory: Path) -> bool:
+        """UNC paths (\\\\server\\share or //server/share) are listed on the pool"""
+        return str(directory).startswith(('\\\\', '//'))
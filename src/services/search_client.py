@@ -0,0 +1,244 @@
+"""
+Shared client for the search page.
+
+All searches of a session go through DeezerAPI's pooled aiohttp session and
+list rate limit on the background loop, and their results are kept in a
+small LRU for a few minutes, so repeating a query or switching between
+filters doesn't refetch anything. Searches are plain coroutines: the search
+page cancels the task of a superseded search, which also cancels its
+requests.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from src.services.background_loop import on_background_loop
+from src.services.paginator import collect_pages
+from src.services.suggestion_index import SuggestionIndex, suggestion_index_for
+
+logger = logging.getLogger(__name__)
+
+# Filter name -> (endpoint path, payload key of the search page)
+SEARCH_ENDPOINTS = {
+    'all': ('/search', 'all_results'),
+    'artists': ('/search/artist', 'artist_results'),
+    'albums': ('/search/album', 'album_results'),
+    'tracks': ('/search/track', 'track_results'),
+    'playlists': ('/search/playlist', 'playlist_results'),
+}
+
+# Results per category in the "All" view
+ALL_VIEW_LIMITS = {'all': 10, 'artists': 10, 'albums': 10, 'tracks': 20, 'playlists': 10}
+
+
+class SearchResultCache:
+    """
+    Thread-safe LRU of search results with a time to live.
+
+    Args:
+        max_entries: Entries kept before the least recently used are dropped
+        ttl: Seconds a result stays valid
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+class SearchClient:
+    """
+    Cached search requests for one DeezerAPI.
+
+    Args:
+        deezer_api: DeezerAPI whose session and rate limit are used
+        ttl: Seconds search results are reused
+        max_entries: Number of result pages kept
+        suggestions: Index the artists and albums of every result page are added to
+    """
+
+    def __init__(self, deezer_api, ttl: float = 300, max_entries: int = 256,
+                 suggestions: Optional[SuggestionIndex] = None):
+        self.deezer_api = deezer_api
+        self.cache = SearchResultCache(max_entries=max_entries, ttl=ttl)
+        self.suggestions = suggestions
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Cache identity of a query (case and surrounding/inner whitespace ignored)"""
+        return " ".join(query.split()).casefold()
+
+    @on_background_loop
+    async def search(self, query: str, filter_name: str = 'all', limit: int = 20, index: int = 0) -> List[Dict]:
+        """
+        One page of results of a search endpoint.
+
+        Args:
+            query: Search text
+            filter_name: Key of SEARCH_ENDPOINTS
+            limit: Number of results
+            index: Index of the first result
+
+        Returns:
+            The results, empty if there are none or the request failed
+        """
+        path, _ = SEARCH_ENDPOINTS.get(filter_name, SEARCH_ENDPOINTS['all'])
+        key = (self.normalize_query(query), filter_name, limit, index)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"[SearchClient] Cache hit for {key}")
+            return list(cached)
+
+        params = {'q': query.strip()}
+        if filter_name == 'all':
+            params['order'] = 'RANKING'
+        pages = self.deezer_api.iter_list_pages(path, params=params, start=index, max_items=limit,
+                                                page_size=min(limit, 100))
+        results = await collect_pages(pages, dedupe_key=None)
+        if results:
+            # Empty results aren't kept, they may come from a failed request
+            self.cache.set(key, results)
+            if self.suggestions is not None:
+                self.suggestions.add_items(results)
+        return list(results)
+
+    async def search_payload(self, query: str, filter_name: str = 'all', limit: int = 20) -> Dict[str, List[Dict]]:
+        """
+        Results in the search page's payload format.
+
+        The "All" view gets one list per category (fetched concurrently),
+        other filters a single list under their payload key.
+        """
+        if filter_name != 'all':
+            _, payload_key = SEARCH_ENDPOINTS[filter_name]
+            return {payload_key: await self.search(query, filter_name, limit=limit)}
+
+        names = list(ALL_VIEW_LIMITS)
+        results = await asyncio.gather(
+            *[self.search(query, name, limit=ALL_VIEW_LIMITS[name]) for name in names],
+            return_exceptions=True
+        )
+        payload = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                logger.error(f"[SearchClient] {name} search for '{query}' failed: {result}")
+                result = []
+            payload[SEARCH_ENDPOINTS[name][1]] = result
+        return payload
+
+
+class SearchCursor:
+    """
+    Position in the results of one search, fetched a page at a time.
+
+    Pages go through SearchClient.search, so a page seen before (e.g. after
+    going back to a view) comes from the cache.
+
+    Args:
+        client: SearchClient used for the requests
+        query: Search text
+        filter_name: Key of SEARCH_ENDPOINTS other than 'all'
+        page_size: Results per page
+        start: Index of the first result not shown yet
+        exhausted: True if there is nothing after start (e.g. the first page was short)
+    """
+
+    def __init__(self, client: SearchClient, query: str, filter_name: str, page_size: int = 20,
+                 start: int = 0, exhausted: bool = False):
+        self.client = client
+        self.query = query
+        self.filter_name = filter_name
+        self.page_size = page_size
+        self.next_index = start
+        self.exhausted = exhausted
+
+    async def next_page(self) -> List[Dict]:
+        """The next page of results, empty once the results are exhausted"""
+        if self.exhausted:
+            return []
+        page = await self.client.search(self.query, self.filter_name, limit=self.page_size, index=self.next_index)
+        self.next_index += len(page)
+        if len(page) < self.page_size:
+            self.exhausted = True
+        return page
+
+    def cancel(self):
+        """Stop paging"""
+        self.exhausted = True
+
+
+class ListCursor:
+    """SearchCursor over a list that is already loaded, handing it out in pages"""
+
+    def __init__(self, items: List[Dict], page_size: int = 20, start: int = 0):
+        self.items = list(items)
+        self.page_size = page_size
+        self.next_index = start
+
+    @property
+    def exhausted(self) -> bool:
+        return self.next_index >= len(self.items)
+
+    async def next_page(self) -> List[Dict]:
+        """The next slice of the list"""
+        page = self.items[self.next_index:self.next_index + self.page_size]
+        self.next_index += len(page)
+        return page
+
+    def cancel(self):
+        """Stop paging"""
+        self.next_index = len(self.items)
+
+
+_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_search_client(deezer_api) -> SearchClient:
+    """The shared SearchClient of a DeezerAPI"""
+    with _clients_lock:
+        client = _clients.get(deezer_api)
+        if client is None:
+            ttl = 300
+            config = getattr(deezer_api, 'config', None)
+            if config is not None:
+                ttl = config.get_setting('search.cache_ttl', 300)
+            client = SearchClient(deezer_api, ttl=ttl, suggestions=suggestion_index_for(config))
+            _clients[deezer_api] = client
+        return client
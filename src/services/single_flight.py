@@ -0,0 +1,102 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+When several callers ask for the same thing while a request for it is still
+in flight, only the first one starts the request; the others wait for it and
+get a copy of its result. Used by DeezerAPI for its public API methods and
+private gateway calls, all of which run on the shared background loop.
+"""
+
+import asyncio
+import copy
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    In-flight request table of one event loop.
+
+    The request runs as its own task, so a caller that gives up (timeout,
+    closed page) doesn't cancel it for the others.
+
+    Args:
+        on_coalesced: Called with the key whenever a caller joins a running request
+    """
+
+    def __init__(self, on_coalesced: Optional[Callable[[Hashable], None]] = None):
+        self.on_coalesced = on_coalesced
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() unless a request with the same key is in flight.
+
+        Args:
+            key: Identity of the request, e.g. (method, url, params)
+            factory: Creates the request coroutine
+
+        Returns:
+            The request's result; callers that joined get a deep copy
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            if self.on_coalesced:
+                self.on_coalesced(key)
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
+        self.started += 1
+        task.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        """Drop a finished request from the table"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"[SingleFlight] Request {key!r} failed: {task.exception()}")
+
+    def in_flight(self) -> int:
+        """Number of requests currently running"""
+        return len(self._inflight)
+
+
+def make_key(*parts: Any) -> Optional[Hashable]:
+    """Hashable key from request parts (dicts and lists are frozen), None if impossible"""
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        return value
+
+    try:
+        key = freeze(parts)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def single_flight(method):
+    """
+    Decorator coalescing concurrent calls of an async method with equal arguments.
+
+    The instance must have a ``_flights`` SingleFlight. Calls whose arguments
+    can't be hashed run uncoalesced.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = make_key(method.__name__, args, kwargs)
+        if key is None:
+            return await method(self, *args, **kwargs)
+        return await self._flights.run(key, lambda: method(self, *args, **kwargs))
+    return wrapper
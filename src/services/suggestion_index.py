@@ -0,0 +1,574 @@
+"""
+Local index of artists and albums seen before, for instant search suggestions.
+
+Artists and albums that came through search results, the home page charts
+and artist pages are indexed by name (token prefixes, plus trigrams for
+typos and infix matches), so suggestions for the header search bar are
+available on every keystroke without a request. Albums and artists of the
+local library (the library scanner's scan_results.json) are indexed too.
+
+Suggestions are ranked by a small linear model: match quality, whether the
+entity is in the user's library or download queue, how often it was seen and
+its popularity.
+
+The index is kept in a JSON lines journal (suggestion_index.jsonl in the
+config directory): changed entries are appended, and the journal is rewritten
+once it holds too many superseded lines.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Import our new system components
+import sys
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.services.event_bus import EventBus, QueueEvents
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, accent-free, punctuation-free form of a name"""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFKD', str(text))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+def _trigrams(normalized: str) -> Set[str]:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class IndexedEntity:
+    """An artist or album known to the index"""
+    type: str
+    id: Optional[int]  # None for library albums/artists not matched to Deezer
+    name: str
+    artist: str = ""  # Album artist
+    cover: str = ""  # Picture/cover URL
+    fans: int = 0
+    seen: int = 0
+    last_seen: float = 0.0
+
+    @property
+    def key(self) -> str:
+        if self.id is not None:
+            return f"{self.type}:{self.id}"
+        return f"{self.type}:~{normalize_text(self.name)}|{normalize_text(self.artist)}"
+
+    @property
+    def name_key(self) -> Tuple[str, str, str]:
+        """Identity by name, used to match library entries to Deezer entities"""
+        return self.type, normalize_text(self.name), normalize_text(self.artist)
+
+    def to_record(self) -> Dict[str, Any]:
+        return {'t': self.type, 'id': self.id, 'n': self.name, 'a': self.artist, 'c': self.cover,
+                'f': self.fans, 's': self.seen, 'ls': round(self.last_seen)}
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'IndexedEntity':
+        return cls(type=record['t'], id=record.get('id'), name=record.get('n', ''), artist=record.get('a', ''),
+                   cover=record.get('c', ''), fans=record.get('f', 0), seen=record.get('s', 0),
+                   last_seen=record.get('ls', 0.0))
+
+
+def entities_from_items(items: Iterable[Dict[str, Any]], default_type: Optional[str] = None) -> List[IndexedEntity]:
+    """
+    Artists and albums in public API items.
+
+    Tracks contribute their artist and album. Items of other types are skipped.
+
+    Args:
+        items: Public API items (search results, chart entries, releases, ...)
+        default_type: Type of items without a 'type' field
+    """
+    entities = []
+
+    def add_artist(data: Dict[str, Any]):
+        if data.get('id') and data.get('name'):
+            entities.append(IndexedEntity(
+                type='artist', id=int(data['id']), name=data['name'],
+                cover=data.get('picture_medium') or data.get('picture') or '',
+                fans=int(data.get('nb_fan') or 0)))
+
+    def add_album(data: Dict[str, Any], artist_name: str = ""):
+        if data.get('id') and data.get('title'):
+            entities.append(IndexedEntity(
+                type='album', id=int(data['id']), name=data['title'],
+                artist=(data.get('artist') or {}).get('name') or artist_name,
+                cover=data.get('cover_medium') or data.get('cover') or '',
+                fans=int(data.get('fans') or 0)))
+
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get('type') or default_type
+        try:
+            if item_type == 'artist':
+                add_artist(item)
+            elif item_type == 'album':
+                add_album(item)
+            elif item_type == 'track':
+                artist = item.get('artist') or {}
+                add_artist(artist)
+                add_album(item.get('album') or {}, artist.get('name', ''))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"[SuggestionIndex] Skipping malformed item {item.get('id')}: {e}")
+    return entities
+
+
+class SuggestionIndex:
+    """
+    Thread-safe name index of artists and albums with ranked lookups.
+
+    Args:
+        path: Journal file (JSON lines)
+        scan_results_path: Library scanner results whose albums/artists are boosted
+        max_entries: Entries kept; the least seen are dropped when compacting
+    """
+
+    MAX_PREFIX = 8
+    MIN_QUERY_LENGTH = 2  # Single letters match too much to be useful
+    FLUSH_INTERVAL = 30.0  # Seconds between journal appends
+    LIBRARY_CHECK_INTERVAL = 30.0  # Seconds between scan_results.json mtime checks
+
+    # Rank model weights
+    EXACT_MATCH = 4.0
+    NAME_PREFIX_MATCH = 3.0
+    TOKEN_PREFIX_MATCH = 2.0
+    TRIGRAM_MATCH = 2.0  # Times the trigram similarity
+    MIN_TRIGRAM_SIMILARITY = 0.5
+    LIBRARY_BOOST = 3.0
+    QUEUE_BOOST = 2.0
+    SEEN_WEIGHT = 0.5  # Times log(1 + times seen)
+    POPULARITY_WEIGHT = 0.15  # Times log10(1 + fans)
+    TYPE_WEIGHTS = {'artist': 0.3, 'album': 0.0}
+
+    def __init__(self, path: Path, scan_results_path: Optional[Path] = None, max_entries: int = 50000):
+        self.path = Path(path)
+        self.scan_results_path = Path(scan_results_path) if scan_results_path else None
+        self.max_entries = max_entries
+
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._entities: Dict[str, IndexedEntity] = {}
+        self._tokens: Dict[str, Tuple[str, ...]] = {}  # key -> name tokens
+        self._prefixes: Dict[str, Set[str]] = {}  # token prefix -> keys
+        self._trigram_index: Dict[str, Set[str]] = {}  # trigram -> keys
+        self._by_name: Dict[Tuple[str, str, str], str] = {}  # name key -> key of a Deezer entity
+
+        self._dirty: Dict[str, IndexedEntity] = {}
+        self._journal_lines = 0
+        self._last_flush = time.monotonic()
+        self.loaded = False
+
+        # Library (from scan_results.json)
+        self._library_keys: Set[str] = set()  # Keys of library-only entities
+        self._library_artists: Set[str] = set()
+        self._library_albums: Set[Tuple[str, str]] = set()
+        self._library_mtime: Optional[float] = None
+        self._library_checked = 0.0
+
+        # Download queue
+        self._queue_manager = None
+        self._event_bus: Optional[EventBus] = None
+        self._queued_ids: Set[Tuple[str, int]] = set()
+        self._queued_artists: Set[str] = set()
+        self._queue_dirty = False
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # ----- Persistence -----
+
+    def load(self):
+        """Read the journal and the library scan (entries added meanwhile are kept)"""
+        records: Dict[str, IndexedEntity] = {}
+        lines = 0
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        lines += 1
+                        try:
+                            entity = IndexedEntity.from_record(json.loads(line))
+                        except (ValueError, KeyError, TypeError):
+                            continue  # Torn last line after a crash
+                        records[entity.key] = entity
+        except Exception as e:
+            logger.error(f"[SuggestionIndex] Error reading {self.path}: {e}")
+
+        with self._lock:
+            for key, entity in records.items():
+                current = self._entities.get(key)
+                if current is not None:
+                    current.seen += entity.seen
+                    current.last_seen = max(current.last_seen, entity.last_seen)
+                    current.cover = current.cover or entity.cover
+                else:
+                    self._insert(entity)
+            self._journal_lines = lines
+            self.loaded = True
+        logger.info(f"[SuggestionIndex] Loaded {len(records)} entries from {lines} journal lines")
+
+        self.refresh_library(force=True)
+        if lines > 2 * len(records) + 1000:
+            self.compact()
+
+    def flush(self):
+        """Append changed entries to the journal"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            self._last_flush = time.monotonic()
+        if not dirty:
+            return
+        try:
+            with self._io_lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    for entity in dirty.values():
+                        f.write(json.dumps(entity.to_record(), ensure_ascii=False) + "\n")
+            with self._lock:
+                self._journal_lines += len(dirty)
+                needs_compaction = self._journal_lines > 2 * len(self._entities) + 1000
+            if needs_compaction:
+                self.compact()
+        except Exception as e:
+            logger.error(f"[SuggestionIndex] Error writing {self.path}: {e}")
+
+    def compact(self):
+        """Rewrite the journal with one line per entry, dropping the least seen beyond max_entries"""
+        with self._lock:
+            entities = [e for e in self._entities.values() if e.id is not None]
+            if len(entities) > self.max_entries:
+                entities.sort(key=lambda e: (e.seen, e.last_seen), reverse=True)
+                for entity in entities[self.max_entries:]:
+                    self._remove(entity.key)
+                entities = entities[:self.max_entries]
+            self._dirty.clear()
+            lines = [json.dumps(e.to_record(), ensure_ascii=False) + "\n" for e in entities]
+        try:
+            with self._io_lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                os.replace(tmp_path, self.path)
+            with self._lock:
+                self._journal_lines = len(lines)
+            logger.debug(f"[SuggestionIndex] Compacted journal to {len(lines)} entries")
+        except Exception as e:
+            logger.error(f"[SuggestionIndex] Error compacting {self.path}: {e}")
+
+    # ----- Updates -----
+
+    def add_items(self, items: Iterable[Dict[str, Any]], default_type: Optional[str] = None):
+        """Index the artists and albums of public API items (see entities_from_items)"""
+        entities = entities_from_items(items, default_type)
+        if not entities:
+            return
+        now = time.time()
+        with self._lock:
+            for entity in entities:
+                current = self._entities.get(entity.key)
+                if current is None:
+                    entity.seen = 1
+                    entity.last_seen = now
+                    self._insert(entity)
+                    current = entity
+                else:
+                    if entity.name != current.name or (entity.artist and entity.artist != current.artist):
+                        self._remove(current.key)
+                        current.name = entity.name
+                        current.artist = entity.artist or current.artist
+                        self._insert(current)
+                    current.cover = entity.cover or current.cover
+                    current.fans = entity.fans or current.fans
+                    current.seen += 1
+                    current.last_seen = now
+                self._dirty[current.key] = current
+            flush_due = time.monotonic() - self._last_flush > self.FLUSH_INTERVAL
+        if flush_due and self.loaded:
+            self.flush()
+
+    def refresh_library(self, force: bool = False):
+        """Re-read the library scan if scan_results.json changed"""
+        if not self.scan_results_path:
+            return
+        now = time.monotonic()
+        if not force and now - self._library_checked < self.LIBRARY_CHECK_INTERVAL:
+            return
+        self._library_checked = now
+        try:
+            mtime = self.scan_results_path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._library_mtime:
+            return
+        try:
+            with open(self.scan_results_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"[SuggestionIndex] Error reading {self.scan_results_path}: {e}")
+            return
+
+        albums = data.get('albums') or data.get('files') or []
+        if isinstance(data.get('tracks'), dict):
+            albums = data['tracks'].get('albums', [])
+        elif isinstance(data.get('tracks'), list) and not albums:
+            albums = data['tracks']
+
+        entities = []
+        for album in albums:
+            if not isinstance(album, dict):
+                continue
+            artist = album.get('album_artist') or album.get('artist') or ''
+            title = album.get('title') or album.get('album') or album.get('name') or ''
+            if artist and artist != 'Unknown':
+                entities.append(IndexedEntity(type='artist', id=None, name=artist))
+            if title and title != 'Unknown':
+                entities.append(IndexedEntity(type='album', id=None, name=title, artist=artist))
+
+        with self._lock:
+            for key in self._library_keys:
+                self._remove(key)
+            self._library_keys = set()
+            self._library_artists = set()
+            self._library_albums = set()
+            for entity in entities:
+                _, name, artist = entity.name_key
+                if entity.type == 'artist':
+                    self._library_artists.add(name)
+                else:
+                    self._library_albums.add((name, artist))
+                if entity.key not in self._entities:
+                    self._insert(entity)
+                    self._library_keys.add(entity.key)
+            self._library_mtime = mtime
+        logger.info(f"[SuggestionIndex] Indexed library scan: {len(self._library_artists)} artists, "
+                    f"{len(self._library_albums)} albums")
+
+    def attach_queue(self, queue_manager, event_bus: EventBus):
+        """Boost entities in the download queue and index queued albums"""
+        self.detach_queue()
+        self._queue_manager = queue_manager
+        self._event_bus = event_bus
+        for event_type in (QueueEvents.ITEM_ADDED, QueueEvents.ITEM_REMOVED,
+                           QueueEvents.QUEUE_CLEARED, QueueEvents.QUEUE_LOADED):
+            event_bus.subscribe(event_type, self._on_queue_changed)
+        self._queue_dirty = True
+
+    def detach_queue(self):
+        """Stop following the download queue"""
+        if self._event_bus is not None:
+            for event_type in (QueueEvents.ITEM_ADDED, QueueEvents.ITEM_REMOVED,
+                               QueueEvents.QUEUE_CLEARED, QueueEvents.QUEUE_LOADED):
+                self._event_bus.unsubscribe(event_type, self._on_queue_changed)
+        self._queue_manager = None
+        self._event_bus = None
+
+    def _on_queue_changed(self, *args):
+        # Re-read lazily on the next lookup, queue events come in bursts
+        self._queue_dirty = True
+
+    def _schedule_refresh(self):
+        """Re-read the queue and library scan on a background thread if they may have changed"""
+        library_due = (self.scan_results_path is not None
+                       and time.monotonic() - self._library_checked >= self.LIBRARY_CHECK_INTERVAL)
+        if not (library_due or self._queue_dirty) or not self.loaded:
+            return
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def refresh():
+            try:
+                self._refresh_queue()
+                self.refresh_library()
+            except Exception as e:
+                logger.error(f"[SuggestionIndex] Error refreshing queue/library data: {e}")
+
+        self._refresh_thread = threading.Thread(target=refresh, name="SuggestionIndexRefresh", daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_queue(self):
+        queue_manager = self._queue_manager
+        if queue_manager is None or not self._queue_dirty:
+            return
+        self._queue_dirty = False
+        with queue_manager._lock:
+            items = list(queue_manager.items.values())
+        queued_ids = set()
+        queued_artists = set()
+        albums = []
+        for item in items:
+            item_type = getattr(item.item_type, 'value', item.item_type)
+            queued_ids.add((item_type, item.deezer_id))
+            queued_artists.add(normalize_text(item.artist))
+            if item_type == 'album':
+                albums.append({'type': 'album', 'id': item.deezer_id, 'title': item.title,
+                               'artist': {'name': item.artist}, 'cover_medium': item.album_cover_url or ''})
+        with self._lock:
+            self._queued_ids = queued_ids
+            self._queued_artists = queued_artists
+            for album in entities_from_items(albums):
+                if album.key not in self._entities:
+                    self._insert(album)
+                    self._dirty[album.key] = album
+
+    def _insert(self, entity: IndexedEntity):
+        key = entity.key
+        self._entities[key] = entity
+        tokens = tuple(normalize_text(entity.name).split())
+        self._tokens[key] = tokens
+        for token in tokens:
+            for length in range(1, min(len(token), self.MAX_PREFIX) + 1):
+                self._prefixes.setdefault(token[:length], set()).add(key)
+        for trigram in _trigrams(" ".join(tokens)):
+            self._trigram_index.setdefault(trigram, set()).add(key)
+        if entity.id is not None:
+            self._by_name[entity.name_key] = key
+
+    def _remove(self, key: str):
+        entity = self._entities.pop(key, None)
+        if entity is None:
+            return
+        tokens = self._tokens.pop(key, ())
+        for token in tokens:
+            for length in range(1, min(len(token), self.MAX_PREFIX) + 1):
+                keys = self._prefixes.get(token[:length])
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._prefixes[token[:length]]
+        for trigram in _trigrams(" ".join(tokens)):
+            keys = self._trigram_index.get(trigram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._trigram_index[trigram]
+        if self._by_name.get(entity.name_key) == key:
+            del self._by_name[entity.name_key]
+        self._dirty.pop(key, None)
+
+    # ----- Lookups -----
+
+    def suggest(self, query: str, limit: int = 8) -> List[IndexedEntity]:
+        """
+        Best matching artists and albums for a partial query.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            Suggestions, best first
+        """
+        normalized = normalize_text(query)
+        if len(normalized) < self.MIN_QUERY_LENGTH:
+            return []
+        self._schedule_refresh()
+
+        query_tokens = normalized.split()
+        with self._lock:
+            matches: Dict[str, float] = {}
+
+            # Every query token must prefix a name token; start from the rarest
+            postings = [self._prefixes.get(token[:self.MAX_PREFIX], set()) for token in query_tokens]
+            candidates = min(postings, key=len) if postings else set()
+            for key in candidates:
+                tokens = self._tokens[key]
+                if all(any(t.startswith(q) for t in tokens) for q in query_tokens):
+                    name = " ".join(tokens)
+                    if name == normalized:
+                        matches[key] = self.EXACT_MATCH
+                    elif name.startswith(normalized):
+                        matches[key] = self.NAME_PREFIX_MATCH
+                    else:
+                        matches[key] = self.TOKEN_PREFIX_MATCH
+
+            # Typos and infix matches
+            if len(matches) < limit and len(normalized) >= 3:
+                query_trigrams = _trigrams(normalized)
+                counts: Dict[str, int] = {}
+                for trigram in query_trigrams:
+                    for key in self._trigram_index.get(trigram, ()):
+                        counts[key] = counts.get(key, 0) + 1
+                for key, count in counts.items():
+                    similarity = count / len(query_trigrams)
+                    if key not in matches and similarity >= self.MIN_TRIGRAM_SIMILARITY:
+                        matches[key] = self.TRIGRAM_MATCH * similarity
+
+            scored = []
+            for key, match_score in matches.items():
+                entity = self._entities[key]
+                if entity.id is None and entity.name_key in self._by_name:
+                    continue  # The Deezer entity of this library entry is indexed
+                scored.append((match_score + self._rank(entity), key))
+            best = heapq.nlargest(limit, scored)
+            return [self._entities[key] for _, key in best]
+
+    def _rank(self, entity: IndexedEntity) -> float:
+        """Query independent part of the score"""
+        _, name, artist = entity.name_key
+        score = self.TYPE_WEIGHTS.get(entity.type, 0.0)
+        if entity.type == 'artist':
+            in_library = name in self._library_artists
+            in_queue = name in self._queued_artists
+        else:
+            in_library = (name, artist) in self._library_albums
+            in_queue = entity.id is not None and (entity.type, entity.id) in self._queued_ids
+        if in_library:
+            score += self.LIBRARY_BOOST
+        if in_queue:
+            score += self.QUEUE_BOOST
+        score += self.SEEN_WEIGHT * math.log1p(entity.seen)
+        score += self.POPULARITY_WEIGHT * math.log10(1 + entity.fans)
+        return score - 0.001 * len(entity.name)  # Shorter names first on ties
+
+
+_indexes: Dict[str, SuggestionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_suggestion_index(config_dir: Path) -> SuggestionIndex:
+    """
+    The shared SuggestionIndex of a config directory.
+
+    Created on first use; the journal and library scan are read on a
+    background thread, lookups return fewer results until then.
+    """
+    key = str(Path(config_dir).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = SuggestionIndex(
+                Path(config_dir) / "suggestion_index.jsonl",
+                scan_results_path=Path(config_dir) / "scan_results.json"
+            )
+            threading.Thread(target=index.load, name="SuggestionIndexLoader", daemon=True).start()
+        return index
+
+
+def suggestion_index_for(config) -> Optional[SuggestionIndex]:
+    """The shared SuggestionIndex of a ConfigManager's directory, None without one"""
+    config_dir = getattr(config, 'config_dir', None)
+    return get_suggestion_index(config_dir) if config_dir else None
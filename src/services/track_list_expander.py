@@ -0,0 +1,191 @@
+"""
+Streaming expansion of large albums and playlists into downloadable tracks.
+
+Instead of fetching every page of a 2,000-track playlist before the queue
+item exists, the item is enqueued right away with its known total and the
+remaining pages are fetched concurrently in the background. Pages are
+appended to the queue item in order as soon as they (and all pages before
+them) have arrived, so the download worker can start on the first page
+while the rest is still in flight.
+
+A page that keeps failing stops the expansion without finalizing the item:
+it keeps its expected total and stays expanding, so the expansion resumes
+on retry or restart instead of the item being downloaded as complete.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import ItemType, TrackInfo, track_info_from_deezer_data
+
+logger = logging.getLogger(__name__)
+
+
+class TrackListExpander:
+    """
+    Fetches the remaining track pages of queue items in the background.
+
+    Each expansion runs on a coordinator thread which fans the page requests
+    out to a shared page pool and appends the results to the queue manager
+    in page order.
+    """
+
+    PAGE_SIZE = 100
+    PAGE_RETRIES = 3  # Attempts per page before the expansion is given up
+    RETRY_DELAY = 1.0  # Seconds before the first retry, doubled for each further one
+
+    def __init__(self, queue_manager, deezer_api, config_manager=None):
+        self.queue_manager = queue_manager
+        self.deezer_api = deezer_api
+
+        page_workers = 4
+        if config_manager is not None:
+            page_workers = config_manager.get_setting('downloads.expansion_page_workers', 4)
+
+        self._coordinators = ThreadPoolExecutor(max_workers=2, thread_name_prefix="TrackExpander")
+        self._page_pool = ThreadPoolExecutor(max_workers=max(1, page_workers), thread_name_prefix="TrackExpanderPage")
+        self._lock = threading.Lock()
+        self._active: Dict[str, bool] = {}
+        self._shutdown = False
+
+        logger.info(f"[TrackListExpander] Initialized with {page_workers} page workers")
+
+    def expand(self, item_id: str, item_type: ItemType, deezer_id: int,
+               start_index: int, total: Optional[int] = None):
+        """
+        Start fetching the tracks of an item from start_index onwards.
+
+        Args:
+            item_id: Queue item to append tracks to
+            item_type: ALBUM or PLAYLIST, selects the tracks endpoint
+            deezer_id: Deezer album/playlist ID
+            start_index: Number of tracks the item already has
+            total: Total track count reported by the API, or None if unknown
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            if item_id in self._active:
+                logger.debug(f"[TrackListExpander] Expansion already running for {item_id}")
+                return
+            self._active[item_id] = True
+
+        self._coordinators.submit(self._expand, item_id, item_type, deezer_id, start_index, total)
+
+    def is_expanding(self, item_id: str) -> bool:
+        """Check if an expansion is currently running for an item"""
+        with self._lock:
+            return item_id in self._active
+
+    def shutdown(self):
+        """Stop accepting expansions and abandon pending page requests"""
+        with self._lock:
+            self._shutdown = True
+        self._page_pool.shutdown(wait=False, cancel_futures=True)
+        self._coordinators.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(self, item_type: ItemType, deezer_id: int, index: int) -> Optional[List[Dict]]:
+        """Fetch one page of raw track data, retrying failed requests. None if it kept failing"""
+        if item_type == ItemType.PLAYLIST:
+            path, endpoint = f"/playlist/{deezer_id}/tracks", 'playlist'
+        else:
+            path, endpoint = f"/album/{deezer_id}/tracks", 'album'
+
+        for attempt in range(self.PAGE_RETRIES):
+            page = self.deezer_api.get_list_page_sync(path, index, self.PAGE_SIZE, endpoint=endpoint)
+            if page is not None:
+                return page
+            if self._shutdown or attempt == self.PAGE_RETRIES - 1:
+                break
+            delay = self.RETRY_DELAY * (2 ** attempt)
+            logger.warning(f"[TrackListExpander] Page at index {index} of {path} failed, retrying in {delay:.0f}s")
+            time.sleep(delay)
+        return None
+
+    def _to_tracks(self, page: List[Dict], index: int) -> List[TrackInfo]:
+        """Convert a page of raw track data, numbering tracks by their position"""
+        tracks = []
+        for position, track_data in enumerate(page, index + 1):
+            try:
+                tracks.append(track_info_from_deezer_data(track_data, position))
+            except (KeyError, TypeError) as e:
+                logger.warning(f"[TrackListExpander] Skipping malformed track at position {position}: {e}")
+        return tracks
+
+    def _expand(self, item_id: str, item_type: ItemType, deezer_id: int,
+                start_index: int, total: Optional[int]):
+        """Coordinator: fan out page requests and append results in order"""
+        index = start_index
+        appended = 0
+        complete = False
+        error = None
+        try:
+            if total is None:
+                # Unknown total - follow pages until a short one comes back
+                while not self._shutdown:
+                    page = self._fetch_page(item_type, deezer_id, index)
+                    if page is None:
+                        error = f"page at index {index} could not be fetched"
+                        return
+                    tracks = self._to_tracks(page, index)
+                    if tracks and not self.queue_manager.append_tracks(item_id, tracks):
+                        return  # Item removed from the queue
+                    appended += len(tracks)
+                    index += len(page)
+                    if len(page) < self.PAGE_SIZE:
+                        complete = True
+                        break
+                return
+
+            offsets = list(range(start_index, total, self.PAGE_SIZE))
+            futures = [
+                self._page_pool.submit(self._fetch_page, item_type, deezer_id, offset)
+                for offset in offsets
+            ]
+
+            for offset, future in zip(offsets, futures):
+                if self._shutdown:
+                    return
+                page = future.result()
+                if page is None:
+                    error = f"page at index {offset} could not be fetched"
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                if not page:
+                    # The API serves fewer tracks than its reported total
+                    logger.warning(f"[TrackListExpander] Empty page at index {offset} for {item_id}, stopping expansion")
+                    break
+                tracks = self._to_tracks(page, offset)
+                if not self.queue_manager.append_tracks(item_id, tracks):
+                    # Item removed from the queue - drop the remaining pages
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                appended += len(tracks)
+            complete = True
+
+        except Exception as e:
+            logger.error(f"[TrackListExpander] Error expanding {item_type.value} {deezer_id}: {e}", exc_info=True)
+            error = str(e)
+
+        finally:
+            if not self._shutdown:
+                if complete:
+                    self.queue_manager.append_tracks(item_id, [], final=True)
+                elif error:
+                    self.queue_manager.fail_expansion(item_id, f"Track list incomplete: {error}")
+            with self._lock:
+                self._active.pop(item_id, None)
+            logger.info(f"[TrackListExpander] Finished expanding {item_type.value} {deezer_id}: {appended} tracks appended")
@@ -50,6 +50,8 @@ class AlbumDetailPage(QWidget):
         self.download_manager = download_manager
         self.current_album_id = None
         self.current_album_data = None 
+        self.current_album_tracks = []  # Tracks shown, reused by the album download
+        self._album_tracks_complete = False
         self.main_album_cover_loaded.connect(self._set_main_album_cover)
         self.thread_pool = QThreadPool.globalInstance() # For main album cover loading
 
@@ -235,12 +237,18 @@ class AlbumDetailPage(QWidget):
             return
 
         self.current_album_id = album_id
+        self.current_album_data = None
+        self.current_album_tracks = []
+        self._album_tracks_complete = False
         # Loading state is already set by set_loading_state() for immediate UI response
 
+        # Header metadata and the first page of tracks are fetched at the same time
+        page_size = getattr(self.deezer_api, 'LIST_PAGE_SIZE', 100)
+        first_page_task = asyncio.ensure_future(self.deezer_api.get_album_tracks_all(album_id, max_items=page_size))
         try:
             album_details = await self.deezer_api.get_album_details(album_id)
             if not album_details or album_details.get('error'):
-                error_msg = album_details.get('error', {}).get('message', 'Failed to fetch album details')
+                error_msg = (album_details or {}).get('error', {}).get('message', 'Failed to fetch album details')
                 logger.error(f"[AlbumDetail] Error loading album details for ID {album_id}: {error_msg}")
                 self.album_title_label.setText(f"Error: {error_msg}")
                 self.album_artist_label.setText("")
@@ -285,7 +293,10 @@ class AlbumDetailPage(QWidget):
             else:
                 self._set_placeholder_main_album_cover()
 
-            await self._fetch_and_display_tracks(album_id, album_details)
+            first_tracks = await first_page_task
+            if album_id != self.current_album_id:
+                return
+            await self._fetch_and_display_tracks(album_id, album_details, first_tracks)
 
         except Exception as e:
             logger.error(f"[AlbumDetail] General error loading album {album_id}: {e}", exc_info=True)
@@ -294,58 +305,68 @@ class AlbumDetailPage(QWidget):
             self.album_stats_label.setText("")
             self._show_track_load_error(f"An error occurred: {e}")
             self.album_download_button.setVisible(False)
+        finally:
+            if not first_page_task.done():
+                first_page_task.cancel()
 
-    async def _fetch_and_display_tracks(self, album_id: int, album_details_for_card_enrichment: dict):
-        """Helper function to fetch tracks and update UI, including download button state."""
-        tracks_data = await self.deezer_api.get_album_tracks(album_id)
-        
-        if tracks_data: # Directly a list
-            logger.info(f"[AlbumDetail] Received {len(tracks_data)} tracks for album {album_id}.")
-            self._clear_track_list() # Clear before adding new ones
-            for track_data in tracks_data:
-                if not isinstance(track_data, dict):
-                    logger.warning(f"[AlbumDetail] Skipping non-dict track item: {track_data}")
-                    continue
-                
-                if 'album' not in track_data:
-                    track_data['album'] = {
-                        'id': album_details_for_card_enrichment.get('id'),
-                        'title': album_details_for_card_enrichment.get('title'),
-                        'cover_small': album_details_for_card_enrichment.get('cover_small'),
-                        # Ensure 'artist' is also present if SearchResultCard expects it at track_data['album']['artist']
-                    }
-                if 'artist' not in track_data: # Ensure top-level artist for SearchResultCard if it expects it
-                    track_data['artist'] = album_details_for_card_enrichment.get('artist', {})
-                
-                if 'type' not in track_data:
-                    track_data['type'] = 'track'
-
-                # Create SearchResultCard for the track, ensure show_duration=True
-                card = SearchResultCard(track_data, show_duration=True) # MODIFIED: show_duration=True
-                card.card_selected.connect(self._handle_track_card_selected)
-                card.download_clicked.connect(self._handle_track_download_selected)
-                # NEW: Connect artist and album name click signals
-                card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
-                card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
-                # LEGACY: Also connect to the old signal names for backward compatibility
-                card.artist_name_clicked.connect(self.artist_selected_from_track.emit)
-                card.album_name_clicked.connect(self.album_selected_from_track.emit)
-                self.tracks_layout.addWidget(card)
-            
-            self.tracks_layout.addStretch(1)
-            # self.album_download_button.setVisible(True) # Visibility now handled by hover
-            # self.album_download_button.setEnabled(True)
-            # No direct call to _update_download_button_state for visibility here
-            # Its enabled state will be checked by hover if current_album_data is set.
-        elif isinstance(tracks_data, dict) and tracks_data.get('error'):
-            error_msg = tracks_data.get('error', {}).get('message', 'Failed to fetch tracks')
-            logger.error(f"[AlbumDetail] Error fetching tracks for album {album_id}: {error_msg}")
-            self._show_track_load_error(f"Could not load tracks: {error_msg}")
-        else:
+    async def _fetch_and_display_tracks(self, album_id: int, album_details_for_card_enrichment: dict, first_tracks: list):
+        """Show the first page of tracks, then fetch and append the rest of a long album."""
+        if not first_tracks:
             logger.warning(f"[AlbumDetail] No tracks found or unexpected data for album {album_id}.")
             self._show_track_load_error("No tracks found for this album.")
-            # self.album_download_button.setVisible(True) 
-            # self.album_download_button.setEnabled(False) # Hover handles visibility and enabled state
+            return
+
+        self._clear_track_list() # Clear before adding new ones
+        self.tracks_layout.addStretch(1)
+        self._append_track_cards(first_tracks, album_details_for_card_enrichment)
+
+        nb_tracks = album_details_for_card_enrichment.get('nb_tracks') or 0
+        if nb_tracks > len(first_tracks):
+            # Remaining pages; the first one comes from the response cache
+            all_tracks = await self.deezer_api.get_album_tracks_all(album_id)
+            if album_id != self.current_album_id:
+                return
+            self._append_track_cards(all_tracks[len(first_tracks):], album_details_for_card_enrichment)
+            # The paginator stops at the first failed page, so only a full list counts
+            self._album_tracks_complete = len(all_tracks) >= nb_tracks
+        else:
+            self._album_tracks_complete = True
+        logger.info(f"[AlbumDetail] Showing {len(self.current_album_tracks)} tracks for album {album_id}.")
+
+    def _append_track_cards(self, tracks_data: list, album_details_for_card_enrichment: dict):
+        """Add track cards above the trailing stretch of the track list."""
+        insert_at = max(0, self.tracks_layout.count() - 1)
+        for track_data in tracks_data:
+            if not isinstance(track_data, dict):
+                logger.warning(f"[AlbumDetail] Skipping non-dict track item: {track_data}")
+                continue
+            
+            if 'album' not in track_data:
+                track_data['album'] = {
+                    'id': album_details_for_card_enrichment.get('id'),
+                    'title': album_details_for_card_enrichment.get('title'),
+                    'cover_small': album_details_for_card_enrichment.get('cover_small'),
+                    # Ensure 'artist' is also present if SearchResultCard expects it at track_data['album']['artist']
+                }
+            if 'artist' not in track_data: # Ensure top-level artist for SearchResultCard if it expects it
+                track_data['artist'] = album_details_for_card_enrichment.get('artist', {})
+            
+            if 'type' not in track_data:
+                track_data['type'] = 'track'
+
+            # Create SearchResultCard for the track, ensure show_duration=True
+            card = SearchResultCard(track_data, show_duration=True) # MODIFIED: show_duration=True
+            card.card_selected.connect(self._handle_track_card_selected)
+            card.download_clicked.connect(self._handle_track_download_selected)
+            # NEW: Connect artist and album name click signals
+            card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
+            card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
+            # LEGACY: Also connect to the old signal names for backward compatibility
+            card.artist_name_clicked.connect(self.artist_selected_from_track.emit)
+            card.album_name_clicked.connect(self.album_selected_from_track.emit)
+            self.tracks_layout.insertWidget(insert_at, card)
+            insert_at += 1
+            self.current_album_tracks.append(track_data)
 
     def _clear_track_list(self):
         """Clears all widgets from the tracks_layout."""
@@ -542,7 +563,11 @@ class AlbumDetailPage(QWidget):
             #busy_icon = get_icon("downloading.png") 
             #if busy_icon: self.album_download_button.setIcon(busy_icon)
             
-            tracks_response = await self.deezer_api.get_album_tracks(self.current_album_id)
+            # Reuse the tracks on the page; a partly loaded album is fetched (mostly from cache)
+            if self._album_tracks_complete and self.current_album_tracks:
+                tracks_response = list(self.current_album_tracks)
+            else:
+                tracks_response = await self.deezer_api.get_album_tracks_all(self.current_album_id)
             
             if tracks_response and isinstance(tracks_response, list):
                 track_ids = [track['id'] for track in tracks_response if isinstance(track, dict) and track.get('id')]
@@ -21,6 +21,7 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QPixmap, QPainter, QPainterPath, QFont, QIcon, QColor, QImage
 
 from src.ui.components.responsive_grid import ResponsiveGridWidget, ResponsiveScrollArea
+from src.services.suggestion_index import suggestion_index_for
 from src.ui.components.album_sort_header import AlbumSortHeader
 from src.ui.track_list_header_widget import TrackListHeaderWidget
 from src.ui.search_widget import SearchResultCard
@@ -54,6 +55,7 @@ class ArtistDetailPage(QWidget):
         self.download_manager = download_manager
         self.current_artist_id = None
         self.current_artist_data = None
+        self._artist_snapshot = None  # ArtistSnapshot every tab and bulk action reads from
         
         # Add tab loading state tracking to prevent unnecessary reloads
         self._tabs_loaded = {
@@ -338,6 +340,7 @@ class ArtistDetailPage(QWidget):
             self._tabs_loaded['eps'] = False
         
         self.current_artist_id = artist_id
+        self._artist_snapshot = None
         # Loading state is already set by set_loading_state() for immediate UI response
         
         # Ensure tab content widgets are initialized before loading data
@@ -346,8 +349,9 @@ class ArtistDetailPage(QWidget):
             self._init_tab_content_widgets()
         
         try:
-            # Get artist details
-            artist_data = await self.deezer_api.get_artist(artist_id)
+            # Artist details, releases and top tracks in one go
+            snapshot = await self._get_artist_snapshot()
+            artist_data = snapshot.artist if snapshot else None
             if not artist_data:
                 logger.error(f"[ArtistDetail] Failed to get artist data for ID: {artist_id}")
                 self.artist_name_label.setText("Failed to load artist")
@@ -416,6 +420,22 @@ class ArtistDetailPage(QWidget):
             logger.error(f"[ArtistDetail] Exception loading artist {artist_id}: {e}", exc_info=True)
             self.artist_name_label.setText("Error loading artist")
             
+    async def _get_artist_snapshot(self):
+        """The ArtistSnapshot of the current artist, loaded on first use."""
+        snapshot = self._artist_snapshot
+        if snapshot is None or snapshot.artist_id != self.current_artist_id:
+            artist_id = self.current_artist_id
+            snapshot = await self.deezer_api.get_artist_snapshot(artist_id)
+            if artist_id != self.current_artist_id:
+                return None  # Another artist was opened meanwhile
+            self._artist_snapshot = snapshot
+            if snapshot:
+                # The artist, its releases and related artists become search suggestions
+                suggestions = suggestion_index_for(getattr(self.deezer_api, 'config', None))
+                if suggestions is not None:
+                    suggestions.add_items([snapshot.artist] + snapshot.releases + snapshot.related_artists, 'artist')
+        return snapshot
+
     def _is_likely_artist_image_url(self, url: str) -> bool:
         """
         Check if the URL is likely an artist image rather than an album cover.
@@ -683,7 +703,11 @@ class ArtistDetailPage(QWidget):
             return
 
         try:
-            tracks = await self.deezer_api.get_artist_top_tracks(self.current_artist_id)
+            snapshot = await self._get_artist_snapshot()
+            if snapshot and snapshot.top_tracks:
+                tracks = snapshot.top_tracks
+            else:
+                tracks = await self.deezer_api.get_artist_top_tracks(self.current_artist_id)
             self._clear_layout(self.top_tracks_list_layout) # Clear loading label
 
             if tracks:
@@ -980,9 +1004,9 @@ class ArtistDetailPage(QWidget):
                 logger.error(f"[ArtistDetail] DeezerAPI not available for _handle_album_card_download_request (album: {album_title})")
                 return
 
-            tracks_response = await self.deezer_api.get_album_tracks(album_id)
-            if tracks_response and isinstance(tracks_response, list): # get_album_tracks now returns a list directly
-                track_items = tracks_response
+            # Complete track list; shared with the album page through the response cache
+            track_items = await self.deezer_api.get_album_tracks_all(album_id)
+            if track_items:
                 # Filter out potential tracks without an ID, though unlikely for album tracks
                 track_ids = [track['id'] for track in track_items if isinstance(track, dict) and track.get('id')]
                 
@@ -990,18 +1014,9 @@ class ArtistDetailPage(QWidget):
                     logger.info(f"[ArtistDetail] Emitting album_selected_for_download for '{album_title}' (ID: {album_id}) with {len(track_ids)} track IDs.")
                     self.album_selected_for_download.emit(album_data, track_ids)
                 else:
-                    logger.warning(f"[ArtistDetail] No track IDs found or extracted for album '{album_title}' (ID: {album_id}). Track items: {len(track_items) if track_items else 'None'}")
-            elif tracks_response and 'data' in tracks_response: # Fallback for old structure if any API parts still use it
-                track_items = tracks_response['data']
-                track_ids = [track['id'] for track in track_items if isinstance(track, dict) and track.get('id')]
-                if track_ids:
-                    logger.info(f"[ArtistDetail] Emitting album_selected_for_download (fallback structure) for '{album_title}' (ID: {album_id}) with {len(track_ids)} track IDs.")
-                    self.album_selected_for_download.emit(album_data, track_ids)
-                else:
-                    logger.warning(f"[ArtistDetail] No track IDs found or extracted (fallback structure) for album '{album_title}' (ID: {album_id}).")
+                    logger.warning(f"[ArtistDetail] No track IDs found or extracted for album '{album_title}' (ID: {album_id}). Track items: {len(track_items)}")
             else:
-                error_detail = tracks_response.get('error', 'No data in response') if isinstance(tracks_response, dict) else 'Invalid response or empty list'
-                logger.error(f"[ArtistDetail] Failed to fetch tracks for album '{album_title}' (ID: {album_id}). Response: {error_detail}")
+                logger.error(f"[ArtistDetail] Failed to fetch tracks for album '{album_title}' (ID: {album_id}).")
         except Exception as e:
             logger.error(f"[ArtistDetail] Exception while fetching tracks for album ID {album_id} ('{album_title}') for download: {e}", exc_info=True)
 
@@ -1050,26 +1065,8 @@ class ArtistDetailPage(QWidget):
         scroll_area.setWidget(loading_label)
         
         try:
-            # Try multiple times with increasing timeouts
-            all_artist_releases = None
-            for attempt in range(2):  # Try up to 2 times
-                try:
-                    timeout_duration = 20  # generous single timeout as we paginate internally
-                    logger.info(f"[ArtistDetail.load_albums] Attempt {attempt + 1}/2 with {timeout_duration}s timeout (paginated)")
-                    all_artist_releases = await asyncio.wait_for(
-                        self.deezer_api.get_artist_albums_all(self.current_artist_id, page_size=100, max_pages=10),
-                        timeout=timeout_duration
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    logger.warning(f"[ArtistDetail.load_albums] Attempt {attempt + 1} timed out")
-                    if attempt == 1:
-                        error_label = QLabel("Loading timed out. Try again later.\nClick on this tab again to retry.")
-                        error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        error_label.setStyleSheet("color: #ff6b6b; padding: 20px;")
-                        scroll_area.setWidget(error_label)
-                        return
-                    await asyncio.sleep(1)
+            snapshot = await self._get_artist_snapshot()
+            all_artist_releases = snapshot.releases if snapshot else None
             
             if not all_artist_releases:
                 logger.info(f"[ArtistDetail.load_albums] No releases found for artist {self.current_artist_id}")
@@ -1079,15 +1076,8 @@ class ArtistDetailPage(QWidget):
                 return
             
             # Filter just the albums (not singles or EPs)
-            # Only include items with record_type explicitly set to 'album'
-            albums_data = []
-            for item in all_artist_releases:
-                record_type = item.get('record_type', '').lower()
-                
-                # Only consider it an album if record_type is explicitly 'album'
-                if record_type == 'album':
-                    albums_data.append(item)
-                    
+            albums_data = snapshot.albums()
+            
             # Debug: Log what we filtered
             logger.debug(f"[ArtistDetail.load_albums] Filtered {len(albums_data)} albums from {len(all_artist_releases)} total releases")
             
@@ -1202,118 +1192,32 @@ class ArtistDetailPage(QWidget):
             current_seq = 0
 
         try:
-            # Optimized approach: Use faster, more targeted API calls with concurrent execution
-            logger.info(f"[ArtistDetail.load_singles] Fetching singles for artist {self.current_artist_id} (optimized)")
-            
-            import concurrent.futures
-            
-            async def fetch_primary_releases():
-                """Fetch primary releases with reduced timeout and pagination."""
-                try:
-                    return await asyncio.wait_for(
-                        self.deezer_api.get_artist_albums_generic(self.current_artist_id, limit=200),
-                        timeout=8  # Reduced from 30 seconds
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning("[ArtistDetail.load_singles] Primary API call timed out")
-                    return []
-                except Exception as e:
-                    logger.error(f"[ArtistDetail.load_singles] Primary API error: {e}")
-                    return []
-            
-            async def fetch_singles_specific():
-                """Fetch singles using specific singles endpoint if available."""
-                try:
-                    # Try to get singles directly from the singles endpoint
-                    session = await self.deezer_api._get_session()
-                    if session:
-                        url = f"{self.deezer_api.PUBLIC_API_BASE}/artist/{self.current_artist_id}/albums"
-                        params = {'limit': 100}
-                        async with session.get(url, params=params, timeout=5) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                return data.get('data', [])
-                    return []
-                except Exception as e:
-                    logger.debug(f"[ArtistDetail.load_singles] Singles-specific API failed: {e}")
-                    return []
-            
-            # Execute both API calls concurrently for better performance
-            primary_task = asyncio.create_task(fetch_primary_releases())
-            singles_task = asyncio.create_task(fetch_singles_specific())
-            
-            # Wait for both with a total timeout
-            try:
-                primary_releases, specific_releases = await asyncio.wait_for(
-                    asyncio.gather(primary_task, singles_task, return_exceptions=True),
-                    timeout=12  # Total timeout for both calls
-                )
-            except asyncio.TimeoutError:
-                logger.warning("[ArtistDetail.load_singles] Both API calls timed out")
-                primary_releases, specific_releases = [], []
-            
-            # Handle exceptions from gather
-            if isinstance(primary_releases, Exception):
-                logger.error(f"Primary releases failed: {primary_releases}")
-                primary_releases = []
-            if isinstance(specific_releases, Exception):
-                logger.debug(f"Specific releases failed: {specific_releases}")
-                specific_releases = []
-            
-            # Combine and deduplicate results
-            all_releases = []
-            seen_ids = set()
-            
-            for release_list in [primary_releases, specific_releases]:
-                if isinstance(release_list, list):
-                    for item in release_list:
-                        if isinstance(item, dict) and item.get('id') not in seen_ids:
-                            all_releases.append(item)
-                            seen_ids.add(item.get('id'))
-            
-            # Filter for singles with optimized detection
-            singles_data = []
-            if all_releases:
-                for item in all_releases:
-                    record_type = (item.get('record_type') or '').lower()
-                    nb_tracks = item.get('nb_tracks', 0)
-                    title = (item.get('title') or '').lower()
-                    
-                    # Optimized single detection (most common cases first)
-                    is_single = (
-                        record_type == 'single' or 
-                        nb_tracks in (1, 2) or
-                        '(feat' in title or 
-                        '(with' in title or
-                        'single' in title
-                    )
-                    
-                    if is_single:
-                        singles_data.append(item)
-            
-            logger.info(f"[ArtistDetail.load_singles] Found {len(singles_data)} singles from {len(all_releases)} total releases (optimized)")
-            
-            # Only use expensive fallback if we have very few results
-            if len(singles_data) < 10:  # Reduced threshold from 50 to 10
-                logger.info("[ArtistDetail.load_singles] Very few singles found, trying comprehensive fallback")
-                try:
-                    # Use a much shorter timeout for the expensive call
-                    agg_releases = await asyncio.wait_for(
-                        self.deezer_api.get_artist_albums_all(self.current_artist_id, page_size=50, max_pages=5),
-                        timeout=8  # Reduced from 15 seconds
-                    )
-                    if agg_releases:
-                        # Merge with existing singles, avoiding duplicates
-                        for agg_single in agg_releases:
-                            if agg_single.get('id') not in seen_ids:
-                                record_type = (agg_single.get('record_type') or '').lower()
-                                nb_tracks = agg_single.get('nb_tracks', 0)
-                                if record_type == 'single' or nb_tracks in (1, 2):
-                                    singles_data.append(agg_single)
-                                    seen_ids.add(agg_single.get('id'))
-                        logger.info(f"[ArtistDetail.load_singles] After fallback: {len(singles_data)} total singles")
-                except Exception as e:
-                    logger.warning(f"[ArtistDetail.load_singles] Fallback failed: {e}")
+            logger.info(f"[ArtistDetail.load_singles] Fetching singles for artist {self.current_artist_id}")
+
+            # Partial results arrive on the API's loop thread; hop back to this
+            # loop and fill the grid while the aggregation is still running
+            ui_loop = asyncio.get_running_loop()
+
+            def _show_partial(partial_singles):
+                if current_seq != getattr(self, '_singles_load_seq', current_seq) or self._safe_sip_is_deleted(scroll_area):
+                    return
+                if partial_singles:
+                    self._show_singles_grid(scroll_area, partial_singles)
+
+            # The snapshot's singles are shown right away, the aggregation adds
+            # the ones only found by searching
+            snapshot = await self._get_artist_snapshot()
+            if snapshot and snapshot.singles():
+                _show_partial(snapshot.singles())
+
+            singles_data = await self.deezer_api.get_artist_singles_full(
+                self.current_artist_id,
+                on_partial=lambda partial: ui_loop.call_soon_threadsafe(_show_partial, partial)
+            ) or []
+            logger.info(f"[ArtistDetail.load_singles] Found {len(singles_data)} singles")
+            if current_seq != getattr(self, '_singles_load_seq', current_seq):
+                logger.debug("[ArtistDetail.load_singles] Newer singles load running, dropping this result")
+                return
             
             # Debug: Log the singles data
             if singles_data:
@@ -1325,70 +1229,7 @@ class ArtistDetailPage(QWidget):
             if singles_data:
                 logger.info(f"[ArtistDetail.load_singles] Found {len(singles_data)} singles for artist {self.current_artist_id}")
                 
-                # Cache the data for sorting
-                self._singles_data_cache = singles_data.copy()
-                
-                # Process each single and create cards
-                cards = []
-                for single_data in singles_data:
-                    if not isinstance(single_data, dict):
-                        logger.warning(f"[ArtistDetail.load_singles] Skipping non-dict single item: {single_data}")
-                        continue
-                    
-                    # Add required fields if missing
-                    if 'type' not in single_data:
-                        single_data['type'] = 'album'  # Use 'album' type for consistency with card handling
-                    
-                    # Add artist information since we're on an artist page and the API data may not include it
-                    if self.current_artist_data and self.current_artist_data.get('name'):
-                        single_data['artist_name'] = self.current_artist_data['name']
-                        # Also add artist object structure for consistency
-                        if 'artist' not in single_data:
-                            single_data['artist'] = {
-                                'id': self.current_artist_id,
-                                'name': self.current_artist_data['name']
-                            }
-                    
-                    # Ensure there's a picture_url field for single artwork
-                    if 'picture_url' not in single_data:
-                        # Try to set from various cover fields that might exist
-                        for field in ['cover_xl', 'cover_big', 'cover_medium', 'cover_small', 'cover']:
-                            if field in single_data and single_data[field]:
-                                single_data['picture_url'] = single_data[field]
-                                break
-                    
-                    # Create card
-                    try:
-                        card = SearchResultCard(single_data)
-                        # Connect signals if needed
-                        if hasattr(card, 'card_selected'):
-                            card.card_selected.connect(lambda data=single_data: self._on_album_selected_for_navigation(data, 'album'))
-                        if hasattr(card, 'download_clicked'):
-                            card.download_clicked.connect(lambda data=single_data: self._initiate_album_download_for_card(data))
-                        
-                        cards.append(card)
-                        logger.info(f"[ArtistDetail.load_singles] Successfully created card: {single_data.get('title', 'Unknown')}")
-                    except Exception as card_error:
-                        logger.error(f"[ArtistDetail.load_singles] Error creating card: {card_error}", exc_info=True)
-                
-                # Update UI immediately with the data we have
-                logger.debug(f"[ArtistDetail.load_singles] About to update UI with {len(cards)} cards")
-                
-                def _apply_singles_ui():
-                    try:
-                        logger.debug(f"[ArtistDetail.load_singles] _apply_singles_ui called with {len(cards)} cards")
-                        grid = ResponsiveGridWidget(card_min_width=160, card_spacing=15)
-                        grid.set_cards(cards)
-                        scroll_area.setWidget(grid)
-                        if hasattr(scroll_area, 'setWidgetResizable'):
-                            scroll_area.setWidgetResizable(True)
-                        if hasattr(scroll_area, 'viewport'):
-                            scroll_area.viewport().update()
-                        logger.info(f"[ArtistDetail] Displayed {len(singles_data)} singles in grid layout.")
-                    except Exception as ui_err:
-                        logger.error(f"[ArtistDetail.load_singles] Error applying singles UI: {ui_err}", exc_info=True)
-                
-                QTimer.singleShot(0, _apply_singles_ui)
+                QTimer.singleShot(0, lambda: self._show_singles_grid(scroll_area, singles_data))
                 return
             
             # No fallback - if no singles found, just show "no singles" message
@@ -1462,6 +1303,66 @@ class ArtistDetailPage(QWidget):
             error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             scroll_area.setWidget(error_label)
 
+    def _show_singles_grid(self, scroll_area, singles_data):
+        """Show singles as cards in a grid, replacing the scroll area's widget."""
+        # Cache the data for sorting
+        self._singles_data_cache = singles_data.copy()
+        
+        # Process each single and create cards
+        cards = []
+        for single_data in singles_data:
+            if not isinstance(single_data, dict):
+                logger.warning(f"[ArtistDetail.load_singles] Skipping non-dict single item: {single_data}")
+                continue
+            
+            # Add required fields if missing
+            if 'type' not in single_data:
+                single_data['type'] = 'album'  # Use 'album' type for consistency with card handling
+            
+            # Add artist information since we're on an artist page and the API data may not include it
+            if self.current_artist_data and self.current_artist_data.get('name'):
+                single_data['artist_name'] = self.current_artist_data['name']
+                # Also add artist object structure for consistency
+                if 'artist' not in single_data:
+                    single_data['artist'] = {
+                        'id': self.current_artist_id,
+                        'name': self.current_artist_data['name']
+                    }
+            
+            # Ensure there's a picture_url field for single artwork
+            if 'picture_url' not in single_data:
+                # Try to set from various cover fields that might exist
+                for field in ['cover_xl', 'cover_big', 'cover_medium', 'cover_small', 'cover']:
+                    if field in single_data and single_data[field]:
+                        single_data['picture_url'] = single_data[field]
+                        break
+            
+            # Create card
+            try:
+                card = SearchResultCard(single_data)
+                # Connect signals if needed
+                if hasattr(card, 'card_selected'):
+                    card.card_selected.connect(lambda data=single_data: self._on_album_selected_for_navigation(data, 'album'))
+                if hasattr(card, 'download_clicked'):
+                    card.download_clicked.connect(lambda data=single_data: self._initiate_album_download_for_card(data))
+                
+                cards.append(card)
+                logger.debug(f"[ArtistDetail.load_singles] Created card: {single_data.get('title', 'Unknown')}")
+            except Exception as card_error:
+                logger.error(f"[ArtistDetail.load_singles] Error creating card: {card_error}", exc_info=True)
+        
+        try:
+            grid = ResponsiveGridWidget(card_min_width=160, card_spacing=15)
+            grid.set_cards(cards)
+            scroll_area.setWidget(grid)
+            if hasattr(scroll_area, 'setWidgetResizable'):
+                scroll_area.setWidgetResizable(True)
+            if hasattr(scroll_area, 'viewport'):
+                scroll_area.viewport().update()
+            logger.info(f"[ArtistDetail] Displayed {len(singles_data)} singles in grid layout.")
+        except Exception as ui_err:
+            logger.error(f"[ArtistDetail.load_singles] Error applying singles UI: {ui_err}", exc_info=True)
+
     async def load_eps(self):
         logger.info(f"[ArtistDetail.load_eps] METHOD CALLED for artist {self.current_artist_id}")
         if not self.current_artist_id or not self.deezer_api:
@@ -1479,25 +1380,9 @@ class ArtistDetailPage(QWidget):
             return
         
         try:
-            # Get all artist releases with increased timeout tolerance
-            try:
-                logger.info(f"[ArtistDetail.load_eps] Fetching EPs for artist {self.current_artist_id}")
-                all_artist_releases = await asyncio.wait_for(
-                    self.deezer_api.get_artist_albums_generic(self.current_artist_id, limit=100),
-                    timeout=10  # 10 second timeout
-                )
-                logger.debug(f"[ArtistDetail.load_eps] Raw API response: {all_artist_releases[:2] if all_artist_releases else 'None'}")
-                
-                # Debug: Let's see what record_types are actually returned
-                if all_artist_releases:
-                    record_types = [item.get('record_type', 'no_record_type') for item in all_artist_releases[:10]]
-                    logger.debug(f"[ArtistDetail.load_eps] First 10 record_types found: {record_types}")
-            except asyncio.TimeoutError:
-                logger.error(f"[ArtistDetail.load_eps] Timeout fetching EPs for artist {self.current_artist_id}")
-                error_label = QLabel("Loading timed out. Try again later.")
-                error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                scroll_area.setWidget(error_label)
-                return
+            logger.info(f"[ArtistDetail.load_eps] Fetching EPs for artist {self.current_artist_id}")
+            snapshot = await self._get_artist_snapshot()
+            all_artist_releases = snapshot.releases if snapshot else None
             
             if not all_artist_releases:
                 logger.info(f"[ArtistDetail] No releases found for artist {self.current_artist_id}")
@@ -1506,22 +1391,9 @@ class ArtistDetailPage(QWidget):
                 scroll_area.setWidget(no_eps_label)
                 return
             
-            # Filter just the EPs
-            # Include both explicit EPs and singles with 4+ tracks
-            eps_data = []
-            for item in all_artist_releases:
-                record_type = item.get('record_type', '').lower()
-                nb_tracks = item.get('nb_tracks', 0)
-                
-                # Consider it an EP if:
-                # 1. record_type is 'ep' (explicit EP)
-                # 2. record_type is 'single' AND has 4+ tracks (single + remixes/bonus tracks)
-                # 3. Has 4-8 tracks and no explicit record_type (fallback heuristic)
-                
-                if (record_type == 'ep' or 
-                    (record_type == 'single' and nb_tracks >= 4) or
-                    (not record_type and 4 <= nb_tracks <= 8)):
-                    eps_data.append(item)
+            # EPs, singles with 4+ tracks (single + remixes/bonus tracks) and
+            # untyped releases of 4-8 tracks
+            eps_data = snapshot.eps()
             
             # Debug: Log what we filtered
             logger.debug(f"[ArtistDetail.load_eps] Filtered {len(eps_data)} EPs from {len(all_artist_releases)} total releases")
@@ -1647,8 +1519,13 @@ class ArtistDetailPage(QWidget):
 
         artist_name = self.current_artist_data.get('name')
         try:
-            # Search for playlists featuring the artist's name
-            search_results = await self.deezer_api.search(query=artist_name, search_type='playlist', limit=20)
+            # Playlists featuring the artist come with the private artist page;
+            # otherwise search for playlists by the artist's name
+            snapshot = await self._get_artist_snapshot()
+            if snapshot and snapshot.playlists:
+                search_results = snapshot.playlists
+            else:
+                search_results = await self.deezer_api.search(query=artist_name, search_type='playlist', limit=20)
 
             if hasattr(self, 'featured_in_page') and self.featured_in_page:
                 scroll_area = self.featured_in_page.findChild(QScrollArea)
@@ -2281,22 +2158,13 @@ class ArtistDetailPage(QWidget):
         try:
             logger.info(f"[ArtistDetail] Starting download of all albums for artist {self.current_artist_id}")
             
-            # Get all artist releases
-            all_artist_releases = await self.deezer_api.get_artist_albums_generic(self.current_artist_id, limit=100)
-            if not all_artist_releases:
+            snapshot = await self._get_artist_snapshot()
+            if not snapshot or not snapshot.releases:
                 logger.info("[ArtistDetail] No releases found for artist")
                 return
             
-            # Filter just the albums
-            albums_data = []
-            for item in all_artist_releases:
-                record_type = item.get('record_type', '').lower()
-                album_type = item.get('type', '').lower() 
-                
-                if (record_type == 'album' or 
-                    album_type == 'album' or
-                    (not record_type and not album_type and item.get('nb_tracks', 0) > 4)):
-                    albums_data.append(item)
+            # The same albums as the Albums tab
+            albums_data = snapshot.albums()
             
             logger.info(f"[ArtistDetail] Found {len(albums_data)} albums to download")
             
@@ -2330,37 +2198,15 @@ class ArtistDetailPage(QWidget):
         try:
             logger.info(f"[ArtistDetail] Starting download of all singles for artist {self.current_artist_id}")
             
-            # Get all artist releases
-            all_artist_releases = await self.deezer_api.get_artist_albums_generic(self.current_artist_id, limit=100)
-            if not all_artist_releases:
-                logger.info("[ArtistDetail] No releases found for artist")
+            # The singles shown in the Singles tab, or the snapshot's if the tab wasn't loaded
+            singles_data = list(self._singles_data_cache)
+            if not singles_data:
+                snapshot = await self._get_artist_snapshot()
+                singles_data = snapshot.singles() if snapshot else []
+            if not singles_data:
+                logger.info("[ArtistDetail] No singles found for artist")
                 return
             
-            # Filter just the singles
-            # Be more strict to avoid including EPs
-            singles_data = []
-            seen_single_ids = set()
-            current_artist_name = (self.current_artist_data or {}).get('name', '')
-            for item in all_artist_releases:
-                record_type = item.get('record_type', '').lower()
-                nb_tracks = item.get('nb_tracks', 0)
-                album_artist_name = (item.get('artist', {}) or {}).get('name', '')
-                item_id = item.get('id')
-
-                # Core single rule: include all 'single' record types regardless of nb_tracks
-                is_single_core = record_type == 'single'
-
-                # Heuristic: some singles are mis-typed; accept releases with 1-2 tracks
-                # where album artist matches the current artist
-                is_single_heur = (nb_tracks in (1, 2)) and (
-                    album_artist_name.lower() == current_artist_name.lower() if current_artist_name and album_artist_name else False
-                )
-
-                if (is_single_core or is_single_heur) and (item_id not in seen_single_ids):
-                    singles_data.append(item)
-                    if item_id is not None:
-                        seen_single_ids.add(item_id)
-            
             logger.info(f"[ArtistDetail] Found {len(singles_data)} singles to download")
             
             # Download each single
@@ -2393,22 +2239,13 @@ class ArtistDetailPage(QWidget):
         try:
             logger.info(f"[ArtistDetail] Starting download of all EPs for artist {self.current_artist_id}")
             
-            # Get all artist releases
-            all_artist_releases = await self.deezer_api.get_artist_albums_generic(self.current_artist_id, limit=100)
-            if not all_artist_releases:
+            snapshot = await self._get_artist_snapshot()
+            if not snapshot or not snapshot.releases:
                 logger.info("[ArtistDetail] No releases found for artist")
                 return
             
-            # Filter just the EPs
-            eps_data = []
-            for item in all_artist_releases:
-                record_type = item.get('record_type', '').lower()
-                album_type = item.get('type', '').lower()
-                
-                if (record_type == 'ep' or 
-                    album_type == 'ep' or
-                    (not record_type and not album_type and 4 <= item.get('nb_tracks', 0) <= 8)):
-                    eps_data.append(item)
+            # The same EPs as the EPs tab
+            eps_data = snapshot.eps()
             
             logger.info(f"[ArtistDetail] Found {len(eps_data)} EPs to download")
             
@@ -2455,6 +2292,11 @@ if __name__ == '__main__':
                     'type': 'artist'
                 }
             return {'error': {'message': 'Artist not found'}}
+
+        async def get_artist_snapshot(self, artist_id):
+            from src.models.artist_snapshot import ArtistSnapshot
+            artist = await self.get_artist_details(artist_id)
+            return ArtistSnapshot(artist=artist) if 'error' not in artist else None
         # Add other mock methods as needed
 
     # This is a simplified way to run asyncio with PyQt for testing.
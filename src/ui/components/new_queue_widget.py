@@ -8,8 +8,8 @@ with automatic updates via the event system.
 import logging
 from typing import Dict, Optional
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                            QLabel, QScrollArea, QFrame, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+                            QLabel, QMessageBox)
+from PyQt6.QtCore import Qt, pyqtSignal
 
 # Import our new system components
 import sys
@@ -21,7 +21,8 @@ if str(src_path) not in sys.path:
 from src.models.queue_models import QueueItem, QueueItemState, DownloadState
 from src.services.download_service import DownloadService
 from src.services.event_bus import EventBus, QueueEvents, DownloadEvents
-from src.ui.components.new_queue_item_widget import QueueItemWidget
+from src.ui.components.queue_list_view import QueueListModel, QueueItemDelegate, QueueListView
+from src.ui.components.queue_ui_bridge import QueueUpdateBridge, QueueItemDelta
 
 logger = logging.getLogger(__name__)
 
@@ -33,45 +34,33 @@ class NewQueueWidget(QWidget):
     Features:
     - Automatic UI updates via events (no manual refresh needed)
     - Individual item controls (remove, retry, pause)
-    - Clean widget lifecycle management
-    - Proper handling of large queues
+    - Virtualized list: only visible rows are painted, so queues of any
+      size are shown in full
     """
     
     # Signals for communication with main window
     queue_cleared = pyqtSignal()
     item_removed = pyqtSignal(str)  # item_id
     
-    # Internal signals for thread-safe GUI updates
-    download_started_signal = pyqtSignal(str)
-    download_progress_signal = pyqtSignal(str, float, int, int)
-    download_completed_signal = pyqtSignal(str)
-    download_failed_signal = pyqtSignal(str, str)
-    
     def __init__(self, download_service: DownloadService, parent=None):
         super().__init__(parent)
         self.download_service = download_service
         self.event_bus = download_service.event_bus
         
-        # Widget tracking
-        self.item_widgets: Dict[str, QueueItemWidget] = {}
-        self.smart_loading_active = False  # Track if we're using smart loading
-        self.loaded_item_count = 0  # Track how many items we've loaded
+        self._last_stats = None  # Last statistics shown, to skip redundant updates
+        
+        # Events from worker threads are applied to the UI at most fps times per second
+        fps = download_service.config.get_setting('downloads.queue_ui_fps', 30)
+        self.ui_bridge = QueueUpdateBridge(self._apply_queue_updates, fps=fps, parent=self)
         
         # Setup UI
         self._setup_ui()
-        self._setup_signal_connections()
         self._setup_event_subscriptions()
+        self.ui_bridge.reset_counters(self._snapshot_states())
         self._load_existing_queue()
         
         logger.info("[NewQueueWidget] Initialized new queue widget")
     
-    def _setup_signal_connections(self):
-        """Connect internal signals to update methods."""
-        self.download_started_signal.connect(self._update_download_started)
-        self.download_progress_signal.connect(self._update_download_progress)
-        self.download_completed_signal.connect(self._update_download_completed)
-        self.download_failed_signal.connect(self._update_download_failed)
-    
     def _setup_ui(self):
         """Setup the user interface."""
         layout = QVBoxLayout(self)
@@ -150,248 +139,58 @@ class NewQueueWidget(QWidget):
         layout.addLayout(button_layout)
     
     def _create_queue_area(self, layout):
-        """Create scrollable area for queue items."""
-        # Create scroll area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        # Create container widget for queue items
-        self.queue_container = QWidget()
-        self.queue_layout = QVBoxLayout(self.queue_container)
-        self.queue_layout.setContentsMargins(2, 2, 2, 2)  # Small margins
-        self.queue_layout.setSpacing(3)  # More spacing between items
-        
-        # Set size policy for container to allow proper scrolling
-        from PyQt6.QtWidgets import QSizePolicy
-        self.queue_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        
-        self.queue_layout.addStretch()  # Push items to top
+        """Create the virtualized queue list."""
+        self.queue_model = QueueListModel(self.download_service, self)
+        self.queue_delegate = QueueItemDelegate(self)
+        self.queue_delegate.action_requested.connect(self._handle_item_action)
         
-        self.scroll_area.setWidget(self.queue_container)
-        layout.addWidget(self.scroll_area)
+        self.queue_view = QueueListView(self)
+        self.queue_view.setObjectName("QueueListView")
+        self.queue_view.setModel(self.queue_model)
+        self.queue_view.setItemDelegate(self.queue_delegate)
+        layout.addWidget(self.queue_view)
     
     def _setup_event_subscriptions(self):
-        """Subscribe to relevant events."""
+        """Subscribe to relevant events (weakly, so the bus never keeps this widget alive)."""
         # Queue events
-        self.event_bus.subscribe(QueueEvents.ITEM_ADDED, self._on_item_added)
-        self.event_bus.subscribe(QueueEvents.ITEM_REMOVED, self._on_item_removed)
-        self.event_bus.subscribe(QueueEvents.ITEM_STATE_CHANGED, self._on_state_changed)
-        self.event_bus.subscribe(QueueEvents.QUEUE_CLEARED, self._on_queue_cleared)
+        self.event_bus.subscribe(QueueEvents.ITEM_ADDED, self._on_item_added, weak=True)
+        self.event_bus.subscribe(QueueEvents.ITEM_REMOVED, self._on_item_removed, weak=True)
+        self.event_bus.subscribe(QueueEvents.ITEM_STATE_CHANGED, self._on_state_changed, weak=True)
+        self.event_bus.subscribe(QueueEvents.QUEUE_CLEARED, self._on_queue_cleared, weak=True)
         
         # Download events
-        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_STARTED, self._on_download_started)
-        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_PROGRESS, self._on_download_progress)
-        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_COMPLETED, self._on_download_completed)
-        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_FAILED, self._on_download_failed)
-        self.event_bus.subscribe(DownloadEvents.TRACK_COMPLETED, self._on_track_completed)
-        self.event_bus.subscribe(DownloadEvents.TRACK_FAILED, self._on_track_failed)
+        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_STARTED, self._on_download_started, weak=True)
+        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_PROGRESS, self._on_download_progress, weak=True)
+        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_COMPLETED, self._on_download_completed, weak=True)
+        self.event_bus.subscribe(DownloadEvents.DOWNLOAD_FAILED, self._on_download_failed, weak=True)
+        self.event_bus.subscribe(DownloadEvents.TRACK_COMPLETED, self._on_track_completed, weak=True)
+        self.event_bus.subscribe(DownloadEvents.TRACK_FAILED, self._on_track_failed, weak=True)
     
     def _load_existing_queue(self):
-        """Load existing queue items on startup with efficient loading for large queues."""
+        """Load all existing queue items into the list model."""
         try:
-            # Get queue info first to check size
-            queue_info = self.download_service.get_queue_items_paginated(0, 1)
-            total_items = queue_info['total_count']
-            
-            logger.info(f"[NewQueueWidget] Loading queue with {total_items} items")
-            
-            if total_items == 0:
-                self._update_statistics()
-                return
-            
-            # For large queues, use smart loading strategy
-            if total_items > 50:
-                logger.info(f"[NewQueueWidget] Large queue detected ({total_items} items), using smart loading")
-                self._load_queue_smartly(total_items)
-            else:
-                # Normal loading for smaller queues
-                items = self.download_service.get_queue_items()
-                for item in items:
-                    self._create_item_widget(item)
-            
+            self.queue_model.reload()
+            logger.info(f"[NewQueueWidget] Loaded queue with {self.queue_model.rowCount()} items")
             self._update_statistics()
             
         except Exception as e:
             logger.error(f"[NewQueueWidget] Error loading existing queue: {e}")
-    
-    def _load_queue_smartly(self, total_items):
-        """Smart loading strategy for large queues."""
-        try:
-            # Priority 1: Load active/downloading items first (up to 20)
-            active_items = self.download_service.get_queue_items_by_state(DownloadState.DOWNLOADING)
-            queued_items = self.download_service.get_queue_items_by_state(DownloadState.QUEUED)
-            
-            priority_items = (active_items + queued_items)[:20]
-            
-            for item in priority_items:
-                self._create_item_widget(item)
-            
-            # Priority 2: Load some failed items for user visibility (up to 10)
-            failed_items = self.download_service.get_queue_items_by_state(DownloadState.FAILED)[:10]
-            for item in failed_items:
-                self._create_item_widget(item)
-            
-            # Add summary for remaining items
-            loaded_count = len(priority_items) + len(failed_items)
-            remaining_count = total_items - loaded_count
-            
-            if remaining_count > 0:
-                # Get completed count for summary
-                completed_items = self.download_service.get_queue_items_by_state(DownloadState.COMPLETED)
-                self._add_smart_summary_widget(remaining_count, len(completed_items), total_items)
-            
-            # Set smart loading flag for automatic progression
-            self.smart_loading_active = True
-            self.loaded_item_count = loaded_count
-            
-            logger.info(f"[NewQueueWidget] Smart loading: {loaded_count} priority items loaded, {remaining_count} summarized")
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error in smart loading: {e}")
-    
-    def _add_smart_summary_widget(self, remaining_count, completed_count, total_items):
-        """Add an intelligent summary widget for large queues."""
-        try:
-            from PyQt6.QtWidgets import QLabel, QFrame, QPushButton, QHBoxLayout
-            
-            summary_frame = QFrame()
-            summary_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-            summary_frame.setObjectName("QueueSummaryFrame")
-            summary_frame.setStyleSheet("""
-                QFrame#QueueSummaryFrame {
-                    background-color: rgba(100, 100, 100, 0.1);
-                    border: 1px solid rgba(150, 150, 150, 0.3);
-                    border-radius: 4px;
-                    margin: 2px;
-                }
-            """)
-            
-            summary_layout = QVBoxLayout(summary_frame)
-            summary_layout.setContentsMargins(8, 6, 8, 6)
-            summary_layout.setSpacing(4)
-            
-            # Main summary text
-            summary_text = f"📊 Queue Summary: {total_items} total items"
-            summary_label = QLabel(summary_text)
-            summary_label.setStyleSheet("font-weight: bold; color: #333; font-size: 11px;")
-            summary_layout.addWidget(summary_label)
-            
-            # Breakdown text
-            breakdown_text = f"• {remaining_count} items not shown (including {completed_count} completed)"
-            breakdown_label = QLabel(breakdown_text)
-            breakdown_label.setStyleSheet("color: #666; font-size: 10px;")
-            summary_layout.addWidget(breakdown_label)
-            
-            # Action buttons layout
-            button_layout = QHBoxLayout()
-            button_layout.setSpacing(8)
-            
-            # Helpful action suggestions
-            if completed_count > 20:
-                suggestion_label = QLabel("💡 Tip: Use 'Clear Completed' to reduce queue size")
-                suggestion_label.setStyleSheet("color: #0066CC; font-size: 10px; font-style: italic;")
-                summary_layout.addWidget(suggestion_label)
-            
-            # Insert before stretch
-            insert_index = self.queue_layout.count() - 1
-            self.queue_layout.insertWidget(insert_index, summary_frame)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error adding smart summary widget: {e}")
-    
-
-    
-    def _create_item_widget(self, item: QueueItem):
-        """Create widget for queue item."""
-        try:
-            # Get current state
-            state = self.download_service.get_queue_state(item.id)
-            if not state:
-                logger.warning(f"[NewQueueWidget] No state found for item {item.id}")
-                return
-            
-            # Fix completed_tracks and progress for completed items
-            if (state.state == DownloadState.COMPLETED and 
-                state.completed_tracks < item.total_tracks):
-                state.completed_tracks = item.total_tracks
-                state.progress = 1.0  # Ensure progress bar shows 100%
-                logger.info(f"[NewQueueWidget] Fixed completed_tracks and progress for loaded item {item.id}: {state.completed_tracks}/{item.total_tracks} (100%)")
- 
-            # Prevent duplicates: remove any existing widget for this item first
-            if item.id in self.item_widgets:
-                self._remove_item_widget(item.id)
- 
-            # Create widget
-            widget = QueueItemWidget(
-                item=item,
-                state=state,
-                on_remove=self._handle_item_remove,
-                on_retry=self._handle_item_retry,
-                on_cancel=self._handle_item_cancel,
-                on_pause=self._handle_item_pause,
-                on_resume=self._handle_item_resume,
-                parent=self
-            )
-             
-            # Add to layout (insert before stretch)
-            # The stretch is always the last item, so insert before it
-            stretch_index = self.queue_layout.count() - 1
-            self.queue_layout.insertWidget(stretch_index, widget)
-             
-            # Track widget
-            self.item_widgets[item.id] = widget
-             
-            logger.debug(f"[NewQueueWidget] Created widget for: {item.title}")
-             
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error creating item widget: {e}")
-     
-    def _remove_item_widget(self, item_id: str):
-        """Remove widget for queue item."""
-        try:
-            # Remove tracked instance if present
-            if item_id in self.item_widgets:
-                widget = self.item_widgets.pop(item_id)
- 
-                # Check if layout still exists before removing widget
-                if hasattr(self, 'queue_layout') and self.queue_layout:
-                    try:
-                        self.queue_layout.removeWidget(widget)
-                    except RuntimeError:
-                        # Qt object has been deleted
-                        pass
- 
-                widget.deleteLater()
-                logger.debug(f"[NewQueueWidget] Removed widget for: {item_id}")
- 
-            # Also defensively remove any duplicate/orphan widgets with same item_id
-            if hasattr(self, 'queue_layout') and self.queue_layout:
-                for i in reversed(range(self.queue_layout.count())):
-                    item = self.queue_layout.itemAt(i)
-                    w = item.widget() if item is not None else None
-                    if w and isinstance(w, QueueItemWidget):
-                        try:
-                            if hasattr(w, 'get_item_id') and w.get_item_id() == item_id:
-                                self.queue_layout.removeWidget(w)
-                                w.deleteLater()
-                                logger.debug(f"[NewQueueWidget] Removed orphan duplicate widget for: {item_id}")
-                        except RuntimeError:
-                            pass
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error removing item widget: {e}")
  
     def _update_statistics(self):
         """Update statistics display."""
         try:
-            stats = self.download_service.get_queue_summary()
+            # Counts are maintained incrementally by the UI bridge
+            stats = self.ui_bridge.get_summary()
              
             total = sum(stats.values())
             queued = stats.get('queued', 0)
             downloading = stats.get('downloading', 0)
             completed = stats.get('completed', 0)
             failed = stats.get('failed', 0)
+            
+            if (total, queued, downloading, completed, failed) == self._last_stats:
+                return
+            self._last_stats = (total, queued, downloading, completed, failed)
              
             stats_text = f"Total: {total} | Queued: {queued} | Active: {downloading} | Completed: {completed} | Failed: {failed}"
              
@@ -429,334 +228,123 @@ class NewQueueWidget(QWidget):
             logger.error(f"[NewQueueWidget] Error updating statistics: {e}")
  
     # Event Handlers
- 
+    #
+    # These run on whichever thread emitted the event. They only merge the
+    # change into the UI bridge, which applies everything that arrived during
+    # a frame in one pass on the main thread (see _apply_queue_updates).
+    
     def _on_item_added(self, item_id: str):
         """Handle item added to queue."""
-        try:
-            # Use QTimer.singleShot to ensure UI updates happen on main thread
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, lambda: self._create_item_widget_safe(item_id))
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling item added: {e}")
-    
-    def _create_item_widget_safe(self, item_id: str):
-        """Create item widget safely on the main thread."""
-        try:
-            item = self.download_service.get_queue_item(item_id)
-            if item:
-                self._create_item_widget(item)
-                self._update_statistics()
-                if self.status_label:
-                    self.status_label.setText(f"Added: {item.title}")
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error creating item widget: {e}")
+        self.ui_bridge.post(item_id, added=True)
     
     def _on_item_removed(self, item_id: str):
         """Handle item removed from queue."""
-        try:
-            # Use QTimer.singleShot to ensure UI updates happen on main thread
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, lambda: self._remove_item_widget_safe(item_id))
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling item removed: {e}")
-    
-    def _remove_item_widget_safe(self, item_id: str):
-        """Remove item widget safely on the main thread."""
-        try:
-            self._remove_item_widget(item_id)
-            self._update_statistics()
-            if self.status_label:
-                self.status_label.setText("Item removed")
-            
-            # Emit signal for main window
-            self.item_removed.emit(item_id)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error removing item widget: {e}")
+        self.ui_bridge.post(item_id, removed=True)
     
     def _on_state_changed(self, item_id: str, state: QueueItemState):
         """Handle item state change."""
-        try:
-            # Use QTimer.singleShot to ensure UI updates happen on main thread
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, lambda: self._update_state_safe(item_id, state))
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling state change: {e}")
-    
-    def _update_state_safe(self, item_id: str, state: QueueItemState):
-        """Update item state safely on the main thread."""
-        try:
-            if item_id in self.item_widgets:
-                logger.debug(f"[NewQueueWidget] Updating widget state for {item_id}: {state.state.value}")
-                self.item_widgets[item_id].update_state(state)
-                self._update_statistics()
-            else:
-                logger.warning(f"[NewQueueWidget] No widget found for state update: {item_id}")
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error updating state: {e}")
+        self.ui_bridge.post(item_id, state=state)
     
     def _on_queue_cleared(self, states, item_ids):
         """Handle queue cleared."""
-        try:
-            # Clear virtual loading data if it exists
-            if hasattr(self, 'all_queue_items'):
-                self.all_queue_items = []
-            if hasattr(self, 'rendered_items'):
-                self.rendered_items.clear()
-            
-            # Remove all tracked widgets
-            for item_id in list(self.item_widgets.keys()):
-                self._remove_item_widget(item_id)
- 
-            # Extra safety: remove ANY remaining widgets from the layout
-            if hasattr(self, 'queue_layout') and self.queue_layout:
-                for i in reversed(range(self.queue_layout.count())):
-                    item = self.queue_layout.itemAt(i)
-                    w = item.widget() if item is not None else None
-                    if w and (hasattr(w, 'get_item_id') or w.objectName() == "QueueSummaryFrame"):
-                        self.queue_layout.removeWidget(w)
-                        w.deleteLater()
-             
-            # Ensure our map is clear
-            self.item_widgets.clear()
- 
-            self._update_statistics()
-             
-            # Check if status_label still exists before accessing it
-            if hasattr(self, 'status_label') and self.status_label:
-                try:
-                    self.status_label.setText("Queue cleared")
-                except RuntimeError:
-                    # Qt object has been deleted
-                    pass
-             
-            # Emit signal for main window
-            self.queue_cleared.emit()
-             
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling queue cleared: {e}")
+        self.ui_bridge.post_cleared(self._snapshot_states())
     
     def _on_download_started(self, item_id: str):
         """Handle download started."""
-        try:
-            # Emit signal to update GUI on main thread
-            self.download_started_signal.emit(item_id)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling download started: {e}")
-    
-    @pyqtSlot(str)
-    def _update_download_started(self, item_id: str):
-        """Update GUI for download started (called on main thread)."""
-        try:
-            if item_id in self.item_widgets:
-                item = self.download_service.get_queue_item(item_id)
-                if item:
-                    self.status_label.setText(f"Started: {item.title}")
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error updating download started: {e}")
+        self.ui_bridge.post(item_id, started=True)
     
     def _on_download_progress(self, item_id: str, progress: float, completed_tracks: int, failed_tracks: int):
         """Handle download progress update."""
-        try:
-            # Emit signal to update GUI on main thread
-            self.download_progress_signal.emit(item_id, progress, completed_tracks, failed_tracks)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling download progress: {e}")
-    
-    @pyqtSlot(str, float, int, int)
-    def _update_download_progress(self, item_id: str, progress: float, completed_tracks: int, failed_tracks: int):
-        """Update GUI for download progress (called on main thread)."""
-        try:
-            if item_id in self.item_widgets:
-                self.item_widgets[item_id].update_progress(progress, completed_tracks, failed_tracks)
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error updating download progress: {e}")
+        self.ui_bridge.post(item_id, progress=(progress, completed_tracks, failed_tracks))
     
     def _on_download_completed(self, item_id: str):
         """Handle download completed."""
-        try:
-            logger.info(f"[NewQueueWidget] Received download completed event for: {item_id}")
-            # Emit signal to update GUI on main thread
-            self.download_completed_signal.emit(item_id)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling download completed: {e}")
+        logger.info(f"[NewQueueWidget] Received download completed event for: {item_id}")
+        self.ui_bridge.post(item_id, completed=True)
     
-    @pyqtSlot(str)
-    def _update_download_completed(self, item_id: str):
-        """Update GUI for download completed (called on main thread)."""
-        try:
-            if item_id in self.item_widgets:
-                # Update the individual widget's state
-                state = self.download_service.get_queue_state(item_id)
-                item = self.download_service.get_queue_item(item_id)
+    def _on_download_failed(self, item_id: str, error_message: str):
+        """Handle download failed."""
+        self.ui_bridge.post(item_id, failed_message=error_message)
+    
+    def _on_track_completed(self, item_id: str, track_id: int):
+        """Handle individual track completed."""
+        self.ui_bridge.post(item_id, tracks_completed=1)
+    
+    def _on_track_failed(self, item_id: str, track_id: int, error_message: str):
+        """Handle individual track failed."""
+        self.ui_bridge.post(item_id, tracks_failed=1)
+    
+    def _snapshot_states(self) -> Dict[str, DownloadState]:
+        """Current state of every queue item, used to seed the bridge counters."""
+        queue_manager = self.download_service.queue_manager
+        with queue_manager._lock:
+            return {item_id: state.state for item_id, state in queue_manager.states.items()}
+    
+    # Frame updates (main thread)
+    
+    def _apply_queue_updates(self, deltas: Dict[str, QueueItemDelta], cleared: bool):
+        """Apply one frame worth of queue changes."""
+        try:
+            status_message = None
+            added, removed, changed = [], [], []
+            
+            if cleared:
+                # Rebuild from the remaining items; pending deltas were dropped
+                self.queue_model.reload()
+                status_message = "Queue cleared"
+                self.queue_cleared.emit()
+            
+            for item_id, delta in deltas.items():
+                if delta.removed:
+                    removed.append(item_id)
+                    self.item_removed.emit(item_id)
+                    status_message = "Item removed"
+                    continue
                 
-                if state and item:
-                    # Ensure completed_tracks and progress are set correctly for completed items
-                    if (state.state == DownloadState.COMPLETED and 
-                        state.completed_tracks < item.total_tracks):
-                        state.completed_tracks = item.total_tracks
-                        state.progress = 1.0  # Ensure progress bar shows 100%
-                        logger.info(f"[NewQueueWidget] Fixed completed_tracks and progress for {item_id}: {state.completed_tracks}/{item.total_tracks} (100%)")
-                    
-                    self.item_widgets[item_id].update_state(state)
-                    logger.debug(f"[NewQueueWidget] Updated widget state for completed item: {item_id}")
+                if delta.added:
+                    # Rows are painted from the current state, which already
+                    # includes every other change in this delta
+                    added.append(item_id)
+                    item = self.download_service.get_queue_item(item_id)
+                    if item:
+                        status_message = f"Added: {item.title}"
+                    continue
                 
-                # Update status label
-                if item and self.status_label:
-                    self.status_label.setText(f"Completed: {item.title}")
-                    
-                self._update_statistics()
-            
-            # Check if we need to load more items (automatic progression)
-            self._check_for_automatic_progression()
-            
-        except RuntimeError as e:
-            if "wrapped C/C++ object" in str(e):
-                logger.debug(f"[NewQueueWidget] Widget deleted during completion handling: {e}")
-            else:
-                logger.error(f"[NewQueueWidget] Runtime error handling download completed: {e}")
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling download completed: {e}")
-    
-    def _check_for_automatic_progression(self):
-        """Check if we should automatically load more items from the queue."""
-        try:
-            if not self.smart_loading_active:
-                return
-            
-            # Count active/queued items currently displayed
-            active_count = 0
-            for item_id in self.item_widgets.keys():
                 state = self.download_service.get_queue_state(item_id)
-                if state and state.state in [DownloadState.QUEUED, DownloadState.DOWNLOADING]:
-                    active_count += 1
-            
-            # If we have fewer than 5 active items, load more
-            if active_count < 5:
-                # Get total queue info
-                queue_info = self.download_service.get_queue_items_paginated(0, 1)
-                total_items = queue_info['total_count']
+                if state:
+                    if delta.tracks_completed or delta.tracks_failed:
+                        state.completed_tracks += delta.tracks_completed
+                        state.failed_tracks += delta.tracks_failed
+                    if delta.progress is not None:
+                        state.progress, state.completed_tracks, state.failed_tracks = delta.progress
+                changed.append(item_id)
                 
-                # Check if there are more items to load
-                if total_items > len(self.item_widgets):
-                    logger.info(f"[NewQueueWidget] Auto-progression: Loading more items ({active_count} active, {total_items} total)")
-                    # Use QTimer to ensure UI updates happen on main thread
-                    from PyQt6.QtCore import QTimer
-                    QTimer.singleShot(0, self._load_next_batch)
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error in automatic progression: {e}")
-    
-    def _load_next_batch(self):
-        """Load the next batch of items from the queue."""
-        try:
-            # Get next batch of queued items (skip already loaded ones)
-            queued_items = self.download_service.get_queue_items_by_state(DownloadState.QUEUED)
-            
-            # Filter out items we already have widgets for
-            new_items = [item for item in queued_items if item.id not in self.item_widgets]
-            
-            # Load up to 10 more items
-            batch_size = min(10, len(new_items))
-            
-            for i in range(batch_size):
-                item = new_items[i]
-                self._create_item_widget(item)
+                if delta.started or delta.completed or delta.failed_message is not None:
+                    item = self.download_service.get_queue_item(item_id)
+                    title = item.title if item else item_id
+                    if delta.completed:
+                        status_message = f"Completed: {title}"
+                    elif delta.failed_message is not None:
+                        status_message = f"Failed: {title}"
+                    else:
+                        status_message = f"Started: {title}"
             
-            if batch_size > 0:
-                logger.info(f"[NewQueueWidget] Auto-progression: Loaded {batch_size} more items")
-                self._update_statistics()
+            self.queue_model.remove_items(removed)
+            self.queue_model.add_items(added)
+            self.queue_model.refresh_items(changed)
             
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error loading next batch: {e}", exc_info=True)
-    
-    def _on_download_failed(self, item_id: str, error_message: str):
-        """Handle download failed."""
-        try:
-            # Emit signal to update GUI on main thread
-            self.download_failed_signal.emit(item_id, error_message)
+            self._update_statistics()
             
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling download failed: {e}")
-    
-    @pyqtSlot(str, str)
-    def _update_download_failed(self, item_id: str, error_message: str):
-        """Update GUI for download failed (called on main thread)."""
-        try:
-            if item_id in self.item_widgets:
-                item = self.download_service.get_queue_item(item_id)
-                if item:
-                    self.status_label.setText(f"Failed: {item.title}")
-                self._update_statistics()
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error updating download failed: {e}")
-    
-    def _on_track_completed(self, item_id: str, track_id: int):
-        """Handle individual track completed."""
-        try:
-            logger.info(f"[NewQueueWidget] Received track completed event: item_id={item_id}, track_id={track_id}")
+            if status_message and self.status_label:
+                self.status_label.setText(status_message)
             
-            # Update the queue manager's state
-            if hasattr(self, 'download_service') and self.download_service:
-                queue_manager = self.download_service.queue_manager
-                if item_id in queue_manager.states:
-                    state = queue_manager.states[item_id]
-                    # Increment completed tracks count
-                    state.completed_tracks = getattr(state, 'completed_tracks', 0) + 1
-                    
-                    logger.info(f"[NewQueueWidget] Updated completed tracks for {item_id}: {state.completed_tracks}")
-                    
-                    # Update the widget display
-                    if item_id in self.item_widgets:
-                        widget = self.item_widgets[item_id]
-                        widget.update_progress(
-                            state.progress, 
-                            state.completed_tracks, 
-                            getattr(state, 'failed_tracks', 0)
-                        )
-                        logger.info(f"[NewQueueWidget] Updated widget display for {item_id}")
-                    else:
-                        logger.warning(f"[NewQueueWidget] No widget found for item {item_id}")
-                else:
-                    logger.warning(f"[NewQueueWidget] No state found for item {item_id}")
+        except RuntimeError as e:
+            if "wrapped C/C++ object" in str(e):
+                logger.debug(f"[NewQueueWidget] Widget deleted while applying queue updates: {e}")
             else:
-                logger.warning(f"[NewQueueWidget] No download service available")
-                    
+                logger.error(f"[NewQueueWidget] Runtime error applying queue updates: {e}")
         except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling track completed: {e}")
-    
-    def _on_track_failed(self, item_id: str, track_id: int, error_message: str):
-        """Handle individual track failed."""
-        try:
-            # Update the queue manager's state
-            if hasattr(self, 'download_service') and self.download_service:
-                queue_manager = self.download_service.queue_manager
-                if item_id in queue_manager.states:
-                    state = queue_manager.states[item_id]
-                    # Increment failed tracks count
-                    state.failed_tracks = getattr(state, 'failed_tracks', 0) + 1
-                    
-                    # Update the widget display
-                    if item_id in self.item_widgets:
-                        widget = self.item_widgets[item_id]
-                        widget.update_progress(
-                            state.progress, 
-                            getattr(state, 'completed_tracks', 0), 
-                            state.failed_tracks
-                        )
-                    
-                    logger.debug(f"[NewQueueWidget] Track {track_id} failed for item {item_id}. Total failed: {state.failed_tracks}")
-                    
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error handling track failed: {e}")
+            logger.error(f"[NewQueueWidget] Error applying queue updates: {e}")
     
     # Button Handlers
     
@@ -796,38 +384,11 @@ class NewQueueWidget(QWidget):
             self.status_label.setText(f"Cleared {completed_count} completed downloads")
             logger.info(f"[NewQueueWidget] User cleared {completed_count} completed downloads")
             
-            # If we had a large queue, reload to show more items
-            remaining_items = self.download_service.get_queue_items_paginated(0, 1)['total_count']
-            if remaining_items > 0 and completed_count > 10:
-                logger.info("[NewQueueWidget] Reloading queue after clearing many completed items")
-                # Clear current widgets and reload
-                self._clear_all_widgets()
-                self._load_existing_queue()
+            # The queue cleared event rebuilds the list from the remaining items
             
         except Exception as e:
             logger.error(f"[NewQueueWidget] Error clearing completed downloads: {e}")
     
-    def _clear_all_widgets(self):
-        """Clear all widgets from the queue layout."""
-        try:
-            # Remove all tracked widgets
-            for item_id in list(self.item_widgets.keys()):
-                self._remove_item_widget(item_id)
-            
-            # Remove any summary widgets
-            if hasattr(self, 'queue_layout') and self.queue_layout:
-                for i in reversed(range(self.queue_layout.count())):
-                    item = self.queue_layout.itemAt(i)
-                    w = item.widget() if item is not None else None
-                    if w and w.objectName() == "QueueSummaryFrame":
-                        self.queue_layout.removeWidget(w)
-                        w.deleteLater()
-            
-            self.item_widgets.clear()
-            
-        except Exception as e:
-            logger.error(f"[NewQueueWidget] Error clearing all widgets: {e}")
-    
     def _handle_clear_failed(self):
         """Handle clear failed button click."""
         try:
@@ -849,6 +410,21 @@ class NewQueueWidget(QWidget):
     
     # Item Action Handlers
     
+    def _handle_item_action(self, item_id: str, action: str):
+        """Dispatch a button click from a queue row."""
+        handlers = {
+            'remove': self._handle_item_remove,
+            'retry': self._handle_item_retry,
+            'cancel': self._handle_item_cancel,
+            'pause': self._handle_item_pause,
+            'resume': self._handle_item_resume,
+        }
+        handler = handlers.get(action)
+        if handler:
+            handler(item_id)
+        else:
+            logger.warning(f"[NewQueueWidget] Unknown item action: {action}")
+    
     def _handle_item_remove(self, item_id: str):
         """Handle individual item remove."""
         try:
@@ -874,8 +450,8 @@ class NewQueueWidget(QWidget):
     def _handle_item_retry(self, item_id: str):
         """Handle individual item retry."""
         try:
-            # Set state back to queued
-            self.download_service.queue_manager.update_state(item_id, state=DownloadState.QUEUED)
+            # Requeue the item - only its failed tracks if the last run got through
+            self.download_service.retry_item(item_id)
             logger.info(f"[NewQueueWidget] User retried item: {item_id}")
             
         except Exception as e:
@@ -926,13 +502,10 @@ class NewQueueWidget(QWidget):
     def cleanup(self):
         """Cleanup resources when widget is destroyed."""
         try:
-            # Unsubscribe from events
-            self.event_bus.clear_subscribers()
-            
-            # Clear widgets
-            for widget in self.item_widgets.values():
-                widget.deleteLater()
-            self.item_widgets.clear()
+            # Stop frame updates and unsubscribe our own handlers (not the
+            # download engine's)
+            self.ui_bridge.stop()
+            self.event_bus.unsubscribe_owner(self)
             
             logger.info("[NewQueueWidget] Cleaned up queue widget")
             
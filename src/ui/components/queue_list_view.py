@@ -0,0 +1,380 @@
+"""
+Virtualized download queue list.
+
+A QAbstractListModel over the queue's item IDs and a delegate that paints
+each row (title, artist, progress bar, status and action buttons) directly.
+Unlike one widget per item, only the rows currently on screen cost
+anything, so scrolling a queue of tens of thousands of items - including
+completed ones - stays smooth with flat memory use.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import (Qt, QAbstractListModel, QModelIndex, QRect, QSize,
+                          QEvent, pyqtSignal)
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter
+from PyQt6.QtWidgets import (QApplication, QListView, QStyle, QStyledItemDelegate,
+                             QStyleOptionButton, QStyleOptionProgressBar,
+                             QStyleOptionViewItem, QToolTip, QAbstractItemView)
+
+# Import our new system components
+import sys
+from pathlib import Path
+src_path = Path(__file__).parent.parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import QueueItem, QueueItemState, DownloadState, ItemType
+
+logger = logging.getLogger(__name__)
+
+ItemRole = Qt.ItemDataRole.UserRole + 1
+StateRole = Qt.ItemDataRole.UserRole + 2
+
+TYPE_DISPLAY = {
+    ItemType.ALBUM: "🎵 ALBUM",
+    ItemType.PLAYLIST: "📋 PLAYLIST",
+    ItemType.TRACK: "🎵 TRACK"
+}
+
+STATE_DISPLAY = {
+    DownloadState.QUEUED: ("Queued", "#666666"),
+    DownloadState.DOWNLOADING: ("Downloading...", "#0066CC"),
+    DownloadState.COMPLETED: ("Completed", "#00AA00"),
+    DownloadState.FAILED: ("Failed", "#CC0000"),
+    DownloadState.CANCELLED: ("Cancelled", "#AA6600"),
+    DownloadState.PAUSED: ("Paused", "#AA6600")
+}
+
+STATE_ACTIONS = {
+    DownloadState.QUEUED: ("cancel", "Cancel", "Cancel download"),
+    DownloadState.DOWNLOADING: ("pause", "Pause", "Pause download"),
+    DownloadState.FAILED: ("retry", "Retry", "Retry download"),
+    DownloadState.CANCELLED: ("retry", "Retry", "Retry download"),
+    DownloadState.PAUSED: ("resume", "Resume", "Resume download")
+}
+
+
+def action_for_state(state: QueueItemState) -> Optional[Tuple[str, str, str]]:
+    """Get (action, button text, tooltip) for an item's state, or None"""
+    if state.state == DownloadState.COMPLETED and state.failed_track_ids:
+        return ("retry", "Retry", f"Retry {len(state.failed_track_ids)} failed tracks")
+    return STATE_ACTIONS.get(state.state)
+
+
+def progress_text(item: QueueItem, state: QueueItemState) -> str:
+    """Progress line shown under the progress bar"""
+    if item.item_type in [ItemType.ALBUM, ItemType.PLAYLIST]:
+        completed = state.completed_tracks
+        if state.state == DownloadState.COMPLETED and completed < item.total_tracks and not state.failed_track_ids:
+            completed = item.total_tracks
+        text = f"{completed}/{item.total_tracks} tracks"
+        if state.failed_tracks > 0:
+            text += f" ({state.failed_tracks} failed)"
+        return text
+    return f"{int(display_progress(state) * 100)}%"
+
+
+def display_progress(state: QueueItemState) -> float:
+    """Progress shown by the bar; completed items always show full"""
+    return 1.0 if state.state == DownloadState.COMPLETED else state.progress
+
+
+class QueueListModel(QAbstractListModel):
+    """
+    List model over the IDs of the queue items, in queue order.
+
+    Only IDs are stored; item and state objects are looked up from the
+    download service when a visible row is painted.
+    """
+
+    # Above this many removals in one batch the model is reset instead of
+    # removing rows one by one
+    RESET_THRESHOLD = 64
+
+    def __init__(self, download_service, parent=None):
+        super().__init__(parent)
+        self.download_service = download_service
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._rows_dirty = False
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+
+        item_id = self._ids[index.row()]
+        if role == ItemRole:
+            return self.download_service.get_queue_item(item_id)
+        if role == StateRole:
+            return self.download_service.get_queue_state(item_id)
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            item = self.download_service.get_queue_item(item_id)
+            if not item:
+                return None
+            return item.title if role == Qt.ItemDataRole.DisplayRole else f"{item.title} - {item.artist}"
+        return None
+
+    def item_id_at(self, row: int) -> Optional[str]:
+        """Get the item ID shown in a row"""
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def row_of(self, item_id: str) -> int:
+        """Get the row of an item, or -1"""
+        if self._rows_dirty:
+            self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+            self._rows_dirty = False
+        return self._rows.get(item_id, -1)
+
+    def reload(self):
+        """Rebuild the model from the queue"""
+        self.beginResetModel()
+        self._ids = [item.id for item in self.download_service.get_queue_items()]
+        self._rows_dirty = True
+        self.endResetModel()
+        logger.debug(f"[QueueListModel] Loaded {len(self._ids)} items")
+
+    def add_items(self, item_ids: List[str]):
+        """Append newly queued items"""
+        new_ids = [item_id for item_id in item_ids if self.row_of(item_id) < 0]
+        if not new_ids:
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_ids) - 1)
+        for offset, item_id in enumerate(new_ids):
+            self._ids.append(item_id)
+            self._rows[item_id] = first + offset
+        self.endInsertRows()
+
+    def remove_items(self, item_ids: List[str]):
+        """Remove rows of items that left the queue"""
+        rows = sorted((row for row in (self.row_of(item_id) for item_id in item_ids) if row >= 0), reverse=True)
+        if not rows:
+            return
+
+        if len(rows) > self.RESET_THRESHOLD:
+            removed = set(item_ids)
+            self.beginResetModel()
+            self._ids = [item_id for item_id in self._ids if item_id not in removed]
+            self._rows_dirty = True
+            self.endResetModel()
+            return
+
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ids[row]
+            self.endRemoveRows()
+        self._rows_dirty = True
+
+    def refresh_items(self, item_ids: List[str]):
+        """Repaint the rows of changed items (off-screen rows cost nothing)"""
+        rows = sorted(row for row in (self.row_of(item_id) for item_id in item_ids) if row >= 0)
+        if not rows:
+            return
+        # One signal per contiguous range
+        start = previous = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == previous + 1:
+                previous = row
+                continue
+            self.dataChanged.emit(self.index(start, 0), self.index(previous, 0), [StateRole])
+            if row is not None:
+                start = previous = row
+
+
+class QueueItemDelegate(QStyledItemDelegate):
+    """
+    Paints queue rows and turns clicks on the painted buttons into
+    action_requested(item_id, action) with action one of 'cancel', 'pause',
+    'resume', 'retry' or 'remove'.
+    """
+
+    ROW_HEIGHT = 70
+    MARGIN = 8
+    ACTION_SIZE = QSize(60, 24)
+    REMOVE_SIZE = QSize(24, 24)
+
+    action_requested = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._type_font = QFont()
+        self._type_font.setBold(True)
+        self._type_font.setPointSize(6)
+        self._title_font = QFont()
+        self._title_font.setBold(True)
+        self._title_font.setPointSize(9)
+        self._small_font = QFont()
+        self._small_font.setPointSize(7)
+        self._status_font = QFont()
+        self._status_font.setPointSize(8)
+        self._status_font.setItalic(True)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def _button_rects(self, rect: QRect) -> Tuple[QRect, QRect]:
+        """Rects of the action and remove buttons within a row"""
+        top = rect.top() + (rect.height() - self.ACTION_SIZE.height()) // 2
+        remove = QRect(rect.right() - self.MARGIN - self.REMOVE_SIZE.width(), top,
+                       self.REMOVE_SIZE.width(), self.REMOVE_SIZE.height())
+        action = QRect(remove.left() - 4 - self.ACTION_SIZE.width(), top,
+                       self.ACTION_SIZE.width(), self.ACTION_SIZE.height())
+        return action, remove
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        item = index.data(ItemRole)
+        state = index.data(StateRole)
+        if not item or not state:
+            return
+
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        rect = option.rect.adjusted(2, 2, -2, -2)
+
+        painter.save()
+        try:
+            # Row background and frame
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+            painter.setPen(option.palette.mid().color())
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+            action_rect, remove_rect = self._button_rects(rect)
+            left = rect.left() + self.MARGIN
+            text_width = action_rect.left() - 10 - left
+            text_color = option.palette.text().color()
+
+            # Type and title
+            painter.setFont(self._type_font)
+            painter.setPen(text_color)
+            type_text = TYPE_DISPLAY.get(item.item_type, "UNKNOWN")
+            type_width = painter.fontMetrics().horizontalAdvance(type_text)
+            painter.drawText(QRect(left, rect.top() + 4, type_width, 16),
+                             Qt.AlignmentFlag.AlignVCenter, type_text)
+
+            painter.setFont(self._title_font)
+            title_rect = QRect(left + type_width + 4, rect.top() + 4, text_width - type_width - 4, 16)
+            painter.drawText(title_rect, Qt.AlignmentFlag.AlignVCenter,
+                             painter.fontMetrics().elidedText(item.title, Qt.TextElideMode.ElideRight, title_rect.width()))
+
+            # Artist and track count
+            painter.setFont(option.font)
+            artist_text = item.artist
+            if item.item_type in [ItemType.ALBUM, ItemType.PLAYLIST]:
+                artist_text += f"  ({item.total_tracks} tracks)"
+            artist_rect = QRect(left, rect.top() + 20, text_width, 14)
+            painter.drawText(artist_rect, Qt.AlignmentFlag.AlignVCenter,
+                             painter.fontMetrics().elidedText(artist_text, Qt.TextElideMode.ElideRight, text_width))
+
+            # Progress bar
+            bar = QStyleOptionProgressBar()
+            bar.rect = QRect(left, rect.top() + 36, text_width, 6)
+            bar.minimum = 0
+            bar.maximum = 100
+            bar.progress = int(display_progress(state) * 100)
+            bar.textVisible = False
+            bar.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+            bar.palette = option.palette
+            style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, widget)
+
+            # Progress details and status
+            painter.setFont(self._small_font)
+            painter.drawText(QRect(left, rect.top() + 42, text_width, 11),
+                             Qt.AlignmentFlag.AlignVCenter, progress_text(item, state))
+
+            status_text, color = STATE_DISPLAY.get(state.state, ("Unknown", "#666666"))
+            if state.state == DownloadState.FAILED and state.error_message:
+                status_text += f": {state.error_message}"
+            painter.setFont(self._status_font)
+            painter.setPen(QColor(color))
+            status_rect = QRect(left, rect.top() + 52, text_width, 13)
+            painter.drawText(status_rect, Qt.AlignmentFlag.AlignVCenter,
+                             painter.fontMetrics().elidedText(status_text, Qt.TextElideMode.ElideRight, text_width))
+
+            # Buttons
+            cursor = widget.mapFromGlobal(QCursor.pos()) if widget else None
+            action = action_for_state(state)
+            if action:
+                self._draw_button(painter, style, widget, option, action_rect, action[1], cursor)
+            self._draw_button(painter, style, widget, option, remove_rect, "✕", cursor)
+        finally:
+            painter.restore()
+
+    def _draw_button(self, painter, style, widget, option, rect: QRect, text: str, cursor):
+        button = QStyleOptionButton()
+        button.rect = rect
+        button.text = text
+        button.palette = option.palette
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        if cursor is not None and rect.contains(cursor):
+            button.state |= QStyle.StateFlag.State_MouseOver
+        painter.setFont(option.font)
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, widget)
+
+    def _hit_test(self, pos, option: QStyleOptionViewItem, index: QModelIndex) -> Optional[Tuple[str, str]]:
+        """Get (action, tooltip) of the button under pos, if any"""
+        state = index.data(StateRole)
+        if not state:
+            return None
+        action_rect, remove_rect = self._button_rects(option.rect.adjusted(2, 2, -2, -2))
+        if remove_rect.contains(pos):
+            return ("remove", "Remove from queue")
+        action = action_for_state(state)
+        if action and action_rect.contains(pos):
+            return (action[0], action[2])
+        return None
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            hit = self._hit_test(event.position().toPoint(), option, index)
+            if hit:
+                item_id = model.item_id_at(index.row())
+                if item_id:
+                    self.action_requested.emit(item_id, hit[0])
+                return True
+        elif event.type() == QEvent.Type.MouseButtonPress and self._hit_test(event.position().toPoint(), option, index):
+            return True  # Don't select the row when a button is pressed
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        hit = self._hit_test(event.pos(), option, index)
+        if hit:
+            QToolTip.showText(event.globalPos(), hit[1], view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class QueueListView(QListView):
+    """List view configured for the virtualized queue"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)  # Fixed row height - no per-row size queries
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setMouseTracking(True)  # Button hover highlight
+        self.setSpacing(1)
+        self._hover_index = QModelIndex()
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        # Repaint the rows the cursor left and entered so button hover states follow it
+        index = self.indexAt(event.position().toPoint())
+        if self._hover_index.isValid():
+            self.viewport().update(self.visualRect(self._hover_index))
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+        self._hover_index = QModelIndex(index) if index.isValid() else QModelIndex()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        if self._hover_index.isValid():
+            self.viewport().update(self.visualRect(self._hover_index))
+        self._hover_index = QModelIndex()
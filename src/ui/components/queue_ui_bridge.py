@@ -0,0 +1,199 @@
+"""
+Frame-rate limited bridge between download events and the queue UI.
+
+Download and queue events arrive on worker threads, often several hundred
+per second with many concurrent tracks. Instead of marshaling each one to
+the GUI thread with its own ``QTimer.singleShot``, the bridge merges them
+into one pending delta per item and hands all deltas to the UI in a single
+pass per frame. It also keeps the per-state item counts up to date from the
+same events, so the statistics header never has to re-scan the queue.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Import our new system components
+import sys
+from pathlib import Path
+src_path = Path(__file__).parent.parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.models.queue_models import DownloadState
+
+logger = logging.getLogger(__name__)
+
+
+class QueueCounters:
+    """
+    Per-state item counts maintained incrementally from queue events.
+
+    Remembers the last known state of every item so repeated or out of
+    order notifications never count an item twice. Not thread-safe on its
+    own - the bridge updates it under its lock.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, DownloadState] = {}
+        self._counts: Dict[DownloadState, int] = {state: 0 for state in DownloadState}
+
+    def reset(self, states: Dict[str, DownloadState]):
+        """Re-seed the counters from a full snapshot of item states"""
+        self._states = dict(states)
+        self._counts = {state: 0 for state in DownloadState}
+        for state in self._states.values():
+            self._counts[state] += 1
+
+    def set_state(self, item_id: str, state: Optional[DownloadState]):
+        """Record an item's new state, or its removal when state is None"""
+        old_state = self._states.get(item_id)
+        if old_state == state:
+            return
+        if old_state is not None:
+            self._counts[old_state] -= 1
+        if state is None:
+            self._states.pop(item_id, None)
+        else:
+            self._states[item_id] = state
+            self._counts[state] += 1
+
+    def summary(self) -> Dict[str, int]:
+        """Counts keyed by state value, like QueueManager.get_queue_summary()"""
+        return {state.value: count for state, count in self._counts.items()}
+
+
+class QueueItemDelta:
+    """Changes to one queue item collected since the last frame"""
+
+    __slots__ = ('added', 'removed', 'state', 'progress', 'started', 'completed',
+                 'failed_message', 'tracks_completed', 'tracks_failed')
+
+    def __init__(self):
+        self.added = False
+        self.removed = False
+        self.state = None  # Latest QueueItemState
+        self.progress = None  # Latest (progress, completed_tracks, failed_tracks)
+        self.started = False
+        self.completed = False
+        self.failed_message: Optional[str] = None
+        self.tracks_completed = 0
+        self.tracks_failed = 0
+
+
+class QueueUpdateBridge(QObject):
+    """
+    Collects queue item deltas from any thread and applies them on the GUI
+    thread at most ``fps`` times per second.
+
+    Args:
+        apply_callback: Called on the GUI thread with (deltas, queue_cleared)
+            where deltas maps item IDs to QueueItemDelta in arrival order
+        fps: Maximum number of UI passes per second
+    """
+
+    _wake = pyqtSignal()
+
+    def __init__(self, apply_callback: Callable[[Dict[str, QueueItemDelta], bool], None],
+                 fps: int = 30, parent=None):
+        super().__init__(parent)
+        self.apply_callback = apply_callback
+        self.frame_interval = 1.0 / max(1, fps)
+        self.counters = QueueCounters()
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, QueueItemDelta] = {}
+        self._cleared = False
+        self._scheduled = False
+        self._last_flush = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+        # Cross-thread emits are queued to the GUI thread the bridge lives on
+        self._wake.connect(self._schedule_flush)
+
+    def post(self, item_id: str, **changes):
+        """
+        Merge changes into the pending delta of an item (any thread).
+
+        Keyword arguments set the QueueItemDelta field of the same name,
+        except tracks_completed/tracks_failed which are added up.
+        """
+        with self._lock:
+            delta = self._pending.get(item_id)
+            if delta is None:
+                delta = self._pending[item_id] = QueueItemDelta()
+            for name, value in changes.items():
+                if name in ('tracks_completed', 'tracks_failed'):
+                    setattr(delta, name, getattr(delta, name) + value)
+                else:
+                    setattr(delta, name, value)
+
+            # Keep the counters in step with the events themselves
+            if 'state' in changes and changes['state'] is not None:
+                self.counters.set_state(item_id, changes['state'].state)
+            elif changes.get('added'):
+                self.counters.set_state(item_id, DownloadState.QUEUED)
+            elif changes.get('removed'):
+                self.counters.set_state(item_id, None)
+
+            wake = not self._scheduled
+            self._scheduled = True
+
+        if wake:
+            self._wake.emit()
+
+    def post_cleared(self, states: Dict[str, DownloadState]):
+        """Drop pending deltas after the queue was cleared and re-seed the counters"""
+        with self._lock:
+            self._pending.clear()
+            self._cleared = True
+            self.counters.reset(states)
+            wake = not self._scheduled
+            self._scheduled = True
+
+        if wake:
+            self._wake.emit()
+
+    def reset_counters(self, states: Dict[str, DownloadState]):
+        """Seed the counters from a snapshot of the queue"""
+        with self._lock:
+            self.counters.reset(states)
+
+    def get_summary(self) -> Dict[str, int]:
+        """Current per-state item counts"""
+        with self._lock:
+            return self.counters.summary()
+
+    def _schedule_flush(self):
+        """Start the frame timer so the next pass lands on a frame boundary (GUI thread)"""
+        if self._timer.isActive():
+            return
+        wait = self.frame_interval - (time.monotonic() - self._last_flush)
+        self._timer.start(max(0, int(wait * 1000)))
+
+    def _flush(self):
+        """Apply all pending deltas in one pass (GUI thread)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            cleared, self._cleared = self._cleared, False
+            self._scheduled = False
+
+        self._last_flush = time.monotonic()
+        if not pending and not cleared:
+            return
+
+        try:
+            self.apply_callback(pending, cleared)
+        except Exception as e:
+            logger.error(f"[QueueUpdateBridge] Error applying {len(pending)} queue updates: {e}", exc_info=True)
+
+    def stop(self):
+        """Stop delivering updates"""
+        self._timer.stop()
+        with self._lock:
+            self._pending.clear()
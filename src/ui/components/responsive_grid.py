@@ -96,6 +96,24 @@ class ResponsiveGridWidget(QWidget):
         self.cards.append(card_widget)
         self._relayout_cards()
         
+    def add_cards(self, card_widgets):
+        """Append several cards, placing only the new ones if the column count doesn't change."""
+        if not card_widgets:
+            return
+        placed = len(self.cards)
+        self.cards.extend(card_widgets)
+
+        columns = self.current_columns
+        available_width = self.width()
+        if (columns and placed and self.grid_layout.count() == placed and available_width > 0
+                and self._calculate_optimal_columns(available_width) == columns):
+            for position, card in enumerate(card_widgets, start=placed):
+                self.grid_layout.addWidget(card, position // columns, position % columns)
+            self.grid_widget.updateGeometry()
+            self.updateGeometry()
+        else:
+            self._relayout_cards()
+
     def clear_cards(self):
         """Remove all cards from the grid."""
         for card in self.cards:
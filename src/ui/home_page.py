@@ -33,6 +33,7 @@ import logging
 
 # Import SearchResultCard from ui.search_widget
 from src.ui.search_widget import SearchResultCard
+from src.services.suggestion_index import suggestion_index_for
 
 logger = logging.getLogger(__name__)
 
@@ -242,122 +243,141 @@ class HomePage(QWidget):
             {"title": "Top Albums", "api_call": self.deezer_api.get_chart_albums, "item_type": "album", "limit": 25, "card_type_field": None}, # limit changed to 25
         ]
 
+        # Create every section first so they keep their order, then show the
+        # last cached snapshot of each right away (stale-while-revalidate)
+        snapshots = {}
         for config in sections_to_load:
             section_title = config["title"]
-            api_call = config["api_call"]
-            default_item_type = config["item_type"]
-            limit = config["limit"]
-            card_type_field = config.get("card_type_field")
-
-
-            logger.info(f"HomePage: Creating and loading section: '{section_title}'")
-            content_layout = self.create_section(section_title, default_item_type) # item_type for view all
-            
-            if not content_layout:
+            logger.info(f"HomePage: Creating section: '{section_title}'")
+            if not self.create_section(section_title, config["item_type"]):
                 logger.error(f"Failed to create content layout for section '{section_title}'")
                 continue
 
-            try:
-                items_data = await api_call(limit=limit)
-                
-                # Add a small delay after chart API calls to prevent session race conditions
-                if section_title in ["Most Streamed Artists", "Top Albums"]:
-                    await asyncio.sleep(0.1)  # 100ms delay to prevent session conflicts
-                
-                # Fallback for New Releases if editorial releases fail
-                if not items_data and section_title == "New Releases":
-                    logger.warning("Editorial releases failed, falling back to chart albums")
-                    try:
-                        items_data = await self.deezer_api.get_chart_albums(limit=limit)
-                        if items_data:
-                            logger.info(f"HomePage: Using chart albums as fallback for New Releases: {len(items_data)} items")
-                    except Exception as fallback_error:
-                        logger.error(f"Fallback to chart albums also failed: {fallback_error}")
-                
-                if items_data:
-                    logger.info(f"HomePage: Received {len(items_data)} items for '{section_title}'.")
-                    
-                    # Clear previous items in this specific section's content layout
-                    try:
-                        while content_layout.count() > 1: # Keep the stretch
-                            item_to_remove = content_layout.takeAt(0)
-                            if item_to_remove.widget():
-                                item_to_remove.widget().deleteLater()
-                    except RuntimeError:
-                        # Layout has been deleted, skip clearing
-                        logger.warning(f"HomePage: Layout for '{section_title}' has been deleted, skipping clear")
-                    
-                    # Get the parent widget (scroll_content_widget) for the cards in this section
-                    current_section_scroll_area = self.section_scroll_areas.get(section_title)
-                    parent_widget_for_cards = current_section_scroll_area.widget() if current_section_scroll_area else None
-
-                    if not parent_widget_for_cards:
-                        logger.error(f"HomePage: Could not find parent widget for cards in section '{section_title}'. Skipping card creation.")
-                        continue
-                    
-                    for item_data in items_data:
-                        # Determine the actual type of the item for SearchResultCard
-                        actual_item_type = item_data.get(card_type_field) if card_type_field else default_item_type
-                        if actual_item_type == "chart_multi": # Special handling for mixed charts
-                            if "albums" in item_data and item_data["albums"]["data"]:
-                                # For simplicity, take the first album from the chart's album list
-                                actual_item_type = "album"
-                                item_data = item_data["albums"]["data"][0] 
-                            elif "artists" in item_data and item_data["artists"]["data"]:
-                                actual_item_type = "artist"
-                                item_data = item_data["artists"]["data"][0]
-                            elif "playlists" in item_data and item_data["playlists"]["data"]:
-                                actual_item_type = "playlist"
-                                item_data = item_data["playlists"]["data"][0]
-                            elif "tracks" in item_data and item_data["tracks"]["data"]:
-                                actual_item_type = "track" # Should ideally not happen for home page sections
-                                item_data = item_data["tracks"]["data"][0]
-                            else:
-                                logger.warning(f"Skipping chart_multi item due to no recognizable sub-data: {item_data.get('id')}")
-                                continue # Skip this item if no valid sub-type found
-                        
-                        # Ensure item_data is a dictionary and has an 'id'
-                        if not isinstance(item_data, dict) or 'id' not in item_data:
-                            logger.warning(f"Skipping item due to missing 'id' or invalid format: {item_data}")
-                            continue
-
-                        # Add 'type' to item_data if not present, using actual_item_type
-                        if 'type' not in item_data:
-                            item_data['type'] = actual_item_type
-
-                        logger.debug(f"HomePage: Preparing to create SearchResultCard with item_data: {item_data}")
-                        
-                        card = SearchResultCard(item_data, parent=parent_widget_for_cards)
-                        # Connect card signals
-                        card.card_selected.connect(self._on_home_card_item_selected)
-                        card.download_clicked.connect(self._on_home_card_download_requested)
-                        
-                        content_layout.insertWidget(content_layout.count() -1, card) # Insert before the stretch
-
-                    # Update scroll arrows for this section
-                    if section_title in self.section_scroll_areas and section_title in self.section_scroll_arrows:
-                        scroll_area_ref = self.section_scroll_areas[section_title] # Renamed to avoid lambda capture issue
-                        left_arrow_ref, right_arrow_ref = self.section_scroll_arrows[section_title]
-                        # Delay update to allow layout to settle
-                        # Use signal for thread-safe scroll arrow updates
-                        self.update_scroll_arrows_signal.emit(scroll_area_ref, left_arrow_ref, right_arrow_ref)
-
-                else:
-                    logger.info(f"HomePage: No items returned for '{section_title}'.")
-            except Exception as e:
-                logger.error(f"HomePage: Error loading content for '{section_title}': {e}", exc_info=True)
-                # For Top Albums, if it fails during initial load, just skip it
-                # The "View All" functionality will still work
-                if section_title == "Top Albums":
-                    logger.info(f"Skipping '{section_title}' section due to initial load timing issue")
+            items_data, stale = self.deezer_api.peek_cached_response(config["api_call"], limit=config["limit"])
+            snapshots[section_title] = (items_data, stale)
+            if items_data:
+                logger.info(f"HomePage: Showing cached '{section_title}' ({len(items_data)} items, stale={stale})")
+                self._populate_section(section_title, items_data, config["item_type"], config.get("card_type_field"))
+
+        # Refresh missing and stale sections concurrently; cards are only
+        # rebuilt when the data actually changed
+        await asyncio.gather(*[
+            self._refresh_section(config, *snapshots[config["title"]])
+            for config in sections_to_load if config["title"] in snapshots
+        ])
         
-                logger.critical(f"!!!!!!!!!!!!!! HomePage.load_content FINISHED. Total sections in main_content_layout: {self.main_content_layout.count()} !!!!!!!!!!!!!!")
+        logger.info(f"HomePage.load_content finished. Total sections in main_content_layout: {self.main_content_layout.count()}")
         self.main_content_layout.addStretch(1) # Add a final stretch to the main page layout
         
         # Emit signal to notify that content loading is complete
         self.content_loaded.emit()
         logger.info("HomePage: Content loading complete, emitted content_loaded signal")
 
+    async def _refresh_section(self, config: dict, snapshot, stale: bool):
+        """Fetch a section unless its snapshot is fresh and repaint it if the data changed."""
+        section_title = config["title"]
+        if snapshot and not stale:
+            return
+
+        try:
+            items_data = await config["api_call"](limit=config["limit"])
+            
+            # Fallback for New Releases if editorial releases fail
+            if not items_data and section_title == "New Releases":
+                logger.warning("Editorial releases failed, falling back to chart albums")
+                try:
+                    items_data = await self.deezer_api.get_chart_albums(limit=config["limit"])
+                    if items_data:
+                        logger.info(f"HomePage: Using chart albums as fallback for New Releases: {len(items_data)} items")
+                except Exception as fallback_error:
+                    logger.error(f"Fallback to chart albums also failed: {fallback_error}")
+            
+            if not items_data:
+                logger.info(f"HomePage: No items returned for '{section_title}'.")
+                return
+            if items_data == snapshot:
+                logger.debug(f"HomePage: '{section_title}' unchanged since the cached snapshot")
+                return
+            
+            logger.info(f"HomePage: Received {len(items_data)} items for '{section_title}'.")
+            self._populate_section(section_title, items_data, config["item_type"], config.get("card_type_field"))
+        except Exception as e:
+            logger.error(f"HomePage: Error loading content for '{section_title}': {e}", exc_info=True)
+
+    def _populate_section(self, section_title: str, items_data: list, default_item_type: str, card_type_field=None):
+        """Replace the cards of a section with cards for items_data."""
+        content_layout = self.section_content_layouts.get(section_title)
+        if content_layout is None:
+            return
+
+        # Chart artists and albums become search suggestions
+        suggestions = suggestion_index_for(getattr(self.deezer_api, 'config', None))
+        if suggestions is not None:
+            suggestions.add_items(items_data, None if card_type_field else default_item_type)
+
+        # Clear previous items in this specific section's content layout
+        try:
+            while content_layout.count() > 1: # Keep the stretch
+                item_to_remove = content_layout.takeAt(0)
+                if item_to_remove.widget():
+                    item_to_remove.widget().deleteLater()
+        except RuntimeError:
+            # Layout has been deleted (page reloaded meanwhile)
+            logger.warning(f"HomePage: Layout for '{section_title}' has been deleted, skipping update")
+            return
+        
+        # Get the parent widget (scroll_content_widget) for the cards in this section
+        current_section_scroll_area = self.section_scroll_areas.get(section_title)
+        parent_widget_for_cards = current_section_scroll_area.widget() if current_section_scroll_area else None
+
+        if not parent_widget_for_cards:
+            logger.error(f"HomePage: Could not find parent widget for cards in section '{section_title}'. Skipping card creation.")
+            return
+        
+        for item_data in items_data:
+            # Determine the actual type of the item for SearchResultCard
+            actual_item_type = item_data.get(card_type_field) if card_type_field else default_item_type
+            if actual_item_type == "chart_multi": # Special handling for mixed charts
+                if "albums" in item_data and item_data["albums"]["data"]:
+                    # For simplicity, take the first album from the chart's album list
+                    actual_item_type = "album"
+                    item_data = item_data["albums"]["data"][0] 
+                elif "artists" in item_data and item_data["artists"]["data"]:
+                    actual_item_type = "artist"
+                    item_data = item_data["artists"]["data"][0]
+                elif "playlists" in item_data and item_data["playlists"]["data"]:
+                    actual_item_type = "playlist"
+                    item_data = item_data["playlists"]["data"][0]
+                elif "tracks" in item_data and item_data["tracks"]["data"]:
+                    actual_item_type = "track" # Should ideally not happen for home page sections
+                    item_data = item_data["tracks"]["data"][0]
+                else:
+                    logger.warning(f"Skipping chart_multi item due to no recognizable sub-data: {item_data.get('id')}")
+                    continue # Skip this item if no valid sub-type found
+            
+            # Ensure item_data is a dictionary and has an 'id'
+            if not isinstance(item_data, dict) or 'id' not in item_data:
+                logger.warning(f"Skipping item due to missing 'id' or invalid format: {item_data}")
+                continue
+
+            # Add 'type' to item_data if not present, using actual_item_type
+            if 'type' not in item_data:
+                item_data['type'] = actual_item_type
+
+            card = SearchResultCard(item_data, parent=parent_widget_for_cards)
+            # Connect card signals
+            card.card_selected.connect(self._on_home_card_item_selected)
+            card.download_clicked.connect(self._on_home_card_download_requested)
+            
+            content_layout.insertWidget(content_layout.count() -1, card) # Insert before the stretch
+
+        # Update scroll arrows for this section
+        if section_title in self.section_scroll_areas and section_title in self.section_scroll_arrows:
+            scroll_area_ref = self.section_scroll_areas[section_title]
+            left_arrow_ref, right_arrow_ref = self.section_scroll_arrows[section_title]
+            # Use signal for thread-safe scroll arrow updates
+            self.update_scroll_arrows_signal.emit(scroll_area_ref, left_arrow_ref, right_arrow_ref)
+
     def _show_error_message(self, message: str):
         """Show error message on the home page."""
         try:
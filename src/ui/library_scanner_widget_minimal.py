@@ -76,7 +76,8 @@ class ImportWorker(QThread):
                     try:
                         # Use the download service to add the album
                         if hasattr(self.queue_integration, 'download_service') and self.queue_integration.download_service:
-                            success = self.queue_integration.download_service.download_album(album_id)
+                            from src.models.queue_models import ItemPriority
+                            success = self.queue_integration.download_service.download_album(album_id, priority=ItemPriority.BULK)
                             if success:
                                 self.imported_count += 1
                         
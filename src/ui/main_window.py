@@ -9,10 +9,10 @@ from PyQt6.QtWidgets import (
     QSlider, QSpacerItem, QSizePolicy, QStackedWidget,
     QTabWidget, QGroupBox, QFormLayout, QCheckBox,
     QComboBox, QSpinBox, QFileDialog, QMenuBar, QMenu,
-    QMessageBox, QDialog, QScrollArea, QStatusBar, QSplashScreen
+    QMessageBox, QDialog, QScrollArea, QStatusBar, QSplashScreen, QCompleter
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QAction, QPixmap
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QModelIndex
+from PyQt6.QtGui import QIcon, QAction, QPixmap, QStandardItemModel, QStandardItem
 # Component imports
 from .components.toggle_switch import ToggleSwitch # Added import
 # Use absolute imports from src.deemusic
@@ -33,6 +33,7 @@ from .library_scanner_widget_minimal import LibraryScannerWidget # ADDED: Import
 from src.config_manager import ConfigManager
 from src.services.deezer_api import DeezerAPI
 from src.services.download_service import DownloadService
+from src.services.suggestion_index import suggestion_index_for
 # Legacy import moved to backup - using new system only
 # from src.services.download_manager import DownloadManager
 from src.services.music_player import MusicPlayer, DummyMusicPlayer
@@ -44,6 +45,11 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Data roles of the header search suggestions
+SUGGESTION_NAME_ROLE = Qt.ItemDataRole.UserRole + 1
+SUGGESTION_TYPE_ROLE = Qt.ItemDataRole.UserRole + 2
+SUGGESTION_ID_ROLE = Qt.ItemDataRole.UserRole + 3
+
 # Add this helper function near the top of the file (after imports)
 def trackinfo_to_dict(track):
     return {
@@ -283,6 +289,10 @@ class MainWindow(QMainWindow):
                     self.download_service = DownloadService(self.config, self.deezer_api)
                     self.download_service.start()
                     logger.info("[Initialize Services] New DownloadService initialized and started.")
+                    # Queued albums and artists rank first among the search suggestions
+                    suggestions = suggestion_index_for(self.config)
+                    if suggestions is not None:
+                        suggestions.attach_queue(self.download_service.queue_manager, self.download_service.event_bus)
                 except Exception as e:
                     logger.error(f"[Initialize Services] Failed to initialize new DownloadService: {e}")
                     logger.info("[Initialize Services] Falling back to legacy DownloadManager...")
@@ -697,11 +707,21 @@ class MainWindow(QMainWindow):
         self.search_bar.setObjectName("searchBar") # For QSS styling
         self.search_bar.setPlaceholderText("Artists, Albums, Tracks, Playlists, Spotify Playlist URL...")
         self.search_bar.returnPressed.connect(self._handle_header_search)
+        self.search_bar.textChanged.connect(self._handle_header_search_text_changed)
         self.search_bar.setMinimumWidth(350) # Set appropriate width for left position
         self.search_bar.setMaximumWidth(450) # Reduced max width since it's on the left
         self.search_bar.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         top_bar_layout.addWidget(self.search_bar)
         
+        # Instant suggestions of artists/albums seen before, shown while the search runs
+        self.suggestion_model = QStandardItemModel(self)
+        self.search_completer = QCompleter(self.suggestion_model, self)
+        self.search_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.search_completer.setCompletionRole(SUGGESTION_NAME_ROLE)
+        self.search_completer.setWidget(self.search_bar)
+        self.search_completer.activated[QModelIndex].connect(self._handle_suggestion_activated)
+        self._suggestion_activated = False
+        
         # Add expanding spacer to push Library Scanner and controls to the right
         top_bar_layout.addStretch(1)
 
@@ -888,25 +908,12 @@ class MainWindow(QMainWindow):
             return
     
     async def _async_add_playlist_to_queue(self, playlist_data: dict):
-        """Async helper to add playlist to queue with proper track fetching."""
+        """Async helper to add playlist to queue; tracks are streamed in by the download service."""
         try:
-            playlist_id = playlist_data.get('id')
             playlist_title = playlist_data.get('title', 'Unknown Playlist')
             
-            if playlist_id and self.deezer_api:
-                logger.info(f"[MainWindow] Fetching tracks for playlist {playlist_id}")
-                # Fetch full playlist data with tracks
-                full_tracks = await self.deezer_api.get_playlist_tracks(playlist_id)
-                
-                if full_tracks:
-                    # Update playlist data with tracks
-                    playlist_data['tracks'] = {'data': full_tracks}
-                    logger.info(f"[MainWindow] Fetched {len(full_tracks)} tracks for playlist '{playlist_title}'")
-                else:
-                    logger.warning(f"[MainWindow] Could not fetch tracks for playlist {playlist_id}")
-                    return
-            
-            # Now add to download service with full track data
+            # The download service enqueues the playlist immediately and fetches
+            # its track pages concurrently in the background
             self.download_service.add_playlist(playlist_data)
             logger.info(f"[MainWindow] Successfully added playlist '{playlist_title}' to download queue")
             
@@ -1105,8 +1112,65 @@ class MainWindow(QMainWindow):
             logger.error("Search widget not found in content stack for 'View All' display.")
         self._update_back_button_visibility()
 
+    def _handle_header_search_text_changed(self, text: str):
+        """Type-ahead: refresh the results while the search page is open."""
+        self._update_search_suggestions(text)
+        if self.search_widget_page and self.content_stack.currentWidget() == self.search_widget_page:
+            self.search_widget_page.schedule_search(text)
+
+    def _update_search_suggestions(self, text: str):
+        """Show the indexed artists/albums matching the header search text."""
+        self.suggestion_model.clear()
+        text = text.strip()
+        suggestions = suggestion_index_for(self.config)
+        if suggestions is None or not self.search_bar.hasFocus() or '://' in text:
+            self.search_completer.popup().hide()
+            return
+
+        entities = suggestions.suggest(text, limit=8)
+        if not entities:
+            self.search_completer.popup().hide()
+            return
+        for entity in entities:
+            label = entity.name if entity.type == 'artist' or not entity.artist else f"{entity.name} - {entity.artist}"
+            item = QStandardItem(f"{label}  ({entity.type.capitalize()})")
+            item.setData(entity.name, SUGGESTION_NAME_ROLE)
+            item.setData(entity.type, SUGGESTION_TYPE_ROLE)
+            item.setData(entity.id, SUGGESTION_ID_ROLE)
+            self.suggestion_model.appendRow(item)
+        self.search_completer.complete()
+
+    def _handle_suggestion_activated(self, index: QModelIndex):
+        """Open the suggested artist/album (or search for a library entry without Deezer ID)."""
+        name = index.data(SUGGESTION_NAME_ROLE) or ""
+        entity_type = index.data(SUGGESTION_TYPE_ROLE)
+        entity_id = index.data(SUGGESTION_ID_ROLE)
+        logger.info(f"[MainWindow] Search suggestion chosen: {entity_type} {entity_id} '{name}'")
+
+        self.search_bar.blockSignals(True)
+        self.search_bar.setText(name)
+        self.search_bar.blockSignals(False)
+        if self.search_widget_page:
+            self.search_widget_page.cancel_scheduled_search()
+
+        # The completer passes the Enter key that chose the suggestion on to the search bar
+        self._suggestion_activated = True
+        QTimer.singleShot(0, lambda: setattr(self, '_suggestion_activated', False))
+
+        if not entity_id:
+            self._run_header_search(name)
+        elif entity_type == 'artist':
+            self.show_artist_detail(entity_id)
+        else:
+            self.show_album_detail(entity_id)
+
     def _handle_header_search(self):
-        query = self.search_bar.text().strip()
+        if self._suggestion_activated:
+            return
+        self._run_header_search(self.search_bar.text())
+
+    def _run_header_search(self, query: str):
+        query = query.strip()
         if not query:
             # Optionally, switch back to home or do nothing if search is cleared
             # For now, just log and return
@@ -1280,6 +1344,14 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 logger.error(f"Error during download service shutdown: {e}")
         
+        # Keep the search suggestions seen this session
+        try:
+            suggestions = suggestion_index_for(self.config)
+            if suggestions is not None:
+                suggestions.flush()
+        except Exception as e:
+            logger.error(f"Error saving search suggestions: {e}")
+        
         # Force application exit immediately to prevent hanging
         from PyQt6.QtCore import QTimer
         from PyQt6.QtWidgets import QApplication
@@ -48,6 +48,8 @@ class PlaylistDetailPage(QWidget):
         self.download_manager = download_manager
         self.current_playlist_id = None
         self.current_playlist_data = None 
+        self.current_playlist_tracks = []  # Tracks shown, reused by the playlist download
+        self._playlist_tracks_complete = False
         self.main_playlist_cover_loaded.connect(self._set_main_playlist_cover)
         self._on_main_cover_artwork_error_signal.connect(self._on_main_cover_artwork)
         
@@ -226,18 +228,23 @@ class PlaylistDetailPage(QWidget):
             return
 
         try:
-            # Get all tracks in the playlist
+            # Reuse the tracks on the page; a partly loaded playlist is fetched (mostly from cache)
             playlist_id = self.current_playlist_id
-            tracks_data = await self.deezer_api.get_playlist_tracks(playlist_id)
+            if self._playlist_tracks_complete and self.current_playlist_tracks:
+                tracks_data = list(self.current_playlist_tracks)
+            else:
+                # Same limit as the page uses, so the pages come from the shared cache
+                nb_tracks = self.current_playlist_data.get('nb_tracks') or 0
+                tracks_data = await self.deezer_api.get_playlist_tracks(playlist_id, limit=nb_tracks or 500)
             
-            if not tracks_data or not tracks_data.get('data'):
+            if not tracks_data:
                 logger.error(f"[PlaylistDetail] No tracks found for playlist {playlist_id}")
                 return
 
             # Extract track IDs
             track_ids = []
-            for track in tracks_data['data']:
-                if track.get('id'):
+            for track in tracks_data:
+                if isinstance(track, dict) and track.get('id'):
                     track_ids.append(track['id'])
 
             if not track_ids:
@@ -269,8 +276,14 @@ class PlaylistDetailPage(QWidget):
             return
 
         self.current_playlist_id = playlist_id
+        self.current_playlist_data = None
+        self.current_playlist_tracks = []
+        self._playlist_tracks_complete = False
         # Loading state is already set by set_loading_state() for immediate UI response
 
+        # Header metadata and the first page of tracks are fetched at the same time
+        page_size = getattr(self.deezer_api, 'LIST_PAGE_SIZE', 100)
+        first_page_task = asyncio.ensure_future(self.deezer_api.get_playlist_tracks(playlist_id, limit=page_size))
         try:
             playlist_details = await self.deezer_api.get_playlist_details(playlist_id)
             if not playlist_details:
@@ -312,32 +325,32 @@ class PlaylistDetailPage(QWidget):
                 logger.warning(f"[PlaylistDetail] No cover_url found for playlist {playlist_id}. Setting placeholder.")
                 self._set_placeholder_main_playlist_cover()
             
-            tracks = playlist_details.get('tracks', {}).get('data', [])
+            tracks = await first_page_task
+            if playlist_id != self.current_playlist_id:
+                return
+            if not tracks:
+                # Fall back to the tracks embedded in the details response
+                tracks = playlist_details.get('tracks', {}).get('data', [])
             if tracks:
-                logger.info(f"[PlaylistDetail] Received {len(tracks)} tracks with playlist details for {playlist_id}.")
+                logger.info(f"[PlaylistDetail] Received first {len(tracks)} tracks for playlist {playlist_id}.")
                 self._clear_track_list()
-                
-                # Load tracks in batches - faster initial rendering
-                for i, track_data in enumerate(tracks):
-                    if not isinstance(track_data, dict):
-                        logger.warning(f"[PlaylistDetail] Skipping non-dict track item: {track_data}")
-                        continue
-                        
-                    # Create the card with track position (1-indexed)
-                    track_position = i + 1
-                    card = SearchResultCard(track_data, show_duration=True, track_position=track_position)
-                    card.card_selected.connect(self._handle_track_card_selected)
-                    card.download_clicked.connect(self._handle_track_download_selected)
-                    # NEW: Connect artist and album name click signals
-                    card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
-                    card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
-                    self.tracks_layout.addWidget(card)
-                    
-                    # DON'T force immediate artwork loading - let cards load when they become visible
-                    # This prevents UI blocking and ensures smooth page navigation
-                    # Cards will automatically load artwork via their showEvent with 1000ms delay
+                self._append_track_cards(tracks)
+
+                # DON'T force immediate artwork loading - let cards load when they become visible
+                # Cards will automatically load artwork via their showEvent with 1000ms delay
+                if num_tracks > len(tracks):
+                    # Remaining pages; the first one comes from the response cache
+                    all_tracks = await self.deezer_api.get_playlist_tracks(playlist_id, limit=num_tracks)
+                    if playlist_id != self.current_playlist_id:
+                        return
+                    self._append_track_cards(all_tracks[len(tracks):])
+                    # The paginator stops at the first failed page, so only a full list counts
+                    self._playlist_tracks_complete = len(all_tracks) >= num_tracks
+                else:
+                    self._playlist_tracks_complete = True
+                logger.info(f"[PlaylistDetail] Showing {len(self.current_playlist_tracks)} tracks for playlist {playlist_id}.")
             else:
-                logger.info(f"[PlaylistDetail] No tracks found in initial details for playlist {playlist_id}.")
+                logger.info(f"[PlaylistDetail] No tracks found for playlist {playlist_id}.")
                 self._show_track_load_error("No tracks found in this playlist.")
 
         except Exception as e:
@@ -348,6 +361,27 @@ class PlaylistDetailPage(QWidget):
             self.playlist_description_label.setVisible(False)
             self.playlist_stats_label.setText("")
             self._show_track_load_error(f"An error occurred: {e}")
+        finally:
+            if not first_page_task.done():
+                first_page_task.cancel()
+
+    def _append_track_cards(self, tracks: list):
+        """Add track cards after the ones already shown, numbered by playlist position."""
+        for track_data in tracks:
+            if not isinstance(track_data, dict):
+                logger.warning(f"[PlaylistDetail] Skipping non-dict track item: {track_data}")
+                continue
+
+            self.current_playlist_tracks.append(track_data)
+            # Create the card with track position (1-indexed)
+            track_position = len(self.current_playlist_tracks)
+            card = SearchResultCard(track_data, show_duration=True, track_position=track_position)
+            card.card_selected.connect(self._handle_track_card_selected)
+            card.download_clicked.connect(self._handle_track_download_selected)
+            # NEW: Connect artist and album name click signals
+            card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
+            card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
+            self.tracks_layout.addWidget(card)
 
     def _clear_track_list(self):
         while self.tracks_layout.count():
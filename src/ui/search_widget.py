@@ -9,6 +9,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QSize,
 import PyQt6.QtGui # Explicitly import the QtGui module first
 from PyQt6.QtGui import QPixmap, QImage, QIcon, QPainter, QColor, QPen, QDesktopServices, QCursor, QBitmap, QBrush, QPainterPath, QMouseEvent # Add QMouseEvent, QCursor
 import asyncio
+import functools
 # Remove aiohttp import if SearchResultCard doesn't use it anymore
 # import aiohttp 
 # Import requests for synchronous HTTP calls in worker
@@ -17,6 +18,7 @@ import concurrent.futures
 from io import BytesIO
 # Use absolute imports
 from src.services.deezer_api import DeezerAPI
+from src.services.search_client import ALL_VIEW_LIMITS, SEARCH_ENDPOINTS, ListCursor, SearchCursor, get_search_client
 # Legacy download manager moved to backup
 # from src.services.download_manager import DownloadManager
 from src.services.spotify_api import SpotifyAPI
@@ -123,140 +125,6 @@ class HoverOverlayWidget(QWidget):
     #     event.ignore() # Or handle as needed
 # --- END CUSTOM HOVER OVERLAY WIDGET ---
 
-class WorkerSignals(QObject):
-    finished = pyqtSignal(dict) # MODIFIED: Emit a dict to carry potentially multiple result sets
-    error = pyqtSignal(str)
-
-class SearchWorker(QRunnable):
-    def __init__(self, api: DeezerAPI, query: str, filter_name: str, limit: int = 20):
-        super().__init__()
-        self.api = api
-        self.query = query
-        self.filter_name = filter_name # Empty string for "all", "tracks", "albums" etc. for specific
-        self.limit = limit # This limit is 60 for "all", 20 for specific, used as total for "all" or single for specific
-        self.signals = WorkerSignals()
-        # Create a session for this worker to reuse connections
-        self.session = requests.Session()
-        # Configure session for better performance
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=2
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
-
-    @pyqtSlot()
-    def run(self):
-        try:
-            logger.debug(f"SearchWorker.run: Initial filter_name='{self.filter_name}', query='{self.query}', limit={self.limit}")
-            
-            results_payload = {}
-
-            if not self.filter_name: # "all" search case
-                logger.debug("SearchWorker: Performing 'all' search with multiple API calls.")
-                # Limits for individual calls in "all" mode
-                general_limit = 10
-                artist_limit = 10
-                album_limit = 10
-                track_limit = 20
-                playlist_limit = 10
-
-                # Use concurrent requests for better performance
-                import concurrent.futures
-                import threading
-                
-                def fetch_search_results(search_type, url, result_key):
-                    """Helper function to fetch search results."""
-                    try:
-                        logger.debug(f"SearchWorker (all): Requesting {search_type} URL: {url}")
-                        response = self.session.get(url, timeout=5)  # Reduced timeout from 10 to 5 seconds
-                        response.raise_for_status()
-                        data = response.json()
-                        results = data.get('data', [])
-                        logger.debug(f"SearchWorker (all): {search_type} search returned {len(results)} items.")
-                        return result_key, results
-                    except Exception as e:
-                        logger.error(f"SearchWorker (all): Error fetching {search_type} results: {e}")
-                        return result_key, []
-
-                # Prepare all search requests
-                search_requests = [
-                    ("General", f"https://api.deezer.com/search?q={self.query}&limit={general_limit}&order=RANKING", 'all_results'),
-                    ("Artist", f"https://api.deezer.com/search/artist?q={self.query}&limit={artist_limit}", 'artist_results'),
-                    ("Album", f"https://api.deezer.com/search/album?q={self.query}&limit={album_limit}", 'album_results'),
-                    ("Track", f"https://api.deezer.com/search/track?q={self.query}&limit={track_limit}", 'track_results'),
-                    ("Playlist", f"https://api.deezer.com/search/playlist?q={self.query}&limit={playlist_limit}", 'playlist_results')
-                ]
-
-                # Execute all requests concurrently with a maximum of 3 concurrent requests
-                with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                    future_to_search = {
-                        executor.submit(fetch_search_results, search_type, url, result_key): (search_type, result_key)
-                        for search_type, url, result_key in search_requests
-                    }
-                    
-                    for future in concurrent.futures.as_completed(future_to_search, timeout=15):  # 15 second total timeout
-                        try:
-                            result_key, results = future.result()
-                            results_payload[result_key] = results
-                        except Exception as e:
-                            search_type, result_key = future_to_search[future]
-                            logger.error(f"SearchWorker (all): {search_type} search failed: {e}")
-                            results_payload[result_key] = []
-                
-                self.signals.finished.emit(results_payload)
-
-            else: # Specific filter search (tracks, albums, artists, playlists)
-                api_filter_type = ""
-                payload_key = "all_results" 
-
-                if self.filter_name == "tracks":
-                    api_filter_type = "/track"
-                    payload_key = "track_results"
-                elif self.filter_name == "albums":
-                    api_filter_type = "/album"
-                    payload_key = "album_results"
-                elif self.filter_name == "artists":
-                    api_filter_type = "/artist"
-                    payload_key = "artist_results"
-                elif self.filter_name == "playlists":
-                    api_filter_type = "/playlist"
-                    payload_key = "playlist_results"
-                else:
-                    logger.warning(f"SearchWorker: Unmapped filter_name '{self.filter_name}', attempting direct use.")
-                    api_filter_type = f"/{self.filter_name}"
-            
-                endpoint_url = f"https://api.deezer.com/search{api_filter_type}?q={self.query}&limit={self.limit}"
-                logger.debug(f"SearchWorker (specific filter '{self.filter_name}'): Requesting URL: {endpoint_url}")
-            
-                response = self.session.get(endpoint_url, timeout=5)  # Reduced timeout from 10 to 5 seconds
-                response.raise_for_status()
-                data = response.json() 
-            
-                if 'error' in data:
-                    error_msg = f"Search API error ({self.filter_name} filter): {data['error']}"
-                    logger.error(error_msg)
-                    self.signals.error.emit(error_msg)
-                else:
-                    results_list = data.get('data', [])
-                    logger.debug(f"SearchWorker (specific filter '{self.filter_name}'): Sync search returned {len(results_list)} results.")
-                    results_payload[payload_key] = results_list
-                    self.signals.finished.emit(results_payload)
-
-        except requests.exceptions.RequestException as e:
-            error_msg = f"SearchWorker network error: {str(e)}"
-            logger.error(error_msg)
-            self.signals.error.emit(error_msg)
-        except Exception as e:
-            error_msg = f"SearchWorker failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            self.signals.error.emit(error_msg)
-        finally:
-            # Clean up the session
-            if hasattr(self, 'session'):
-                self.session.close()
-
 class SearchResultCard(QFrame):
     """Card widget for displaying search results."""
     
@@ -1124,6 +992,15 @@ class SearchWidget(QWidget):
     album_name_clicked_from_track = pyqtSignal(int)   # Emits album_id when album name clicked in track
     back_button_pressed = pyqtSignal() # ADDED: Signal for back button
     
+    # Type-ahead searches wait for a pause in typing this long (ms)
+    TYPE_AHEAD_DELAY_MS = 350
+    TYPE_AHEAD_MIN_LENGTH = 2
+    
+    # Result lists are filled a page at a time; the next page is requested
+    # once the view is scrolled past NEXT_PAGE_SCROLL_RATIO
+    RESULTS_PAGE_SIZE = 20
+    NEXT_PAGE_SCROLL_RATIO = 0.7
+    
     def __init__(self, deezer_api: DeezerAPI, download_service=None, config_manager=None, parent=None):
         super().__init__(parent)
         self._deezer_api = deezer_api  # Use private attribute for property
@@ -1149,6 +1026,20 @@ class SearchWidget(QWidget):
         self.is_converting_playlist = False
         self.conversion_progress_widget = None
         
+        # Only the latest search may render; older ones are cancelled
+        self._search_task = None
+        self._search_generation = 0
+        self._type_ahead_query = ""
+        self._type_ahead_timer = QTimer(self)
+        self._type_ahead_timer.setSingleShot(True)
+        self._type_ahead_timer.timeout.connect(self._run_type_ahead_search)
+        
+        # Paged result view: cursor of the next page and the function appending its cards
+        self._results_cursor = None
+        self._results_appender = None
+        self._results_seen = set()
+        self._page_task = None
+        
         self.setup_ui()
     
     def _get_deezer_api(self):
@@ -1244,7 +1135,13 @@ class SearchWidget(QWidget):
         self.results_layout = QVBoxLayout(self.results_widget)
         self.results_area.setWidget(self.results_widget)
         
-        # Removed complex scroll event handling that was causing blocking
+        # Request the next result page when scrolled far enough (checked once scrolling settles)
+        self._page_check_timer = QTimer(self)
+        self._page_check_timer.setSingleShot(True)
+        self._page_check_timer.timeout.connect(self._check_next_page)
+        results_scroll_bar = self.results_area.verticalScrollBar()
+        results_scroll_bar.valueChanged.connect(lambda _value: self._page_check_timer.start(100))
+        results_scroll_bar.rangeChanged.connect(lambda _min, _max: self._page_check_timer.start(100))
         
         # Add to main layout
         layout.addWidget(header_panel_widget) # ADDED: new header panel
@@ -1293,8 +1190,29 @@ class SearchWidget(QWidget):
             button.update()
 
 
+    def schedule_search(self, query: str):
+        """Search for query once typing pauses (type-ahead)."""
+        query = query.strip()
+        self._type_ahead_query = query
+        if len(query) < self.TYPE_AHEAD_MIN_LENGTH or query == self.current_query:
+            self._type_ahead_timer.stop()
+            return
+        self._type_ahead_timer.start(self.TYPE_AHEAD_DELAY_MS)
+
+    def cancel_scheduled_search(self):
+        """Drop a pending type-ahead search."""
+        self._type_ahead_timer.stop()
+
+    def _run_type_ahead_search(self):
+        """Debounce timer: search for the last typed query."""
+        query = self._type_ahead_query
+        # Spotify links are converted on Enter only
+        if query and query != self.current_query and not self.spotify_api.is_spotify_playlist_url(query):
+            self.set_search_query_and_search(query)
+
     def set_search_query_and_search(self, query: str):
         """Sets the search query and triggers a new search."""
+        self._type_ahead_timer.stop()
         self.current_query = query.strip()
         # When a new search is initiated, typically "All" filter is selected by default on Deezer.
         # Or, we can keep the current filter. For now, let's reset to 'All' for a new query.
@@ -1304,7 +1222,7 @@ class SearchWidget(QWidget):
         self.perform_search()
         
     def perform_search(self):
-        """Execute the search using QThreadPool."""
+        """Execute the search as an asyncio task, superseding any running one."""
         if hasattr(self, 'filter_buttons_panel'): # Make sure filters are visible for regular search
             self.filter_buttons_panel.show()
         # ADDED: Hide the view_all_title_label for regular searches
@@ -1312,6 +1230,9 @@ class SearchWidget(QWidget):
             self.view_all_title_label.setText("")
             self.view_all_title_label.setVisible(False)
 
+        # Supersede the running search; its results must never be rendered
+        self._cancel_search()
+
         query = self.current_query
         if not query:
             logger.debug("Perform search called but no current query.")
@@ -1327,21 +1248,99 @@ class SearchWidget(QWidget):
             self._handle_spotify_playlist_conversion(query)
             return
             
-        search_type_for_api = "" if self.active_filter_type == 'all' else self.active_filter_type
-        limit_for_search = 60 if self.active_filter_type == 'all' else 20 # Increased limit for 'all'
-        
         self._clear_results()
                 
         loading_label = QLabel("Searching...")
         loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.results_layout.addWidget(loading_label)
         
-        # Create and run worker
-        logger.debug("Creating and starting SearchWorker...")
-        worker = SearchWorker(self.deezer_api, query, search_type_for_api, limit=limit_for_search)
-        worker.signals.finished.connect(self.handle_search_results)
-        worker.signals.error.connect(self.handle_search_error)
-        QThreadPool.globalInstance().start(worker)
+        generation = self._search_generation
+        self._search_task = asyncio.ensure_future(
+            self._run_search(generation, query, self.active_filter_type, limit=self.RESULTS_PAGE_SIZE)
+        )
+
+    def _cancel_search(self):
+        """Cancel the running search and invalidate its results."""
+        self._search_generation += 1
+        if self._search_task and not self._search_task.done():
+            self._search_task.cancel()
+        self._search_task = None
+
+    async def _run_search(self, generation: int, query: str, filter_name: str, limit: int):
+        """Fetch search results (cached by the shared search client) and show them if still current."""
+        try:
+            payload = await get_search_client(self.deezer_api).search_payload(query, filter_name, limit=limit)
+        except asyncio.CancelledError:
+            logger.debug(f"[SearchWidget] Search for '{query}' ({filter_name}) cancelled")
+            return
+        except Exception as e:
+            if generation == self._search_generation:
+                logger.error(f"[SearchWidget] Search for '{query}' failed: {e}", exc_info=True)
+                self.handle_search_error(str(e))
+            return
+
+        if generation != self._search_generation or sip_is_deleted(self):
+            logger.debug(f"[SearchWidget] Dropping stale results for '{query}' ({filter_name})")
+            return
+        self._clear_results()
+        self.handle_search_results(payload)
+
+    def _start_paging(self, cursor, appender, shown_items: list):
+        """Append the cursor's further pages to the current view as the user scrolls."""
+        self._stop_paging()
+        if appender is None or cursor.exhausted:
+            return
+        self._results_cursor = cursor
+        self._results_appender = appender
+        self._results_seen = {(item.get('type'), item.get('id')) for item in shown_items}
+        self._page_check_timer.start(100)
+
+    def _stop_paging(self):
+        """Stop paging the current view and cancel a page being fetched."""
+        if self._page_task and not self._page_task.done():
+            self._page_task.cancel()
+        self._page_task = None
+        if self._results_cursor:
+            self._results_cursor.cancel()
+        self._results_cursor = None
+        self._results_appender = None
+        self._results_seen = set()
+
+    def _check_next_page(self):
+        """Request the next page if the view is scrolled past the threshold (or doesn't fill the area)."""
+        cursor = self._results_cursor
+        if cursor is None or cursor.exhausted or (self._page_task and not self._page_task.done()):
+            return
+        scroll_bar = self.results_area.verticalScrollBar()
+        if scroll_bar.maximum() > 0 and scroll_bar.value() < scroll_bar.maximum() * self.NEXT_PAGE_SCROLL_RATIO:
+            return
+        self._page_task = asyncio.ensure_future(self._load_next_page(cursor))
+
+    async def _load_next_page(self, cursor):
+        """Fetch the cursor's next page and append its cards to the view."""
+        try:
+            page = await cursor.next_page()
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.error(f"[SearchWidget] Loading the next result page failed: {e}")
+            cursor.cancel()
+            return
+
+        if cursor is not self._results_cursor or sip_is_deleted(self):
+            return
+        new_items = []
+        for item in page:
+            key = (item.get('type'), item.get('id'))
+            if item.get('id') is not None and key in self._results_seen:
+                continue
+            self._results_seen.add(key)
+            new_items.append(item)
+        if new_items:
+            logger.debug(f"[SearchWidget] Appending {len(new_items)} results (next index {cursor.next_index})")
+            self._results_appender(new_items)
+        # The view may still not reach the threshold, e.g. on a tall window
+        self._page_check_timer.start(100)
     
     def _handle_spotify_playlist_conversion(self, spotify_url: str):
         """Handle conversion of a Spotify playlist URL to Deezer tracks."""
@@ -1965,6 +1964,7 @@ class SearchWidget(QWidget):
 
     def _clear_results(self):
         logger.debug("Calling _clear_results")
+        self._stop_paging()
 
         # Clear the main results_layout
         layout_to_clear = self.results_layout
@@ -2069,23 +2069,26 @@ class SearchWidget(QWidget):
         else:
             # For specific tabs, get the relevant list from the payload
             items_to_display = []
+            appender = None
             if self.active_filter_type == "tracks":
                 items_to_display = results_payload.get('track_results', [])
-                self._add_track_list_section(items_to_display) # Tracks have a special display
+                appender = self._display_categorized_search_results(items_to_display, "Tracks")
             elif self.active_filter_type == "albums":
                 items_to_display = results_payload.get('album_results', [])
-                self._display_categorized_search_results(items_to_display, "Albums")
+                appender = self._display_categorized_search_results(items_to_display, "Albums")
             elif self.active_filter_type == "artists":
                 items_to_display = results_payload.get('artist_results', [])
-                self._display_categorized_search_results(items_to_display, "Artists")
+                appender = self._display_categorized_search_results(items_to_display, "Artists")
             elif self.active_filter_type == "playlists":
                 items_to_display = results_payload.get('playlist_results', [])
-                self._display_categorized_search_results(items_to_display, "Playlists")
+                appender = self._display_categorized_search_results(items_to_display, "Playlists")
             
-            if not items_to_display and self.active_filter_type != "tracks": # Tracks already handled
-                no_results_label = QLabel(f"No {self.active_filter_type} found.")
-                no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.results_layout.addWidget(no_results_label)
+            # Further pages are fetched while scrolling
+            if self.current_query and self.active_filter_type in SEARCH_ENDPOINTS:
+                cursor = SearchCursor(get_search_client(self.deezer_api), self.current_query, self.active_filter_type,
+                                      page_size=self.RESULTS_PAGE_SIZE, start=len(items_to_display),
+                                      exhausted=len(items_to_display) < self.RESULTS_PAGE_SIZE)
+                self._start_paging(cursor, appender, items_to_display)
         
         self.results_layout.addStretch() # Add stretch at the end
 
@@ -2348,7 +2351,10 @@ class SearchWidget(QWidget):
                         layout.addWidget(card)
 
     def _display_categorized_search_results(self, results: list, category_title: str):
-        """Displays search results for a specific category (e.g., Tracks, Albums)."""
+        """Displays search results for a specific category (e.g., Tracks, Albums).
+
+        Returns a function appending more items of the category to the view, or None.
+        """
         logger.debug(f"Displaying categorized results for '{category_title}'. Number of items: {len(results)}") # Existing
         if results:
             logger.debug(f"First item in categorized results for '{category_title}': {results[0]}") # Log first item
@@ -2384,36 +2390,24 @@ class SearchWidget(QWidget):
             # Store reference to the container for sorting updates
             self.current_track_list_container = track_list_content_widget
 
-            for item_data in results:
-                card = SearchResultCard(item_data, show_duration=True)
-                card.card_selected.connect(self._handle_card_selection)
-                card.download_clicked.connect(self._handle_card_download_request)
-                # NEW: Connect artist and album name click signals for track lists
-                card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
-                card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
-                track_list_vbox.addWidget(card)
-            
             track_list_vbox.addStretch(1) # Stretch at the end of the vertical track list
+            self._append_track_cards(track_list_vbox, results)
 
             centering_hbox.addWidget(track_list_content_widget, 15) # Content stretch
             centering_hbox.addStretch(1) # Right stretch
 
             self.results_layout.addWidget(constrained_width_container)
 
+            def append_tracks(tracks: list):
+                self.current_tracks_data = list(self.current_tracks_data) + list(tracks)
+                self._append_track_cards(track_list_vbox, tracks)
+            return append_tracks
+
         elif category_title.lower() in ["albums", "artists", "playlists"]: # Grid views
             responsive_grid = ResponsiveGridWidget(card_min_width=180, card_spacing=15)
-            
-            # Create all cards
-            cards = []
-            for item_data in results:
-                card = SearchResultCard(item_data)
-                card.card_selected.connect(self._handle_card_selection)
-                card.download_clicked.connect(self._handle_card_download_request)
-                cards.append(card)
-                
-            # Add all cards to the responsive grid
-            responsive_grid.set_cards(cards)
+            self._append_grid_cards(responsive_grid, results)
             self.results_layout.addWidget(responsive_grid)
+            return functools.partial(self._append_grid_cards, responsive_grid)
         else: # Fallback for unknown category_title, though should not happen with current filters
             logger.warning(f"Unknown category title for display: {category_title}")
             for item_data in results: # Display as simple vertical list
@@ -2422,6 +2416,31 @@ class SearchWidget(QWidget):
                 card.download_clicked.connect(self._handle_card_download_request)
                 self.results_layout.addWidget(card)
 
+    def _append_track_cards(self, track_list_vbox: QVBoxLayout, tracks: list):
+        """Add track rows to a track list, above its trailing stretch."""
+        insert_at = track_list_vbox.count()
+        last_item = track_list_vbox.itemAt(insert_at - 1) if insert_at else None
+        if last_item is not None and last_item.spacerItem():
+            insert_at -= 1
+        for item_data in tracks:
+            card = SearchResultCard(item_data, show_duration=True)
+            card.card_selected.connect(self._handle_card_selection)
+            card.download_clicked.connect(self._handle_card_download_request)
+            card.artist_name_clicked.connect(self.artist_name_clicked_from_track.emit)
+            card.album_name_clicked.connect(self.album_name_clicked_from_track.emit)
+            track_list_vbox.insertWidget(insert_at, card)
+            insert_at += 1
+
+    def _append_grid_cards(self, responsive_grid: ResponsiveGridWidget, items: list):
+        """Add cards for items to a responsive grid."""
+        cards = []
+        for item_data in items:
+            card = SearchResultCard(item_data)
+            card.card_selected.connect(self._handle_card_selection)
+            card.download_clicked.connect(self._handle_card_download_request)
+            cards.append(card)
+        responsive_grid.add_cards(cards)
+
     def _create_section_widget(self, title: str, items: list, item_type_for_view_all: str, horizontal: bool = True, max_items: int = 5):
         """Creates a widget for a section of search results (e.g., Top Result, Tracks, Albums)."""
         section_frame = QFrame()
@@ -2627,7 +2646,16 @@ class SearchWidget(QWidget):
         # Update filter button style to show which category is being viewed, if desired, or keep "All" active
         # For now, we'll just display the results in a categorized view without changing the top filter buttons.
         # The back button in _display_categorized_search_results will handle returning.
-        self._display_categorized_search_results(category_results, f"{category_to_view.capitalize()}s")
+        appender = self._display_categorized_search_results(category_results, f"{category_to_view.capitalize()}s")
+
+        # Continue after the results the "All" search fetched for this category
+        filter_name = f"{category_to_view}s"
+        if self.current_query and filter_name in SEARCH_ENDPOINTS:
+            loaded = len(getattr(self, 'all_loaded_results_payload', {}).get(f"{category_to_view}_results", []))
+            cursor = SearchCursor(get_search_client(self.deezer_api), self.current_query, filter_name,
+                                  page_size=self.RESULTS_PAGE_SIZE, start=loaded,
+                                  exhausted=loaded < ALL_VIEW_LIMITS[filter_name])
+            self._start_paging(cursor, appender, category_results)
 
     def _handle_card_selection(self, item_data: dict):
         """Handles the card_selected signal from a SearchResultCard."""
@@ -2734,16 +2762,9 @@ class SearchWidget(QWidget):
         # Content Area (Responsive Grid) - REPLACED fixed grid
         responsive_grid = ResponsiveGridWidget(card_min_width=180, card_spacing=15)
         
-        # Create all cards
-        cards = []
-        for item_data in items:
-            card = SearchResultCard(item_data)
-            card.card_selected.connect(self._handle_card_selection)
-            card.download_clicked.connect(self._handle_card_download_request)
-            cards.append(card)
-            
-        # Add all cards to the responsive grid
-        responsive_grid.set_cards(cards)
+        # Only the first page gets cards now, the rest is appended while scrolling
+        first_page = items[:self.RESULTS_PAGE_SIZE]
+        self._append_grid_cards(responsive_grid, first_page)
         section_layout.addWidget(responsive_grid)
         section_layout.addStretch(1) # Pushes content to the top
 
@@ -2757,6 +2778,9 @@ class SearchWidget(QWidget):
         if self.results_area:
             self.results_area.verticalScrollBar().setValue(0)
 
+        self._start_paging(ListCursor(items, page_size=self.RESULTS_PAGE_SIZE, start=len(first_page)),
+                           functools.partial(self._append_grid_cards, responsive_grid), first_page)
+
     def _handle_view_all_tracks_clicked(self):
         """Handles the 'View All' button click specifically for the tracks section."""
         logger.info("View All tracks clicked. Switching to Tracks filter.")
@@ -0,0 +1,64 @@
+"""Parsing of Deezer album, playlist and track references (URLs, type:id, bare IDs)."""
+
+import logging
+import re
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ITEM_TYPES = ('album', 'playlist', 'track')
+
+_URL_PATTERN = re.compile(r'deezer\.com/(?:[a-z]{2}(?:-[a-z]{2})?/)?(album|playlist|track)/(\d+)', re.IGNORECASE)
+_TYPED_ID_PATTERN = re.compile(r'^(album|playlist|track):(\d+)$', re.IGNORECASE)
+_SHORT_LINK_PATTERN = re.compile(r'^https?://(?:deezer\.page\.link|link\.deezer\.com)/', re.IGNORECASE)
+
+
+def resolve_short_link(url: str) -> Optional[str]:
+    """Follow a deezer.page.link / link.deezer.com short link to the full URL"""
+    import requests
+
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=10)
+        return response.url
+    except Exception as e:
+        logger.error(f"Could not resolve short link {url}: {e}")
+        return None
+
+
+def parse_reference(text: str, default_type: str = 'album') -> Optional[Tuple[str, int]]:
+    """
+    Parse a Deezer URL, 'type:id' or bare ID into (item_type, deezer_id).
+
+    Args:
+        text: Reference as given on the command line, in a file or an API call
+        default_type: Item type assumed for bare numeric IDs
+
+    Returns:
+        (item_type, deezer_id) or None if the text is not a reference
+    """
+    text = str(text).strip()
+    if not text:
+        return None
+
+    if _SHORT_LINK_PATTERN.match(text):
+        text = resolve_short_link(text) or ''
+
+    match = _URL_PATTERN.search(text) or _TYPED_ID_PATTERN.match(text)
+    if match:
+        return match.group(1).lower(), int(match.group(2))
+
+    if text.isdigit():
+        return default_type, int(text)
+
+    return None
+
+
+def split_references(values: Iterable[str]) -> List[str]:
+    """Split arguments and lines holding comma or whitespace separated ID lists, skipping '#' comments"""
+    references = []
+    for value in values:
+        value = str(value)
+        if value.lstrip().startswith('#'):
+            continue
+        references.extend(part for part in re.split(r'[\s,]+', value) if part)
+    return references
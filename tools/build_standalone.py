@@ -211,14 +211,23 @@ a = Analysis(
         'src.services.download_service',
         'src.services.new_download_engine',
         'src.services.new_download_worker',
+        'src.services.async_download_worker',
+        'src.services.process_download_worker',
         'src.services.new_queue_manager',
         'src.services.event_bus',
+        'src.services.background_loop',
+        'src.services.api_cache',
+        'src.services.single_flight',
+        'src.services.paginator',
+        'src.services.search_client',
+        'src.services.suggestion_index',
         'src.services.spotify_api',
         'src.services.music_player',
         
         # Models and Utils - Complete set
         'src.models',
         'src.models.queue_models',
+        'src.models.artist_snapshot',
         'src.utils',
         'src.utils.image_cache',
         'src.utils.helpers',
@@ -230,7 +239,8 @@ a = Analysis(
         'src.ui.components.toggle_switch',
         'src.ui.components.progress_card',
         'src.ui.components.new_queue_widget',
-        'src.ui.components.new_queue_item_widget',
+        'src.ui.components.queue_list_view',
+        'src.ui.components.queue_ui_bridge',
     ],
     hookspath=[],
     hooksconfig={{}},